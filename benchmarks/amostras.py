@@ -0,0 +1,158 @@
+"""
+Amostras sintéticas para os benchmarks: orçamentos em colunas e arquivos de impressão (JPEG, PNG, TIFF, PDF)
+e planilhas gerados na hora, sem depender de arquivos do usuário nem de bibliotecas externas.
+
+Os arquivos de imagem são válidos até onde o programa os lê (cabeçalhos completos), com um "miolo"
+de bytes para que tenham um tamanho próximo do real.
+"""
+
+import os
+import random
+import struct
+import zlib
+from dataclasses import dataclass
+
+from src.configs.precificacao import TabelaPrecos
+
+SEMENTE = 2024  # Mesmas amostras em todas as execuções (resultados comparáveis)
+FORMATOS = ("jpg", "png", "tif", "pdf")
+TAMANHO_MIOLO = 256 * 1024  # Bytes extras em cada imagem (o programa não deve lê-los)
+
+
+@dataclass
+class OrcamentoSintetico:
+    """Colunas de um orçamento de N linhas, prontas para Orcamento.adicionar_colunas()."""
+
+    descricoes: list[str]
+    larguras: list[float]
+    alturas: list[float]
+    quantidades: list[int]
+    materiais: list[str]
+    acabamentos: list[str]
+
+    def __len__(self) -> int:
+        return len(self.descricoes)
+
+    def colunas(self) -> dict[str, list]:
+        """Argumentos nomeados de Orcamento.adicionar_colunas()."""
+        return vars(self).copy()
+
+    def areas(self) -> list[float]:
+        """Área de cada linha em m² (entrada do MotorPrecificacao)."""
+        return [largura * altura / 10_000 for largura, altura in zip(self.larguras, self.alturas)]
+
+
+def orcamento(linhas: int, tabela: TabelaPrecos | None = None) -> OrcamentoSintetico:
+    """Orçamento com medidas, quantidades, materiais e acabamentos variados (todos válidos na tabela)."""
+    tabela = tabela or TabelaPrecos()
+    sorteio = random.Random(SEMENTE)
+    materiais, acabamentos = list(tabela.materiais), list(tabela.acabamentos)
+    return OrcamentoSintetico(
+        descricoes=[f"ARTE_{indice:06d}.pdf" for indice in range(linhas)],
+        larguras=[round(sorteio.uniform(5, 300), 1) for _ in range(linhas)],
+        alturas=[round(sorteio.uniform(5, 500), 1) for _ in range(linhas)],
+        quantidades=[sorteio.randint(1, 50) for _ in range(linhas)],
+        materiais=[sorteio.choice(materiais) for _ in range(linhas)],
+        acabamentos=[sorteio.choice(acabamentos) for _ in range(linhas)],
+    )
+
+
+# ARQUIVOS ==============================
+def jpeg(largura: int, altura: int, dpi: int = 300, miolo: int = TAMANHO_MIOLO) -> bytes:
+    """JPEG com APP0/JFIF (densidade), SOF0 (dimensões) e um miolo de dados de imagem."""
+    jfif = b"JFIF\x00\x01\x01" + struct.pack(">BHHBB", 1, dpi, dpi, 0, 0)
+    sof = struct.pack(">BHHB", 8, altura, largura, 3) + b"\x01\x22\x00\x02\x11\x01\x03\x11\x01"
+    return (b"\xff\xd8" + _marcador(0xE0, jfif) + _marcador(0xC0, sof)
+            + _marcador(0xDA, b"\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00") + bytes(miolo) + b"\xff\xd9")
+
+
+def png(largura: int, altura: int, dpi: int = 300, alfa: bool = False) -> bytes:
+    """PNG RGB/RGBA de 8 bits, com pHYs e pixels reais (um degradê, comprimido de verdade)."""
+    canais = 4 if alfa else 3
+    linhas = b"".join(b"\x00" + bytes((x + y) % 256 for x in range(largura) for _ in range(canais))
+                      for y in range(altura))
+    por_metro = round(dpi / 0.0254)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _bloco_png(b"IHDR", struct.pack(">IIBBBBB", largura, altura, 8, 6 if alfa else 2, 0, 0, 0))
+            + _bloco_png(b"pHYs", struct.pack(">IIB", por_metro, por_metro, 1))
+            + _bloco_png(b"IDAT", zlib.compress(linhas, 6))
+            + _bloco_png(b"IEND", b""))
+
+
+def tiff(largura: int, altura: int, dpi: int = 300, miolo: int = TAMANHO_MIOLO) -> bytes:
+    """TIFF (little-endian) com uma IFD: dimensões, resolução em polegadas e um miolo de dados."""
+    entradas = ((256, 4, largura), (257, 4, altura), (282, 5, 0), (283, 5, 0), (296, 3, 2))
+    inicio_racionais = 8 + 2 + len(entradas) * 12 + 4
+    ifd = struct.pack("<H", len(entradas))
+    for indice, (tag, tipo, valor) in enumerate(entradas):
+        if tipo == 5:
+            valor = inicio_racionais + (indice - 2) * 8
+        ifd += struct.pack("<HHII", tag, tipo, 1, valor) if tipo != 3 else struct.pack("<HHIHH", tag, tipo, 1, valor, 0)
+    return b"II*\x00" + struct.pack("<I", 8) + ifd + struct.pack("<I", 0) + struct.pack("<IIII", dpi, 1, dpi, 1) \
+        + bytes(miolo)
+
+
+def pdf(paginas: int = 4, largura_pt: float = 595.0, altura_pt: float = 842.0) -> bytes:
+    """PDF simples com várias páginas do mesmo tamanho (MediaBox) e um conteúdo de texto em cada."""
+    objetos = ["<< /Type /Catalog /Pages 2 0 R >>",
+               f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(paginas))}] /Count {paginas} >>"]
+    for indice in range(paginas):
+        conteudo = f"BT /F1 24 Tf 72 720 Td (Pagina {indice + 1}) Tj ET " + "0 0 m 595 842 l S " * 200
+        objetos.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {largura_pt} {altura_pt}] "
+                       f"/Contents {4 + 2 * indice} 0 R >>")
+        objetos.append(f"<< /Length {len(conteudo)} >>\nstream\n{conteudo}\nendstream")
+
+    corpo, posicoes = bytearray(b"%PDF-1.4\n"), []
+    for numero, objeto in enumerate(objetos, start=1):
+        posicoes.append(len(corpo))
+        corpo += f"{numero} 0 obj\n{objeto}\nendobj\n".encode("latin-1")
+    xref = len(corpo)
+    corpo += f"xref\n0 {len(objetos) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    corpo += "".join(f"{posicao:010d} 00000 n \n" for posicao in posicoes).encode("latin-1")
+    corpo += f"trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return bytes(corpo)
+
+
+def arquivos_impressao(pasta: str, quantidade: int) -> list[str]:
+    """
+    Grava 'quantidade' arquivos de impressão (formatos alternados, tamanhos variados) e retorna os caminhos.
+    Os arquivos já gravados numa execução anterior na mesma pasta são reaproveitados.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    sorteio = random.Random(SEMENTE)
+    geradores = {"jpg": jpeg, "tif": tiff,
+                 "png": lambda largura, altura: png(64, 64),  # Pixels reais: pequeno, para a geração ser rápida
+                 "pdf": lambda largura, altura: pdf(paginas=sorteio.randint(1, 8))}
+    caminhos = []
+    for indice in range(quantidade):
+        formato = FORMATOS[indice % len(FORMATOS)]
+        largura, altura = sorteio.randint(500, 12_000), sorteio.randint(500, 12_000)
+        caminho = os.path.join(pasta, f"arte_{indice:06d}.{formato}")
+        if not os.path.exists(caminho):
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(geradores[formato](largura, altura))
+        caminhos.append(caminho)
+    return caminhos
+
+
+def planilha_csv(caminho: str, dados: OrcamentoSintetico) -> str:
+    """Grava o orçamento como a planilha de um pedido (CSV com ';' e vírgula decimal, como o Excel brasileiro)."""
+    with open(caminho, "w", encoding="utf-8-sig", newline="") as arquivo:
+        arquivo.write("Descrição;Largura (cm);Altura (cm);Qtd;Material;Acabamento\n")
+        for linha in zip(dados.descricoes, dados.larguras, dados.alturas, dados.quantidades,
+                         dados.materiais, dados.acabamentos):
+            descricao, largura, altura, quantidade, material, acabamento = linha
+            arquivo.write(f"{descricao};{str(largura).replace('.', ',')};{str(altura).replace('.', ',')};"
+                          f"{quantidade};{material};{acabamento}\n")
+    return caminho
+
+
+# INTERNOS ==============================
+def _marcador(codigo: int, conteudo: bytes) -> bytes:
+    """Metodo Privado. Segmento JPEG: 0xFF, código, tamanho (inclui os 2 bytes do tamanho) e conteúdo."""
+    return bytes((0xFF, codigo)) + struct.pack(">H", len(conteudo) + 2) + conteudo
+
+
+def _bloco_png(tipo: bytes, dados: bytes) -> bytes:
+    """Metodo Privado. Bloco PNG: tamanho, tipo, dados e CRC."""
+    return struct.pack(">I", len(dados)) + tipo + dados + struct.pack(">I", zlib.crc32(tipo + dados))
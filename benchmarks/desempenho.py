@@ -0,0 +1,349 @@
+"""
+Benchmarks das etapas do Orça Fácil, sem janela (não importa customtkinter nem a View).
+
+Etapas (cada uma com orçamentos sintéticos de 10, 1 mil, 10 mil e 100 mil linhas):
+  precificacao   MotorPrecificacao.calcular() sobre as colunas do orçamento
+  orcamento      Orcamento.adicionar_colunas() + totais (armazenamento por colunas e soma incremental)
+  validacao      Validador.validar() de todas as linhas
+  planilha       Leitura de um CSV do pedido em lotes (model/planilhas.ler_lotes)
+  ingestao       Análise dos cabeçalhos de arquivos de impressão (JPEG, PNG, TIFF, PDF), no próprio processo
+  ingestao_pool  O mesmo pelo pipeline do programa (IngestaoArquivos: pool de processos + cache), a frio
+  pdf            GeradorPDF.gerar() do orçamento inteiro
+  repositorio    RepositorioOrcamentos.salvar() (SQLite, uma transação)
+
+Para cada etapa: tempo (melhor de N repetições), itens por segundo e pico de memória do Python
+(tracemalloc, numa passada separada para não distorcer o tempo; o pico dos processos do pool não entra).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.desempenho --saida benchmarks/base.json          # grava a referência
+    python -m benchmarks.desempenho --base benchmarks/base.json           # compara com a referência
+    python -m benchmarks.desempenho --etapas pdf repositorio --tamanhos 1000 10000
+
+Com --base, sai com código 1 se alguma etapa ficar mais lenta (ou usar mais memória) que a referência
+além da tolerância.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable
+
+from benchmarks import amostras
+
+VERSAO_FORMATO = 1
+TAMANHOS = (10, 1_000, 10_000, 100_000)
+ARQUIVOS_MAXIMOS = 1_000  # Arquivos distintos gerados para a ingestão (as linhas além disso repetem arquivos)
+TOLERANCIA = 0.25  # Piora aceita em relação à referência (25%)
+MEMORIA_MINIMA_KB = 256  # Diferenças de memória abaixo disso são ruído, não regressão
+TEMPO_MINIMO = 1e-4  # Diferenças de tempo abaixo disso (100 µs) também
+DURACAO_MINIMA = 0.05  # Etapas mais rápidas que isso são repetidas em série dentro de cada medição (como o timeit)
+
+
+@dataclass
+class Resultado:
+    """Medição de uma etapa com um tamanho de orçamento."""
+
+    etapa: str
+    linhas: int
+    itens: int  # Itens efetivamente processados (ex.: arquivos distintos no ingestao_pool)
+    segundos: float
+    itens_por_segundo: float
+    pico_memoria_kb: float | None
+
+    @property
+    def chave(self) -> str:
+        return f"{self.etapa}/{self.linhas}"
+
+
+class Contexto:
+    """Pasta temporária e amostras já geradas (reaproveitadas entre as etapas do mesmo tamanho)."""
+
+    def __init__(self, pasta: str) -> None:
+        self.pasta = pasta
+        self._orcamentos: dict[int, amostras.OrcamentoSintetico] = {}
+        self._arquivos: list[str] = []
+        self.fundo = os.path.join(pasta, "fundo.jpg")
+        self.logo = os.path.join(pasta, "logo.png")
+        with open(self.fundo, "wb") as arquivo:
+            arquivo.write(amostras.jpeg(2480, 3508, miolo=512 * 1024))
+        with open(self.logo, "wb") as arquivo:
+            arquivo.write(amostras.png(320, 120, alfa=True))
+
+    def orcamento(self, linhas: int) -> amostras.OrcamentoSintetico:
+        if linhas not in self._orcamentos:
+            self._orcamentos[linhas] = amostras.orcamento(linhas)
+        return self._orcamentos[linhas]
+
+    def orcamento_precificado(self, linhas: int):
+        from src.orca_facil.model.model import Orcamento
+        orcamento = Orcamento()
+        orcamento.adicionar_colunas(**self.orcamento(linhas).colunas())
+        return orcamento
+
+    def arquivos(self, quantidade: int) -> list[str]:
+        if len(self._arquivos) < quantidade:
+            self._arquivos = amostras.arquivos_impressao(os.path.join(self.pasta, "arquivos"), quantidade)
+        return self._arquivos[:quantidade]
+
+
+# ETAPAS ==============================
+# Cada etapa prepara as entradas (fora da medição) e devolve a função medida, que retorna os itens processados.
+def etapa_precificacao(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.configs.precificacao import MotorPrecificacao
+    dados = contexto.orcamento(linhas)
+    motor, areas = MotorPrecificacao(), dados.areas()
+
+    def medir() -> int:
+        motor.calcular(areas, dados.quantidades, dados.materiais, dados.acabamentos)
+        return linhas
+    return medir
+
+
+def etapa_orcamento(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.model.model import Orcamento
+    colunas = contexto.orcamento(linhas).colunas()
+
+    def medir() -> int:
+        orcamento = Orcamento()
+        orcamento.adicionar_colunas(**colunas)
+        _ = orcamento.resultado  # Força o cálculo dos totais
+        return linhas
+    return medir
+
+
+def etapa_validacao(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.model.validacao import validador_da_tabela
+    orcamento = contexto.orcamento_precificado(linhas)
+    validador = validador_da_tabela(orcamento.motor.tabela)
+
+    def medir() -> int:
+        validador.validar(orcamento.colunas)
+        return linhas
+    return medir
+
+
+def etapa_planilha(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.model.planilhas import ler_lotes
+    caminho = amostras.planilha_csv(os.path.join(contexto.pasta, f"pedido_{linhas}.csv"), contexto.orcamento(linhas))
+
+    def medir() -> int:
+        return sum(len(lote) for lote, _ in ler_lotes(caminho))
+    return medir
+
+
+def etapa_ingestao(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.model.arquivos import analisar_arquivo
+    arquivos = contexto.arquivos(min(linhas, ARQUIVOS_MAXIMOS))
+    caminhos = [arquivos[indice % len(arquivos)] for indice in range(linhas)]
+
+    def medir() -> int:
+        for caminho in caminhos:
+            analisar_arquivo(caminho)
+        return linhas
+    return medir
+
+
+def etapa_ingestao_pool(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.controller.ingestao import IngestaoArquivos
+    from src.orca_facil.model.cache import CacheMetadados
+    arquivos = contexto.arquivos(min(linhas, ARQUIVOS_MAXIMOS))
+    rodada = iter(range(sys.maxsize))
+
+    def medir() -> int:
+        # Cache novo a cada repetição (a frio); o tempo inclui a criação do pool de processos
+        ingestao = IngestaoArquivos(cache=CacheMetadados(os.path.join(contexto.pasta, f"cache_{next(rodada)}.json")))
+        ingestao.iniciar(arquivos)
+        coletados = 0
+        while coletados < len(arquivos):
+            coletados += len(ingestao.coletar(limite=len(arquivos)))
+            time.sleep(0.001)
+        ingestao.encerrar()
+        return coletados
+    return medir
+
+
+def etapa_pdf(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.results.saida import CabecalhoPDF, GeradorPDF, LinhaPDF
+    orcamento = contexto.orcamento_precificado(linhas)
+    gerador = GeradorPDF(contexto.fundo, contexto.logo)
+    cabecalho = CabecalhoPDF(numero="1", cliente="Cliente Teste", perfil="Padrão")
+    destino = os.path.join(contexto.pasta, f"orcamento_{linhas}.pdf")
+
+    def medir() -> int:
+        itens = (LinhaPDF(linha.descricao, linha.material, linha.acabamento, linha.largura_cm, linha.altura_cm,
+                          linha.quantidade, linha.valor) for linha in orcamento.linhas())
+        gerador.gerar(destino, cabecalho, itens, orcamento.resultado)
+        return linhas
+    return medir
+
+
+def etapa_repositorio(contexto: Contexto, linhas: int) -> Callable[[], int]:
+    from src.orca_facil.model.repositorio import RepositorioOrcamentos
+    orcamento = contexto.orcamento_precificado(linhas)
+    repositorio = RepositorioOrcamentos(os.path.join(contexto.pasta, f"orcamentos_{linhas}.sqlite3"))
+    numeros = iter(range(1, sys.maxsize))
+
+    def medir() -> int:
+        repositorio.salvar(orcamento, next(numeros), "Cliente Teste", "", "Padrão")
+        return linhas
+    return medir
+
+
+ETAPAS: dict[str, Callable[[Contexto, int], Callable[[], int]]] = {
+    "precificacao": etapa_precificacao,
+    "orcamento": etapa_orcamento,
+    "validacao": etapa_validacao,
+    "planilha": etapa_planilha,
+    "ingestao": etapa_ingestao,
+    "ingestao_pool": etapa_ingestao_pool,
+    "pdf": etapa_pdf,
+    "repositorio": etapa_repositorio,
+}
+
+
+# MEDIÇÃO ==============================
+def medir_etapa(contexto: Contexto, etapa: str, linhas: int, repeticoes: int, memoria: bool) -> Resultado:
+    """Prepara a etapa, mede o melhor tempo de N repetições e, numa passada separada, o pico de memória."""
+    medir = ETAPAS[etapa](contexto, linhas)
+
+    # 1. Calibragem: quantas execuções seguidas cabem em DURACAO_MINIMA (etapas de microssegundos são ruidosas)
+    inicio = time.perf_counter()
+    itens = medir()
+    vezes = max(1, int(DURACAO_MINIMA / max(time.perf_counter() - inicio, 1e-9)))
+
+    # 2. Tempo: melhor de N (o coletor de lixo é adiado para não cair no meio de uma medição)
+    tempos = []
+    for _ in range(repeticoes):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            for _ in range(vezes):
+                medir()
+            tempos.append((time.perf_counter() - inicio) / vezes)
+        finally:
+            gc.enable()
+    segundos = min(tempos)
+
+    # 3. Memória: pico alocado pelo Python durante uma execução
+    pico_kb = None
+    if memoria:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            medir()
+            pico_kb = (tracemalloc.get_traced_memory()[1] - base) / 1024
+        finally:
+            tracemalloc.stop()
+
+    return Resultado(etapa, linhas, itens, segundos, itens / segundos if segundos else 0.0, pico_kb)
+
+
+def comparar(resultados: list[Resultado], base: dict, tolerancia: float) -> list[str]:
+    """
+    Compara com uma execução de referência (JSON gravado com --saida).
+
+    :return: Descrição das regressões encontradas (vazia se nenhuma).
+    """
+    referencias = base.get("resultados", {})
+    regressoes = []
+    print(f"\n{'etapa/linhas':<26}{'tempo':>12}{'ref.':>12}{'var.':>9}{'memória':>12}{'ref.':>12}")
+    for resultado in resultados:
+        referencia = referencias.get(resultado.chave)
+        if referencia is None:
+            continue
+        variacao = resultado.segundos / referencia["segundos"] - 1 if referencia["segundos"] else 0.0
+        marca = ""
+        if variacao > tolerancia and resultado.segundos - referencia["segundos"] > TEMPO_MINIMO:
+            marca = "  << MAIS LENTO"
+            regressoes.append(f"{resultado.chave}: tempo {variacao:+.0%}")
+
+        memoria, memoria_ref = resultado.pico_memoria_kb, referencia.get("pico_memoria_kb")
+        if memoria is not None and memoria_ref is not None and memoria - memoria_ref > MEMORIA_MINIMA_KB \
+                and memoria > memoria_ref * (1 + tolerancia):
+            marca += "  << MAIS MEMÓRIA"
+            regressoes.append(f"{resultado.chave}: memória {memoria / memoria_ref - 1:+.0%}" if memoria_ref
+                              else f"{resultado.chave}: memória {memoria:.0f} KB")
+
+        print(f"{resultado.chave:<26}{_tempo(resultado.segundos):>12}{_tempo(referencia['segundos']):>12}"
+              f"{variacao:>+9.0%}{_memoria(memoria):>12}{_memoria(memoria_ref):>12}{marca}")
+    return regressoes
+
+
+def main(argumentos=None) -> int:
+    leitor = argparse.ArgumentParser(description="Benchmarks do Orça Fácil (sem janela)")
+    leitor.add_argument("--etapas", nargs="+", choices=list(ETAPAS), default=list(ETAPAS), help="etapas a medir")
+    leitor.add_argument("--tamanhos", nargs="+", type=int, default=list(TAMANHOS), help="linhas dos orçamentos")
+    leitor.add_argument("--repeticoes", type=int, default=3, help="repetições por medição (vale a melhor)")
+    leitor.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória (mais rápido)")
+    leitor.add_argument("--saida", metavar="ARQUIVO", help="grava os resultados em JSON (ex.: a referência)")
+    leitor.add_argument("--base", metavar="ARQUIVO", help="compara com os resultados de referência (JSON)")
+    leitor.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="piora aceita (padrão: 0.25)")
+    opcoes = leitor.parse_args(argumentos)
+
+    resultados = []
+    with tempfile.TemporaryDirectory(prefix="orca_bench_") as pasta:
+        os.environ["ORCA_FACIL_DADOS"] = pasta  # Caches e bancos do programa ficam na pasta temporária
+        contexto = Contexto(pasta)
+        print(f"{'etapa':<15}{'linhas':>8}{'tempo':>12}{'itens/s':>14}{'memória':>12}")
+        for linhas in opcoes.tamanhos:
+            for etapa in opcoes.etapas:
+                resultado = medir_etapa(contexto, etapa, linhas, max(1, opcoes.repeticoes), not opcoes.sem_memoria)
+                resultados.append(resultado)
+                print(f"{etapa:<15}{linhas:>8}{_tempo(resultado.segundos):>12}"
+                      f"{resultado.itens_por_segundo:>14,.0f}{_memoria(resultado.pico_memoria_kb):>12}")
+
+    if opcoes.saida:
+        with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(_documento(resultados, opcoes.repeticoes), arquivo, ensure_ascii=False, indent=2)
+        print(f"\nResultados gravados em {opcoes.saida}")
+
+    if opcoes.base:
+        with open(opcoes.base, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), opcoes.tolerancia)
+        if regressoes:
+            print("\nRegressões:\n  " + "\n  ".join(regressoes))
+            return 1
+        print("\nSem regressões.")
+    return 0
+
+
+# INTERNOS ==============================
+def _documento(resultados: list[Resultado], repeticoes: int) -> dict:
+    """Metodo Privado. Resultados + ambiente da execução (para saber se duas execuções são comparáveis)."""
+    return {
+        "formato": VERSAO_FORMATO,
+        "quando": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sistema": platform.platform(),
+        "processadores": os.cpu_count(),
+        "repeticoes": repeticoes,
+        "resultados": {resultado.chave: asdict(resultado) for resultado in resultados},
+    }
+
+
+def _tempo(segundos: float) -> str:
+    """Metodo Privado. Tempo legível (µs, ms ou s)."""
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:.0f} µs"
+    return f"{segundos * 1e3:.1f} ms" if segundos < 1 else f"{segundos:.2f} s"
+
+
+def _memoria(kb: float | None) -> str:
+    """Metodo Privado. Memória legível (KB ou MB)."""
+    if kb is None:
+        return "-"
+    return f"{kb:.0f} KB" if kb < 1024 else f"{kb / 1024:.1f} MB"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Teste de estresse da numeração de orçamentos (model/numeracao.py).
+Vários processos, como várias estações na mesma pasta compartilhada, pedem números ao mesmo banco ao
+mesmo tempo. No fim, confere que nenhum número foi entregue duas vezes e que a sequência não tem buracos
+(todo número abaixo do contador foi usado ou está na tabela de devolvidos).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.estresse_numeracao
+    python -m benchmarks.estresse_numeracao --processos 32 --numeros 300 --blocos 1 10 50 --pasta /mnt/rede
+
+Sai com código 1 se encontrar números repetidos ou buracos.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from src.orca_facil.model.numeracao import AlocadorNumeros
+
+
+def estacao(caminho: str, tamanho_bloco: int, quantidade: int, largada: float) -> tuple[list[int], float]:
+    """
+    Uma "estação": espera a largada (para todos competirem juntos), pede os números e fecha o alocador,
+    devolvendo o que sobrou do último bloco.
+
+    :return: (números recebidos, segundos gastos)
+    """
+    alocador = AlocadorNumeros(caminho, tamanho_bloco)
+    time.sleep(max(0.0, largada - time.time()))
+    inicio = time.perf_counter()
+    numeros = [alocador.proximo() for _ in range(quantidade)]
+    alocador.fechar()
+    return numeros, time.perf_counter() - inicio
+
+
+def rodada(pasta: str, processos: int, numeros: int, tamanho_bloco: int) -> bool:
+    """Executa uma rodada com um banco novo e imprime o resultado. Retorna False se a numeração falhou."""
+    caminho = os.path.join(pasta, f"numeracao_bloco{tamanho_bloco}.sqlite3")
+    for sufixo in ("", "-journal"):
+        if os.path.exists(caminho + sufixo):
+            os.remove(caminho + sufixo)
+    AlocadorNumeros(caminho).fechar()  # Cria o banco antes da largada
+
+    # Quantidades diferentes por estação, para que sobrem números nos blocos (e sejam devolvidos)
+    quantidades = [numeros - indice % max(1, tamanho_bloco) for indice in range(processos)]
+    largada = time.time() + 1.0
+    contexto = multiprocessing.get_context("spawn")  # O mesmo modo do Windows
+    with ProcessPoolExecutor(processos, mp_context=contexto) as executor:
+        resultados = list(executor.map(estacao, [caminho] * processos, [tamanho_bloco] * processos,
+                                       quantidades, [largada] * processos))
+
+    # Conferência
+    usados = [numero for recebidos, _ in resultados for numero in recebidos]
+    repetidos = sum(vezes - 1 for vezes in Counter(usados).values() if vezes > 1)
+    with sqlite3.connect(caminho) as conexao:
+        proximo = conexao.execute("SELECT proximo FROM contador").fetchone()[0]
+        livres = {numero for (numero,) in conexao.execute("SELECT numero FROM livres")}
+    buracos = len(set(range(1, proximo)) - set(usados) - livres)
+
+    duracao = max(segundos for _, segundos in resultados)
+    print(f"bloco {tamanho_bloco:>4} | {len(usados):>7} números | {len(usados) / duracao:>9.0f} números/s | "
+          f"repetidos {repetidos} | buracos {buracos} | devolvidos {len(livres)}")
+    return repetidos == 0 and buracos == 0
+
+
+def main(argumentos=None) -> int:
+    leitor = argparse.ArgumentParser(description="Teste de estresse da numeração de orçamentos")
+    leitor.add_argument("--processos", type=int, default=16, help="estações simultâneas (padrão: 16)")
+    leitor.add_argument("--numeros", type=int, default=200, help="números pedidos por estação (padrão: 200)")
+    leitor.add_argument("--blocos", type=int, nargs="+", default=[1, 10, 50], help="tamanhos de bloco a comparar")
+    leitor.add_argument("--pasta", help="pasta do banco (ex.: a pasta de rede). Padrão: uma pasta temporária")
+    opcoes = leitor.parse_args(argumentos)
+
+    print(f"{opcoes.processos} processos x {opcoes.numeros} números")
+    with tempfile.TemporaryDirectory() as temporaria:
+        pasta = opcoes.pasta or temporaria
+        resultados = [rodada(pasta, opcoes.processos, opcoes.numeros, bloco) for bloco in opcoes.blocos]
+    return 0 if all(resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""
+Módulo de configurações de caminhos.
+Responsabilidade: Centralizar onde o programa guarda os seus dados locais (caches, perfis, bancos de dados).
+"""
+
+import os
+
+# Pasta de dados do usuário. Pode ser trocada pela variável de ambiente ORCA_FACIL_DADOS (ex.: pasta compartilhada).
+PASTA_DADOS_PADRAO = os.path.join(os.path.expanduser("~"), ".orca_facil")
+
+
+def pasta_dados(*partes: str) -> str:
+    """
+    Retorna um caminho dentro da pasta de dados, criando as pastas necessárias.
+
+    :param partes: Subpastas e/ou nome do arquivo dentro da pasta de dados.
+    """
+    raiz = os.environ.get("ORCA_FACIL_DADOS", PASTA_DADOS_PADRAO)
+    caminho = os.path.join(raiz, *partes)
+
+    # Cria a pasta (ou a pasta do arquivo, quando o último item tem extensão)
+    pasta = os.path.dirname(caminho) if os.path.splitext(caminho)[1] else caminho
+    os.makedirs(pasta, exist_ok=True)
+    return caminho
+
+
+def pasta_compartilhada(*partes: str) -> str:
+    """
+    Retorna um caminho dentro da pasta compartilhada entre as estações (ex.: numeração dos orçamentos).
+    A pasta é definida pela variável de ambiente ORCA_FACIL_COMPARTILHADO; sem ela, usa a pasta de dados local.
+
+    :param partes: Subpastas e/ou nome do arquivo dentro da pasta compartilhada.
+    """
+    raiz = os.environ.get("ORCA_FACIL_COMPARTILHADO")
+    if not raiz:
+        return pasta_dados(*partes)
+
+    caminho = os.path.join(raiz, *partes)
+    pasta = os.path.dirname(caminho) if os.path.splitext(caminho)[1] else caminho
+    os.makedirs(pasta, exist_ok=True)
+    return caminho
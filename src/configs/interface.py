@@ -4,6 +4,7 @@ Responsabilidade: Centralizar e simplificar a criação e manutenção das confi
 """
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 
 @dataclass
@@ -38,7 +39,13 @@ class Cores:
 
 @dataclass
 class Fontes:
-    """Define tipos, tamanhos e cores das fontes do programa"""
+    """
+    Define tipos, tamanhos e cores das fontes do programa.
+
+    > Por que as fontes são guardadas?
+    As tuplas (tipo, tamanho, negrito) são montadas uma vez, na criação. E objeto_fonte() cria um único
+    CTkFont por estilo, compartilhado por todos os widgets (em vez de cada widget criar a sua fonte no Tk).
+    """
 
     tipo_geral: str = "verdana"
 
@@ -50,7 +57,7 @@ class Fontes:
     @property
     def fonte_padrao(self) -> tuple:
         """Configura o padrão de tipo, tamanho e negrito da fonte do programa"""
-        return self.tipo_padrao, self.tamanho_padrao, self.negrito_padrao
+        return self._tuplas["padrao"]
 
     # TÍTULO =============================================
     tipo_titulo: str = tipo_geral
@@ -60,7 +67,7 @@ class Fontes:
     @property
     def fonte_titulo(self) -> tuple:
         """Configura o tipo, tamanho e negrito da fonte para títulos"""
-        return self.tipo_titulo, self.tamanho_titulo, self.negrito_titulo
+        return self._tuplas["titulo"]
 
     # BOTÕES =============================================
     tipo_botao: str = tipo_geral
@@ -70,7 +77,7 @@ class Fontes:
     @property
     def fonte_botao(self) -> tuple:
         """Padroniza tipo, tamanho e negrito dos botões"""
-        return self.tipo_botao, self.tamanho_botao, self.negrito_botao
+        return self._tuplas["botao"]
 
     # LABELS =============================================
     tipo_label: str = tipo_geral
@@ -80,59 +87,119 @@ class Fontes:
     @property
     def fonte_label(self) -> tuple:
         """Padroniza tipo, tamanho e negrito dos labels"""
-        return self.tipo_label, self.tamanho_label, self.negrito_label
-    @staticmethod
-    def fonte_status() -> tuple:
-        """Muda a cor do texto do label de Status"""
-        janelas = Janelas()
-        cores = Cores()
-
-        if janelas.modo == "dark":
-            cor_texto_status = cores.amarelo
-        else:
-            cor_texto_status = cores.laranja
-
-        return cor_texto_status
+        return self._tuplas["label"]
+
+    # DESTAQUE (valor total) =============================
+    tipo_destaque: str = tipo_geral
+    tamanho_destaque: int = 20
+    negrito_destaque: str = "bold"
+
+    @property
+    def fonte_destaque(self) -> tuple:
+        """Padroniza tipo, tamanho e negrito dos valores em destaque (ex.: valor total)"""
+        return self._tuplas["destaque"]
+
+    # CACHE =============================================
+    estilos: ClassVar[tuple[str, ...]] = ("padrao", "titulo", "botao", "label", "destaque")
+    _tuplas: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _objetos: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Monta as tuplas de todos os estilos uma única vez."""
+        self._tuplas = {estilo: (getattr(self, f"tipo_{estilo}"), getattr(self, f"tamanho_{estilo}"),
+                                 getattr(self, f"negrito_{estilo}")) for estilo in self.estilos}
+
+    def objeto_fonte(self, estilo: str):
+        """
+        Retorna o CTkFont do estilo (ex.: "botao"), criado no primeiro uso e compartilhado pelos widgets.
+        Só pode ser chamado depois de a janela principal existir (o Tk precisa de uma janela para criar fontes).
+
+        Raises:
+            ValueError: Se o estilo não existir.
+        """
+        fonte = self._objetos.get(estilo)
+        if fonte is None:
+            if estilo not in self._tuplas:
+                raise ValueError(f"Fonte '{estilo}' não encontrada. Estilos disponíveis: {', '.join(self.estilos)}")
+            from customtkinter import CTkFont  # Importado aqui: as configurações não dependem do Tk
+
+            tipo, tamanho, negrito = self._tuplas[estilo]
+            fonte = self._objetos[estilo] = CTkFont(family=tipo, size=tamanho, weight=negrito or "normal")
+        return fonte
+
+
 @dataclass
 class Gerais:
     """ Define outras características dos widgets."""
     raio_canto = 10
 
 
+@dataclass(frozen=True)
+class Paleta:
+    """Cores-base de um tema (usadas pelos widgets ao aplicar o seu estilo)."""
+
+    cor_principal: str
+    cor_principal_hover: str
+    cor_destaque: str
+
+
+def _paletas_padrao(cor: Cores) -> dict[str, Paleta]:
+    """Metodo Privado. Monta a paleta de cada tema disponível."""
+    return {
+        "Azul": Paleta(cor.azul_escuro, cor.azul_claro, cor.laranja),
+        "Verde": Paleta(cor.verde_escuro, cor.verde_claro, cor.laranja),
+        "Roxo": Paleta(cor.roxo_escuro, cor.roxo_claro, cor.laranja),
+    }
+
+
+# Registro de temas: nome → paleta (montadas uma única vez, na importação)
+TEMAS: dict[str, Paleta] = _paletas_padrao(Cores())
+
+# Cor do texto de status conforme o modo da janela ('dark' ou 'light')
+CORES_STATUS: dict[str, str] = {"dark": Cores.amarelo, "light": Cores.laranja}
+
+
+def registrar_tema(nome: str, paleta: Paleta) -> None:
+    """
+    Adiciona (ou substitui) um tema no registro. Ele passa a aparecer nas novas instâncias de Tema.
+
+    :param nome: Nome do tema (ex.: "Vermelho"); é guardado com a primeira letra maiúscula.
+    :param paleta: Cores-base do tema.
+    """
+    TEMAS[nome.capitalize()] = paleta
+
+
 @dataclass
 class Tema:
     """Define as cores do programa e permite alterar entre temas."""
 
-    # Instancia a classe de cores.
-    cor = Cores()
-
-    # Cria a lista de temas disponíveis
-    lista_tema: list[str] = field(default_factory=lambda: ["Azul", "Verde", "Roxo"])
+    # Cria a lista de temas disponíveis (os nomes do registro TEMAS)
+    lista_tema: list[str] = field(default_factory=lambda: list(TEMAS))
     """
     O parâmetro default_factory do field() espera uma função (callable)
     Isto é, algo que possa ser chamado para gerar o valor padrão.
     Ou seja, ele precisa de uma função que retorne o valor desejado.
-    lambda: ["Azul", "Verde", "Roxo"] é uma função anônima.
+    lambda: list(TEMAS) é uma função anônima.
     Ela será chamada quando o objeto for criado, retornando uma nova lista.
-    ["Azul", "Verde", "Roxo"] é apenas uma lista — um objeto pronto, não chamável.
     """
 
     # Define o tema atual
     tema_atual: str = "Verde"
 
-    # Atributos explicitamente definidos
-    cor_principal: str = f"{cor.verde_escuro}"
-    cor_principal_hover: str = f"{cor.verde_claro}"
-    cor_destaque: str = f"{cor.laranja}"
+    # Atributos explicitamente definidos (os mesmos da paleta do tema atual)
+    paleta: Paleta = TEMAS["Verde"]
+    cor_principal: str = paleta.cor_principal
+    cor_principal_hover: str = paleta.cor_principal_hover
+    cor_destaque: str = paleta.cor_destaque
 
     # Define as cores globais conforme o tema escolhido, sem alterar diretamente os widgets.
-    def aplicar_tema(self, tema: str = f"{tema_atual}") -> None:
+    def aplicar_tema(self, tema: str | None = None) -> None:
         """
         Redefine as cores-base do programa conforme o tema selecionado.
 
         Responsabilidade:
-            Este metodo atua no nível de configuração global, ajustando
-            os valores de cor associados ao tema ativo (ex.: Verde, Azul, Roxo).
+            Este metodo atua no nível de configuração global, trocando a paleta ativa
+            (ex.: Verde, Azul, Roxo) por uma única consulta ao registro TEMAS.
             Ele não altera diretamente a aparência dos widgets — apenas
             atualiza os atributos de cor que os widgets usam ao aplicar
             o seu próprio estilo.
@@ -148,26 +215,17 @@ class Tema:
             ValueError: Se o nome informado não corresponder a nenhum tema disponível.
         """
 
-        if tema:
-            self.tema_atual = tema.capitalize()  # Para garantir consistência com 'Verde', 'Azul', etc.
-
-        if tema == "Verde":
-            self.cor_principal = f"{self.cor.verde_escuro}"
-            self.cor_principal_hover = f"{self.cor.verde_claro}"
-            self.cor_destaque = f"{self.cor.laranja}"
+        nome = (tema or self.tema_atual).capitalize()  # Para garantir consistência com 'Verde', 'Azul', etc.
+        try:
+            paleta = TEMAS[nome]
+        except KeyError:
+            raise ValueError(f"Tema '{tema}' não encontrado. Temas disponíveis: {', '.join(TEMAS)}") from None
 
-        elif tema == "Azul":
-            self.cor_principal = f"{self.cor.azul_escuro}"
-            self.cor_principal_hover = f"{self.cor.azul_claro}"
-            self.cor_destaque = f"{self.cor.laranja}"
-
-        elif tema == "Roxo":
-            self.cor_principal = f"{self.cor.roxo_escuro}"
-            self.cor_principal_hover = f"{self.cor.roxo_claro}"
-            self.cor_destaque = f"{self.cor.laranja}"
-
-        else:
-            raise ValueError(f"Tema '{tema}' não encontrado. Temas disponíveis: {', '.join(self.lista_tema)}")
+        self.tema_atual = nome
+        self.paleta = paleta
+        self.cor_principal = paleta.cor_principal
+        self.cor_principal_hover = paleta.cor_principal_hover
+        self.cor_destaque = paleta.cor_destaque
 
 @dataclass
 class InterfaceVisual:
@@ -188,3 +246,8 @@ class InterfaceVisual:
     fontes: Fontes = field(default_factory=Fontes)
     gerais: Gerais = field(default_factory=Gerais)
     tema: Tema = field(default_factory=Tema)
+
+    @property
+    def cor_status(self) -> str:
+        """Cor do texto do label de Status conforme o modo da janela."""
+        return CORES_STATUS.get(self.janelas.modo, Cores.amarelo)
@@ -0,0 +1,215 @@
+"""
+Módulo de configurações de precificação.
+Responsabilidade: Centralizar a tabela de preços e calcular, em lote, todos os valores exibidos
+no bloco de precificação da Janela Principal (valor total, parcelado, parcelas, PIX e imposto).
+
+> Por que calcular por colunas?
+Um orçamento pode ter milhares de linhas (arquivos × tamanhos × quantidades).
+Em vez de percorrer item por item com código Python, o orçamento inteiro é recebido como
+colunas (áreas, quantidades, materiais, acabamentos) e cada etapa do cálculo é feita de uma vez
+com 'map' + funções do módulo 'operator', que rodam em C.
+O arredondamento em Decimal só acontece na etapa final, garantindo que os totais batam com o PDF centavo a centavo.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import repeat
+from operator import add, mul
+from typing import Sequence
+
+CENTAVO = Decimal("0.01")  # Unidade mínima de arredondamento (R$ 0,01)
+
+
+@dataclass
+class TabelaPrecos:
+    """Define os preços por m² de cada material e de cada acabamento, além das condições de pagamento."""
+
+    # PREÇOS POR M² ======================================
+    materiais: dict[str, float] = field(default_factory=lambda: {
+        "Lona": 45.00,
+        "Adesivo Vinil": 60.00,
+        "Banner": 50.00,
+        "Papel Fotográfico": 35.00,
+    })
+    acabamentos: dict[str, float] = field(default_factory=lambda: {
+        "Sem Acabamento": 0.00,
+        "Ilhós": 5.00,
+        "Bastão e Cordão": 8.00,
+        "Laminação": 15.00,
+    })
+
+    # Área mínima cobrada por peça (m²). Peças menores são cobradas como se tivessem esta área.
+    area_minima: float = 0.10
+
+    # LIMITES DA MÁQUINA (cm) =============================
+    medida_minima_cm: float = 1.0  # Menor lado aceito em uma peça
+    largura_maxima_cm: float = 320.0  # Largura útil da bobina: o menor lado da peça precisa caber nela
+    comprimento_maximo_cm: float = 5000.0  # Maior lado aceito em uma peça
+
+    # CONDIÇÕES DE PAGAMENTO =============================
+    parcelas: int = 3
+    juros_parcelamento: Decimal = Decimal("0.05")  # Acréscimo sobre o total quando parcelado
+    desconto_pix: Decimal = Decimal("0.05")  # Desconto sobre o total no PIX / dinheiro
+    aliquota_imposto: Decimal = Decimal("0.06")  # Imposto da nota fiscal sobre o total
+
+
+@dataclass
+class ResultadoPrecificacao:
+    """Reúne os valores de saída exibidos no bloco de precificação e no PDF."""
+
+    valores_itens: list[Decimal]
+    valor_total: Decimal
+    valor_parcelado: Decimal
+    parcelas: int
+    valor_parcela: Decimal
+    pix_dinheiro: Decimal
+    imposto_nota: Decimal
+    porcentagem_imposto: Decimal
+
+
+def arredondar(valor) -> Decimal:
+    """
+    Converte um valor (float ou Decimal) para Decimal com duas casas, arredondando meio centavo para cima.
+
+    O float é formatado com 6 casas antes da conversão para que erros de representação binária
+    (ex.: 2.675 guardado como 2.67499999...) não alterem o centavo final.
+    """
+    if not isinstance(valor, Decimal):
+        valor = Decimal(f"{valor:.6f}")
+    return valor.quantize(CENTAVO, rounding=ROUND_HALF_UP)
+
+
+def formatar_moeda(valor: Decimal) -> str:
+    """Formata um valor no padrão brasileiro (ex.: 1.234,56)."""
+    return f"{arredondar(valor):,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+class MotorPrecificacao:
+    """
+    Calcula os preços de um orçamento inteiro em uma única passada por colunas.
+
+    Etapas:
+      1. calcular_linhas(): valor bruto (float) de cada linha, sem arredondamento.
+      2. fechar(): arredonda cada linha em Decimal e deriva os totais a partir da soma exata.
+    """
+
+    def __init__(self, tabela: TabelaPrecos | None = None) -> None:
+        """
+        :param tabela: Tabela de preços usada no cálculo. Caso omitida, usa a tabela padrão.
+        """
+        self.tabela = tabela or TabelaPrecos()
+
+    def calcular(self, areas: Sequence[float], quantidades: Sequence[int],
+                 materiais: Sequence[str], acabamentos: Sequence[str]) -> ResultadoPrecificacao:
+        """
+        Calcula todos os valores de saída do orçamento.
+
+        :param areas: Área de uma peça de cada linha, em m².
+        :param quantidades: Quantidade de peças de cada linha.
+        :param materiais: Nome do material de cada linha (chave de TabelaPrecos.materiais).
+        :param acabamentos: Nome do acabamento de cada linha (chave de TabelaPrecos.acabamentos).
+        """
+        return self.fechar(self.calcular_linhas(areas, quantidades, materiais, acabamentos))
+
+    def calcular_linhas(self, areas: Sequence[float], quantidades: Sequence[int],
+                        materiais: Sequence[str], acabamentos: Sequence[str]) -> array:
+        """
+        Calcula o valor bruto de cada linha: max(área, área mínima) × quantidade × (preço material + preço acabamento).
+
+        Todas as colunas devem ter o mesmo tamanho.
+        Raises:
+            ValueError: Se as colunas tiverem tamanhos diferentes ou se algum material/acabamento não existir na tabela.
+        """
+
+        # 1. Confere se as colunas estão alinhadas
+        total_linhas = len(areas)
+        if not (len(quantidades) == len(materiais) == len(acabamentos) == total_linhas):
+            raise ValueError("As colunas do orçamento (áreas, quantidades, materiais, acabamentos) "
+                             "devem ter o mesmo tamanho")
+
+        # 2. Resolve o preço por m² de cada linha (consulta ao dicionário feita em C pelo 'map')
+        precos_materiais = self._resolver_precos(self.tabela.materiais, materiais, "Material")
+        precos_acabamentos = self._resolver_precos(self.tabela.acabamentos, acabamentos, "Acabamento")
+
+        return self._valores_brutos(areas, quantidades, precos_materiais, precos_acabamentos)
+
+    def calcular_linhas_codificadas(self, areas: Sequence[float], quantidades: Sequence[int],
+                                    codigos_materiais: Sequence[int], codigos_acabamentos: Sequence[int],
+                                    textos: Sequence[str]) -> array:
+        """
+        Igual a calcular_linhas(), mas com materiais e acabamentos representados por códigos de uma tabela de textos
+        (o armazenamento por colunas do Model). Cada nome é consultado na tabela de preços uma única vez.
+
+        :param textos: Tabela de textos: textos[código] é o nome do material/acabamento.
+        """
+        precos_materiais = self._resolver_precos(self.tabela.materiais, textos, "Material", codigos_materiais)
+        precos_acabamentos = self._resolver_precos(self.tabela.acabamentos, textos, "Acabamento",
+                                                   codigos_acabamentos)
+        return self._valores_brutos(areas, quantidades, precos_materiais, precos_acabamentos)
+
+    def _valores_brutos(self, areas, quantidades, precos_materiais, precos_acabamentos) -> array:
+        """Metodo Privado. Valor bruto = max(área, área mínima) × quantidade × (preço material + preço acabamento)."""
+
+        # 1. Aplica a área mínima por peça
+        areas_cobradas = map(max, areas, repeat(self.tabela.area_minima, len(areas)))
+
+        # 2. Multiplica pela quantidade e pelo preço por m² da linha
+        areas_totais = map(mul, areas_cobradas, quantidades)
+        precos_m2 = map(add, precos_materiais, precos_acabamentos)
+        return array("d", map(mul, areas_totais, precos_m2))
+
+    def valor_linha(self, area: float, quantidade: int, material: str, acabamento: str) -> Decimal:
+        """
+        Calcula o valor arredondado de UMA linha (usado quando o operador edita um único item).
+        Segue exatamente a mesma ordem de operações de calcular_linhas(), para dar o mesmo centavo.
+        """
+        return arredondar(self.calcular_linhas([area], [quantidade], [material], [acabamento])[0])
+
+    def fechar(self, valores_brutos: Sequence[float]) -> ResultadoPrecificacao:
+        """
+        Etapa final: arredonda cada linha em Decimal e calcula os totais a partir da soma exata das linhas.
+        Assim, a soma dos itens impressa no PDF é sempre igual ao VALOR TOTAL.
+        """
+        valores_itens = list(map(arredondar, valores_brutos))
+        resultado = self.totais(sum(valores_itens, Decimal("0.00")))
+        resultado.valores_itens = valores_itens
+        return resultado
+
+    def totais(self, valor_total: Decimal) -> ResultadoPrecificacao:
+        """
+        Deriva os valores de pagamento a partir do valor total já arredondado.
+
+        O valor parcelado é sempre 'parcelas × valor da parcela', para que os dois números exibidos fechem.
+        """
+        tabela = self.tabela
+        valor_total = arredondar(valor_total)
+
+        valor_parcela = arredondar(valor_total * (1 + tabela.juros_parcelamento) / tabela.parcelas)
+
+        return ResultadoPrecificacao(
+            valores_itens=[],
+            valor_total=valor_total,
+            valor_parcelado=valor_parcela * tabela.parcelas,
+            parcelas=tabela.parcelas,
+            valor_parcela=valor_parcela,
+            pix_dinheiro=arredondar(valor_total * (1 - tabela.desconto_pix)),
+            imposto_nota=arredondar(valor_total * tabela.aliquota_imposto),
+            porcentagem_imposto=arredondar(tabela.aliquota_imposto * 100),
+        )
+
+    @staticmethod
+    def _resolver_precos(precos: dict[str, float], nomes: Sequence[str], descricao: str,
+                         codigos: Sequence[int] | None = None) -> list[float]:
+        """
+        Metodo Privado. Converte a coluna de nomes em uma coluna de preços por m².
+        Com 'codigos', 'nomes' é a tabela de textos e só os nomes usados são consultados.
+        """
+        try:
+            if codigos is None:
+                return list(map(precos.__getitem__, nomes))
+            por_codigo = {codigo: precos[nomes[codigo]] for codigo in set(codigos)}
+            return list(map(por_codigo.__getitem__, codigos))
+        except KeyError as erro:
+            raise ValueError(f"{descricao} '{erro.args[0]}' não encontrado. "
+                             f"Disponíveis: {', '.join(precos)}") from None
@@ -0,0 +1,126 @@
+"""
+Módulo de configurações de registro (logging).
+Responsabilidade: Centralizar as mensagens de todos os módulos, com níveis e um nome por subsistema
+(MAIN, CONTROLLER, VIEW, WIDGETS, RESULTS, PERFIS), substituindo os antigos console() de cada módulo.
+
+> Por que uma fila?
+Escrever no console pode travar (terminal lento, saída redirecionada) e a escrita acontecia na thread do Tk.
+Aqui, a thread que registra só coloca o registro numa fila (QueueHandler); uma thread em segundo plano
+(QueueListener) formata e escreve nos destinos: o console colorido (opcional) e/ou um arquivo.
+
+> E quando o nível está desligado?
+logger.debug("Criando botão %s", texto) não formata nada se DEBUG estiver desligado: o custo é uma
+comparação de nível (que o próprio logging guarda em cache). Por isso as mensagens usam '%s' e não f-strings.
+
+Nível padrão: INFO. Pode ser trocado pela variável de ambiente ORCA_FACIL_LOG (ex.: DEBUG, WARNING).
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+RAIZ = "orca_facil"  # Logger pai de todos os subsistemas
+NIVEL_PADRAO = "INFO"
+
+# Cores ANSI de cada subsistema no console (as mesmas dos antigos console())
+CORES = {
+    "MAIN": "\033[95m",  # MAGENTA
+    "CONTROLLER": "\033[94m",  # AZUL
+    "VIEW": "\033[93m",  # AMARELO
+    "WIDGETS": "\033[96m",  # CIANO
+    "RESULTS": "\033[92m",  # VERDE
+    "PERFIS": "\033[35m",  # MAGENTA ESCURO
+}
+COR_AVISO = "\033[91m"  # VERMELHO para WARNING e acima
+SEM_COR = "\033[0m"
+
+_ouvinte: logging.handlers.QueueListener | None = None
+
+
+class FormatoColorido(logging.Formatter):
+    """Formata como os antigos console(): '[SUBSISTEMA] mensagem.' na cor do subsistema."""
+
+    def format(self, registro: logging.LogRecord) -> str:
+        subsistema = registro.name.rpartition(".")[2]
+        cor = COR_AVISO if registro.levelno >= logging.WARNING else CORES.get(subsistema, "")
+        return f"{cor}[{subsistema}] {registro.getMessage()}.{SEM_COR}"
+
+
+def registro(subsistema: str) -> logging.Logger:
+    """
+    Retorna o logger de um subsistema (ex.: registro("WIDGETS")).
+    Pode ser chamado na importação do módulo: as mensagens só saem depois de configurar_registro().
+    """
+    return logging.getLogger(f"{RAIZ}.{subsistema}")
+
+
+def configurar_registro(nivel: str | int | None = None, console: bool = True, arquivo: str | None = None) -> None:
+    """
+    Liga o registro: fila + thread de escrita + destinos. Chamar uma vez, no início do programa.
+    Chamadas seguintes substituem a configuração anterior.
+
+    :param nivel: Nível mínimo (ex.: "DEBUG"). Caso omitido, usa ORCA_FACIL_LOG ou INFO.
+                  Um nível desconhecido (ex.: "verbose") vira INFO, com um aviso no próprio registro.
+    :param console: Se True, escreve no console com as cores de cada subsistema.
+    :param arquivo: Caminho de um arquivo de registro (opcional, sem cores e com data/hora).
+    """
+    global _ouvinte
+    encerrar_registro()
+
+    # 1. Destinos (executados na thread do QueueListener, fora da thread do Tk)
+    destinos: list[logging.Handler] = []
+    if console:
+        saida = logging.StreamHandler()
+        saida.setFormatter(FormatoColorido())
+        destinos.append(saida)
+    if arquivo:
+        gravacao = logging.FileHandler(arquivo, encoding="utf-8")
+        gravacao.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        destinos.append(gravacao)
+
+    # 2. O logger raiz do programa só enfileira
+    raiz = logging.getLogger(RAIZ)
+    for manipulador in list(raiz.handlers):
+        raiz.removeHandler(manipulador)
+    fila: queue.SimpleQueue = queue.SimpleQueue()
+    raiz.addHandler(logging.handlers.QueueHandler(fila))
+    pedido = nivel if nivel is not None else os.environ.get("ORCA_FACIL_LOG", NIVEL_PADRAO)
+    nivel_aplicado = _resolver_nivel(pedido)
+    valido = nivel_aplicado is not None
+    raiz.setLevel(nivel_aplicado if valido else NIVEL_PADRAO)
+    raiz.propagate = False
+
+    # 3. Thread que esvazia a fila
+    _ouvinte = logging.handlers.QueueListener(fila, *destinos, respect_handler_level=True)
+    _ouvinte.start()
+    if not valido:
+        registro("MAIN").warning("Nível de registro desconhecido %r (parâmetro ou ORCA_FACIL_LOG). Usando %s",
+                                 pedido, NIVEL_PADRAO)
+
+
+def _resolver_nivel(pedido) -> str | int | None:
+    """
+    Metodo Privado.
+    Nível aceito por setLevel(): números (ex.: logging.WARNING, vindo dos processos do pool) passam direto;
+    nomes são conferidos sem diferenciar maiúsculas. Retorna None se o nível for desconhecido.
+    """
+    if isinstance(pedido, int):
+        return pedido
+    if isinstance(pedido, str) and pedido.upper() in logging.getLevelNamesMapping():
+        return pedido.upper()
+    return None
+
+
+def encerrar_registro() -> None:
+    """Escreve o que ainda estiver na fila e para a thread de escrita (chamado automaticamente ao sair)."""
+    global _ouvinte
+    if _ouvinte is not None:
+        _ouvinte.stop()
+        for destino in _ouvinte.handlers:
+            destino.close()
+        _ouvinte = None
+
+
+atexit.register(encerrar_registro)
@@ -2,13 +2,44 @@
 Módulo Controller.
 Responsabilidade: Fazer a ponte entre a View e o Model,
 controlando o fluxo da aplicação (inicialização, comandos e eventos).
+
+Os comandos só alteram o Model quando isso é instantâneo; o resto (validação, reprecificação, PDF, banco)
+vai para o AgendadorTarefas (controller/tarefas.py), que devolve os resultados à janela num único
+ciclo de after(). Assim a janela não fica parada por mais de um quadro.
 """
 
-from src.orca_facil.view.principal import JanelaPrincipal
+import math
+import threading
+from functools import cached_property, partial
+from typing import Callable
+
+from src.orca_facil.importacao_tardia import importar_tardio
+from src.orca_facil.view.principal import QUANTIDADE_SUGESTOES, JanelaPrincipal
+from src.orca_facil.model.model import LinhaOrcamento, Orcamento, reprecificar
+from src.orca_facil.model.validacao import RelatorioValidacao, validador_da_tabela
 from src.configs.interface import InterfaceVisual
+from src.configs.precificacao import formatar_moeda
+from src.configs.registro import registro
+from src.perfis.manager import GerenciadorPerfis, Perfil
+
+# Módulos pesados (pool de processos, leitura de imagens, PDF): carregados só no primeiro uso da funcionalidade
+ingestao_arquivos = importar_tardio("src.orca_facil.controller.ingestao")
+geracao_miniaturas = importar_tardio("src.orca_facil.model.miniaturas")
+saida_pdf = importar_tardio("src.results.saida")
+importacao_planilhas = importar_tardio("src.orca_facil.controller.importacao")
+planilhas = importar_tardio("src.orca_facil.model.planilhas")
+repositorio_orcamentos = importar_tardio("src.orca_facil.model.repositorio")
+numeracao_orcamentos = importar_tardio("src.orca_facil.model.numeracao")
+tarefas_janela = importar_tardio("src.orca_facil.controller.tarefas")
+instrumentacao = importar_tardio("src.orca_facil.view.instrumentacao")
+
+log = registro("CONTROLLER")
 
-def console(mensagem) -> None:
-    print(f"\033[94m[CONTROLLER] {mensagem}.\033[0m")  # Print em AZUL no console
+ESPERA_VALIDACAO = 0.15  # Segundos sem novas edições antes de validar (rajadas viram uma única validação)
+ESPERA_BUSCA = 0.12  # Segundos sem novas teclas no campo CLIENTE antes de buscar os perfis
+
+# Coluna de texto da tabela de itens → campo editado no duplo clique (a coluna VALOR é calculada)
+CAMPOS_TABELA = {0: "descricao", 1: "medidas", 2: "quantidade", 3: "material", 4: "acabamento"}
 
 class Controller:
     """
@@ -27,19 +58,583 @@ class Controller:
         # Cria as instâncias de configuração e junta tudo em um único objeto de interface
         self.interface = InterfaceVisual()
 
-    def iniciar(self) -> None:
+        # Orçamento (Model) com recálculo incremental dos valores
+        self.orcamento = Orcamento()
+
+        # Pipeline de análise de arquivos e miniaturas (criados no primeiro uso: ver as propriedades abaixo)
+        self._sem_miniatura: set[str] = set()  # Arquivos cuja miniatura não pôde ser gerada (não pede de novo)
+        self._acompanhando_miniaturas = False
+
+        # Perfis de clientes/preços (índice montado em segundo plano ao iniciar)
+        self.perfis = GerenciadorPerfis()
+        self.perfil = None  # Perfil aplicado ao orçamento atual
+        self._sugestoes: list = []  # Perfis sugeridos pela busca do campo CLIENTE (ResumoPerfil)
+        self.numero_orcamento: int | None = None  # Definido ao gerar o primeiro PDF do orçamento atual
+        self.monitor = None  # Instrumentação da janela (só com --monitor)
+
+    # SERVIÇOS (criados no primeiro uso)
+    @cached_property
+    def tarefas(self) -> "tarefas_janela.AgendadorTarefas":
+        """Trabalho dos comandos em segundo plano (resultados devolvidos à janela via after())."""
+        return tarefas_janela.AgendadorTarefas(self.view)
+
+    @cached_property
+    def ingestao(self) -> "ingestao_arquivos.IngestaoArquivos":
+        """Análise de arquivos em processos de segundo plano."""
+        return ingestao_arquivos.IngestaoArquivos()
+
+    @cached_property
+    def miniaturas(self) -> "geracao_miniaturas.GeradorMiniaturas":
+        """Geração das miniaturas das linhas visíveis."""
+        return geracao_miniaturas.GeradorMiniaturas()
+
+    @cached_property
+    def importacao(self) -> "importacao_planilhas.ImportacaoPlanilha":
+        """Leitura de planilhas em segundo plano."""
+        return importacao_planilhas.ImportacaoPlanilha()
+
+    @cached_property
+    def gerador_pdf(self) -> "saida_pdf.GeradorPDF":
+        """Saída em PDF."""
+        return saida_pdf.GeradorPDF()
+
+    @cached_property
+    def repositorio(self) -> "repositorio_orcamentos.RepositorioOrcamentos":
+        """Orçamentos emitidos (banco SQLite, uma conexão para toda a sessão)."""
+        return repositorio_orcamentos.RepositorioOrcamentos()
+
+    @cached_property
+    def numeracao(self) -> "numeracao_orcamentos.AlocadorNumeros":
+        """Números dos orçamentos, compartilhados entre as estações (continua depois do último já salvo aqui)."""
+        return numeracao_orcamentos.AlocadorNumeros(inicio=self.repositorio.ultimo_numero() + 1)
+
+    def _criado(self, servico: str) -> bool:
+        """Metodo Privado. Indica se o serviço já foi criado (consultá-lo não deve carregar o seu módulo)."""
+        return servico in vars(self)
+
+    def iniciar(self, ao_abrir: Callable[[JanelaPrincipal], None] | None = None, monitorar: bool = False) -> None:
         """
         Inicia a aplicação e aplica as configurações visuais.
+
+        :param ao_abrir: Função chamada com a janela quando ela terminar de abrir (usada pelo --profile-startup).
+        :param monitorar: Liga o monitor de desempenho da janela (--monitor; ver view/instrumentacao.py).
         """
-        console("Iniciando Controlador")
+        log.info("Iniciando Controlador")
 
         # 1. Instancia a Janela Principal (View)
-        console("Instanciando View - JanelaPrincipal")
+        log.debug("Instanciando View - JanelaPrincipal")
         self.view = JanelaPrincipal(interface=self.interface, janela=self.interface.janelas)
-        console("JanelaPrincipal instanciada")
+        log.debug("JanelaPrincipal instanciada")
+        if monitorar:
+            self.monitor = instrumentacao.MonitorDesempenho(self.view).instalar()
+
+        # 2. Conecta os botões aos comandos do Controller
+        log.debug("Conectando comandos aos botões")
+        self.view.botao_novo_orcamento.configure(command=self.novo_orcamento)
+        self.view.botao_adicionar_arquivos.configure(command=self.adicionar_arquivos)
+        self.view.botao_carregar_perfil.configure(command=self.carregar_perfil)
+        self.view.botao_importar_planilha.configure(command=self.importar_planilha)
+        self.view.botao_gerar_pdf.configure(command=self.gerar_pdf)
+        self.view.entrada_cliente.bind("<KeyRelease>", self._cliente_digitado, add="+")
+        self.view.entrada_cliente.bind("<Escape>", lambda evento: self.view.exibir_sugestoes([]), add="+")
+
+        # 3. Conecta a tabela de itens quando ela for criada (depois da primeira pintura da janela)
+        self.view.quando_pronta(self._conectar_tabela)
+        self.view.exibir_precificacao(self.orcamento.resultado)
+        if ao_abrir is not None:
+            self.view.quando_pronta(lambda: ao_abrir(self.view))
 
-        # 2. Inicia o loop principal do programa com as configurações aplicadas
-        console("Inicialização concluída")
-        console("Executando aplicação")
-        print("\n========== - ========== - ========== - ==========\n")
+        # 4. Monta o índice de perfis em segundo plano (não atrasa a abertura da janela)
+        threading.Thread(target=self.perfis.indexar, daemon=True, name="perfis").start()
+
+        # 5. Inicia o loop principal do programa com as configurações aplicadas
+        log.info("Inicialização concluída")
+        log.info("Executando aplicação")
         self.view.mainloop()
+        self._encerrar()
+
+    def _encerrar(self) -> None:
+        """
+        Metodo Privado.
+        Libera os serviços ao fechar a janela. Cada etapa roda mesmo que uma anterior falhe: um banco de
+        numeração inacessível não pode impedir o repositório de fechar nem o índice de perfis de ser salvo.
+        """
+        etapas = [self.monitor.desinstalar] if self.monitor is not None else []
+        etapas += [getattr(self, servico).encerrar  # Um PDF em andamento termina antes de fechar o banco
+                   for servico in ("tarefas", "ingestao", "miniaturas") if self._criado(servico)]
+        etapas += [getattr(self, servico).fechar  # A numeração devolve os números reservados e não usados
+                   for servico in ("numeracao", "repositorio") if self._criado(servico)]
+        etapas.append(self.perfis.salvar_indice)  # Guarda a ordem de "último uso"
+        for etapa in etapas:
+            try:
+                etapa()
+            except Exception:
+                log.exception("Erro ao encerrar (%s)", etapa.__qualname__)
+
+    # COMANDOS
+    def novo_orcamento(self) -> None:
+        """
+        Comando do botão "Novo Orçamento".
+        Cancela a análise em andamento e esvazia o orçamento.
+        """
+        for servico in ("ingestao", "importacao"):
+            if self._criado(servico):
+                getattr(self, servico).cancelar()
+        if self._criado("tarefas"):
+            self.tarefas.cancelar_todas()  # Resultados do orçamento anterior não chegam mais à janela
+        self.orcamento.limpar()
+        self.numero_orcamento = None
+        self.view.exibir_numero(None)
+        self._atualizar_orcamento()
+        self.view.atualizar_progresso(0, 0)
+        self.view.atualizar_status("PRONTO PARA COMEÇAR")
+
+    def carregar_perfil(self) -> None:
+        """
+        Comando do botão "Carregar Perfil".
+        Abre o modal com os perfis usados mais recentemente; o perfil escolhido é aplicado ao orçamento.
+        """
+        resumos = self.perfis.listar()
+        if not resumos:
+            self.view.atualizar_status("NENHUM PERFIL CADASTRADO")
+            return
+        self.view.modal("perfis").exibir(resumos, ao_escolher=lambda resumo: self.aplicar_perfil(resumo.arquivo))
+
+    def aplicar_perfil(self, arquivo: str) -> None:
+        """
+        Carrega o perfil escolhido em "Carregar Perfil" e reprecifica o orçamento com a sua tabela de preços.
+        A leitura do perfil e a reprecificação rodam em segundo plano; um novo perfil escolhido antes
+        do fim substitui o anterior.
+
+        :param arquivo: Arquivo do perfil (ResumoPerfil.arquivo).
+        """
+        def falhou(erro: BaseException) -> None:
+            log.warning("Perfil não carregado (%s): %s", arquivo, erro)
+            self.view.atualizar_status("PERFIL INVÁLIDO")
+
+        self.tarefas.executar(self.perfis.carregar, arquivo, ao_concluir=self._reprecificar, ao_falhar=falhou,
+                              chave="perfil")
+
+    def adicionar_arquivos(self) -> None:
+        """
+        Comando do botão "Adicionar Arquivos".
+        Envia os arquivos escolhidos para análise em segundo plano e passa a acompanhar o progresso.
+        """
+        caminhos = self.view.selecionar_arquivos()
+        if not caminhos:
+            return
+
+        estava_ativo = self.ingestao.ativo
+        if self.ingestao.iniciar(caminhos) and not estava_ativo:
+            self.tarefas.acompanhar(self._acompanhar_ingestao)
+
+    def importar_planilha(self) -> None:
+        """
+        Comando do botão "Importar Planilha".
+        Lê a planilha do pedido (CSV/XLSX) em segundo plano e adiciona as linhas ao orçamento em lotes.
+        As colunas seguem o mapeamento do perfil aplicado (ou os cabeçalhos padrão).
+        """
+        caminho = self.view.selecionar_planilha()
+        if not caminho:
+            return
+
+        # 1. Mapeamento do perfil, com o primeiro material/acabamento da tabela como padrão
+        tabela = self.orcamento.motor.tabela
+        try:
+            mapeamento = planilhas.MapeamentoColunas.do_perfil(self.perfil.planilha if self.perfil else {}, tabela)
+        except ValueError as erro:
+            log.error("Planilha não importada: %s", erro)
+            self.view.atualizar_status("PERFIL SEM MATERIAIS")
+            return
+
+        # 2. Leitura em segundo plano; a janela consome os lotes pelo AgendadorTarefas
+        estava_ativo = self.importacao.ativo
+        self.importacao.iniciar(caminho, mapeamento, tabela)
+        if not estava_ativo:
+            self.tarefas.acompanhar(self._acompanhar_importacao)
+
+    def gerar_pdf(self) -> None:
+        """
+        Comando do botão "Gerar PDF".
+        Grava o PDF com as linhas e os totais atuais do orçamento e guarda o orçamento no repositório
+        (o mesmo número é mantido se o PDF for gerado de novo). A gravação roda em segundo plano,
+        sobre uma cópia do orçamento: a janela continua livre para edição.
+        """
+        if not len(self.orcamento):
+            self.view.atualizar_status("ADICIONE ARQUIVOS PRIMEIRO")
+            return
+        if self._criado("tarefas") and self.tarefas.ativa("pdf"):
+            return  # Um clique a mais no botão não pode reservar outro número
+
+        caminho = self.view.selecionar_destino_pdf()
+        if not caminho:
+            return
+
+        # Serviços criados aqui, na thread do Tk: nem o LazyLoader dos módulos nem o cached_property são seguros
+        # entre threads. Criá-los carrega saida_pdf, repositorio_orcamentos e numeracao_orcamentos por completo,
+        # então a tarefa só usa módulos e objetos já prontos
+        try:
+            servicos = self.gerador_pdf, self.numeracao, self.repositorio
+        except repositorio_orcamentos.ErroRepositorio as erro:
+            log.error("Repositório de orçamentos indisponível: %s", erro)
+            self.view.atualizar_status("REPOSITÓRIO INDISPONÍVEL")
+            return
+
+        cliente, documento, nome_perfil = ((self.perfil.cliente, self.perfil.documento, self.perfil.nome)
+                                           if self.perfil else ("", "", ""))
+        self.view.atualizar_status("GERANDO PDF...")
+        self.tarefas.executar(self._emitir_pdf, *servicos, caminho, self.orcamento.copiar(), self.numero_orcamento,
+                              cliente, documento, nome_perfil, ao_concluir=self._pdf_emitido,
+                              ao_falhar=self._pdf_falhou, chave="pdf")
+
+    def editar_linha(self, indice: int, **campos) -> None:
+        """
+        Edição de uma linha (ex.: quantidade) vinda da tabela de itens.
+        O valor da linha e os totais são recalculados na hora (só o que a edição afeta); a validação
+        espera a rajada de edições terminar e roda uma única vez.
+
+        :param indice: Posição da linha no orçamento.
+        :param campos: Campos editados (ex.: quantidade=10).
+        """
+        try:
+            self.orcamento.atualizar(indice, **campos)
+        except (ValueError, TypeError, ArithmeticError, IndexError) as erro:
+            log.warning("Edição da linha %s recusada: %s", indice + 1, erro)
+            self.view.atualizar_status("EDIÇÃO INVÁLIDA")
+            return
+        self._atualizar_orcamento()
+        self.validar_orcamento(atraso=ESPERA_VALIDACAO)
+
+    def validar_orcamento(self, atraso: float = 0.0) -> None:
+        """
+        Confere todas as linhas (limites da máquina, quantidades, materiais e acabamentos do perfil)
+        e o CPF/CNPJ do cliente do perfil. Os erros vão para o registro e o status mostra quantas linhas falharam.
+        Roda em segundo plano sobre uma cópia das colunas; um novo pedido descarta o anterior.
+
+        :param atraso: Segundos de espera por novas edições antes de validar.
+        """
+        documento = self.perfil.documento if self.perfil else None
+        validador = validador_da_tabela(self.orcamento.motor.tabela)
+        self.tarefas.executar(partial(validador.validar, documento=documento), self.orcamento.colunas.copiar(),
+                              ao_concluir=self._exibir_validacao, chave="validacao", atraso=atraso)
+
+    def _acompanhar_ingestao(self) -> bool:
+        """
+        Metodo Privado.
+        Lê os resultados já prontos da ingestão (chamado pelo AgendadorTarefas enquanto retornar True).
+        Nunca espera por um arquivo, então a janela continua respondendo durante toda a análise.
+        """
+        total = self.ingestao.total
+        resultados = self.ingestao.coletar()
+
+        # Cada arquivo válido vira uma linha (uma peça por página), com o material e o acabamento padrão
+        tabela = self.orcamento.motor.tabela
+        material, acabamento = next(iter(tabela.materiais), None), next(iter(tabela.acabamentos), None)
+        if material is None or acabamento is None:
+            log.error("Perfil sem materiais ou acabamentos: ingestão cancelada (%s arquivo(s))", total)
+            self.ingestao.cancelar()
+            self.view.atualizar_progresso(0, 0)
+            self.view.atualizar_status("PERFIL SEM MATERIAIS")
+            return False
+        novas = []
+        for metadados in resultados:
+            if metadados.erro:
+                log.warning("Arquivo ignorado (%s): %s", metadados.nome, metadados.erro)
+                continue
+            novas.append(LinhaOrcamento.do_arquivo(metadados, material, acabamento))
+        if novas:
+            self.orcamento.adicionar(novas)
+            self._atualizar_orcamento()
+
+        if self.ingestao.ativo:
+            self.view.atualizar_progresso(self.ingestao.concluidos, self.ingestao.total)
+            return True
+        self.view.atualizar_progresso(total, total)
+        log.info("Ingestão concluída: %s linha(s) no orçamento", len(self.orcamento))
+        self.validar_orcamento()
+        return False
+
+    def _acompanhar_importacao(self) -> bool:
+        """
+        Metodo Privado.
+        Adiciona ao orçamento os lotes já lidos da planilha (chamado pelo AgendadorTarefas enquanto a leitura continuar).
+        Poucos lotes por ciclo: a janela continua respondendo mesmo com planilhas de 100 mil linhas.
+        """
+        importacao = self.importacao
+        lotes = importacao.coletar()
+        for lote in lotes:
+            if not len(lote):
+                continue
+            try:
+                self.orcamento.adicionar_colunas(**lote.colunas())
+            except (ValueError, TypeError, ArithmeticError) as erro:
+                log.warning("Planilha: lote de %s linha(s) recusado: %s", len(lote), erro)
+                importacao.recusar(lote, str(erro))  # Entra no relatório de linhas ignoradas, ao fim da leitura
+        if lotes:
+            self._atualizar_orcamento()
+
+        if importacao.ativo:
+            self.view.atualizar_importacao(importacao.linhas, importacao.progresso)
+            return True
+        if importacao.cancelada:
+            return False
+
+        # Fim da leitura
+        if importacao.falha is not None:
+            self.view.atualizar_progresso(0, 0)
+            self.view.atualizar_status("PLANILHA INVÁLIDA")
+            return False
+        self.view.atualizar_importacao(importacao.linhas, 1.0)
+        log.info("Importação concluída: %s linha(s) importada(s), %s ignorada(s)", importacao.linhas,
+                 len(importacao.erros))
+        for numero, motivo in importacao.erros[:5]:
+            log.warning("Planilha, linha %s ignorada: %s", numero, motivo)
+        if importacao.erros:
+            self.view.atualizar_status(f"{len(importacao.erros)} LINHA(S) IGNORADA(S)")
+        self.validar_orcamento()
+        return False
+
+    # TAREFAS EM SEGUNDO PLANO
+    def _reprecificar(self, perfil: Perfil) -> None:
+        """
+        Metodo Privado.
+        Reprecifica uma cópia do orçamento com a tabela do perfil num processo à parte (centenas de
+        milhares de linhas levam décimos de segundo). Orçamento vazio: troca a tabela na hora.
+        """
+        if not len(self.orcamento):
+            self.orcamento.definir_tabela(perfil.tabela)
+            self._perfil_aplicado(perfil)
+            return
+
+        def falhou(erro: BaseException) -> None:
+            log.warning("Perfil não aplicado (%s): %s", perfil.nome, erro)
+            self.view.atualizar_status("PERFIL INVÁLIDO")
+
+        copia = self.orcamento.copiar()
+        self.view.atualizar_status("REPRECIFICANDO...")
+        self.tarefas.executar(reprecificar, copia, perfil.tabela, processo=True, chave="perfil", ao_falhar=falhou,
+                              ao_concluir=lambda orcamento: self._adotar_orcamento(perfil, orcamento, copia.versao))
+
+    def _adotar_orcamento(self, perfil: Perfil, reprecificado: Orcamento, versao: int) -> None:
+        """
+        Metodo Privado.
+        Troca o orçamento pela cópia reprecificada, se ninguém o alterou nesse meio tempo; senão, reprecifica de novo.
+        """
+        if self.orcamento.versao != versao:
+            self._reprecificar(perfil)
+            return
+        self.orcamento = reprecificado
+        self._perfil_aplicado(perfil)
+
+    def _perfil_aplicado(self, perfil: Perfil) -> None:
+        """Metodo Privado. Reflete na janela o perfil cuja tabela já está no orçamento."""
+        self.perfil = perfil
+        self._atualizar_orcamento()
+        self.view.exibir_perfil(perfil.nome, perfil.cliente)
+        self.view.atualizar_status(f"PERFIL: {perfil.nome.upper()}")
+        self.validar_orcamento()
+
+    # BUSCA DE PERFIS (campo CLIENTE)
+    def _cliente_digitado(self, evento=None) -> None:
+        """
+        Metodo Privado.
+        Cada tecla no campo CLIENTE reagenda a busca: só a última, ESPERA_BUSCA segundos depois
+        da última tecla, consulta o índice de perfis (prefixos/trigramas) e preenche as sugestões.
+        """
+        texto = self.view.entrada_cliente.get().strip()
+        if not texto:
+            self.tarefas.cancelar("busca_perfil")
+            self.view.exibir_sugestoes([])
+            return
+        self.tarefas.executar(self.perfis.buscar, texto, QUANTIDADE_SUGESTOES, ao_concluir=self._exibir_sugestoes,
+                              chave="busca_perfil", atraso=ESPERA_BUSCA)
+
+    def _exibir_sugestoes(self, resumos: list) -> None:
+        """Metodo Privado. Mostra os perfis encontrados abaixo do campo CLIENTE."""
+        self._sugestoes = resumos
+        self.view.exibir_sugestoes([f"{resumo.nome} — {resumo.cliente}" if resumo.cliente else resumo.nome
+                                    for resumo in resumos], ao_escolher=self._sugestao_escolhida)
+
+    def _sugestao_escolhida(self, posicao: int) -> None:
+        """Metodo Privado. Aplica o perfil da sugestão clicada e esconde a lista."""
+        self.view.exibir_sugestoes([])
+        self.aplicar_perfil(self._sugestoes[posicao].arquivo)
+
+    def _emitir_pdf(self, gerador: "saida_pdf.GeradorPDF", numeracao: "numeracao_orcamentos.AlocadorNumeros",
+                    repositorio: "repositorio_orcamentos.RepositorioOrcamentos", caminho: str, orcamento: Orcamento,
+                    numero: int | None, cliente: str, documento: str, nome_perfil: str) -> tuple[int, int, bool]:
+        """
+        Metodo Privado.
+        Executado numa thread do AgendadorTarefas: numera (se for a primeira emissão), grava o PDF e
+        registra o orçamento no repositório. Os serviços chegam prontos da thread do Tk (ver gerar_pdf).
+
+        :return: (número, páginas, registrado no repositório).
+        """
+        # 1. Número do orçamento (reservado na primeira emissão; o mesmo nas seguintes)
+        reservado = numero is None
+        if reservado:
+            numero = numeracao.proximo()
+
+        # 2. PDF (o PDF consome as linhas sob demanda, sem montar uma lista paralela)
+        itens = (saida_pdf.LinhaPDF(linha.descricao, linha.material, linha.acabamento, linha.largura_cm,
+                                    linha.altura_cm, linha.quantidade, linha.valor)
+                 for linha in orcamento.linhas())
+        cabecalho = saida_pdf.CabecalhoPDF(numero=str(numero), cliente=cliente, perfil=nome_perfil)
+        try:
+            paginas = gerador.gerar(caminho, cabecalho, itens, orcamento.resultado)
+        except Exception:
+            if reservado:  # Número novo sem PDF: volta ao banco para não deixar um buraco na sequência
+                self._devolver_numero(numeracao, numero)
+            raise
+
+        # 3. Registro do orçamento emitido (cabeçalho + linhas numa única transação)
+        try:
+            repositorio.salvar(orcamento, numero, cliente, documento, nome_perfil)
+        except repositorio_orcamentos.ErroRepositorio as erro:
+            log.error("Orçamento %s não gravado no repositório: %s", numero, erro)
+            return numero, paginas, False
+        return numero, paginas, True
+
+    @staticmethod
+    def _devolver_numero(numeracao: "numeracao_orcamentos.AlocadorNumeros", numero: int) -> None:
+        """Metodo Privado. Devolve à numeração um número reservado para um PDF que não foi gerado."""
+        try:
+            numeracao.devolver([numero])
+        except numeracao_orcamentos.ErroNumeracao as erro:
+            log.error("Número %s não devolvido à numeração: %s", numero, erro)
+
+    def _pdf_emitido(self, emissao: tuple[int, int, bool]) -> None:
+        """Metodo Privado. Resultado do "Gerar PDF", na thread do Tk."""
+        numero, paginas, registrado = emissao
+        self.numero_orcamento = numero
+        if not registrado:
+            self.view.atualizar_status(f"PDF GERADO ({paginas} PÁG.) - NÃO SALVO")
+            return
+        self.view.exibir_numero(numero)
+        self.view.atualizar_status(f"PDF GERADO ({paginas} PÁG.)")
+
+    def _pdf_falhou(self, erro: BaseException) -> None:
+        """Metodo Privado. Falha do "Gerar PDF" (numeração indisponível ou erro ao gravar o arquivo)."""
+        if isinstance(erro, numeracao_orcamentos.ErroNumeracao):
+            log.error("Numeração indisponível (%s): %s", self.numeracao.caminho, erro)
+            self.view.atualizar_status("NUMERAÇÃO INDISPONÍVEL")
+            return
+        log.error("PDF não gerado: %s: %s", type(erro).__name__, erro)
+        self.view.atualizar_status("PDF NÃO GERADO")
+
+    def _exibir_validacao(self, relatorio: RelatorioValidacao) -> None:
+        """Metodo Privado. Resultado da validação, na thread do Tk."""
+        if relatorio.valido:
+            return
+        for linha in relatorio.resumo():
+            log.warning("Validação: %s", linha)
+        linhas = len(relatorio.linhas_com_erro)
+        self.view.atualizar_status(f"{linhas} LINHA(S) COM ERRO" if linhas else "CPF/CNPJ DO CLIENTE INVÁLIDO")
+
+    def _atualizar_orcamento(self) -> None:
+        """
+        Metodo Privado.
+        Reflete o orçamento na janela: quantidade de linhas da tabela e bloco de precificação.
+        """
+        self.view.tabela_itens.definir_total(len(self.orcamento))
+        self.view.tabela_itens.atualizar()
+        self.view.exibir_precificacao(self.orcamento.resultado)
+
+    # TABELA DE ITENS
+    def _conectar_tabela(self) -> None:
+        """
+        Metodo Privado.
+        Conecta a tabela de itens às linhas do orçamento (só as linhas visíveis são consultadas).
+        """
+        self.view.tabela_itens.definir_dados(
+            total=len(self.orcamento),
+            obter_linha=self._linha_tabela,
+            obter_imagem=lambda indice: self.view.miniatura(self.orcamento.colunas.caminhos[indice]),
+            ao_exibir=self._exibir_linhas,
+            ao_editar=self._editar_celula
+        )
+
+    def _editar_celula(self, indice: int, coluna: int) -> None:
+        """
+        Metodo Privado.
+        Duplo clique numa célula da tabela: pede o novo valor, converte o texto e edita a linha (editar_linha).
+        """
+        campo = CAMPOS_TABELA.get(coluna)
+        if campo is None:
+            return
+
+        # 1. Pede o novo valor, mostrando o atual
+        atual = self._linha_tabela(indice)[coluna]
+        formato = " (largura x altura)" if campo == "medidas" else ""
+        texto = self.view.pedir_texto(f"Linha {indice + 1}", f"{campo.upper()}{formato}. Atual: {atual}")
+        if texto is None or not texto.strip():
+            return
+
+        # 2. Converte o texto no tipo da coluna (a vírgula decimal é aceita)
+        try:
+            campos = _converter_edicao(campo, texto.strip())
+        except ValueError as erro:
+            log.warning("Edição da linha %s recusada: %s", indice + 1, erro)
+            self.view.atualizar_status("EDIÇÃO INVÁLIDA")
+            return
+        self.editar_linha(indice, **campos)
+
+    def _linha_tabela(self, indice: int) -> tuple[str, ...]:
+        """
+        Metodo Privado.
+        Textos da linha 'indice' da tabela de itens (chamado só para as linhas visíveis).
+        """
+        linha = self.orcamento.linha(indice)
+        return (linha.descricao, f"{linha.largura_cm:.1f} x {linha.altura_cm:.1f}", str(linha.quantidade),
+                linha.material, linha.acabamento, formatar_moeda(linha.valor))
+
+    def _exibir_linhas(self, inicio: int, fim: int) -> None:
+        """
+        Metodo Privado.
+        Chamado pela tabela após cada rolagem: pede as miniaturas das linhas visíveis que ainda não chegaram.
+        """
+        faltando = [caminho for caminho in self.orcamento.colunas.caminhos[inicio:fim]
+                    if caminho and caminho not in self._sem_miniatura and self.view.miniatura(caminho) is None]
+        if faltando:
+            self.miniaturas.solicitar(faltando)
+            if not self._acompanhando_miniaturas:
+                self._acompanhando_miniaturas = True
+                self.tarefas.acompanhar(self._acompanhar_miniaturas)
+
+    def _acompanhar_miniaturas(self) -> bool:
+        """
+        Metodo Privado.
+        Recebe as miniaturas prontas e redesenha a tabela; continua sendo chamado enquanto houver pedidos em andamento.
+        """
+        prontas = self.miniaturas.coletar()
+        for caminho, dados in prontas:
+            if dados is None:
+                self._sem_miniatura.add(caminho)
+            else:
+                self.view.guardar_miniatura(caminho, dados)
+
+        if prontas:
+            self.view.tabela_itens.atualizar()
+        self._acompanhando_miniaturas = bool(self.miniaturas.pendentes)
+        return self._acompanhando_miniaturas
+
+
+# INTERNOS ==============================
+def _converter_edicao(campo: str, texto: str) -> dict:
+    """
+    Converte o texto digitado numa célula da tabela nos campos de Orcamento.atualizar().
+
+    Raises:
+        ValueError: Se o texto não for um número válido para o campo (medidas finitas, quantidade inteira).
+    """
+    if campo == "quantidade":
+        return {"quantidade": int(texto)}
+    if campo == "medidas":
+        partes = texto.lower().replace(",", ".").split("x")
+        if len(partes) != 2:
+            raise ValueError(f"Medidas '{texto}': use largura x altura (ex.: 100 x 50)")
+        largura, altura = map(float, partes)
+        if not (math.isfinite(largura) and math.isfinite(altura)):
+            raise ValueError(f"Medidas '{texto}': valores não finitos")
+        return {"largura_cm": largura, "altura_cm": altura}
+    return {campo: texto}
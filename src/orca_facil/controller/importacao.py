@@ -0,0 +1,127 @@
+"""
+Módulo de Importação de Planilhas.
+Responsabilidade: Ler, fora da thread do Tk, a planilha escolhida em "Importar Planilha" e entregar os
+lotes de linhas à janela, que os adiciona ao orçamento aos poucos.
+
+Fluxo:
+    Controller → ImportacaoPlanilha.iniciar(caminho, mapeamento, tabela)
+        → thread de leitura: model/planilhas.ler_lotes() → lotes filtrados pela tabela de preços
+        → cada lote entra numa fila limitada (a leitura espera se a janela ainda não consumiu os anteriores)
+    Controller (via after()) → ImportacaoPlanilha.coletar() → Orcamento.adicionar_colunas(lote) → progresso
+
+A janela nunca espera a leitura: ela só consome o que já está na fila, alguns lotes por ciclo.
+"""
+
+import queue
+import threading
+
+from src.configs.precificacao import TabelaPrecos
+from src.configs.registro import registro
+from src.orca_facil.model.planilhas import LotePlanilha, MapeamentoColunas, ler_lotes
+
+
+log = registro("CONTROLLER")
+
+LOTES_EM_ESPERA = 8  # Lotes lidos e ainda não consumidos pela janela (limita a memória)
+
+
+class ImportacaoPlanilha:
+    """Leitura de uma planilha em segundo plano, entregue em lotes."""
+
+    def __init__(self) -> None:
+        # (geração, lote | erro | None no fim da planilha)
+        self._fila: queue.Queue[tuple[int, LotePlanilha | Exception | None]] = queue.Queue(maxsize=LOTES_EM_ESPERA)
+        self._geracao = 0  # Incrementada a cada cancelamento: a thread de uma importação antiga para sozinha
+        self.ativo = False
+        self.cancelada = False  # True se a última importação foi cancelada (não há resultado a exibir)
+        self.progresso = 0.0  # Fração do arquivo já consumida pela janela
+        self.linhas = 0  # Linhas já entregues na importação atual
+        self.erros: list[tuple[int, str]] = []  # (linha na planilha, motivo) das linhas ignoradas
+        self.falha: Exception | None = None  # Erro que interrompeu a importação (ex.: coluna obrigatória ausente)
+
+    def iniciar(self, caminho: str, mapeamento: MapeamentoColunas, tabela: TabelaPrecos) -> None:
+        """
+        Começa a ler a planilha numa thread própria (uma importação em andamento é cancelada).
+
+        :param caminho: Arquivo .csv ou .xlsx.
+        :param mapeamento: Correspondência entre cabeçalhos e campos (material/acabamento padrão já resolvidos).
+        :param tabela: Tabela de preços do orçamento: linhas com material/acabamento fora dela são ignoradas.
+        """
+        self.cancelar()
+        self.ativo, self.cancelada = True, False
+        self.progresso, self.linhas, self.erros, self.falha = 0.0, 0, [], None
+        threading.Thread(target=self._ler, args=(caminho, mapeamento, tabela, self._geracao),
+                         daemon=True, name="planilha").start()
+        log.info("Importação: lendo planilha %s", caminho)
+
+    def coletar(self, limite: int = 4) -> list[LotePlanilha]:
+        """
+        Retira da fila os lotes já lidos, sem esperar.
+        Chamado pela janela via after(); o limite evita que um único ciclo segure o Tk por muito tempo.
+        """
+        lotes = []
+        while self.ativo and len(lotes) < limite:
+            try:
+                geracao, item = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            if geracao != self._geracao:
+                continue  # Sobra de uma importação cancelada
+            if isinstance(item, Exception):
+                self.falha, self.ativo = item, False
+            elif item is None:
+                self.ativo = False  # Fim da planilha
+            else:
+                lotes.append(item)
+                self.linhas += len(item)
+                self.erros.extend(item.erros)
+                self.progresso = item.progresso
+        return lotes
+
+    def recusar(self, lote: LotePlanilha, motivo: str) -> None:
+        """
+        Registra como ignoradas as linhas de um lote que o orçamento recusou (o Model já desfez o lote).
+
+        :param motivo: Erro do Model, repetido para cada linha do lote no relatório.
+        """
+        self.linhas -= len(lote)
+        self.erros.extend((numero_linha, motivo) for numero_linha in lote.numeros)
+
+    def cancelar(self) -> None:
+        """Interrompe a importação atual ("Novo Orçamento") e descarta os lotes ainda não consumidos."""
+        self._geracao += 1
+        self.cancelada = self.cancelada or self.ativo
+        self.ativo = False
+        while True:
+            try:
+                self._fila.get_nowait()
+            except queue.Empty:
+                break
+
+    # INTERNOS ==============================
+    def _ler(self, caminho: str, mapeamento: MapeamentoColunas, tabela: TabelaPrecos, geracao: int) -> None:
+        """Metodo Privado. Thread de leitura: produz os lotes até o fim da planilha (ou até ser cancelada)."""
+        try:
+            for lote, linhas in ler_lotes(caminho, mapeamento):
+                lote.filtrar(tabela.materiais, tabela.acabamentos, linhas)
+                if not self._entregar(lote, geracao):
+                    return
+            self._entregar(None, geracao)
+        except (OSError, ValueError, OverflowError) as erro:
+            log.warning("Importação interrompida (%s): %s", caminho, erro)
+            self._entregar(erro, geracao)
+
+    def _entregar(self, item, geracao: int) -> bool:
+        """
+        Metodo Privado.
+        Coloca o item na fila, esperando vaga (sem travar para sempre se a importação for cancelada).
+
+        :return: False se a importação foi cancelada (a leitura deve parar).
+        """
+        while geracao == self._geracao:
+            try:
+                self._fila.put((geracao, item), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
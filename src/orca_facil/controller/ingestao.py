@@ -0,0 +1,171 @@
+"""
+Módulo de Ingestão de Arquivos.
+Responsabilidade: Analisar, em paralelo e fora da thread do Tk, os arquivos escolhidos em "Adicionar Arquivos".
+
+Fluxo:
+    Controller → IngestaoArquivos.iniciar(caminhos)
+        → thread despachante consulta o cache de metadados (model/cache.py)
+        → arquivos já conhecidos vão direto para a fila; os novos são enviados ao pool de processos
+        → cada resultado pronto entra numa fila thread-safe (queue.Queue)
+    Controller (via after()) → IngestaoArquivos.coletar() → atualiza a barra de progresso
+
+A janela nunca espera um arquivo: ela só lê o que já está na fila.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from src.configs.registro import registro
+from src.orca_facil.model.arquivos import MetadadosArquivo, analisar_arquivo, expandir_caminhos
+from src.orca_facil.model.cache import CacheMetadados
+
+
+log = registro("CONTROLLER")
+
+
+class IngestaoArquivos:
+    """
+    Pipeline de ingestão concorrente.
+    O pool de processos é criado no primeiro uso e reaproveitado nas ingestões seguintes.
+    """
+
+    def __init__(self, processos: int | None = None, cache: CacheMetadados | None = None) -> None:
+        """
+        :param processos: Quantidade de processos do pool. Caso omitido, usa um por núcleo (deixando um livre para a janela).
+        :param cache: Cache persistente de metadados. Caso omitido, usa o cache padrão da pasta de dados.
+        """
+        self.processos = processos or max((os.cpu_count() or 2) - 1, 1)
+        self.cache = cache or CacheMetadados()
+        self._pool: ProcessPoolExecutor | None = None
+        self._fila: queue.Queue[MetadadosArquivo] = queue.Queue()
+        self._futuros: set[Future] = set()
+        self._trava = threading.Lock()
+        self._geracao = 0  # Incrementada a cada cancelamento: resultados de gerações antigas são descartados
+
+        self.total = 0  # Arquivos na ingestão atual
+        self.concluidos = 0  # Arquivos já coletados pela janela
+
+    @property
+    def ativo(self) -> bool:
+        """Indica se ainda há arquivos a coletar na ingestão atual."""
+        return self.concluidos < self.total
+
+    def iniciar(self, caminhos) -> int:
+        """
+        Inicia a ingestão dos caminhos selecionados (arquivos e/ou pastas) sem bloquear quem chamou.
+
+        :param caminhos: Arquivos e pastas escolhidos pelo usuário.
+        :return: Quantidade de arquivos que serão analisados.
+        """
+
+        # 1. Expande pastas em arquivos suportados
+        arquivos = expandir_caminhos(caminhos)
+        self.total += len(arquivos)
+        log.info("Ingestão: %s arquivo(s) enviados para análise", len(arquivos))
+
+        # 2. Envia os arquivos ao pool numa thread própria, para que nem o envio ocupe a janela
+        if arquivos:
+            threading.Thread(target=self._despachar, args=(arquivos, self._geracao),
+                             daemon=True, name="ingestao").start()
+
+        return len(arquivos)
+
+    def coletar(self, limite: int = 200) -> list[MetadadosArquivo]:
+        """
+        Retira da fila os resultados já prontos, sem esperar.
+        Chamado pela janela via after(); o limite evita que um único ciclo segure o Tk por muito tempo.
+        """
+        resultados = []
+        while len(resultados) < limite:
+            try:
+                resultados.append(self._fila.get_nowait())
+            except queue.Empty:
+                break
+
+        self.concluidos += len(resultados)
+        if not self.ativo:
+            self.total = self.concluidos = 0  # Prepara a próxima ingestão
+            if resultados:
+                threading.Thread(target=self.cache.salvar, daemon=True, name="cache").start()
+        return resultados
+
+    def cancelar(self) -> None:
+        """
+        Cancela a ingestão atual ("Novo Orçamento").
+        Arquivos que ainda não começaram são cancelados; os que já estão em análise terminam,
+        alimentam o cache, mas não chegam mais à fila.
+        """
+        with self._trava:
+            self._geracao += 1
+            cancelados = sum(futuro.cancel() for futuro in self._futuros)
+            self._futuros.clear()
+
+        while True:
+            try:
+                self._fila.get_nowait()
+            except queue.Empty:
+                break
+
+        self.total = self.concluidos = 0
+        log.info("Ingestão: %s arquivo(s) cancelados", cancelados)
+
+    def encerrar(self) -> None:
+        """Finaliza o pool de processos e grava o cache (chamado ao fechar o programa)."""
+        self.cache.salvar()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # INTERNOS ==============================
+    def _despachar(self, arquivos: list[str], geracao: int) -> None:
+        """
+        Metodo Privado.
+        Consulta o cache de cada arquivo; só os desconhecidos são enviados ao pool.
+        O resultado volta pela fila em ambos os casos.
+        """
+        for caminho in arquivos:
+            if geracao != self._geracao:
+                return  # Ingestão cancelada
+
+            # 1. Arquivo já analisado antes: nem chega a ser aberto pelo pool
+            try:
+                chave, metadados = self.cache.obter(caminho)
+            except OSError as erro:
+                self._entregar(MetadadosArquivo(caminho=caminho, erro=f"{type(erro).__name__}: {erro}"), geracao)
+                continue
+            if metadados is not None:
+                self._entregar(metadados, geracao)
+                continue
+
+            # 2. Arquivo novo: análise no pool de processos (criado no primeiro uso)
+            with self._trava:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.processos)
+                futuro = self._pool.submit(analisar_arquivo, caminho)
+                self._futuros.add(futuro)
+            futuro.add_done_callback(
+                lambda f, caminho=caminho, chave=chave: self._ao_concluir(f, caminho, chave, geracao)
+            )
+
+    def _ao_concluir(self, futuro: Future, caminho: str, chave: str, geracao: int) -> None:
+        """
+        Metodo Privado.
+        Executado na thread do pool quando um arquivo termina: guarda no cache e coloca o resultado na fila.
+        """
+        with self._trava:
+            self._futuros.discard(futuro)
+
+        if futuro.cancelled():
+            return
+        erro = futuro.exception()
+        metadados = MetadadosArquivo(caminho=caminho, erro=str(erro)) if erro else futuro.result()
+        self.cache.guardar(chave, metadados)
+        self._entregar(metadados, geracao)
+
+    def _entregar(self, metadados: MetadadosArquivo, geracao: int) -> None:
+        """Metodo Privado. Coloca o resultado na fila, a menos que a sua ingestão tenha sido cancelada."""
+        with self._trava:
+            if geracao == self._geracao:
+                self._fila.put(metadados)
@@ -0,0 +1,420 @@
+"""
+Módulo de Orçamentos em Lote (modo de linha de comando).
+Responsabilidade: Orçar pastas inteiras de trabalhos sem abrir a janela (ex.: de madrugada, após uma
+mudança de preços) e gravar um PDF por pasta, usando o mesmo Model, a mesma precificação e a mesma
+saída em PDF do "Gerar PDF" da janela.
+
+Fluxo:
+    main.py --lote PASTAS... → executar_lote()
+        → perfil escolhido (--perfil) e números dos orçamentos reservados (model/numeracao.py)
+        → pool de processos: um trabalho (pasta) por vez em cada processo → orcar_pasta()
+            arquivos de impressão (analisar_arquivo) + planilhas (ler_lotes) → Orcamento → validação → PDF
+            → repositório de orçamentos
+        → resumo com o tempo de cada trabalho
+
+Cada pasta vira um orçamento: os arquivos de impressão da pasta (e subpastas) são as linhas, como no
+"Adicionar Arquivos", e as planilhas (.csv/.xlsx) na raiz da pasta são importadas como no "Importar Planilha".
+
+Reemissão (main.py --reemitir NÚMEROS...): orçamentos já salvos são reprecificados com a tabela atual
+do perfil e os PDFs são gerados em paralelo por results/lote_pdf.py.
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from src.configs.precificacao import MotorPrecificacao, formatar_moeda
+from src.configs.registro import configurar_registro, registro
+from src.orca_facil.model.arquivos import analisar_arquivo, expandir_caminhos
+from src.orca_facil.model.model import LinhaOrcamento, Orcamento
+from src.orca_facil.model.planilhas import EXTENSOES as EXTENSOES_PLANILHA, MapeamentoColunas, ler_lotes
+from src.orca_facil.model.validacao import validador_da_tabela
+from src.perfis.manager import GerenciadorPerfis, Perfil
+from src.results.lote_pdf import PedidoPDF, ResultadoPDF, gerador_do_processo, gerar_lote
+from src.results.saida import CabecalhoPDF, LinhaPDF
+
+log = registro("CONTROLLER")
+
+LIMITE_AVISOS = 10  # Trabalhos com avisos listados no resumo
+
+
+@dataclass
+class TrabalhoLote:
+    """Uma pasta a orçar (enviada a um processo do pool, por isso só dados simples)."""
+
+    pasta: str
+    destino: str  # Arquivo PDF de saída
+    perfil: Perfil
+    numero: int | None = None  # Número do orçamento (None = sem numeração nem registro)
+
+
+@dataclass
+class ResultadoLote:
+    """O que cada trabalho devolve ao processo principal."""
+
+    pasta: str
+    destino: str = ""
+    numero: int | None = None
+    linhas: int = 0
+    ignorados: int = 0  # Arquivos ilegíveis e linhas de planilha descartadas
+    linhas_com_erro: int = 0  # Linhas reprovadas na validação (entram no PDF, como na janela)
+    paginas: int = 0
+    total: Decimal = Decimal("0.00")
+    segundos: float = 0.0
+    erro: str = ""
+    avisos: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.erro
+
+
+# PROCESSO PRINCIPAL ==============================
+def listar_trabalhos(caminhos: list[str]) -> list[str]:
+    """
+    Pastas dos trabalhos, em ordem alfabética e sem repetição.
+    Aceita curingas (ex.: 'entrada/*'), expandidos aqui para funcionar também no prompt do Windows.
+    """
+    pastas = []
+    for caminho in caminhos:
+        encontrados = glob.glob(caminho) if glob.has_magic(caminho) else [caminho]
+        pastas.extend(os.path.abspath(pasta) for pasta in encontrados if os.path.isdir(pasta))
+    return sorted(set(pastas))
+
+
+def escolher_perfil(consulta: str | None, perfis: GerenciadorPerfis | None = None) -> Perfil:
+    """
+    Perfil dos orçamentos do lote: pelo arquivo (ex.: 'grafica_abc.json') ou pela busca por nome, cliente ou
+    documento (o melhor resultado). Sem consulta, usa a tabela de preços padrão.
+
+    Raises:
+        ValueError: Se nenhum perfil corresponder à consulta.
+    """
+    if not consulta:
+        return Perfil(nome="Padrão")
+
+    perfis = perfis or GerenciadorPerfis()
+    perfis.indexar()
+    arquivos = {resumo.arquivo for resumo in perfis.listar()}
+    if consulta not in arquivos:
+        encontrados = perfis.buscar(consulta, limite=1)
+        if not encontrados:
+            raise ValueError(f"Nenhum perfil encontrado para '{consulta}'")
+        consulta = encontrados[0].arquivo
+    return perfis.carregar(consulta)
+
+
+def executar_lote(caminhos: list[str], perfil: str | None = None, destino: str | None = None,
+                  processos: int | None = None, registrar: bool = True, nivel_registro: str | None = None) -> int:
+    """
+    Orça as pastas em paralelo e imprime o resumo.
+
+    :param caminhos: Pastas dos trabalhos (curingas aceitos).
+    :param perfil: Arquivo ou busca do perfil (--perfil). Caso omitido, a tabela de preços padrão.
+    :param destino: Pasta dos PDFs. Caso omitida, cada PDF é gravado dentro da pasta do seu trabalho.
+    :param processos: Tamanho do pool. Caso omitido, um por núcleo.
+    :param registrar: Se True, numera os orçamentos e os grava no repositório (como o "Gerar PDF").
+    :param nivel_registro: Nível das mensagens nos processos do pool.
+    :return: Código de saída do programa (0 = todos os trabalhos concluídos, 1 = algum falhou).
+    """
+    inicio = time.perf_counter()
+
+    # 1. Trabalhos e perfil
+    pastas = listar_trabalhos(caminhos)
+    if not pastas:
+        print("Nenhuma pasta de trabalho encontrada.")
+        return 1
+    try:
+        perfil_lote = escolher_perfil(perfil)
+    except (OSError, ValueError) as erro:
+        print(f"Perfil inválido: {erro}")
+        return 1
+    if destino:
+        os.makedirs(destino, exist_ok=True)
+
+    # 2. Números dos orçamentos (reservados de uma vez, na ordem das pastas)
+    alocador = None
+    numeros: list[int | None] = [None] * len(pastas)
+    if registrar:
+        from src.orca_facil.model.numeracao import AlocadorNumeros
+        from src.orca_facil.model.repositorio import RepositorioOrcamentos
+        repositorio = RepositorioOrcamentos()
+        alocador = AlocadorNumeros(tamanho_bloco=len(pastas), inicio=repositorio.ultimo_numero() + 1)
+        repositorio.fechar()
+        numeros = [alocador.proximo() for _ in pastas]
+
+    trabalhos = [TrabalhoLote(pasta, _destino_pdf(pasta, destino), perfil_lote, numero)
+                 for pasta, numero in zip(pastas, numeros)]
+
+    # 3. Pool de processos: cada processo orça uma pasta inteira por vez
+    processos = min(processos or os.cpu_count() or 1, len(trabalhos))
+    print(f"Orçando {len(trabalhos)} pasta(s) com o perfil '{perfil_lote.nome}' em {processos} processo(s)...")
+    resultados: list[ResultadoLote] = []
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_processo,
+                             initargs=(nivel_registro,)) as pool:
+        futuros = {pool.submit(orcar_pasta, trabalho): trabalho for trabalho in trabalhos}
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            trabalho = futuros[futuro]
+            try:
+                resultado = futuro.result()
+            except Exception as erro:  # O processo morreu ou o resultado não pôde voltar
+                resultado = ResultadoLote(trabalho.pasta, numero=trabalho.numero, erro=f"{type(erro).__name__}: {erro}")
+            resultados.append(resultado)
+            print(f"[{concluidos}/{len(trabalhos)}] {_linha_resumo(resultado)}")
+
+    # 4. Números dos trabalhos que falharam voltam para a numeração (a sequência não fica com buracos)
+    if alocador is not None:
+        alocador.devolver(resultado.numero for resultado in resultados
+                          if not resultado.ok and resultado.numero is not None)
+        alocador.fechar()
+
+    _imprimir_resumo(resultados, time.perf_counter() - inicio, processos)
+    return 0 if all(resultado.ok for resultado in resultados) else 1
+
+
+def reemitir_orcamentos(numeros: list[int], perfil: str | None = None, destino: str | None = None,
+                        processos: int | None = None) -> int:
+    """
+    Reemite orçamentos já salvos (ex.: depois de uma mudança na tabela de preços): reprecifica as linhas
+    guardadas no repositório, gera os PDFs em paralelo (results/lote_pdf.py) e atualiza o repositório.
+
+    :param numeros: Números dos orçamentos.
+    :param perfil: Arquivo ou busca do perfil com a nova tabela. Caso omitido, o perfil de cada orçamento
+                   (pelo nome salvo; a tabela padrão se ele não existir mais).
+    :param destino: Pasta dos PDFs ('orcamento_<número>.pdf'). Caso omitida, a pasta atual.
+    :param processos: Tamanho do pool. Caso omitido, um por núcleo.
+    :return: Código de saída do programa (0 = todos reemitidos, 1 = algum falhou).
+    """
+    from src.orca_facil.model.repositorio import RepositorioOrcamentos
+
+    inicio = time.perf_counter()
+    destino = destino or os.getcwd()
+    os.makedirs(destino, exist_ok=True)
+    perfis: dict[str | None, Perfil] = {}
+    if perfil:
+        try:
+            perfis[perfil] = escolher_perfil(perfil)
+        except ValueError as erro:
+            print(erro)
+            return 1
+    repositorio = RepositorioOrcamentos()
+    falhas: list[str] = []
+
+    try:
+        # 1. Reprecifica cada orçamento com a tabela do perfil (no processo principal: é rápido, sem E/S de arquivos)
+        pedidos, orcamentos = [], {}
+        for numero in numeros:
+            resumo = repositorio.obter(numero)
+            if resumo is None:
+                falhas.append(f"nº {numero}: não encontrado no repositório")
+                continue
+            consulta = perfil or resumo.perfil or None
+            try:
+                if consulta not in perfis:
+                    perfis[consulta] = _perfil_salvo(consulta)
+                perfil_orcamento = perfis[consulta]
+                orcamento = Orcamento(MotorPrecificacao(perfil_orcamento.tabela))
+                orcamento.adicionar_colunas(**repositorio.colunas(numero))
+            except (OSError, ValueError) as erro:
+                falhas.append(f"nº {numero}: {erro}")
+                continue
+
+            caminho = os.path.join(destino, f"orcamento_{numero}.pdf")
+            itens = [LinhaPDF(linha.descricao, linha.material, linha.acabamento, linha.largura_cm, linha.altura_cm,
+                              linha.quantidade, linha.valor) for linha in orcamento.linhas()]
+            pedidos.append(PedidoPDF(caminho, CabecalhoPDF(str(numero), resumo.cliente, perfil_orcamento.nome),
+                                     itens, orcamento.resultado))
+            orcamentos[caminho] = (numero, orcamento, resumo, perfil_orcamento)
+
+        # 2. PDFs em paralelo
+        def ao_concluir(resultado: ResultadoPDF) -> None:
+            situacao = f"{resultado.paginas} pág. em {resultado.segundos:.2f} s" if resultado.ok else resultado.erro
+            print(f"{os.path.basename(resultado.caminho)}: {situacao}")
+
+        resultados = gerar_lote(pedidos, processos, ao_concluir=ao_concluir) if pedidos else []
+
+        # 3. O repositório passa a ter os valores reemitidos
+        for resultado in resultados:
+            numero, orcamento, resumo, perfil_orcamento = orcamentos[resultado.caminho]
+            if not resultado.ok:
+                falhas.append(f"nº {numero}: {resultado.erro}")
+                continue
+            repositorio.salvar(orcamento, numero, resumo.cliente, resumo.documento, perfil_orcamento.nome)
+    finally:
+        repositorio.fechar()
+
+    print(f"\n{len(numeros) - len(falhas)} orçamento(s) reemitido(s), {len(falhas)} com falha, "
+          f"em {time.perf_counter() - inicio:.2f} s")
+    for falha in falhas:
+        print(f"  {falha}")
+    return 0 if not falhas else 1
+
+
+# PROCESSOS DO POOL ==============================
+def orcar_pasta(trabalho: TrabalhoLote) -> ResultadoLote:
+    """
+    Orça uma pasta e grava o seu PDF. Executado num processo do pool (função de módulo, serializável).
+    Nunca levanta exceção: a falha volta no campo 'erro', para não interromper o lote.
+    """
+    inicio = time.perf_counter()
+    resultado = ResultadoLote(trabalho.pasta, trabalho.destino, trabalho.numero)
+    perfil = trabalho.perfil
+    tabela = perfil.tabela
+    orcamento = Orcamento(MotorPrecificacao(tabela))
+
+    try:
+        # 1. Arquivos de impressão: uma linha por arquivo (como o "Adicionar Arquivos")
+        material, acabamento = next(iter(tabela.materiais), None), next(iter(tabela.acabamentos), None)
+        if material is None or acabamento is None:
+            raise ValueError("Perfil sem materiais ou acabamentos na tabela de preços")
+        linhas = []
+        for metadados in map(analisar_arquivo, expandir_caminhos([trabalho.pasta])):
+            if metadados.erro:
+                resultado.ignorados += 1
+                resultado.avisos.append(f"{metadados.nome}: {metadados.erro}")
+                continue
+            linhas.append(LinhaOrcamento.do_arquivo(metadados, material, acabamento))
+        orcamento.adicionar(linhas)
+
+        # 2. Planilhas na raiz da pasta (como o "Importar Planilha")
+        mapeamento = MapeamentoColunas.do_perfil(perfil.planilha, tabela)
+        for planilha in _planilhas(trabalho.pasta):
+            for lote, numeros in ler_lotes(planilha, mapeamento):
+                lote.filtrar(tabela.materiais, tabela.acabamentos, numeros)
+                resultado.ignorados += len(lote.erros)
+                if not len(lote):
+                    continue
+                try:
+                    orcamento.adicionar_colunas(**lote.colunas())
+                except (ValueError, TypeError, ArithmeticError) as erro:  # Lote desfeito pelo Model: segue a pasta
+                    resultado.ignorados += len(lote)
+                    resultado.avisos.append(f"{os.path.basename(planilha)}: {len(lote)} linha(s) recusada(s): {erro}")
+
+        if not len(orcamento):
+            raise ValueError("Nenhum arquivo ou linha de planilha válida na pasta")
+
+        # 3. Validação (só informa, como na janela)
+        relatorio = validador_da_tabela(tabela).validar(orcamento.colunas, documento=perfil.documento or None)
+        resultado.linhas_com_erro = len(relatorio.linhas_com_erro)
+        resultado.avisos.extend(relatorio.resumo())
+
+        # 4. PDF (fundo e logo preparados uma vez por processo)
+        cabecalho = CabecalhoPDF(numero=str(trabalho.numero or ""), cliente=perfil.cliente, perfil=perfil.nome)
+        itens = (LinhaPDF(linha.descricao, linha.material, linha.acabamento, linha.largura_cm, linha.altura_cm,
+                          linha.quantidade, linha.valor)
+                 for linha in orcamento.linhas())
+        resultado.paginas = gerador_do_processo().gerar(trabalho.destino, cabecalho, itens, orcamento.resultado)
+
+        # 5. Registro do orçamento emitido. Qualquer falha a partir daqui (inclusive ao abrir o banco, ex.:
+        #    "database is locked" com vários processos) devolve o número: o PDF com esse número não pode ficar
+        if trabalho.numero is not None:
+            try:
+                from src.orca_facil.model.repositorio import RepositorioOrcamentos
+                repositorio = RepositorioOrcamentos()
+                try:
+                    repositorio.salvar(orcamento, trabalho.numero, perfil.cliente, perfil.documento, perfil.nome)
+                finally:
+                    repositorio.fechar()
+            except Exception:
+                _descartar_pdf(resultado)
+                raise
+
+    except (OSError, ValueError) as erro:
+        resultado.erro = f"{type(erro).__name__}: {erro}"
+        log.info("Lote: %s não orçada: %s", trabalho.pasta, resultado.erro)  # O resumo já mostra a falha
+    except Exception as erro:  # Falha inesperada (ex.: banco travado): registra e segue o lote
+        resultado.erro = f"{type(erro).__name__}: {erro}"
+        log.exception("Lote: erro inesperado em %s", trabalho.pasta)
+
+    resultado.linhas = len(orcamento)
+    resultado.total = orcamento.resultado.valor_total
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
+
+
+# INTERNOS ==============================
+def _descartar_pdf(resultado: ResultadoLote) -> None:
+    """
+    Metodo Privado.
+    Apaga o PDF de um trabalho que falhou depois de gravá-lo, para o número voltar à numeração.
+    Se o arquivo não puder ser apagado, o número fica com ele (não é devolvido) e a sequência pula um número.
+    """
+    try:
+        os.remove(resultado.destino)
+    except FileNotFoundError:
+        pass
+    except OSError as erro:
+        log.error("Lote: PDF %s não apagado (%s); o número %s não será reutilizado",
+                  resultado.destino, erro, resultado.numero)
+        resultado.numero = None
+
+
+def _iniciar_processo(nivel_registro: str | None) -> None:
+    """Metodo Privado. Executado uma vez em cada processo do pool: liga o registro (só avisos no console)."""
+    configurar_registro(nivel_registro or "WARNING")
+
+
+def _perfil_salvo(nome: str | None) -> Perfil:
+    """
+    Metodo Privado.
+    Perfil salvo num orçamento, para reemiti-lo. O perfil pode ter sido apagado ou renomeado desde então:
+    nesse caso vale a tabela padrão.
+    """
+    if not nome or nome == "Padrão":
+        return Perfil(nome="Padrão")
+    try:
+        return escolher_perfil(nome)
+    except ValueError:
+        log.warning("Perfil '%s' não encontrado: usando a tabela padrão", nome)
+        return Perfil(nome="Padrão")
+
+
+def _planilhas(pasta: str) -> list[str]:
+    """Metodo Privado. Planilhas (.csv/.xlsx) na raiz da pasta do trabalho."""
+    return sorted(entrada.path for entrada in os.scandir(pasta)
+                  if entrada.is_file() and entrada.name.lower().endswith(EXTENSOES_PLANILHA))
+
+
+def _destino_pdf(pasta: str, destino: str | None) -> str:
+    """Metodo Privado. Arquivo do PDF: '<nome da pasta>.pdf' na pasta de destino (ou dentro da própria pasta)."""
+    nome = f"{os.path.basename(os.path.normpath(pasta))}.pdf"
+    return os.path.join(destino or pasta, nome)
+
+
+def _linha_resumo(resultado: ResultadoLote) -> str:
+    """Metodo Privado. Uma linha do andamento/resumo para o trabalho."""
+    nome = os.path.basename(resultado.pasta)
+    if not resultado.ok:
+        return f"{nome}: FALHOU ({resultado.erro}) em {resultado.segundos:.2f} s"
+    numero = f"nº {resultado.numero}, " if resultado.numero is not None else ""
+    extras = "".join((f", {resultado.ignorados} ignorado(s)" if resultado.ignorados else "",
+                      f", {resultado.linhas_com_erro} linha(s) com erro" if resultado.linhas_com_erro else ""))
+    return (f"{nome}: {numero}{resultado.linhas} linha(s), {resultado.paginas} pág., "
+            f"R$ {formatar_moeda(resultado.total)}{extras} em {resultado.segundos:.2f} s")
+
+
+def _imprimir_resumo(resultados: list[ResultadoLote], segundos: float, processos: int) -> None:
+    """Metodo Privado. Resumo final: totais, ganho do paralelismo e os trabalhos mais lentos."""
+    concluidos = [resultado for resultado in resultados if resultado.ok]
+    tempo_trabalhos = sum(resultado.segundos for resultado in resultados)
+    print("\n========== RESUMO DO LOTE ==========")
+    print(f"Trabalhos: {len(concluidos)} concluído(s), {len(resultados) - len(concluidos)} com falha")
+    print(f"Linhas: {sum(resultado.linhas for resultado in concluidos)}  |  "
+          f"Total: R$ {formatar_moeda(sum((resultado.total for resultado in concluidos), Decimal('0.00')))}")
+    print(f"Tempo: {segundos:.2f} s ({processos} processo(s); {tempo_trabalhos:.2f} s somando os trabalhos, "
+          f"ganho de {tempo_trabalhos / segundos if segundos else 0:.1f}x)")
+    print("Mais lentos:")
+    for resultado in sorted(resultados, key=lambda item: item.segundos, reverse=True)[:5]:
+        print(f"  {_linha_resumo(resultado)}")
+
+    com_avisos = [resultado for resultado in concluidos if resultado.avisos]
+    if com_avisos:
+        print(f"Avisos em {len(com_avisos)} trabalho(s) (o primeiro de cada):")
+        for resultado in com_avisos[:LIMITE_AVISOS]:
+            print(f"  {os.path.basename(resultado.pasta)}: {resultado.avisos[0]}")
+        if len(com_avisos) > LIMITE_AVISOS:
+            print(f"  ... e mais {len(com_avisos) - LIMITE_AVISOS} trabalho(s)")
+    print("====================================")
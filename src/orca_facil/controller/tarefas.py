@@ -0,0 +1,293 @@
+"""
+Módulo de Tarefas em Segundo Plano.
+Responsabilidade: Tirar da thread do Tk todo trabalho do Model e de E/S disparado pelos comandos da janela
+(validação, reprecificação, PDF, banco), devolvendo os resultados à View sem nunca travá-la.
+
+Fluxo:
+    Controller (thread do Tk) → AgendadorTarefas.executar(funcao, ..., ao_concluir)
+        → pool de threads (E/S, banco) ou de processos (cálculo pesado) executa a função
+        → o resultado entra numa fila thread-safe
+    AgendadorTarefas._despachar() (um único ciclo de after(), ~1 quadro) → ao_concluir(resultado) na thread do Tk
+
+> Cancelamento
+Cada tarefa tem um TokenCancelamento. Uma tarefa cancelada que ainda não começou nem chega a rodar; uma que
+já está rodando pode consultar o token (passar_token=True) para parar mais cedo. Em qualquer caso, o
+resultado de uma tarefa cancelada é descartado: o ao_concluir nunca é chamado.
+
+> Rajadas de eventos (chave)
+Tarefas com a mesma chave são coalescidas: um novo pedido cancela o anterior, então só o último roda
+(ex.: várias edições de quantidade seguidas → uma única validação, do estado final). Com 'atraso', o
+pedido ainda espera a rajada acabar antes de ser enviado ao pool.
+
+> Acompanhamentos
+Os serviços que já têm a própria fila (ingestão, importação, miniaturas) registram uma função de coleta
+em acompanhar(); o mesmo ciclo de after() a chama no intervalo pedido, enquanto ela retornar True.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+from src.configs.registro import registro
+
+log = registro("CONTROLLER")
+
+INTERVALO_MS = 16  # Ciclo do despacho enquanto houver tarefas (~1 quadro a 60 Hz)
+ORCAMENTO_QUADRO = 0.008  # Segundos de callbacks por ciclo: metade do quadro fica para o Tk desenhar
+THREADS = 2  # Tarefas de E/S simultâneas (PDF, banco, validação)
+
+
+class TarefaCancelada(Exception):
+    """Levantada por TokenCancelamento.verificar() dentro de uma tarefa cancelada."""
+
+
+class TokenCancelamento:
+    """Sinal de cancelamento de uma tarefa, consultado pela própria tarefa (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._evento = threading.Event()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._evento.is_set()
+
+    def cancelar(self) -> None:
+        self._evento.set()
+
+    def verificar(self) -> None:
+        """
+        Ponto de parada para tarefas longas.
+
+        Raises:
+            TarefaCancelada: Se a tarefa foi cancelada.
+        """
+        if self._evento.is_set():
+            raise TarefaCancelada()
+
+
+@dataclass(eq=False)  # Comparada por identidade (guardada em conjuntos)
+class _Tarefa:
+    """Uma tarefa pedida pela janela (só existe no processo principal)."""
+
+    funcao: Callable[..., Any]
+    argumentos: tuple
+    token: TokenCancelamento
+    ao_concluir: Callable[[Any], None] | None
+    ao_falhar: Callable[[BaseException], None] | None
+    chave: str | None
+    processo: bool
+    passar_token: bool
+    vencimento: float = 0.0  # time.monotonic() a partir do qual pode ser enviada (atraso)
+    futuro: Future | None = field(default=None, repr=False)
+
+
+@dataclass
+class _Acompanhamento:
+    """Função de coleta chamada periodicamente pelo despacho."""
+
+    funcao: Callable[[], bool]
+    intervalo: float  # Segundos
+    proxima: float = 0.0
+
+
+class AgendadorTarefas:
+    """
+    Agendador das tarefas da janela. Deve ser usado só pela thread do Tk (os pools e a fila de
+    resultados são os únicos pontos de contato com as outras threads).
+    """
+
+    def __init__(self, janela, threads: int = THREADS, processos: int = 1) -> None:
+        """
+        :param janela: Janela do Tk (fornece after()).
+        :param threads: Tamanho do pool de threads (E/S).
+        :param processos: Tamanho do pool de processos (cálculo pesado), criado só no primeiro uso.
+        """
+        self.janela = janela
+        self._threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="tarefas")
+        self._tamanho_processos = processos
+        self._processos: ProcessPoolExecutor | None = None
+        self._trava_processos = threading.Lock()
+        self._resultados: queue.SimpleQueue[tuple[_Tarefa, Any, BaseException | None]] = queue.SimpleQueue()
+        self._esperando: list[_Tarefa] = []  # Com atraso, ainda não enviadas
+        self._em_execucao: set[_Tarefa] = set()  # Enviadas ao pool, resultado ainda não despachado
+        self._por_chave: dict[str, _Tarefa] = {}  # Última tarefa de cada chave
+        self._acompanhamentos: list[_Acompanhamento] = []
+        self._agendado = False  # Há um after() do despacho pendente
+
+    @property
+    def pendentes(self) -> int:
+        """Tarefas ainda sem resultado despachado."""
+        return len(self._esperando) + len(self._em_execucao)
+
+    def ativa(self, chave: str) -> bool:
+        """Indica se há uma tarefa com a chave esperando ou em execução."""
+        return chave in self._por_chave
+
+    def executar(self, funcao: Callable[..., Any], *argumentos, ao_concluir: Callable[[Any], None] | None = None,
+                 ao_falhar: Callable[[BaseException], None] | None = None, chave: str | None = None,
+                 atraso: float = 0.0, processo: bool = False, passar_token: bool = False) -> TokenCancelamento:
+        """
+        Executa funcao(*argumentos) em segundo plano.
+
+        :param ao_concluir: Chamada na thread do Tk com o retorno da função.
+        :param ao_falhar: Chamada na thread do Tk com a exceção (caso omitida, a falha só vai para o registro).
+        :param chave: Tarefas com a mesma chave são coalescidas: esta cancela a anterior.
+        :param atraso: Segundos de espera antes do envio (uma nova tarefa com a mesma chave reinicia a espera).
+        :param processo: Executa no pool de processos (a função e os argumentos precisam ser serializáveis,
+                         e a função não recebe o token).
+        :param passar_token: Passa o token à função como argumento nomeado 'token' (só em threads).
+        :return: O token da tarefa (cancelar() descarta o resultado).
+        """
+        tarefa = _Tarefa(funcao, argumentos, TokenCancelamento(), ao_concluir, ao_falhar, chave, processo,
+                         passar_token and not processo, vencimento=time.monotonic() + atraso)
+        if chave is not None:
+            self.cancelar(chave)
+            self._por_chave[chave] = tarefa
+
+        if atraso > 0:
+            self._esperando.append(tarefa)
+        else:
+            self._enviar(tarefa)
+        self._agendar()
+        return tarefa.token
+
+    def acompanhar(self, funcao: Callable[[], bool], intervalo: float = 0.05) -> None:
+        """
+        Chama funcao() no ciclo do despacho a cada 'intervalo' segundos, enquanto ela retornar True.
+        Usado pelos serviços com fila própria (ingestão, importação, miniaturas).
+        """
+        self._acompanhamentos.append(_Acompanhamento(funcao, intervalo, time.monotonic() + intervalo))
+        self._agendar()
+
+    def cancelar(self, chave: str) -> bool:
+        """Cancela a tarefa da chave (esperando ou em execução). Retorna False se não havia nenhuma."""
+        tarefa = self._por_chave.pop(chave, None)
+        if tarefa is None:
+            return False
+        self._descartar(tarefa)
+        return True
+
+    def cancelar_todas(self) -> None:
+        """Cancela todas as tarefas (os acompanhamentos continuam)."""
+        for tarefa in [*self._esperando, *self._em_execucao]:
+            self._descartar(tarefa)
+        self._por_chave.clear()
+
+    def encerrar(self) -> None:
+        """
+        Encerra os pools ao fechar o programa: as tarefas na fila são canceladas e as que já estão
+        rodando terminam (um PDF pela metade não fica para trás).
+        """
+        self.cancelar_todas()
+        self._acompanhamentos.clear()
+        with self._trava_processos:
+            if self._processos is not None:
+                self._processos.shutdown(wait=False, cancel_futures=True)
+        self._threads.shutdown(wait=True, cancel_futures=True)
+
+    # INTERNOS ==============================
+    def _enviar(self, tarefa: _Tarefa) -> None:
+        """
+        Metodo Privado.
+        Envia a tarefa ao pool de threads; o fim dela só coloca o resultado na fila. Uma tarefa de processo
+        é enviada ao pool de processos por uma dessas threads: criar os processos e serializar os
+        argumentos também fica fora da thread do Tk.
+        """
+        funcao = partial(tarefa.funcao, token=tarefa.token) if tarefa.passar_token else tarefa.funcao
+        if tarefa.processo:
+            funcao = partial(self._em_processo, funcao)
+        tarefa.futuro = self._threads.submit(funcao, *tarefa.argumentos)
+        self._em_execucao.add(tarefa)
+        tarefa.futuro.add_done_callback(lambda futuro, tarefa=tarefa: self._ao_terminar(tarefa, futuro))
+
+    def _em_processo(self, funcao: Callable[..., Any], *argumentos) -> Any:
+        """
+        Metodo Privado.
+        Executado numa thread do agendador: roda a função no pool de processos (criado no primeiro uso) e espera o retorno.
+        """
+        with self._trava_processos:
+            if self._processos is None:
+                self._processos = ProcessPoolExecutor(max_workers=self._tamanho_processos)
+            pool = self._processos
+        return pool.submit(funcao, *argumentos).result()
+
+    def _ao_terminar(self, tarefa: _Tarefa, futuro: Future) -> None:
+        """Metodo Privado. Executado na thread do pool: só entrega o resultado à fila (nada de Tk aqui)."""
+        if futuro.cancelled():
+            self._resultados.put((tarefa, None, None))
+            return
+        erro = futuro.exception()
+        self._resultados.put((tarefa, None if erro else futuro.result(), erro))
+
+    def _descartar(self, tarefa: _Tarefa) -> None:
+        """Metodo Privado. Cancela o token e, se a tarefa ainda não começou, tira-a da fila."""
+        tarefa.token.cancelar()
+        if tarefa in self._esperando:
+            self._esperando.remove(tarefa)
+        elif tarefa.futuro is not None:
+            tarefa.futuro.cancel()  # Sem efeito se já estiver rodando: o resultado será descartado
+
+    def _agendar(self) -> None:
+        """Metodo Privado. Garante um (e só um) after() do despacho pendente."""
+        if not self._agendado:
+            self._agendado = True
+            self.janela.after(INTERVALO_MS, self._despachar)
+
+    def _despachar(self) -> None:
+        """
+        Metodo Privado.
+        Ciclo único de after(): envia as tarefas cuja espera acabou, chama os acompanhamentos no horário
+        e entrega os resultados prontos, parando quando o orçamento do quadro acaba (o resto fica para o
+        próximo ciclo). Se reagenda enquanto houver algo pendente.
+        """
+        self._agendado = False
+        inicio = time.monotonic()
+
+        # 1. Tarefas com atraso cuja rajada terminou
+        for tarefa in [tarefa for tarefa in self._esperando if tarefa.vencimento <= inicio]:
+            self._esperando.remove(tarefa)
+            self._enviar(tarefa)
+
+        # 2. Acompanhamentos no horário
+        for acompanhamento in [item for item in self._acompanhamentos if item.proxima <= inicio]:
+            if self._chamar(acompanhamento.funcao):
+                acompanhamento.proxima = time.monotonic() + acompanhamento.intervalo
+            else:
+                self._acompanhamentos.remove(acompanhamento)
+
+        # 3. Resultados, até o limite do quadro
+        while time.monotonic() - inicio < ORCAMENTO_QUADRO:
+            try:
+                tarefa, resultado, erro = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            self._em_execucao.discard(tarefa)
+            if tarefa.chave is not None and self._por_chave.get(tarefa.chave) is tarefa:
+                del self._por_chave[tarefa.chave]
+            if tarefa.token.cancelado or isinstance(erro, TarefaCancelada):
+                continue
+            if erro is None:
+                if tarefa.ao_concluir is not None:
+                    self._chamar(tarefa.ao_concluir, resultado)
+            elif tarefa.ao_falhar is not None:
+                self._chamar(tarefa.ao_falhar, erro)
+            else:
+                log.error("Tarefa %s falhou: %s: %s", getattr(tarefa.funcao, "__qualname__", tarefa.funcao),
+                          type(erro).__name__, erro)
+
+        if self._esperando or self._em_execucao or self._acompanhamentos or not self._resultados.empty():
+            self._agendar()
+
+    @staticmethod
+    def _chamar(funcao: Callable, *argumentos):
+        """Metodo Privado. Chama um callback da janela; uma exceção nele não pode parar o despacho."""
+        try:
+            return funcao(*argumentos)
+        except Exception:
+            log.exception("Erro em %s", getattr(funcao, "__qualname__", funcao))
+            return False
+
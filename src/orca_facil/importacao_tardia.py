@@ -0,0 +1,142 @@
+"""
+Módulo de Importação Tardia.
+Responsabilidade: Adiar o carregamento dos módulos pesados até o primeiro uso da funcionalidade
+e medir quanto tempo cada importação custa na abertura do programa (--profile-startup).
+
+> Como funciona a importação tardia?
+importar_tardio("pacote.modulo") devolve um objeto de módulo "vazio" (importlib.util.LazyLoader).
+O código do módulo — e tudo o que ele importa — só é executado no primeiro acesso a um atributo
+(ex.: saida.GeradorPDF). Assim, a Janela Principal aparece antes de o gerador de PDF ou o pool de
+processos da análise de arquivos serem carregados.
+"""
+
+import importlib.util
+import sys
+import time
+from dataclasses import dataclass, field
+
+
+def importar_tardio(nome: str):
+    """
+    Retorna o módulo 'nome' sem executá-lo; ele é carregado no primeiro acesso a um atributo.
+    Se o módulo já foi importado, retorna o próprio módulo.
+
+    Raises:
+        ModuleNotFoundError: Se o módulo não existir (verificado já na chamada, sem executar o módulo).
+    """
+    if nome in sys.modules:
+        return sys.modules[nome]
+
+    especificacao = importlib.util.find_spec(nome)
+    if especificacao is None:
+        raise ModuleNotFoundError(f"Módulo '{nome}' não encontrado", name=nome)
+
+    carregador = importlib.util.LazyLoader(especificacao.loader)
+    especificacao.loader = carregador
+    modulo = importlib.util.module_from_spec(especificacao)
+    sys.modules[nome] = modulo
+    carregador.exec_module(modulo)
+    return modulo
+
+
+@dataclass
+class TempoImportacao:
+    """Tempo gasto para executar um módulo durante a importação."""
+
+    modulo: str
+    total: float = 0.0  # Segundos, incluindo os módulos importados por ele
+    proprio: float = 0.0  # Segundos, só o código do próprio módulo
+    filhos: list[str] = field(default_factory=list)
+
+
+class _CarregadorMedido:
+    """Carregador que envolve o original e mede quanto tempo a execução do módulo leva."""
+
+    def __init__(self, carregador, perfil: "PerfilImportacao") -> None:
+        self._carregador = carregador
+        self._perfil = perfil
+
+    def __getattr__(self, nome):
+        return getattr(self._carregador, nome)  # Demais recursos do carregador (get_data, is_package...)
+
+    def create_module(self, especificacao):
+        return self._carregador.create_module(especificacao)
+
+    def exec_module(self, modulo) -> None:
+        self._perfil._entrar(modulo.__name__)
+        try:
+            self._carregador.exec_module(modulo)
+        finally:
+            self._perfil._sair()
+
+
+class PerfilImportacao:
+    """
+    Mede o tempo de importação de cada módulo enquanto estiver ativo (equivalente a 'python -X importtime',
+    mas embutido no programa e com relatório próprio).
+    Instalado como o primeiro localizador de sys.meta_path: só os módulos importados depois de iniciar() são medidos.
+    """
+
+    def __init__(self) -> None:
+        self.tempos: dict[str, TempoImportacao] = {}
+        self._pilha: list[tuple[str, float]] = []  # (módulo, início) das importações em andamento
+        self._ativo = False
+
+    def iniciar(self) -> "PerfilImportacao":
+        """Começa a medir as importações."""
+        if not self._ativo:
+            sys.meta_path.insert(0, self)
+            self._ativo = True
+        return self
+
+    def parar(self) -> None:
+        """Para de medir (as medições já feitas continuam disponíveis)."""
+        if self._ativo:
+            sys.meta_path.remove(self)
+            self._ativo = False
+
+    def relatorio(self, limite: int = 25) -> list[str]:
+        """
+        Linhas do relatório: os módulos mais caros, com o tempo total e o tempo próprio em ms.
+
+        :param limite: Quantidade máxima de módulos listados.
+        """
+        tempos = sorted(self.tempos.values(), key=lambda tempo: tempo.total, reverse=True)
+        filhos = {filho for tempo in tempos for filho in tempo.filhos}
+        raizes = sum(tempo.total for tempo in tempos if tempo.modulo not in filhos)  # Sem contar duas vezes
+        linhas = [f"{'TOTAL (ms)':>10} {'PRÓPRIO (ms)':>12}  MÓDULO"]
+        linhas += [f"{tempo.total * 1000:>10.1f} {tempo.proprio * 1000:>12.1f}  {tempo.modulo}"
+                   for tempo in tempos[:limite]]
+        linhas.append(f"{raizes * 1000:>10.1f} {'':>12}  ({len(self.tempos)} módulo(s) importado(s))")
+        return linhas
+
+    # LOCALIZADOR (sys.meta_path) ==============================
+    def find_spec(self, nome, caminho=None, alvo=None):
+        """Delega a busca aos demais localizadores e envolve o carregador encontrado."""
+        for localizador in sys.meta_path:
+            if localizador is self or not hasattr(localizador, "find_spec"):
+                continue
+            especificacao = localizador.find_spec(nome, caminho, alvo)
+            if especificacao is not None:
+                if especificacao.loader is not None and hasattr(especificacao.loader, "exec_module"):
+                    especificacao.loader = _CarregadorMedido(especificacao.loader, self)
+                return especificacao
+        return None
+
+    # INTERNOS ==============================
+    def _entrar(self, modulo: str) -> None:
+        """Metodo Privado. Marca o início da execução de um módulo (e o registra como filho do anterior)."""
+        if self._pilha:
+            self.tempos.setdefault(self._pilha[-1][0], TempoImportacao(self._pilha[-1][0])).filhos.append(modulo)
+        self._pilha.append((modulo, time.perf_counter()))
+
+    def _sair(self) -> None:
+        """Metodo Privado. Fecha a medição do módulo atual e desconta o seu tempo do módulo que o importou."""
+        modulo, inicio = self._pilha.pop()
+        duracao = time.perf_counter() - inicio
+        tempo = self.tempos.setdefault(modulo, TempoImportacao(modulo))
+        tempo.total += duracao
+        tempo.proprio += duracao
+        if self._pilha:
+            pai = self._pilha[-1][0]
+            self.tempos.setdefault(pai, TempoImportacao(pai)).proprio -= duracao
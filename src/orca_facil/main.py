@@ -1,27 +1,115 @@
 """
 Módulo de inicialização.
 Responsabilidade: Instanciação do Controller e inicialização da interface por meio dele (Main → Controller → View)
+
+Opções de linha de comando:
+  --profile-startup  Mostra o tempo de importação de cada módulo e o tempo até a primeira pintura da janela.
+  --log-level NIVEL  Nível mínimo das mensagens (DEBUG, INFO, WARNING, ERROR).
+  --log-file ARQUIVO Também grava as mensagens num arquivo.
+  --quiet            Não escreve as mensagens no console.
+  --monitor          Mede o atraso do loop da janela, os comandos e a memória (F12 mostra o painel;
+                     resumo por segundo em diagnostico/desempenho.jsonl na pasta de dados).
+
+Modo em lote (sem janela; ver controller/lote.py):
+  --lote PASTA...    Orça cada pasta (curingas aceitos, ex.: entrada/*) e grava um PDF por pasta.
+  --perfil PERFIL    Perfil dos orçamentos: arquivo (ex.: cliente.json) ou busca por nome/cliente/documento.
+  --destino PASTA    Pasta dos PDFs (padrão: dentro de cada pasta de trabalho).
+  --processos N      Processos em paralelo (padrão: um por núcleo).
+  --sem-registro     Não numera os orçamentos nem os grava no repositório.
+  --reemitir N...    Reemite orçamentos já salvos com a tabela atual do perfil (--perfil, --destino, --processos).
 """
 
-# Importa a classe Controller responsável por gerenciar o fluxo da aplicação
-from src.orca_facil.controller.controller import Controller
-""" 'from' <pasta> → <pasta> → <pasta> → <módulo> 'import' <Classe> """
+import sys
+import time
+
+INICIO = time.perf_counter()  # Referência para o tempo de abertura (antes de qualquer outra importação do programa)
+
+from src.orca_facil.importacao_tardia import PerfilImportacao
+
+# O perfil começa antes das demais importações (inclusive argparse) para medir a abertura inteira
+PERFIL_ABERTURA = PerfilImportacao().iniciar() if "--profile-startup" in sys.argv[1:] else None
+
+import argparse
+
+from src.configs.registro import configurar_registro, registro
 
-def console(mensagem) -> None:
-    print(f"\033[95m[MAIN] {mensagem}.\033[0m")  # Print em MAGENTA no console
+log = registro("MAIN")
 
-def main() -> None:
+def ler_argumentos(argumentos=None) -> argparse.Namespace:
+    """Interpreta as opções da linha de comando."""
+    leitor = argparse.ArgumentParser(prog="orca_facil", description="Orça Fácil 3.0")
+    leitor.add_argument("--profile-startup", action="store_true",
+                        help="mostra o tempo de importação por módulo e o tempo até a primeira pintura")
+    leitor.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], type=str.upper,
+                        help="nível mínimo das mensagens (padrão: ORCA_FACIL_LOG ou INFO)")
+    leitor.add_argument("--log-file", metavar="ARQUIVO", help="também grava as mensagens neste arquivo")
+    leitor.add_argument("--quiet", action="store_true", help="não escreve as mensagens no console")
+    leitor.add_argument("--monitor", action="store_true",
+                        help="mede o atraso da janela, os comandos e a memória (F12 mostra o painel)")
+
+    lote = leitor.add_argument_group("modo em lote (sem janela)")
+    lote.add_argument("--lote", nargs="+", metavar="PASTA", help="orça cada pasta e grava um PDF por pasta")
+    lote.add_argument("--perfil", help="perfil dos orçamentos (arquivo ou busca por nome/cliente/documento)")
+    lote.add_argument("--destino", metavar="PASTA", help="pasta dos PDFs (padrão: dentro de cada pasta)")
+    lote.add_argument("--processos", type=int, metavar="N", help="processos em paralelo (padrão: um por núcleo)")
+    lote.add_argument("--sem-registro", action="store_true",
+                      help="não numera os orçamentos nem os grava no repositório")
+    lote.add_argument("--reemitir", nargs="+", type=int, metavar="NUMERO",
+                      help="reemite orçamentos já salvos com a tabela atual do perfil")
+    return leitor.parse_args(argumentos)
+
+def main(argumentos=None) -> int:
     """
     Instancia o Controller, inicializa a interface e o loop principal do programa.
+    Com --lote, orça as pastas sem abrir a janela.
+
+    :return: Código de saída do programa.
     """
+    opcoes = ler_argumentos(argumentos)
+    configurar_registro(opcoes.log_level, console=not opcoes.quiet, arquivo=opcoes.log_file)
+
+    # Modo em lote: não importa a View (nem o customtkinter)
+    if opcoes.reemitir:
+        from src.orca_facil.controller.lote import reemitir_orcamentos
+        return reemitir_orcamentos(opcoes.reemitir, perfil=opcoes.perfil, destino=opcoes.destino,
+                                   processos=opcoes.processos)
+    if opcoes.lote:
+        from src.orca_facil.controller.lote import executar_lote
+        return executar_lote(opcoes.lote, perfil=opcoes.perfil, destino=opcoes.destino, processos=opcoes.processos,
+                             registrar=not opcoes.sem_registro, nivel_registro=opcoes.log_level)
+
+    log.info("Inicializando..")
+    perfil = (PERFIL_ABERTURA or PerfilImportacao().iniciar()) if opcoes.profile_startup else None
+
+    # Importa a classe Controller responsável por gerenciar o fluxo da aplicação.
+    # A importação fica aqui (e não no topo) para que o --profile-startup meça a árvore inteira de módulos
+    from src.orca_facil.controller.controller import Controller
+    """ 'from' <pasta> → <pasta> → <pasta> → <módulo> 'import' <Classe> """
+    fim_importacoes = time.perf_counter()
 
     controller = Controller()  # Instancia o Controller (<variável> = <Classe> importada
-    console("Controller instanciado")
+    log.info("Controller instanciado")
+
+    def relatorio_abertura(janela) -> None:
+        """Imprime o relatório do --profile-startup quando a janela termina de abrir."""
+        perfil.parar()
+        print("\n========== PERFIL DE ABERTURA (--profile-startup) ==========")
+        print("\n".join(perfil.relatorio()))
+        print(f"\nImportações concluídas: {(fim_importacoes - INICIO) * 1000:.0f} ms")
+        for etapa, descricao in (("nucleo", "Janela criada (núcleo)"), ("primeira_pintura", "Primeira pintura"),
+                                 ("paineis", "Painéis concluídos")):
+            instante = janela.instante_inicio + janela.tempos[etapa]
+            print(f"{descricao}: {(instante - INICIO) * 1000:.0f} ms")
+        print("=============================================================\n")
 
-    console("Iniciando processo de carregamento da Janela Principal")
-    controller.iniciar()  # Chama o metodo de inicialização do programa, que cria a janela principal e os seus widgets
+    log.info("Iniciando processo de carregamento da Janela Principal")
+    # Chama o metodo de inicialização do programa, que cria a janela principal e os seus widgets
+    controller.iniciar(ao_abrir=relatorio_abertura if perfil else None, monitorar=opcoes.monitor)
+    return 0
 
 
 if __name__ == "__main__":  # Garante que "main()" só será executado se for rodado diretamente (não quando importado)
-    console("Inicializando..")
-    main()  # Executa a aplicação
+    if getattr(sys, "frozen", False):  # freeze_support() só age no executável; fora dele evita ~13 ms de importação
+        import multiprocessing
+        multiprocessing.freeze_support()  # Necessário para o pool de processos no executável (PyInstaller / Windows)
+    sys.exit(main())  # Executa a aplicação
@@ -0,0 +1,250 @@
+"""
+Módulo de análise de arquivos.
+Responsabilidade: Ler os metadados de impressão de cada arquivo (dimensões em pixels, DPI e número de páginas)
+sem decodificar a imagem inteira.
+
+> Por que ler só o cabeçalho?
+Arquivos de impressão costumam ter centenas de MB. As dimensões e o DPI ficam no cabeçalho
+(JPEG: marcadores SOF/JFIF, PNG: blocos IHDR/pHYs, TIFF: primeira IFD, PDF: MediaBox),
+então basta ler alguns KB para conhecer o tamanho físico da peça.
+
+As funções deste módulo são chamadas pelos processos da ingestão (controller/ingestao.py),
+por isso devem ser funções de nível de módulo (serializáveis pelo 'pickle').
+"""
+
+import mmap
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+
+# Extensões aceitas em "Adicionar Arquivos"
+EXTENSOES_SUPORTADAS = (".jpg", ".jpeg", ".png", ".tif", ".tiff", ".pdf")
+
+POLEGADA_CM = 2.54
+DPI_PADRAO = 72.0  # Valor assumido quando o arquivo não informa a resolução (padrão de Photoshop/Illustrator)
+
+
+@dataclass
+class MetadadosArquivo:
+    """Informações de impressão extraídas de um arquivo."""
+
+    caminho: str
+    formato: str = ""
+    largura_px: int = 0
+    altura_px: int = 0
+    dpi_x: float = DPI_PADRAO
+    dpi_y: float = DPI_PADRAO
+    paginas: int = 1
+    largura_cm: float = 0.0
+    altura_cm: float = 0.0
+    erro: str = field(default="")  # Mensagem de erro quando o arquivo não pôde ser lido
+
+    @property
+    def nome(self) -> str:
+        """Nome do arquivo sem a pasta."""
+        return os.path.basename(self.caminho)
+
+    @property
+    def area_m2(self) -> float:
+        """Área de uma página/peça em m²."""
+        return (self.largura_cm / 100) * (self.altura_cm / 100)
+
+
+def expandir_caminhos(caminhos) -> list[str]:
+    """
+    Transforma a seleção do usuário em uma lista de arquivos suportados.
+    Pastas são percorridas recursivamente; arquivos com extensão não suportada são ignorados.
+    """
+    arquivos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            for pasta, _, nomes in os.walk(caminho):
+                arquivos.extend(os.path.join(pasta, nome) for nome in sorted(nomes)
+                                if nome.lower().endswith(EXTENSOES_SUPORTADAS))
+        elif caminho.lower().endswith(EXTENSOES_SUPORTADAS):
+            arquivos.append(caminho)
+    return arquivos
+
+
+def analisar_arquivo(caminho: str) -> MetadadosArquivo:
+    """
+    Lê os metadados de um arquivo conforme o formato.
+    Nunca levanta exceção: erros de leitura são devolvidos no campo 'erro', para não interromper o lote.
+    """
+    metadados = MetadadosArquivo(caminho=caminho)
+
+    try:
+        with open(caminho, "rb") as arquivo:
+            assinatura = arquivo.read(8)
+            arquivo.seek(0)
+
+            # 1. Identifica o formato pela assinatura (não pela extensão)
+            if assinatura.startswith(b"\xff\xd8"):
+                _ler_jpeg(arquivo, metadados)
+            elif assinatura.startswith(b"\x89PNG\r\n\x1a\n"):
+                _ler_png(arquivo, metadados)
+            elif assinatura[:4] in (b"II*\x00", b"MM\x00*"):
+                _ler_tiff(arquivo, metadados)
+            elif assinatura.startswith(b"%PDF"):
+                _ler_pdf(arquivo, metadados)
+            else:
+                metadados.erro = "Formato não suportado"
+                return metadados
+
+        # 2. Converte pixels em centímetros (PDFs já informam o tamanho físico)
+        if metadados.formato != "PDF":
+            metadados.largura_cm = metadados.largura_px / metadados.dpi_x * POLEGADA_CM
+            metadados.altura_cm = metadados.altura_px / metadados.dpi_y * POLEGADA_CM
+
+    except (OSError, ValueError, struct.error) as erro:
+        metadados.erro = f"{type(erro).__name__}: {erro}"
+
+    return metadados
+
+
+# LEITORES POR FORMATO ==============================
+def _ler_jpeg(arquivo, metadados: MetadadosArquivo) -> None:
+    """Percorre os marcadores do JPEG até o SOF (dimensões), lendo o JFIF (densidade) pelo caminho."""
+    metadados.formato = "JPEG"
+    arquivo.seek(2)
+
+    while True:
+        # 1. Localiza o próximo marcador (0xFF seguido do código)
+        byte = arquivo.read(1)
+        while byte and byte != b"\xff":
+            byte = arquivo.read(1)
+        while byte == b"\xff":
+            byte = arquivo.read(1)
+        if not byte:
+            raise ValueError("Marcador SOF não encontrado no JPEG")
+        marcador = byte[0]
+
+        # 2. Marcadores sem conteúdo
+        if marcador in (0x01, *range(0xD0, 0xD9)):
+            continue
+
+        tamanho = struct.unpack(">H", arquivo.read(2))[0]
+        conteudo = arquivo.read(tamanho - 2)
+
+        # 3. APP0/JFIF: unidade (1 = pol, 2 = cm) e densidade
+        if marcador == 0xE0 and conteudo.startswith(b"JFIF\x00") and len(conteudo) >= 12:
+            unidade, densidade_x, densidade_y = struct.unpack(">BHH", conteudo[7:12])
+            if unidade and densidade_x and densidade_y:
+                fator = POLEGADA_CM if unidade == 2 else 1.0
+                metadados.dpi_x, metadados.dpi_y = densidade_x * fator, densidade_y * fator
+
+        # 4. SOF0..SOF15 (exceto DHT, JPG e DAC): altura e largura
+        elif 0xC0 <= marcador <= 0xCF and marcador not in (0xC4, 0xC8, 0xCC):
+            metadados.altura_px, metadados.largura_px = struct.unpack(">HH", conteudo[1:5])
+            return
+
+
+def _ler_png(arquivo, metadados: MetadadosArquivo) -> None:
+    """Lê o IHDR (dimensões) e o pHYs (pixels por metro), parando no primeiro bloco de dados."""
+    metadados.formato = "PNG"
+    arquivo.seek(8)
+
+    while True:
+        cabecalho = arquivo.read(8)
+        if len(cabecalho) < 8:
+            return
+        tamanho, tipo = struct.unpack(">I4s", cabecalho)
+
+        if tipo == b"IHDR":
+            metadados.largura_px, metadados.altura_px = struct.unpack(">II", arquivo.read(8))
+            arquivo.seek(tamanho - 8 + 4, os.SEEK_CUR)  # Resto do bloco + CRC
+        elif tipo == b"pHYs":
+            por_metro_x, por_metro_y, unidade = struct.unpack(">IIB", arquivo.read(9))
+            if unidade == 1 and por_metro_x and por_metro_y:
+                metadados.dpi_x, metadados.dpi_y = por_metro_x * 0.0254, por_metro_y * 0.0254
+            arquivo.seek(4, os.SEEK_CUR)
+        elif tipo in (b"IDAT", b"IEND"):
+            return  # O pHYs sempre vem antes dos dados da imagem
+        else:
+            arquivo.seek(tamanho + 4, os.SEEK_CUR)
+
+
+def _ler_tiff(arquivo, metadados: MetadadosArquivo) -> None:
+    """Lê as tags de dimensão e resolução da primeira IFD e conta as páginas (IFDs encadeadas)."""
+    metadados.formato = "TIFF"
+    ordem = "<" if arquivo.read(2) == b"II" else ">"
+    arquivo.seek(4)
+    deslocamento = struct.unpack(f"{ordem}I", arquivo.read(4))[0]
+
+    tipos = {3: ("H", 2), 4: ("I", 4), 5: ("II", 8)}  # SHORT, LONG, RATIONAL
+    unidade = 2  # 2 = polegada (padrão TIFF), 3 = centímetro
+    paginas = 0
+
+    while deslocamento and paginas < 10_000:
+        arquivo.seek(deslocamento)
+        quantidade = struct.unpack(f"{ordem}H", arquivo.read(2))[0]
+        entradas = arquivo.read(quantidade * 12)
+        deslocamento = struct.unpack(f"{ordem}I", arquivo.read(4))[0]
+        paginas += 1
+
+        # As dimensões e a resolução vêm apenas da primeira página
+        if paginas > 1:
+            continue
+
+        for indice in range(quantidade):
+            tag, tipo, _, valor = struct.unpack(f"{ordem}HHI4s", entradas[indice * 12:indice * 12 + 12])
+            if tipo not in tipos:
+                continue
+            formato, tamanho = tipos[tipo]
+            if tamanho > 4:  # RATIONAL: o campo guarda o deslocamento do valor
+                posicao = arquivo.tell()
+                arquivo.seek(struct.unpack(f"{ordem}I", valor)[0])
+                numerador, denominador = struct.unpack(f"{ordem}{formato}", arquivo.read(8))
+                arquivo.seek(posicao)
+                numero = numerador / denominador if denominador else 0
+            else:
+                numero = struct.unpack(f"{ordem}{formato}", valor[:tamanho])[0]
+
+            if tag == 256:
+                metadados.largura_px = int(numero)
+            elif tag == 257:
+                metadados.altura_px = int(numero)
+            elif tag == 282 and numero:
+                metadados.dpi_x = numero
+            elif tag == 283 and numero:
+                metadados.dpi_y = numero
+            elif tag == 296:
+                unidade = int(numero)
+
+    if unidade == 3:
+        metadados.dpi_x *= POLEGADA_CM
+        metadados.dpi_y *= POLEGADA_CM
+    metadados.paginas = max(paginas, 1)
+
+
+_PDF_PAGINA = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+_PDF_CONTAGEM = re.compile(rb"/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b")
+_PDF_MEDIABOX = re.compile(rb"/MediaBox\s*\[\s*([-\d.]+)\s+([-\d.]+)\s+([-\d.]+)\s+([-\d.]+)\s*\]")
+
+
+def _ler_pdf(arquivo, metadados: MetadadosArquivo) -> None:
+    """
+    Conta as páginas e lê o MediaBox da primeira página.
+    O arquivo é mapeado em memória, então o sistema operacional só carrega os trechos percorridos pela busca.
+
+    Raises:
+        ValueError: Se o MediaBox não estiver em texto aberto (ex.: PDF 1.5+ com object streams comprimidos).
+            Sem ele a peça sairia com 0 × 0 cm e valor zero no orçamento.
+    """
+    metadados.formato = "PDF"
+    metadados.dpi_x = metadados.dpi_y = 0.0  # Vetorial: a resolução não se aplica
+
+    with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        # 1. Páginas: o maior '/Count' de um nó '/Pages' é o da raiz; senão conta os objetos '/Page'
+        contagens = [int(a or b) for a, b in _PDF_CONTAGEM.findall(mapa)]
+        metadados.paginas = max(contagens) if contagens else max(len(_PDF_PAGINA.findall(mapa)), 1)
+
+        # 2. Tamanho físico: MediaBox em pontos (1 pt = 1/72 pol)
+        caixa = _PDF_MEDIABOX.search(mapa)
+        if not caixa:
+            raise ValueError("MediaBox não encontrado no PDF (objetos comprimidos?): arquivo não lido")
+        x0, y0, x1, y1 = map(float, caixa.groups())
+        metadados.largura_cm = abs(x1 - x0) / 72 * POLEGADA_CM
+        metadados.altura_cm = abs(y1 - y0) / 72 * POLEGADA_CM
+        metadados.largura_px, metadados.altura_px = round(abs(x1 - x0)), round(abs(y1 - y0))
@@ -0,0 +1,135 @@
+"""
+Módulo de Cache de Metadados.
+Responsabilidade: Guardar em disco os metadados já extraídos de cada arquivo, para que um arquivo
+adicionado de novo (outro orçamento, cliente recorrente) não precise ser aberto e medido outra vez.
+
+> Como um arquivo é identificado?
+Pela impressão digital: hash do conteúdo + tamanho + data de modificação (mtime).
+O hash usa apenas o início e o fim do arquivo (amostra de 64 KB cada), pois ler centenas de MB
+só para descobrir que o arquivo já é conhecido tornaria o cache inútil. O tamanho e o mtime
+completam a chave, então qualquer alteração no arquivo gera uma nova entrada.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+
+from src.configs.caminhos import pasta_dados
+from src.orca_facil.model.arquivos import MetadadosArquivo
+
+TAMANHO_AMOSTRA = 64 * 1024  # Bytes lidos do início e do fim do arquivo para o hash
+CAPACIDADE_PADRAO = 20_000  # Máximo de arquivos mantidos no cache
+
+
+def impressao_digital(caminho: str) -> str:
+    """
+    Calcula a chave do arquivo no cache: hash da amostra do conteúdo + tamanho + mtime.
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido.
+    """
+    estado = os.stat(caminho)
+    resumo = hashlib.blake2b(digest_size=16)
+
+    with open(caminho, "rb") as arquivo:
+        resumo.update(arquivo.read(TAMANHO_AMOSTRA))
+        if estado.st_size > 2 * TAMANHO_AMOSTRA:
+            arquivo.seek(-TAMANHO_AMOSTRA, os.SEEK_END)
+            resumo.update(arquivo.read(TAMANHO_AMOSTRA))
+
+    return f"{resumo.hexdigest()}:{estado.st_size}:{estado.st_mtime_ns}"
+
+
+class CacheMetadados:
+    """
+    Cache LRU persistente de metadados de arquivos.
+    As entradas menos usadas recentemente são descartadas quando a capacidade é ultrapassada.
+    Pode ser usado por várias threads ao mesmo tempo (despachante e pool da ingestão).
+    """
+
+    def __init__(self, caminho: str | None = None, capacidade: int = CAPACIDADE_PADRAO) -> None:
+        """
+        :param caminho: Arquivo JSON do cache. Caso omitido, usa a pasta de dados do programa.
+        :param capacidade: Quantidade máxima de arquivos guardados.
+        """
+        self.caminho = caminho or pasta_dados("cache", "metadados.json")
+        self.capacidade = capacidade
+        self._entradas: OrderedDict[str, dict] | None = None  # Carregado no primeiro uso
+        self._trava = threading.Lock()
+        self._trava_gravacao = threading.Lock()  # Impede duas gravações simultâneas do mesmo arquivo
+        self._alterado = False
+
+    def obter(self, caminho: str) -> tuple[str, MetadadosArquivo | None]:
+        """
+        Consulta o cache antes de qualquer decodificação do arquivo.
+
+        :return: A impressão digital do arquivo e os metadados guardados (ou None, se ainda não conhecido).
+        """
+        chave = impressao_digital(caminho)
+
+        with self._trava:
+            entradas = self._carregar()
+            dados = entradas.get(chave)
+            if dados is None or not dados.get("largura_cm"):
+                return chave, None  # Sem tamanho físico: entrada antiga de um PDF não lido, analisa de novo
+            try:
+                metadados = MetadadosArquivo(caminho=caminho, **dados)
+            except TypeError:
+                # Entrada gravada por outra versão, com um campo que MetadadosArquivo não tem mais: analisa de novo
+                del entradas[chave]
+                self._alterado = True
+                return chave, None
+            entradas.move_to_end(chave)  # Marca como usado recentemente
+
+        return chave, metadados
+
+    def guardar(self, chave: str, metadados: MetadadosArquivo) -> None:
+        """Guarda os metadados de um arquivo analisado com sucesso, descartando os mais antigos se necessário."""
+        if metadados.erro:
+            return
+
+        dados = asdict(metadados)
+        del dados["caminho"]  # O mesmo conteúdo pode estar em outra pasta
+
+        with self._trava:
+            entradas = self._carregar()
+            entradas[chave] = dados
+            entradas.move_to_end(chave)
+            while len(entradas) > self.capacidade:
+                entradas.popitem(last=False)
+            self._alterado = True
+
+    def salvar(self) -> None:
+        """
+        Grava o cache em disco, se houve alterações.
+        A gravação é feita num arquivo temporário e depois substituída, então o cache nunca fica corrompido.
+        """
+        with self._trava_gravacao:
+            with self._trava:
+                if not self._alterado:
+                    return
+                conteudo = json.dumps(self._entradas, ensure_ascii=False, separators=(",", ":"))
+                self._alterado = False
+
+            temporario = f"{self.caminho}.tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                arquivo.write(conteudo)
+            os.replace(temporario, self.caminho)
+
+    def __len__(self) -> int:
+        with self._trava:
+            return len(self._carregar())
+
+    # INTERNOS ==============================
+    def _carregar(self) -> OrderedDict:
+        """Metodo Privado. Lê o arquivo do cache na primeira consulta (chamado com a trava adquirida)."""
+        if self._entradas is None:
+            try:
+                with open(self.caminho, encoding="utf-8") as arquivo:
+                    self._entradas = OrderedDict(json.load(arquivo))
+            except (OSError, ValueError):
+                self._entradas = OrderedDict()  # Sem cache ou cache ilegível: começa vazio
+        return self._entradas
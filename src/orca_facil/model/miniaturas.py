@@ -0,0 +1,262 @@
+"""
+Módulo de Miniaturas.
+Responsabilidade: Gerar as miniaturas dos arquivos adicionados em "Adicionar Arquivos",
+decodificando só o necessário e guardando o resultado em cache (memória e disco).
+
+> Como evitar carregar 1.000 imagens inteiras?
+  - Só as miniaturas das linhas visíveis são pedidas (GeradorMiniaturas.solicitar);
+    pedidos de linhas que saíram da tela são cancelados antes de começar.
+  - O arquivo é mapeado em memória (mmap): o sistema operacional só lê os trechos que o decodificador acessa.
+  - JPEG usa o modo 'draft' do Pillow, que decodifica direto em 1/2, 1/4 ou 1/8 da resolução.
+  - PDF renderiza apenas a primeira página, já na escala da miniatura (requer PyMuPDF, opcional).
+  - A geração roda num pool de processos, fora da thread do Tk.
+"""
+
+import io
+import mmap
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from src.configs.caminhos import pasta_dados
+from src.orca_facil.model.cache import impressao_digital
+
+TAMANHO_PADRAO = 96  # Lado maior da miniatura, em pixels
+CAPACIDADE_MEMORIA = 300  # Miniaturas mantidas em memória (mais que as linhas visíveis de várias telas)
+CAPACIDADE_DISCO = 5_000  # Miniaturas mantidas na pasta de cache
+
+
+def gerar_miniatura(caminho: str, tamanho: int = TAMANHO_PADRAO) -> bytes | None:
+    """
+    Gera a miniatura de um arquivo e a retorna como PNG.
+    Executada nos processos do pool, por isso é uma função de nível de módulo.
+
+    :return: Os bytes do PNG, ou None se o formato não puder ser lido.
+    """
+    from PIL import Image  # Importado aqui: só os processos do pool carregam o Pillow
+
+    if caminho.lower().endswith(".pdf"):
+        imagem = _primeira_pagina_pdf(caminho, tamanho)
+        if imagem is None:
+            return None
+    else:
+        with open(caminho, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            imagem = Image.open(mapa)
+            imagem.draft("RGB", (tamanho, tamanho))  # Só tem efeito em JPEG: decodifica em resolução reduzida
+            imagem.thumbnail((tamanho, tamanho))
+            imagem = imagem.convert("RGBA" if "A" in imagem.getbands() else "RGB")
+
+    saida = io.BytesIO()
+    imagem.save(saida, format="PNG")
+    return saida.getvalue()
+
+
+def _primeira_pagina_pdf(caminho: str, tamanho: int):
+    """Renderiza só a primeira página do PDF, já no tamanho da miniatura. Retorna None sem o PyMuPDF."""
+    try:
+        import fitz  # PyMuPDF (dependência opcional)
+    except ImportError:
+        return None
+    from PIL import Image
+
+    with fitz.open(caminho) as documento:
+        pagina = documento[0]
+        escala = tamanho / max(pagina.rect.width, pagina.rect.height)
+        pixmap = pagina.get_pixmap(matrix=fitz.Matrix(escala, escala), alpha=False)
+        return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+
+class CacheMiniaturas:
+    """
+    Cache de miniaturas em dois níveis:
+      - memória: LRU limitado em quantidade (acesso imediato ao rolar a tabela);
+      - disco: uma imagem PNG por arquivo, identificada pela impressão digital do conteúdo.
+    """
+
+    def __init__(self, pasta: str | None = None, capacidade_memoria: int = CAPACIDADE_MEMORIA,
+                 capacidade_disco: int = CAPACIDADE_DISCO) -> None:
+        """
+        :param pasta: Pasta das miniaturas em disco. Caso omitida, usa a pasta de dados do programa.
+        :param capacidade_memoria: Quantidade máxima de miniaturas em memória.
+        :param capacidade_disco: Quantidade máxima de miniaturas em disco.
+        """
+        self.pasta = pasta or pasta_dados("cache", "miniaturas")
+        self.capacidade_memoria = capacidade_memoria
+        self.capacidade_disco = capacidade_disco
+        self._memoria: OrderedDict[str, bytes] = OrderedDict()
+        self._trava = threading.Lock()
+        self._gravadas = 0  # Gravações desde a última limpeza do disco
+
+    def obter(self, chave: str) -> bytes | None:
+        """Procura a miniatura na memória e depois no disco."""
+        with self._trava:
+            if chave in self._memoria:
+                self._memoria.move_to_end(chave)
+                return self._memoria[chave]
+
+        try:
+            with open(self._arquivo(chave), "rb") as arquivo:
+                dados = arquivo.read()
+        except OSError:
+            return None
+
+        self._lembrar(chave, dados)
+        return dados
+
+    def guardar(self, chave: str, dados: bytes) -> None:
+        """Guarda a miniatura na memória e no disco."""
+        self._lembrar(chave, dados)
+
+        temporario = f"{self._arquivo(chave)}.tmp"
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(dados)
+        os.replace(temporario, self._arquivo(chave))
+
+        self._gravadas += 1
+        if self._gravadas >= 100:
+            self._gravadas = 0
+            self._limpar_disco()
+
+    # INTERNOS ==============================
+    def _arquivo(self, chave: str) -> str:
+        """Metodo Privado. Caminho da miniatura em disco (a chave tem ':' que não é válido no Windows)."""
+        return os.path.join(self.pasta, chave.replace(":", "_") + ".png")
+
+    def _lembrar(self, chave: str, dados: bytes) -> None:
+        """Metodo Privado. Insere na memória, descartando as miniaturas menos usadas recentemente."""
+        with self._trava:
+            self._memoria[chave] = dados
+            self._memoria.move_to_end(chave)
+            while len(self._memoria) > self.capacidade_memoria:
+                self._memoria.popitem(last=False)
+
+    def _limpar_disco(self) -> None:
+        """Metodo Privado. Remove as miniaturas mais antigas quando o disco passa da capacidade."""
+        with os.scandir(self.pasta) as itens:
+            arquivos = [(item.stat().st_mtime, item.path) for item in itens if item.name.endswith(".png")]
+        if len(arquivos) <= self.capacidade_disco:
+            return
+
+        arquivos.sort()
+        for _, caminho in arquivos[:len(arquivos) - self.capacidade_disco]:
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass  # Pode estar em uso por outra instância; será removida na próxima limpeza
+
+
+class GeradorMiniaturas:
+    """
+    Atende os pedidos de miniaturas da tabela de itens.
+    Segue o mesmo fluxo da ingestão: thread despachante → cache → pool de processos → fila → coletar() via after().
+    """
+
+    def __init__(self, tamanho: int = TAMANHO_PADRAO, processos: int = 2, cache: CacheMiniaturas | None = None) -> None:
+        """
+        :param tamanho: Lado maior da miniatura, em pixels.
+        :param processos: Quantidade de processos do pool (poucos: a prioridade é a ingestão).
+        :param cache: Cache de miniaturas. Caso omitido, usa o cache padrão da pasta de dados.
+        """
+        self.tamanho = tamanho
+        self.processos = processos
+        self.cache = cache or CacheMiniaturas()
+        self._pool: ProcessPoolExecutor | None = None
+        self._fila: queue.Queue[tuple[str, bytes | None]] = queue.Queue()
+        self._pendentes: dict[str, Future] = {}  # Caminho → pedido em andamento
+        self._chaves: dict[tuple, str] = {}  # (caminho, tamanho, mtime) → chave no cache, evita reler a amostra
+        self._despachos = 0  # Threads despachantes ainda em execução
+        self._trava = threading.Lock()
+
+    def solicitar(self, caminhos) -> None:
+        """
+        Pede as miniaturas dos caminhos visíveis na tela.
+        Pedidos anteriores que ainda não começaram e não estão mais visíveis são cancelados.
+
+        :param caminhos: Caminhos dos arquivos das linhas visíveis.
+        """
+        visiveis = set(caminhos)
+        with self._trava:
+            for caminho, futuro in list(self._pendentes.items()):
+                if caminho not in visiveis and futuro.cancel():
+                    del self._pendentes[caminho]
+            novos = [caminho for caminho in visiveis if caminho not in self._pendentes]
+
+        if novos:
+            with self._trava:
+                self._despachos += 1
+            threading.Thread(target=self._despachar, args=(novos,), daemon=True, name="miniaturas").start()
+
+    @property
+    def pendentes(self) -> bool:
+        """Indica se ainda há miniaturas em geração ou prontas na fila."""
+        return bool(self._despachos or self._pendentes) or not self._fila.empty()
+
+    def coletar(self, limite: int = 50) -> list[tuple[str, bytes | None]]:
+        """Retira da fila as miniaturas já prontas (caminho, PNG), sem esperar."""
+        prontas = []
+        while len(prontas) < limite:
+            try:
+                prontas.append(self._fila.get_nowait())
+            except queue.Empty:
+                break
+        return prontas
+
+    def encerrar(self) -> None:
+        """Finaliza o pool de processos (chamado ao fechar o programa)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # INTERNOS ==============================
+    def _despachar(self, caminhos: list[str]) -> None:
+        """Metodo Privado. Entrega o que estiver em cache e envia o restante ao pool."""
+        try:
+            self._despachar_caminhos(caminhos)
+        finally:
+            with self._trava:
+                self._despachos -= 1
+
+    def _despachar_caminhos(self, caminhos: list[str]) -> None:
+        """Metodo Privado. Laço do despachante (separado para que o contador seja sempre decrementado)."""
+        for caminho in caminhos:
+            try:
+                chave = self._chave(caminho)
+            except OSError:
+                self._fila.put((caminho, None))
+                continue
+
+            dados = self.cache.obter(chave)
+            if dados is not None:
+                self._fila.put((caminho, dados))
+                continue
+
+            with self._trava:
+                if caminho in self._pendentes:
+                    continue
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.processos)
+                futuro = self._pool.submit(gerar_miniatura, caminho, self.tamanho)
+                self._pendentes[caminho] = futuro
+            futuro.add_done_callback(lambda f, caminho=caminho, chave=chave: self._ao_concluir(f, caminho, chave))
+
+    def _chave(self, caminho: str) -> str:
+        """Metodo Privado. Chave da miniatura no cache; a impressão digital só é recalculada se o arquivo mudar."""
+        estado = os.stat(caminho)
+        identificacao = (caminho, estado.st_size, estado.st_mtime_ns)
+        if identificacao not in self._chaves:
+            self._chaves[identificacao] = f"{impressao_digital(caminho)}:{self.tamanho}"
+        return self._chaves[identificacao]
+
+    def _ao_concluir(self, futuro: Future, caminho: str, chave: str) -> None:
+        """Metodo Privado. Guarda a miniatura pronta no cache e a coloca na fila."""
+        with self._trava:
+            self._pendentes.pop(caminho, None)
+
+        if futuro.cancelled():
+            return
+        dados = None if futuro.exception() else futuro.result()
+        if dados is not None:
+            self.cache.guardar(chave, dados)
+        self._fila.put((caminho, dados))
@@ -0,0 +1,453 @@
+"""
+Módulo Model.
+Responsabilidade: Guardar as linhas do orçamento e manter os valores derivados (valor de cada linha,
+total, parcelamento, PIX e imposto) sempre atualizados, recalculando só o que uma edição afeta.
+
+> Como funciona o recálculo incremental?
+Cada valor derivado declara de quais entradas depende (Orcamento.DEPENDENCIAS).
+Ao editar um campo, só os valores que dependem dele são invalidados:
+  - editar a quantidade de uma linha recalcula APENAS aquela linha;
+  - o total é uma soma corrente: recebe a diferença (novo valor - valor antigo) da linha, em O(1);
+  - parcelamento, PIX e imposto dependem só do total e são recalculados na próxima leitura.
+
+> Como as linhas são guardadas?
+Por colunas (ColunasItens): cada campo é um 'array' do Python (números) e os textos repetidos
+(materiais, acabamentos) viram códigos de uma tabela de textos. Dezenas de milhares de linhas ocupam
+poucos MB e os totais/agrupamentos percorrem as colunas sem criar um objeto Python por linha.
+Os valores ficam em centavos inteiros: cada linha é arredondada em Decimal uma vez, quando é precificada,
+e a partir daí o total e as edições somam inteiros, de forma exata e sem refazer o arredondamento.
+"""
+
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import compress, repeat
+from operator import and_, eq, gt, mul, truediv
+from typing import Iterable, Iterator, Sequence
+
+from src.configs.precificacao import MotorPrecificacao, ResultadoPrecificacao, TabelaPrecos, arredondar
+from src.orca_facil.model.arquivos import MetadadosArquivo
+
+
+@dataclass
+class LinhaOrcamento:
+    """
+    Uma linha do orçamento: um arquivo (ou tamanho) com quantidade, material e acabamento.
+    Usada para entrada de dados e para leitura de uma linha específica (ex.: linhas visíveis da tabela);
+    o orçamento em si não guarda estes objetos.
+    """
+
+    descricao: str
+    largura_cm: float
+    altura_cm: float
+    quantidade: int
+    material: str
+    acabamento: str
+    caminho: str = ""  # Arquivo de origem (vazio para linhas digitadas ou importadas)
+    valor: Decimal = Decimal("0.00")  # Derivado: calculado pelo Orcamento
+
+    @property
+    def area_m2(self) -> float:
+        """Área de uma peça em m²."""
+        return (self.largura_cm / 100) * (self.altura_cm / 100)
+
+    @classmethod
+    def do_arquivo(cls, metadados: MetadadosArquivo, material: str, acabamento: str) -> "LinhaOrcamento":
+        """Linha de um arquivo analisado na ingestão: uma peça por página, no tamanho físico do arquivo."""
+        return cls(metadados.nome, metadados.largura_cm, metadados.altura_cm, metadados.paginas, material, acabamento,
+                   caminho=metadados.caminho)
+
+
+class TabelaTextos:
+    """
+    Tabela de textos internados: cada texto distinto é guardado uma única vez e representado por um código inteiro.
+    """
+
+    def __init__(self) -> None:
+        self.textos: list[str] = []
+        self._codigos: dict[str, int] = {}
+
+    def codigo(self, texto: str) -> int:
+        """Retorna o código do texto, cadastrando-o se ainda não existir."""
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = self._codigos[texto] = len(self.textos)
+            self.textos.append(texto)
+        return codigo
+
+    def procurar(self, texto: str) -> int | None:
+        """Retorna o código do texto, ou None se ele nunca foi cadastrado."""
+        return self._codigos.get(texto)
+
+    def __getitem__(self, codigo: int) -> str:
+        return self.textos[codigo]
+
+    def __len__(self) -> int:
+        return len(self.textos)
+
+
+class ColunasItens:
+    """
+    Armazenamento das linhas do orçamento por colunas.
+
+    Colunas numéricas: 'array' do Python (8 bytes por valor, sem objetos por linha).
+    Colunas de texto repetido (material, acabamento): códigos 'array("I")' + TabelaTextos.
+    Colunas de texto único (descrição, caminho): listas de str.
+    """
+
+    # Campo de LinhaOrcamento → atributo da coluna correspondente
+    COLUNAS = {"descricao": "descricoes", "largura_cm": "larguras", "altura_cm": "alturas",
+               "quantidade": "quantidades", "material": "materiais", "acabamento": "acabamentos"}
+    TEXTOS_INTERNADOS = ("material", "acabamento")
+
+    def __init__(self) -> None:
+        self.textos = TabelaTextos()
+        self.descricoes: list[str] = []
+        self.caminhos: list[str] = []
+        self.larguras = array("d")  # cm
+        self.alturas = array("d")  # cm
+        self.quantidades = array("q")
+        self.materiais = array("I")  # Códigos em self.textos
+        self.acabamentos = array("I")  # Códigos em self.textos
+        self.centavos = array("q")  # Valor de cada linha, em centavos
+
+    def __len__(self) -> int:
+        return len(self.quantidades)
+
+    # ESCRITA ==============================
+    def adicionar(self, descricoes: Sequence[str], larguras: Sequence[float], alturas: Sequence[float],
+                  quantidades: Sequence[int], materiais: Sequence[str], acabamentos: Sequence[str],
+                  caminhos: Sequence[str] | None = None) -> None:
+        """Acrescenta um lote de linhas, coluna a coluna (valores zerados até serem precificados)."""
+        quantidade_linhas = len(descricoes)
+        codigo = self.textos.codigo
+
+        self.descricoes.extend(descricoes)
+        self.caminhos.extend(caminhos if caminhos is not None else repeat("", quantidade_linhas))
+        self.larguras.extend(larguras)
+        self.alturas.extend(alturas)
+        self.quantidades.extend(quantidades)
+        self.materiais.extend(map(codigo, materiais))
+        self.acabamentos.extend(map(codigo, acabamentos))
+        self.centavos.extend(repeat(0, quantidade_linhas))
+
+    def atualizar(self, indice: int, **campos) -> dict[str, object]:
+        """
+        Altera campos de uma linha no lugar (sem recriar a linha).
+        Se algum valor não couber na coluna (ex.: quantidade '3' em vez de 3), a linha volta a ser como era.
+
+        :return: Os valores anteriores de cada coluna alterada, para restaurar().
+        Raises:
+            TypeError: Se um valor não for do tipo da coluna.
+        """
+        anteriores = {campo: getattr(self, self.COLUNAS[campo])[indice] for campo in campos}
+        try:
+            for campo, valor in campos.items():
+                if campo in self.TEXTOS_INTERNADOS:
+                    valor = self.textos.codigo(valor)
+                getattr(self, self.COLUNAS[campo])[indice] = valor
+        except (TypeError, OverflowError):
+            self.restaurar(indice, anteriores)
+            raise
+        return anteriores
+
+    def restaurar(self, indice: int, anteriores: dict[str, object]) -> None:
+        """Devolve a uma linha os valores devolvidos por atualizar() (códigos de texto já internados)."""
+        for campo, valor in anteriores.items():
+            getattr(self, self.COLUNAS[campo])[indice] = valor
+
+    def remover(self, indice: int) -> None:
+        """Remove uma linha de todas as colunas."""
+        for coluna in (self.descricoes, self.caminhos, self.larguras, self.alturas, self.quantidades,
+                       self.materiais, self.acabamentos, self.centavos):
+            del coluna[indice]
+
+    def copiar(self) -> "ColunasItens":
+        """
+        Cópia das colunas (ex.: para uma tarefa em segundo plano ler sem disputar com as edições da janela).
+        A tabela de textos é compartilhada: ela só cresce, e os códigos já copiados nunca mudam.
+        """
+        copia = ColunasItens.__new__(ColunasItens)
+        copia.textos = self.textos
+        for nome in ("descricoes", "caminhos", "larguras", "alturas", "quantidades", "materiais", "acabamentos",
+                     "centavos"):
+            setattr(copia, nome, getattr(self, nome)[:])
+        return copia
+
+    def truncar(self, tamanho: int = 0) -> None:
+        """
+        Mantém só as primeiras 'tamanho' linhas (0 = esvazia).
+        A tabela de textos é mantida, pois os materiais e acabamentos se repetem entre orçamentos.
+        """
+        for coluna in (self.descricoes, self.caminhos, self.larguras, self.alturas, self.quantidades,
+                       self.materiais, self.acabamentos, self.centavos):
+            del coluna[tamanho:]
+
+    # LEITURA ==============================
+    def areas(self, inicio: int = 0, fim: int | None = None) -> list[float]:
+        """Área de uma peça (m²) de cada linha do intervalo, na mesma ordem de operações de LinhaOrcamento.area_m2."""
+        larguras = self.larguras[inicio:fim]
+        alturas = self.alturas[inicio:fim]
+        return list(map(mul, map(truediv, larguras, repeat(100.0)), map(truediv, alturas, repeat(100.0))))
+
+    def linha(self, indice: int) -> LinhaOrcamento:
+        """Monta UMA linha como objeto (ex.: para exibir uma linha visível da tabela)."""
+        return LinhaOrcamento(
+            descricao=self.descricoes[indice],
+            largura_cm=self.larguras[indice],
+            altura_cm=self.alturas[indice],
+            quantidade=self.quantidades[indice],
+            material=self.textos[self.materiais[indice]],
+            acabamento=self.textos[self.acabamentos[indice]],
+            caminho=self.caminhos[indice],
+            valor=Decimal(self.centavos[indice]).scaleb(-2),
+        )
+
+    def filtrar(self, material: str | None = None, acabamento: str | None = None) -> array:
+        """
+        Retorna os índices das linhas com o material e/ou acabamento informados.
+        A comparação é feita entre códigos inteiros, coluna a coluna.
+        """
+        selecao: Iterable[bool] = repeat(True, len(self))
+        for coluna, texto in ((self.materiais, material), (self.acabamentos, acabamento)):
+            if texto is None:
+                continue
+            codigo = self.textos.procurar(texto)
+            if codigo is None:
+                return array("q")
+            selecao = map(and_, selecao, map(eq, coluna, repeat(codigo)))
+        return array("q", compress(range(len(self)), selecao))
+
+    def somar_por_grupo(self, coluna: str = "material", valores: str = "centavos") -> dict[str, int]:
+        """
+        Soma uma coluna numérica agrupada por material ou acabamento.
+
+        :param coluna: 'material' ou 'acabamento'.
+        :param valores: Coluna somada: 'centavos' (valor) ou 'quantidades'.
+        :return: Texto do grupo → soma.
+        """
+        codigos = getattr(self, self.COLUNAS[coluna])
+        numeros = getattr(self, valores)
+        return {self.textos[codigo]: sum(compress(numeros, map(eq, codigos, repeat(codigo))))
+                for codigo in set(codigos)}
+
+
+class Orcamento:
+    """
+    Orçamento com recálculo incremental.
+    As entradas são alteradas pelos métodos públicos; os valores derivados nunca são atribuídos diretamente.
+    """
+
+    # Valor derivado → entradas (ou outros valores derivados) das quais ele depende
+    DEPENDENCIAS: dict[str, tuple[str, ...]] = {
+        "valor": ("largura_cm", "altura_cm", "quantidade", "material", "acabamento", "tabela"),
+        "valor_total": ("valor",),
+        "valor_parcelado": ("valor_total", "tabela"),
+        "valor_parcela": ("valor_total", "tabela"),
+        "pix_dinheiro": ("valor_total", "tabela"),
+        "imposto_nota": ("valor_total", "tabela"),
+    }
+    CAMPOS_EDITAVEIS = ("descricao", "largura_cm", "altura_cm", "quantidade", "material", "acabamento")
+
+    def __init__(self, motor: MotorPrecificacao | None = None) -> None:
+        """
+        :param motor: Motor de precificação (com a tabela de preços do perfil). Caso omitido, usa a tabela padrão.
+        """
+        self.motor = motor or MotorPrecificacao()
+        self.colunas = ColunasItens()
+        self._total_centavos = 0  # Soma corrente dos valores das linhas
+        self._resultado: ResultadoPrecificacao | None = None  # Totais derivados (None = precisa recalcular)
+        self.versao = 0  # Incrementada a cada alteração (uma cópia antiga sabe se ainda está em dia)
+
+    def __len__(self) -> int:
+        return len(self.colunas)
+
+    # ENTRADAS ==============================
+    def adicionar(self, linhas: Iterable[LinhaOrcamento]) -> None:
+        """Adiciona várias linhas de uma vez (convertidas para colunas e precificadas em lote)."""
+        novas = list(linhas)
+        if novas:
+            self.adicionar_colunas(
+                descricoes=[linha.descricao for linha in novas],
+                larguras=[linha.largura_cm for linha in novas],
+                alturas=[linha.altura_cm for linha in novas],
+                quantidades=[linha.quantidade for linha in novas],
+                materiais=[linha.material for linha in novas],
+                acabamentos=[linha.acabamento for linha in novas],
+                caminhos=[linha.caminho for linha in novas],
+            )
+
+    def adicionar_colunas(self, descricoes: Sequence[str], larguras: Sequence[float], alturas: Sequence[float],
+                          quantidades: Sequence[int], materiais: Sequence[str], acabamentos: Sequence[str],
+                          caminhos: Sequence[str] | None = None) -> None:
+        """
+        Adiciona um lote de linhas já em colunas (ex.: importação de planilha), precificando o lote numa única passada.
+
+        Raises:
+            ValueError: Medida ou quantidade zero/negativa, ou material/acabamento fora da tabela de preços.
+            TypeError: Valor que não cabe na coluna (ex.: quantidade 2.5).
+            ArithmeticError: Valor que não pode ser precificado (ex.: largura infinita).
+        Em caso de erro o lote inteiro é desfeito: as colunas, o total e a versão ficam como estavam.
+        """
+        inicio = len(self.colunas)
+        try:
+            self.colunas.adicionar(descricoes, larguras, alturas, quantidades, materiais, acabamentos, caminhos)
+            self._validar_medidas(inicio)
+            self._precificar(inicio)
+        except (ValueError, TypeError, ArithmeticError):
+            self.colunas.truncar(inicio)  # Todas as colunas voltam ao tamanho anterior, mesmo as já estendidas
+            raise
+        self.versao += 1
+
+    def atualizar(self, indice: int, **campos) -> Decimal:
+        """
+        Edita os campos de uma linha e recalcula só o que depende deles.
+
+        :param indice: Posição da linha no orçamento.
+        :param campos: Campos editados (ex.: quantidade=10, material="Lona").
+        :return: O novo valor da linha.
+        Raises:
+            ValueError: Se algum campo não for editável, a medida/quantidade não for maior que zero ou o
+                material/acabamento não estiver na tabela de preços.
+            TypeError: Se um valor não for do tipo do campo (ex.: quantidade '3').
+        Em caso de erro a linha, o total e a versão ficam exatamente como estavam.
+        """
+        invalidos = set(campos) - set(self.CAMPOS_EDITAVEIS)
+        if invalidos:
+            raise ValueError(f"Campo(s) não editável(is): {', '.join(sorted(invalidos))}")
+
+        # 1. Grava os novos valores, guardando os anteriores para desfazer a edição
+        colunas = self.colunas
+        anteriores = colunas.atualizar(indice, **campos)
+
+        # 2. Só recalcula a linha se algum campo editado fizer parte das dependências do valor
+        centavos = colunas.centavos[indice]
+        if "valor" in self.afetados(campos):
+            try:
+                self._validar_medidas(indice, indice + 1)
+                area = colunas.areas(indice, indice + 1)[0]
+                novo = self.motor.valor_linha(area, colunas.quantidades[indice],
+                                              colunas.textos[colunas.materiais[indice]],
+                                              colunas.textos[colunas.acabamentos[indice]])
+            except (ValueError, TypeError, ArithmeticError):
+                colunas.restaurar(indice, anteriores)  # Edição recusada: a linha não pode ficar com o preço antigo
+                raise
+            centavos = int(novo.scaleb(2))
+
+        # 3. Edição aceita: aplica a diferença ao total e só então muda a versão
+        self._somar(centavos - colunas.centavos[indice])
+        colunas.centavos[indice] = centavos
+        self.versao += 1
+        return Decimal(centavos).scaleb(-2)
+
+    def remover(self, indice: int) -> None:
+        """Remove uma linha, descontando o seu valor do total."""
+        self._somar(-self.colunas.centavos[indice])
+        self.colunas.remover(indice)
+        self.versao += 1
+
+    def limpar(self) -> None:
+        """Esvazia o orçamento ("Novo Orçamento")."""
+        self.colunas.truncar()
+        self._total_centavos = 0
+        self._resultado = None
+        self.versao += 1
+
+    def definir_tabela(self, tabela: TabelaPrecos) -> None:
+        """
+        Troca a tabela de preços (ex.: ao carregar outro perfil).
+        Todas as linhas dependem da tabela, então o orçamento inteiro é reprecificado em lote.
+        """
+        self.motor = MotorPrecificacao(tabela)
+        self._total_centavos = 0
+        self._resultado = None
+        self.versao += 1
+        self._precificar(0)
+
+    def copiar(self) -> "Orcamento":
+        """
+        Cópia independente do orçamento, com os mesmos valores (ex.: para gerar o PDF ou reprecificar em
+        segundo plano enquanto a janela continua editando o original). Custa uma cópia das colunas, sem recálculo.
+        """
+        copia = Orcamento(self.motor)
+        copia.colunas = self.colunas.copiar()
+        copia._total_centavos = self._total_centavos
+        copia._resultado = self._resultado
+        copia.versao = self.versao
+        return copia
+
+    # LEITURA ==============================
+    def linha(self, indice: int) -> LinhaOrcamento:
+        """Retorna uma linha como objeto (só para as linhas que precisam ser exibidas)."""
+        return self.colunas.linha(indice)
+
+    def linhas(self) -> Iterator[LinhaOrcamento]:
+        """Percorre as linhas sob demanda (ex.: geração do PDF), uma de cada vez."""
+        return map(self.colunas.linha, range(len(self.colunas)))
+
+    @property
+    def resultado(self) -> ResultadoPrecificacao:
+        """
+        Valores do bloco de precificação (total, parcelado, PIX, imposto).
+        Recalculados a partir do total corrente apenas quando alguma linha mudou desde a última leitura.
+        """
+        if self._resultado is None:
+            self._resultado = self.motor.totais(Decimal(self._total_centavos).scaleb(-2))
+        return self._resultado
+
+    @classmethod
+    def afetados(cls, campos: Iterable[str]) -> set[str]:
+        """Retorna todos os valores derivados que dependem (direta ou indiretamente) dos campos informados."""
+        afetados = set()
+        pendentes = set(campos)
+        while pendentes:
+            campo = pendentes.pop()
+            for derivado, entradas in cls.DEPENDENCIAS.items():
+                if campo in entradas and derivado not in afetados:
+                    afetados.add(derivado)
+                    pendentes.add(derivado)
+        return afetados
+
+    # INTERNOS ==============================
+    def _validar_medidas(self, inicio: int, fim: int | None = None) -> None:
+        """
+        Metodo Privado. Recusa linhas do intervalo com largura, altura ou quantidade zero ou negativa
+        (ou NaN): elas dariam um valor zerado ou negativo que entraria no total sem aviso.
+
+        Raises:
+            ValueError: Se algum desses valores não for maior que zero.
+        """
+        colunas = self.colunas
+        for nome, coluna in (("Largura", colunas.larguras), ("Altura", colunas.alturas),
+                             ("Quantidade", colunas.quantidades)):
+            if not all(map(gt, coluna[inicio:fim], repeat(0))):
+                raise ValueError(f"{nome} deve ser maior que zero")
+
+    def _precificar(self, inicio: int) -> None:
+        """Metodo Privado. Precifica, numa única passada por colunas, as linhas a partir de 'inicio'."""
+        colunas = self.colunas
+        brutos = self.motor.calcular_linhas_codificadas(
+            areas=colunas.areas(inicio),
+            quantidades=colunas.quantidades[inicio:],
+            codigos_materiais=colunas.materiais[inicio:],
+            codigos_acabamentos=colunas.acabamentos[inicio:],
+            textos=colunas.textos,
+        )
+        centavos = array("q", (int(arredondar(bruto).scaleb(2)) for bruto in brutos))
+        self._somar(sum(centavos) - sum(colunas.centavos[inicio:]))
+        colunas.centavos[inicio:] = centavos
+
+    def _somar(self, diferenca: int) -> None:
+        """Metodo Privado. Aplica a diferença (em centavos) ao total corrente e invalida os totais derivados."""
+        if diferenca:
+            self._total_centavos += diferenca
+            self._resultado = None
+
+
+def reprecificar(orcamento: Orcamento, tabela: TabelaPrecos) -> Orcamento:
+    """
+    Reprecifica o orçamento com outra tabela e o retorna.
+    Função do módulo para poder rodar num processo à parte (ex.: uma cópia do orçamento, ao trocar de perfil).
+    """
+    orcamento.definir_tabela(tabela)
+    return orcamento
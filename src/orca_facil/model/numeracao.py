@@ -0,0 +1,178 @@
+"""
+Módulo de Numeração de Orçamentos.
+Responsabilidade: Entregar os números dos orçamentos ("ORÇAMENTO Nº") sem repetição, mesmo com várias
+estações usando a mesma pasta compartilhada ao mesmo tempo.
+
+> Como o número é reservado?
+O contador fica num banco SQLite na pasta compartilhada (ver configs/caminhos.pasta_compartilhada).
+Cada reserva é uma transação BEGIN IMMEDIATE: o SQLite trava o arquivo para escrita antes de ler o
+contador, então duas estações nunca leem o mesmo valor.
+
+> Por que em blocos?
+Travar um arquivo de rede a cada orçamento é lento e disputado. Cada sessão reserva um bloco
+(ex.: 10 números) de uma vez e os entrega da memória; só volta ao banco quando o bloco acaba.
+
+> E os números que sobram do bloco?
+Ao fechar o programa, os números reservados e não usados são devolvidos (tabela 'livres') e são os
+primeiros entregues na próxima reserva, de qualquer estação: a sequência não fica com buracos.
+Só uma sessão interrompida (queda de energia, processo encerrado à força) perde o resto do seu bloco;
+quem não aceita nem isso usa tamanho_bloco=1 (uma trava por orçamento).
+
+Observação: o banco usa o journal tradicional (journal_mode=DELETE) e não o WAL, que depende de
+memória compartilhada e não funciona entre máquinas numa pasta de rede.
+"""
+
+import sqlite3
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from src.configs.caminhos import pasta_compartilhada
+from src.configs.registro import registro
+
+log = registro("CONTROLLER")
+
+ARQUIVO_BANCO = "numeracao.sqlite3"
+TAMANHO_BLOCO = 10  # Números reservados por ida ao banco
+ESPERA_TRAVA = 30.0  # Segundos esperando outra estação liberar o banco antes de desistir
+
+ErroNumeracao = sqlite3.Error  # Banco inacessível ou travado por outra estação além de ESPERA_TRAVA
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS contador (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    proximo INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS livres (
+    numero INTEGER PRIMARY KEY
+);
+"""
+
+
+class AlocadorNumeros:
+    """
+    Numeração dos orçamentos, reservada em blocos num banco compartilhado.
+    Pode ser usado por várias threads; cada processo deve ter o seu alocador.
+    """
+
+    def __init__(self, caminho: str | None = None, tamanho_bloco: int = TAMANHO_BLOCO, inicio: int = 1) -> None:
+        """
+        :param caminho: Arquivo do banco. Caso omitido, usa 'numeracao.sqlite3' na pasta compartilhada.
+        :param tamanho_bloco: Números reservados de cada vez (1 = uma reserva por orçamento).
+        :param inicio: Primeiro número da sequência. Se o contador já estiver abaixo dele, é adiantado
+                       (ex.: ao adotar a numeração compartilhada com orçamentos já emitidos).
+        """
+        self.caminho = caminho or pasta_compartilhada(ARQUIVO_BANCO)
+        self.tamanho_bloco = max(1, tamanho_bloco)
+        self._inicio = inicio
+        self._reservados: deque[int] = deque()  # Bloco atual, em ordem crescente
+        self._trava = threading.RLock()
+        self._conexao: sqlite3.Connection | None = None  # Aberta na primeira reserva
+
+    @property
+    def reservados(self) -> int:
+        """Números do bloco atual ainda não entregues."""
+        return len(self._reservados)
+
+    def proximo(self) -> int:
+        """Entrega o próximo número (vai ao banco só quando o bloco reservado acaba)."""
+        with self._trava:
+            if not self._reservados:
+                self._reservados.extend(self._reservar(self.tamanho_bloco))
+            return self._reservados.popleft()
+
+    def devolver(self, numeros: Iterable[int] = ()) -> int:
+        """
+        Devolve ao banco os números reservados e não usados (serão os primeiros da próxima reserva).
+
+        :param numeros: Números já entregues por proximo() que acabaram não sendo usados
+                        (ex.: um orçamento do lote que falhou). Caso omitido, só o que sobrou do bloco.
+        :return: Quantidade de números devolvidos.
+        """
+        with self._trava:
+            devolvidos = [*numeros, *self._reservados]
+            if not devolvidos:
+                return 0
+            with self._transacao() as cursor:
+                cursor.executemany("INSERT OR IGNORE INTO livres (numero) VALUES (?)",
+                                   ((numero,) for numero in devolvidos))
+            self._reservados.clear()
+        log.debug("Numeração: %s número(s) devolvido(s)", len(devolvidos))
+        return len(devolvidos)
+
+    def fechar(self) -> None:
+        """Devolve o que sobrou do bloco e fecha a conexão (chamado ao fechar o programa)."""
+        with self._trava:
+            try:
+                self.devolver()
+            finally:
+                if self._conexao is not None:
+                    self._conexao.close()
+                    self._conexao = None
+
+    # INTERNOS ==============================
+    def _reservar(self, quantidade: int) -> list[int]:
+        """
+        Metodo Privado.
+        Reserva os números numa única transação: primeiro os devolvidos, depois os novos do contador.
+        """
+        with self._transacao() as cursor:
+            # 1. Números devolvidos por sessões anteriores (mantém a sequência sem buracos)
+            numeros = [numero for (numero,) in cursor.execute(
+                "SELECT numero FROM livres ORDER BY numero LIMIT ?", (quantidade,))]
+            if numeros:
+                cursor.execute("DELETE FROM livres WHERE numero <= ?", (numeros[-1],))
+
+            # 2. O restante, adiantando o contador
+            falta = quantidade - len(numeros)
+            if falta:
+                proximo = cursor.execute("SELECT proximo FROM contador WHERE id = 1").fetchone()[0]
+                cursor.execute("UPDATE contador SET proximo = ? WHERE id = 1", (proximo + falta,))
+                numeros.extend(range(proximo, proximo + falta))
+
+        log.debug("Numeração: reservados %s a %s", numeros[0], numeros[-1])
+        return numeros
+
+    @contextmanager
+    def _transacao(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Metodo Privado.
+        Transação de escrita: BEGIN IMMEDIATE trava o banco para as outras estações antes de qualquer leitura,
+        COMMIT no fim e ROLLBACK se algo der errado.
+        """
+        with self._trava:
+            cursor = self._conectar().cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def _conectar(self) -> sqlite3.Connection:
+        """Metodo Privado. Abre a conexão (uma vez) e cria o contador, se for o primeiro uso do banco."""
+        if self._conexao is not None:
+            return self._conexao
+
+        conexao = sqlite3.connect(self.caminho, isolation_level=None, check_same_thread=False, timeout=ESPERA_TRAVA)
+        conexao.execute("PRAGMA journal_mode=DELETE")
+        conexao.execute("PRAGMA synchronous=FULL")  # O contador não pode voltar atrás após uma queda
+        conexao.execute("BEGIN IMMEDIATE")
+        try:
+            # executescript() faria COMMIT antes de começar: as instruções vão uma a uma, dentro da transação
+            for instrucao in ESQUEMA.split(";"):
+                if instrucao.strip():
+                    conexao.execute(instrucao)
+            conexao.execute("INSERT INTO contador (id, proximo) VALUES (1, ?) "
+                            "ON CONFLICT (id) DO UPDATE SET proximo = MAX(proximo, excluded.proximo)",
+                            (self._inicio,))
+        except BaseException:
+            conexao.execute("ROLLBACK")
+            conexao.close()
+            raise
+        conexao.execute("COMMIT")
+
+        self._conexao = conexao
+        return conexao
@@ -0,0 +1,413 @@
+"""
+Módulo de Planilhas.
+Responsabilidade: Ler pedidos enviados como planilha (CSV ou XLSX) e convertê-los em linhas do orçamento,
+em lotes já no formato de colunas do Model (Orcamento.adicionar_colunas).
+
+> Por que ler "em fluxo"?
+Uma planilha de 100 mil linhas não é carregada inteira: o CSV é lido linha a linha (módulo csv) e o XLSX
+(um .zip de arquivos XML) é percorrido com xml.etree.ElementTree.iterparse, descartando cada linha da
+planilha assim que ela vira valores. A memória usada depende do tamanho do lote, não do tamanho do arquivo.
+
+> Mapeamento de colunas
+Cada cliente nomeia as colunas do seu jeito ("Larg.", "Largura (cm)", "Qtde"...). MapeamentoColunas diz
+quais cabeçalhos correspondem a cada campo da linha (acentos e maiúsculas são ignorados) e pode ser
+guardado no perfil do cliente.
+"""
+
+import csv
+import io
+import math
+import os
+import zipfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterator, Sequence
+from xml.etree.ElementTree import ParseError, iterparse
+
+from src.configs.precificacao import TabelaPrecos
+from src.perfis.busca import normalizar
+
+EXTENSOES = (".csv", ".xlsx")
+TAMANHO_LOTE = 2000  # Linhas por lote entregue ao Model
+# Limites de sanidade da leitura: acima deles é erro de digitação ou de unidade, e o preço da linha
+# nem caberia nos centavos do Model. Os limites reais da máquina ficam com a validação (model/validacao.py).
+MEDIDA_MAXIMA_CM = 100_000.0  # 1 km
+QUANTIDADE_MAXIMA = 1_000_000
+
+# Campo da linha do orçamento → cabeçalhos aceitos (já normalizados: sem acento, minúsculos)
+CABECALHOS_PADRAO: dict[str, tuple[str, ...]] = {
+    "descricao": ("descricao", "item", "arquivo", "nome", "produto"),
+    "largura_cm": ("largura", "largura cm", "largura (cm)", "larg", "larg.", "l"),
+    "altura_cm": ("altura", "altura cm", "altura (cm)", "alt", "alt.", "a", "h"),
+    "quantidade": ("quantidade", "qtd", "qtd.", "qtde", "quant", "quant."),
+    "material": ("material", "midia", "substrato"),
+    "acabamento": ("acabamento", "acab", "acab."),
+}
+OBRIGATORIOS = ("largura_cm", "altura_cm")
+FATORES_UNIDADE = {"mm": 0.1, "cm": 1.0, "m": 100.0}  # Unidade das medidas na planilha → cm
+
+# Espaços de nomes do XLSX (SpreadsheetML)
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PACOTE = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+@dataclass
+class MapeamentoColunas:
+    """Como as colunas de uma planilha viram os campos da linha do orçamento."""
+
+    cabecalhos: dict[str, tuple[str, ...]] = field(default_factory=lambda: dict(CABECALHOS_PADRAO))
+    unidade: str = "cm"  # Unidade das medidas na planilha: 'mm', 'cm' ou 'm'
+    quantidade_padrao: int = 1  # Usada quando a planilha não tem coluna de quantidade (ou a célula está vazia)
+    material_padrao: str = ""  # Idem para material/acabamento ('' = o primeiro da tabela de preços)
+    acabamento_padrao: str = ""
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "MapeamentoColunas":
+        """
+        Monta o mapeamento guardado no perfil: os cabeçalhos informados se somam aos padrões de cada campo.
+        Ex.: {"largura_cm": ["base"], "unidade": "mm"}
+        """
+        cabecalhos = dict(CABECALHOS_PADRAO)
+        opcoes = {}
+        for chave, valor in dados.items():
+            if chave in cabecalhos:
+                cabecalhos[chave] = tuple(map(normalizar, valor)) + cabecalhos[chave]
+            elif chave in ("unidade", "quantidade_padrao", "material_padrao", "acabamento_padrao"):
+                opcoes[chave] = valor
+        return cls(cabecalhos=cabecalhos, **opcoes)
+
+    @classmethod
+    def do_perfil(cls, dados: dict, tabela: TabelaPrecos) -> "MapeamentoColunas":
+        """
+        Mapeamento do perfil (de_dict), com o primeiro material/acabamento da tabela de preços como padrão.
+
+        :param dados: Perfil.planilha (vazio = cabeçalhos padrão).
+        :param tabela: Tabela de preços do orçamento.
+        Raises:
+            ValueError: Se não houver padrão no perfil e a tabela de preços não tiver materiais ou acabamentos.
+        """
+        mapeamento = cls.de_dict(dados)
+        mapeamento.material_padrao = mapeamento.material_padrao or next(iter(tabela.materiais), None)
+        mapeamento.acabamento_padrao = mapeamento.acabamento_padrao or next(iter(tabela.acabamentos), None)
+        if mapeamento.material_padrao is None or mapeamento.acabamento_padrao is None:
+            raise ValueError("Perfil sem materiais ou acabamentos na tabela de preços")
+        return mapeamento
+
+    def resolver(self, cabecalho: Sequence[str]) -> dict[str, int]:
+        """
+        Encontra a posição de cada campo na linha de cabeçalho da planilha.
+
+        :return: Campo → índice da coluna (só os campos encontrados).
+        Raises:
+            ValueError: Se faltar uma coluna obrigatória (largura ou altura) ou a unidade for desconhecida.
+        """
+        if self.unidade not in FATORES_UNIDADE:
+            raise ValueError(f"Unidade '{self.unidade}' desconhecida. Use: {', '.join(FATORES_UNIDADE)}")
+
+        posicoes = {normalizar(str(titulo)): indice for indice, titulo in reversed(list(enumerate(cabecalho)))}
+        encontrados = {}
+        for campo, aceitos in self.cabecalhos.items():
+            indice = next((posicoes[nome] for nome in aceitos if nome in posicoes), None)
+            if indice is not None:
+                encontrados[campo] = indice
+
+        faltando = [campo for campo in OBRIGATORIOS if campo not in encontrados]
+        if faltando:
+            raise ValueError(f"Coluna(s) obrigatória(s) não encontrada(s): {', '.join(faltando)}. "
+                             f"Cabeçalho da planilha: {', '.join(map(str, cabecalho))}")
+        return encontrados
+
+
+@dataclass
+class LotePlanilha:
+    """Um lote de linhas lidas, já em colunas (argumentos de Orcamento.adicionar_colunas)."""
+
+    descricoes: list[str] = field(default_factory=list)
+    larguras: list[float] = field(default_factory=list)
+    alturas: list[float] = field(default_factory=list)
+    quantidades: list[int] = field(default_factory=list)
+    materiais: list[str] = field(default_factory=list)
+    acabamentos: list[str] = field(default_factory=list)
+    erros: list[tuple[int, str]] = field(default_factory=list)  # (linha na planilha, motivo) das linhas ignoradas
+    numeros: list[int] = field(default_factory=list)  # Linha na planilha de cada linha do lote
+    progresso: float = 0.0  # Fração do arquivo já lida (0 a 1)
+
+    def __len__(self) -> int:
+        return len(self.larguras)
+
+    def colunas(self) -> dict[str, list]:
+        """Argumentos nomeados para Orcamento.adicionar_colunas()."""
+        return {"descricoes": self.descricoes, "larguras": self.larguras, "alturas": self.alturas,
+                "quantidades": self.quantidades, "materiais": self.materiais, "acabamentos": self.acabamentos}
+
+    def filtrar(self, materiais: set[str] | dict, acabamentos: set[str] | dict, linhas: list[int]) -> None:
+        """
+        Retira do lote as linhas com material ou acabamento que não existe na tabela de preços
+        (o Model recusaria o lote inteiro por causa delas) e as registra em 'erros'.
+
+        :param linhas: Número, na planilha, de cada linha do lote (para o relatório de erros).
+        """
+        manter = [material in materiais and acabamento in acabamentos
+                  for material, acabamento in zip(self.materiais, self.acabamentos)]
+        if all(manter):
+            return
+        for posicao, mantida in enumerate(manter):
+            if not mantida:
+                material, acabamento = self.materiais[posicao], self.acabamentos[posicao]
+                motivo = (f"Material '{material}' não existe no perfil" if material not in materiais
+                          else f"Acabamento '{acabamento}' não existe no perfil")
+                self.erros.append((linhas[posicao], motivo))
+        for nome in ("descricoes", "larguras", "alturas", "quantidades", "materiais", "acabamentos", "numeros"):
+            coluna = getattr(self, nome)
+            coluna[:] = [valor for valor, mantida in zip(coluna, manter) if mantida]
+
+
+# LEITURA ==============================
+class _LeitorContado(io.RawIOBase):
+    """Arquivo binário que repassa a leitura de outro, contando os bytes lidos (para o progresso)."""
+
+    def __init__(self, origem) -> None:
+        self._origem = origem
+        self.lidos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, destino) -> int:
+        dados = self._origem.read(len(destino))
+        destino[:len(dados)] = dados
+        self.lidos += len(dados)
+        return len(dados)
+
+
+def ler_celulas(caminho: str) -> Iterator[tuple[list[str], float]]:
+    """
+    Percorre a planilha linha a linha, sem carregá-la inteira.
+
+    :return: Gerador de (células da linha como texto, fração do arquivo já lida).
+    Raises:
+        ValueError: Se a extensão não for suportada ou o arquivo não for uma planilha válida.
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".csv":
+        return _ler_csv(caminho)
+    if extensao == ".xlsx":
+        return _ler_xlsx(caminho)
+    raise ValueError(f"Formato '{extensao}' não suportado. Use: {', '.join(EXTENSOES)}")
+
+
+def _ler_csv(caminho: str) -> Iterator[tuple[list[str], float]]:
+    """Metodo Privado. CSV com ';', ',' ou tabulação (detectado), em UTF-8 ou Windows-1252 (Excel)."""
+    total = os.path.getsize(caminho) or 1
+    with open(caminho, "rb") as arquivo:
+        amostra = arquivo.read(64 * 1024)
+        arquivo.seek(0)
+        try:
+            amostra.decode("utf-8-sig")
+            codificacao = "utf-8-sig"
+        except UnicodeDecodeError as erro:
+            # Um caractere cortado no fim da amostra não conta; um byte inválido antes dele sim
+            codificacao = "utf-8-sig" if erro.start >= len(amostra) - 3 else "cp1252"
+        texto_amostra = amostra.decode(codificacao, errors="ignore")
+        try:
+            delimitador = csv.Sniffer().sniff(texto_amostra.split("\n", 20)[0], delimiters=";,\t").delimiter
+        except csv.Error:
+            delimitador = ";"
+
+        contador = _LeitorContado(arquivo)
+        texto = io.TextIOWrapper(io.BufferedReader(contador), encoding=codificacao, newline="")
+        for celulas in csv.reader(texto, delimiter=delimitador):
+            yield celulas, contador.lidos / total
+
+
+def _ler_xlsx(caminho: str) -> Iterator[tuple[list[str], float]]:
+    """Metodo Privado. Primeira aba de um XLSX, lida com iterparse."""
+    try:
+        pacote = zipfile.ZipFile(caminho)
+    except zipfile.BadZipFile:
+        raise ValueError(f"'{os.path.basename(caminho)}' não é um arquivo XLSX válido") from None
+
+    with pacote:
+        try:
+            textos = _textos_compartilhados(pacote)
+            aba = _primeira_aba(pacote)
+            total = pacote.getinfo(aba).file_size or 1
+        except (KeyError, ParseError):
+            raise ValueError(f"'{os.path.basename(caminho)}' não é um arquivo XLSX válido") from None
+
+        with pacote.open(aba) as origem:
+            contador = _LeitorContado(origem)
+            try:
+                for celulas in _linhas_aba(io.BufferedReader(contador), textos):
+                    yield celulas, contador.lidos / total
+            except ParseError as erro:
+                raise ValueError(f"'{os.path.basename(caminho)}' não é um arquivo XLSX válido ({erro})") from None
+
+
+def _linhas_aba(origem, textos: list[str]) -> Iterator[list[str]]:
+    """Metodo Privado. Células de cada linha do XML de uma aba (cada linha é descartada após o uso)."""
+    dados_aba = None
+    for evento, elemento in iterparse(origem, events=("start", "end")):
+        if evento == "start":
+            if elemento.tag == f"{_NS}sheetData":
+                dados_aba = elemento
+            continue
+        if elemento.tag != f"{_NS}row":
+            continue
+
+        celulas: list[str] = []
+        for celula in elemento.iter(f"{_NS}c"):
+            coluna = _indice_coluna(celula.get("r", ""), len(celulas))
+            celulas.extend([""] * (coluna - len(celulas)))
+            celulas.append(_valor_celula(celula, textos))
+        yield celulas
+
+        if dados_aba is not None:
+            dados_aba.clear()  # Descarta as linhas já lidas (a memória não cresce com o arquivo)
+
+
+def _textos_compartilhados(pacote: zipfile.ZipFile) -> list[str]:
+    """Metodo Privado. Tabela de textos do XLSX (as células de texto guardam só o índice nela)."""
+    try:
+        origem = pacote.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    textos = []
+    with origem:
+        for _, elemento in iterparse(origem):
+            if elemento.tag == f"{_NS}si":
+                textos.append("".join(texto.text or "" for texto in elemento.iter(f"{_NS}t")))
+                elemento.clear()
+    return textos
+
+
+def _primeira_aba(pacote: zipfile.ZipFile) -> str:
+    """Metodo Privado. Caminho, dentro do .zip, do XML da primeira aba da pasta de trabalho."""
+    try:
+        with pacote.open("xl/workbook.xml") as origem:
+            aba = next(elemento for _, elemento in iterparse(origem) if elemento.tag == f"{_NS}sheet")
+            identificador = aba.get(f"{_NS_REL}id")
+        with pacote.open("xl/_rels/workbook.xml.rels") as origem:
+            alvo = next(elemento.get("Target") for _, elemento in iterparse(origem)
+                        if elemento.tag == f"{_NS_PACOTE}Relationship" and elemento.get("Id") == identificador)
+    except (KeyError, StopIteration):
+        raise ValueError("Planilha XLSX sem abas") from None
+    return alvo.lstrip("/") if alvo.startswith("/") else f"xl/{alvo}"
+
+
+@lru_cache(maxsize=1024)
+def _indice_letras(letras: str) -> int:
+    """Metodo Privado. Converte as letras da coluna ('C', 'AB') no índice da coluna (2, 27)."""
+    indice = 0
+    for caractere in letras.upper():
+        indice = indice * 26 + ord(caractere) - 64
+    return indice - 1
+
+
+def _indice_coluna(referencia: str, padrao: int) -> int:
+    """Metodo Privado. Converte a referência da célula ('C12') no índice da coluna (2); sem referência, 'padrao'."""
+    letras = referencia.rstrip("0123456789")
+    return _indice_letras(letras) if letras else padrao
+
+
+def _valor_celula(celula, textos: list[str]) -> str:
+    """Metodo Privado. Valor da célula como texto (texto compartilhado, texto embutido, número ou booleano)."""
+    tipo = celula.get("t")
+    if tipo == "inlineStr":
+        return "".join(texto.text or "" for texto in celula.iter(f"{_NS}t"))
+    valor = celula.find(f"{_NS}v")
+    if valor is None or valor.text is None:
+        return ""
+    if tipo == "s":
+        return textos[int(valor.text)]
+    return valor.text
+
+
+# CONVERSÃO EM LINHAS ==============================
+def numero(texto: str) -> float:
+    """
+    Converte um número da planilha, no formato brasileiro ('1.234,5') ou no do XLSX ('1234.5').
+
+    Raises:
+        ValueError: Se o texto não for um número finito ('inf' e 'nan' são recusados, como qualquer texto).
+    """
+    texto = texto.strip()
+    if "," in texto:
+        texto = texto.replace(".", "").replace(",", ".")
+    valor = float(texto)
+    if not math.isfinite(valor):
+        raise ValueError(f"Número não finito: {texto!r}")
+    return valor
+
+
+def _celula(celulas: list[str], posicoes: dict[str, int], campo: str) -> str:
+    """Metodo Privado. Texto da célula do campo na linha ('' se a coluna não existe ou a linha é mais curta)."""
+    indice = posicoes.get(campo)
+    return celulas[indice].strip() if indice is not None and indice < len(celulas) else ""
+
+
+def ler_lotes(caminho: str, mapeamento: MapeamentoColunas | None = None,
+              tamanho_lote: int = TAMANHO_LOTE) -> Iterator[tuple[LotePlanilha, list[int]]]:
+    """
+    Lê a planilha em lotes de linhas do orçamento. A primeira linha não vazia é o cabeçalho.
+
+    :param caminho: Arquivo .csv ou .xlsx.
+    :param mapeamento: Correspondência entre cabeçalhos e campos. Caso omitido, usa os cabeçalhos padrão.
+    :param tamanho_lote: Linhas por lote.
+    :return: Gerador de (lote, número na planilha de cada linha do lote = lote.numeros). Linhas com medidas
+             ou quantidade ilegíveis, zeradas ou negativas não entram no lote e ficam em lote.erros.
+    Raises:
+        ValueError: Formato não suportado, arquivo inválido ou coluna obrigatória ausente.
+    """
+    mapeamento = mapeamento or MapeamentoColunas()
+    fator = FATORES_UNIDADE.get(mapeamento.unidade, 1.0)
+    posicoes: dict[str, int] | None = None
+    lote = LotePlanilha()
+
+    for numero_linha, (celulas, progresso) in enumerate(ler_celulas(caminho), start=1):
+        if not any(celula.strip() for celula in celulas):
+            continue  # Linha em branco
+
+        # 1. Cabeçalho
+        if posicoes is None:
+            posicoes = mapeamento.resolver(celulas)
+            continue
+
+        # 2. Linha de dados
+        try:
+            largura = numero(_celula(celulas, posicoes, "largura_cm")) * fator
+            altura = numero(_celula(celulas, posicoes, "altura_cm")) * fator
+            texto_quantidade = _celula(celulas, posicoes, "quantidade")
+            quantidade = numero(texto_quantidade) if texto_quantidade else mapeamento.quantidade_padrao
+        except ValueError:
+            lote.erros.append((numero_linha, "Medida ou quantidade ilegível"))
+            continue
+        if largura <= 0 or altura <= 0:
+            lote.erros.append((numero_linha, "Medida zerada ou negativa"))  # O Model recusaria o lote inteiro
+            continue
+        if largura > MEDIDA_MAXIMA_CM or altura > MEDIDA_MAXIMA_CM:
+            lote.erros.append((numero_linha, f"Medida acima de {MEDIDA_MAXIMA_CM:.0f} cm"))
+            continue
+        if quantidade != int(quantidade) or not 0 < quantidade <= QUANTIDADE_MAXIMA:
+            lote.erros.append((numero_linha, "Quantidade não inteira, zerada ou grande demais"))  # Sem truncar 2,5
+            continue
+        quantidade = int(quantidade)
+
+        lote.descricoes.append(_celula(celulas, posicoes, "descricao") or f"Linha {numero_linha}")
+        lote.larguras.append(largura)
+        lote.alturas.append(altura)
+        lote.quantidades.append(quantidade)
+        lote.materiais.append(_celula(celulas, posicoes, "material") or mapeamento.material_padrao)
+        lote.acabamentos.append(_celula(celulas, posicoes, "acabamento") or mapeamento.acabamento_padrao)
+        lote.numeros.append(numero_linha)
+
+        if len(lote) >= tamanho_lote:
+            lote.progresso = progresso
+            yield lote, lote.numeros
+            lote = LotePlanilha()
+
+    if posicoes is None:
+        raise ValueError("Planilha vazia (sem linha de cabeçalho)")
+    lote.progresso = 1.0
+    yield lote, lote.numeros
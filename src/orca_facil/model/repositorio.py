@@ -0,0 +1,278 @@
+"""
+Módulo de Repositório de Orçamentos.
+Responsabilidade: Guardar os orçamentos emitidos (cabeçalho + linhas) num banco SQLite local e
+encontrá-los depois por número, cliente ou data.
+
+> Por que SQLite em modo WAL?
+O modo WAL (write-ahead log) deixa as leituras (ex.: busca de orçamentos antigos) acontecerem enquanto
+um orçamento é gravado, e torna o COMMIT barato: com synchronous=NORMAL, gravar um orçamento de 10 mil
+linhas é uma única transação de poucos milissegundos.
+Observação: o WAL precisa de memória compartilhada entre os processos, por isso o banco deve ficar num
+disco local (não numa pasta de rede).
+
+> Como a gravação fica rápida?
+  - uma única conexão, aberta uma vez e reaproveitada (o sqlite3 guarda as instruções já preparadas);
+  - todas as linhas entram com um único executemany(), direto das colunas do orçamento (ColunasItens),
+    sem criar um objeto por linha;
+  - cabeçalho e linhas numa única transação (BEGIN IMMEDIATE ... COMMIT).
+
+> Como a busca fica rápida?
+Índices por número, por cliente (nome normalizado, sem acentos) e por data. A busca por cliente é uma
+faixa no índice (prefixo <= nome < prefixo + '\\uffff'), sem percorrer a tabela.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import count, repeat
+from typing import Iterator
+
+from src.configs.caminhos import pasta_dados
+from src.orca_facil.model.model import Orcamento
+from src.perfis.busca import normalizar
+
+ARQUIVO_BANCO = "orcamentos.sqlite3"
+VERSAO_ESQUEMA = 2
+
+ErroRepositorio = sqlite3.Error  # Falhas do banco (disco cheio, banco travado por outro processo...)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS orcamentos (
+    id INTEGER PRIMARY KEY,
+    numero INTEGER NOT NULL,
+    cliente TEXT NOT NULL DEFAULT '',
+    cliente_busca TEXT NOT NULL DEFAULT '',
+    documento TEXT NOT NULL DEFAULT '',
+    perfil TEXT NOT NULL DEFAULT '',
+    criado_em REAL NOT NULL,
+    atualizado_em REAL NOT NULL,
+    total_centavos INTEGER NOT NULL,
+    linhas INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_orcamentos_numero ON orcamentos (numero);
+CREATE INDEX IF NOT EXISTS idx_orcamentos_cliente ON orcamentos (cliente_busca, criado_em);
+CREATE INDEX IF NOT EXISTS idx_orcamentos_data ON orcamentos (criado_em);
+
+CREATE TABLE IF NOT EXISTS itens (
+    orcamento_id INTEGER NOT NULL REFERENCES orcamentos (id) ON DELETE CASCADE,
+    posicao INTEGER NOT NULL,
+    descricao TEXT NOT NULL,
+    caminho TEXT NOT NULL,
+    largura_cm REAL NOT NULL,
+    altura_cm REAL NOT NULL,
+    quantidade INTEGER NOT NULL,
+    material TEXT NOT NULL,
+    acabamento TEXT NOT NULL,
+    valor_centavos INTEGER NOT NULL,
+    PRIMARY KEY (orcamento_id, posicao)
+) WITHOUT ROWID;
+"""
+
+# Versão do esquema → instruções que atualizam um banco da versão anterior (um banco novo já nasce com ESQUEMA)
+MIGRACOES = {
+    2: """
+ALTER TABLE orcamentos ADD COLUMN atualizado_em REAL NOT NULL DEFAULT 0;
+UPDATE orcamentos SET atualizado_em = criado_em;
+""",
+}
+
+# Instruções usadas a cada gravação/consulta (preparadas uma vez e mantidas no cache da conexão)
+_SQL_ID = "SELECT id FROM orcamentos WHERE numero = ?"
+_SQL_EXISTENTE = "SELECT id, criado_em FROM orcamentos WHERE numero = ?"
+_SQL_INSERIR = ("INSERT INTO orcamentos (numero, cliente, cliente_busca, documento, perfil, atualizado_em, "
+                "total_centavos, linhas, criado_em) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+_SQL_ATUALIZAR = ("UPDATE orcamentos SET cliente = ?, cliente_busca = ?, documento = ?, perfil = ?, atualizado_em = ?, "
+                  "total_centavos = ?, linhas = ? WHERE id = ?")
+_SQL_LIMPAR_ITENS = "DELETE FROM itens WHERE orcamento_id = ?"
+_SQL_INSERIR_ITEM = ("INSERT INTO itens (orcamento_id, posicao, descricao, caminho, largura_cm, altura_cm, quantidade, "
+                     "material, acabamento, valor_centavos) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+_COLUNAS_RESUMO = "numero, cliente, documento, perfil, criado_em, total_centavos, linhas, atualizado_em"
+_SQL_ITENS = ("SELECT descricao, caminho, largura_cm, altura_cm, quantidade, material, acabamento, valor_centavos "
+              "FROM itens WHERE orcamento_id = ? ORDER BY posicao")
+
+
+@dataclass
+class ResumoOrcamento:
+    """Cabeçalho de um orçamento salvo (sem as linhas)."""
+
+    numero: int
+    cliente: str
+    documento: str
+    perfil: str
+    criado_em: float  # time.time() da primeira gravação (mantido quando o orçamento é reemitido)
+    total: Decimal
+    linhas: int
+    atualizado_em: float = 0.0  # time.time() da última gravação
+
+    @classmethod
+    def da_linha(cls, linha: tuple) -> "ResumoOrcamento":
+        """Monta o resumo a partir de uma linha do SELECT (_COLUNAS_RESUMO)."""
+        numero, cliente, documento, perfil, criado_em, total_centavos, linhas, atualizado_em = linha
+        return cls(numero, cliente, documento, perfil, criado_em, Decimal(total_centavos).scaleb(-2), linhas,
+                   atualizado_em)
+
+
+class RepositorioOrcamentos:
+    """
+    Orçamentos salvos em SQLite, com uma única conexão de longa duração.
+    Pode ser usado por várias threads (as operações são serializadas por uma trava).
+    """
+
+    def __init__(self, caminho: str | None = None) -> None:
+        """
+        :param caminho: Arquivo do banco. Caso omitido, usa 'orcamentos.sqlite3' na pasta de dados.
+        """
+        self.caminho = caminho or pasta_dados(ARQUIVO_BANCO)
+        self._trava = threading.RLock()
+
+        # Autocommit do módulo desligado (isolation_level=None): as transações são abertas explicitamente
+        self._conexao = sqlite3.connect(self.caminho, isolation_level=None, check_same_thread=False,
+                                        cached_statements=64, timeout=5.0)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")  # Seguro com WAL: só o último COMMIT pode se perder
+        self._conexao.execute("PRAGMA foreign_keys=ON")
+        self._criar_esquema()
+
+    def fechar(self) -> None:
+        """Fecha a conexão (chamado ao fechar o programa)."""
+        with self._trava:
+            self._conexao.close()
+
+    # GRAVAÇÃO ==============================
+    def salvar(self, orcamento: Orcamento, numero: int, cliente: str = "", documento: str = "",
+               perfil: str = "") -> ResumoOrcamento:
+        """
+        Grava o orçamento inteiro numa única transação. Se o número já existir, o orçamento é substituído
+        (mantendo a data de criação; só 'atualizado_em' muda).
+
+        :param orcamento: Orçamento (as linhas são lidas direto das colunas, com os valores já calculados).
+        :param numero: Número do orçamento.
+        :return: O resumo gravado.
+        """
+        colunas = orcamento.colunas
+        textos = colunas.textos
+        total_centavos = int(orcamento.resultado.valor_total.scaleb(2))
+        atualizado_em = time.time()
+        cabecalho = (cliente, normalizar(cliente), documento, perfil, atualizado_em, total_centavos, len(colunas))
+
+        with self._transacao() as cursor:
+            # 1. Cabeçalho (novo ou substituído)
+            existente = cursor.execute(_SQL_EXISTENTE, (numero,)).fetchone()
+            if existente is None:
+                criado_em = atualizado_em
+                cursor.execute(_SQL_INSERIR, (numero, *cabecalho, criado_em))
+                orcamento_id = cursor.lastrowid
+            else:
+                orcamento_id, criado_em = existente
+                cursor.execute(_SQL_ATUALIZAR, (*cabecalho, orcamento_id))
+                cursor.execute(_SQL_LIMPAR_ITENS, (orcamento_id,))
+
+            # 2. Linhas: um único executemany, alimentado coluna a coluna
+            cursor.executemany(_SQL_INSERIR_ITEM, zip(
+                repeat(orcamento_id), count(), colunas.descricoes, colunas.caminhos, colunas.larguras,
+                colunas.alturas, colunas.quantidades, map(textos.__getitem__, colunas.materiais),
+                map(textos.__getitem__, colunas.acabamentos), colunas.centavos,
+            ))
+
+        return ResumoOrcamento(numero, cliente, documento, perfil, criado_em,
+                               Decimal(total_centavos).scaleb(-2), len(colunas), atualizado_em)
+
+    def remover(self, numero: int) -> bool:
+        """Apaga o orçamento e as suas linhas. Retorna False se ele não existia."""
+        with self._transacao() as cursor:
+            return cursor.execute("DELETE FROM orcamentos WHERE numero = ?", (numero,)).rowcount > 0
+
+    # CONSULTA ==============================
+    def obter(self, numero: int) -> ResumoOrcamento | None:
+        """Cabeçalho do orçamento pelo número (índice único), ou None se não existir."""
+        with self._trava:
+            linha = self._conexao.execute(f"SELECT {_COLUNAS_RESUMO} FROM orcamentos WHERE numero = ?",
+                                          (numero,)).fetchone()
+        return ResumoOrcamento.da_linha(linha) if linha else None
+
+    def colunas(self, numero: int) -> dict[str, list]:
+        """
+        Linhas do orçamento já em colunas, prontas para Orcamento.adicionar_colunas()
+        (os valores são recalculados pela tabela de preços do orçamento que as receber).
+
+        Raises:
+            KeyError: Se o orçamento não existir.
+        """
+        with self._trava:
+            existente = self._conexao.execute(_SQL_ID, (numero,)).fetchone()
+            if existente is None:
+                raise KeyError(numero)
+            itens = self._conexao.execute(_SQL_ITENS, existente).fetchall()
+        descricoes, caminhos, larguras, alturas, quantidades, materiais, acabamentos, _ = \
+            map(list, zip(*itens)) if itens else ([] for _ in range(8))
+        return {"descricoes": descricoes, "caminhos": caminhos, "larguras": larguras, "alturas": alturas,
+                "quantidades": quantidades, "materiais": materiais, "acabamentos": acabamentos}
+
+    def buscar_por_cliente(self, prefixo: str, limite: int = 50) -> list[ResumoOrcamento]:
+        """
+        Orçamentos cujo cliente começa com o prefixo (acentos e maiúsculas ignorados), do mais recente
+        ao mais antigo. Usa o índice (cliente_busca, criado_em): é uma leitura de faixa, não uma varredura.
+        """
+        inicio = normalizar(prefixo)
+        with self._trava:
+            linhas = self._conexao.execute(
+                f"SELECT {_COLUNAS_RESUMO} FROM orcamentos WHERE cliente_busca >= ? AND cliente_busca < ? "
+                "ORDER BY criado_em DESC LIMIT ?", (inicio, inicio + "\uffff", limite)).fetchall()
+        return list(map(ResumoOrcamento.da_linha, linhas))
+
+    def buscar_por_periodo(self, inicio: float, fim: float, limite: int = 500) -> list[ResumoOrcamento]:
+        """Orçamentos gravados entre 'inicio' e 'fim' (time.time()), do mais recente ao mais antigo."""
+        with self._trava:
+            linhas = self._conexao.execute(
+                f"SELECT {_COLUNAS_RESUMO} FROM orcamentos WHERE criado_em >= ? AND criado_em < ? "
+                "ORDER BY criado_em DESC LIMIT ?", (inicio, fim, limite)).fetchall()
+        return list(map(ResumoOrcamento.da_linha, linhas))
+
+    def ultimo_numero(self) -> int:
+        """Maior número de orçamento salvo (0 se não houver nenhum)."""
+        with self._trava:
+            return self._conexao.execute("SELECT COALESCE(MAX(numero), 0) FROM orcamentos").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._trava:
+            return self._conexao.execute("SELECT COUNT(*) FROM orcamentos").fetchone()[0]
+
+    # INTERNOS ==============================
+    @contextmanager
+    def _transacao(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Metodo Privado.
+        Transação de escrita: BEGIN IMMEDIATE reserva a escrita logo no início (sem risco de falhar no meio),
+        COMMIT no fim e ROLLBACK se algo der errado.
+        """
+        with self._trava:
+            cursor = self._conexao.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def _criar_esquema(self) -> None:
+        """
+        Metodo Privado.
+        Cria as tabelas e índices (só na primeira vez) ou aplica as MIGRACOES de um banco antigo, e registra
+        a versão do esquema. A versão é lida dentro da transação: dois processos abrindo o mesmo banco
+        (ex.: o modo --lote) não migram duas vezes.
+        """
+        with self._transacao() as cursor:
+            versao = cursor.execute("PRAGMA user_version").fetchone()[0]
+            if versao >= VERSAO_ESQUEMA:
+                return
+            pendentes = range(versao + 1, VERSAO_ESQUEMA + 1)
+            scripts = [ESQUEMA] if versao == 0 else [MIGRACOES[nova] for nova in pendentes]
+            # executescript() faria COMMIT antes de começar: as instruções vão uma a uma, dentro da transação
+            for instrucao in ";".join(scripts).split(";"):
+                if instrucao.strip():
+                    cursor.execute(instrucao)
+            cursor.execute(f"PRAGMA user_version = {VERSAO_ESQUEMA}")
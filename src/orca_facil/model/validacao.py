@@ -0,0 +1,275 @@
+"""
+Módulo de Validação.
+Responsabilidade: Conferir as linhas do orçamento (medidas dentro dos limites da máquina, quantidades
+positivas, materiais e acabamentos existentes no perfil) e o CPF/CNPJ do cliente, relatando TODOS os erros
+de uma vez, com o índice de cada linha.
+
+> Por que "compilar" as regras?
+As regras dependem do perfil (tabela de preços e limites). compilar() as transforma uma única vez em
+verificações por coluna, guardadas em cache por conjunto de regras. Cada verificação percorre a coluna
+inteira com 'map' + funções do módulo 'operator' (que rodam em C), sem criar um objeto Python por linha:
+só as linhas reprovadas viram ErroValidacao. 50 mil linhas são conferidas em poucos milissegundos.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import ge, gt, lt, mul, not_, or_
+from typing import Callable, Iterable, Sequence
+
+from src.configs.precificacao import TabelaPrecos
+
+# Pesos dos dígitos verificadores (módulo 11)
+PESOS_CPF = (tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+PESOS_CNPJ = ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+
+
+# CPF / CNPJ ==============================
+def somente_digitos(texto: str) -> str:
+    """Remove pontuação e espaços (ex.: "123.456.789-09" → "12345678909")."""
+    return "".join(filter(str.isdigit, texto))
+
+
+def _digitos_conferem(digitos: str, pesos: tuple[tuple[int, ...], tuple[int, ...]]) -> bool:
+    """Metodo Privado. Confere os dois dígitos verificadores (módulo 11) de um CPF ou CNPJ só com dígitos."""
+    if len(set(digitos)) == 1:
+        return False  # 000.000.000-00, 111.111.111-11...: passam na conta, mas não existem
+    numeros = list(map(int, digitos))
+    for posicao, pesos_digito in enumerate(pesos, start=len(digitos) - 2):
+        resto = sum(map(mul, numeros, pesos_digito)) % 11
+        if numeros[posicao] != (0 if resto < 2 else 11 - resto):
+            return False
+    return True
+
+
+def validar_cpf(texto: str) -> bool:
+    """Retorna True se o texto for um CPF válido (com ou sem pontuação)."""
+    digitos = somente_digitos(texto)
+    return len(digitos) == 11 and _digitos_conferem(digitos, PESOS_CPF)
+
+
+def validar_cnpj(texto: str) -> bool:
+    """Retorna True se o texto for um CNPJ válido (com ou sem pontuação)."""
+    digitos = somente_digitos(texto)
+    return len(digitos) == 14 and _digitos_conferem(digitos, PESOS_CNPJ)
+
+
+def validar_documento(texto: str) -> bool:
+    """Retorna True se o texto for um CPF (11 dígitos) ou um CNPJ (14 dígitos) válido."""
+    return validar_cpf(texto) or validar_cnpj(texto)
+
+
+# REGRAS ==============================
+@dataclass(frozen=True)
+class RegrasValidacao:
+    """
+    Conjunto de regras de um perfil. Imutável (e por isso usável como chave do cache de compilar()).
+    """
+
+    materiais: frozenset[str]
+    acabamentos: frozenset[str]
+    medida_minima_cm: float = 1.0
+    largura_maxima_cm: float = 320.0
+    comprimento_maximo_cm: float = 5000.0
+    quantidade_minima: int = 1
+    documento_obrigatorio: bool = False  # Se False, um documento vazio é aceito (mas um preenchido é conferido)
+
+    @classmethod
+    def da_tabela(cls, tabela: TabelaPrecos, documento_obrigatorio: bool = False) -> "RegrasValidacao":
+        """Monta as regras a partir da tabela de preços de um perfil (materiais, acabamentos e limites da máquina)."""
+        return cls(
+            materiais=frozenset(tabela.materiais),
+            acabamentos=frozenset(tabela.acabamentos),
+            medida_minima_cm=tabela.medida_minima_cm,
+            largura_maxima_cm=tabela.largura_maxima_cm,
+            comprimento_maximo_cm=tabela.comprimento_maximo_cm,
+            documento_obrigatorio=documento_obrigatorio,
+        )
+
+
+@dataclass(frozen=True)
+class ErroValidacao:
+    """Um erro encontrado na validação."""
+
+    linha: int | None  # Índice da linha no orçamento (None = erro do cliente, não de uma linha)
+    campo: str
+    mensagem: str
+
+
+@dataclass
+class RelatorioValidacao:
+    """Resultado de uma validação: todos os erros, ordenados por linha."""
+
+    total_linhas: int
+    erros: list[ErroValidacao] = field(default_factory=list)
+
+    @property
+    def valido(self) -> bool:
+        return not self.erros
+
+    @property
+    def linhas_com_erro(self) -> list[int]:
+        """Índices das linhas com pelo menos um erro, em ordem crescente."""
+        return sorted({erro.linha for erro in self.erros if erro.linha is not None})
+
+    def resumo(self, limite: int = 5) -> list[str]:
+        """Linhas de texto com os primeiros erros (ex.: para o registro ou um aviso na tela)."""
+        linhas = [f"{'Cliente' if erro.linha is None else f'Linha {erro.linha + 1}'} ({erro.campo}): {erro.mensagem}"
+                  for erro in self.erros[:limite]]
+        if len(self.erros) > limite:
+            linhas.append(f"... e mais {len(self.erros) - limite} erro(s)")
+        return linhas
+
+
+@dataclass(frozen=True)
+class _Verificacao:
+    """
+    Metodo Privado.
+    Uma regra compilada: 'falhas' recebe as colunas e devolve, por linha, True quando a linha é reprovada
+    (ou None quando já sabe que nenhuma é); 'mensagem' descreve o erro de uma linha reprovada.
+    """
+
+    campo: str
+    colunas: tuple[str, ...]
+    falhas: Callable[..., Iterable[bool] | None]
+    mensagem: Callable[..., str]
+
+
+# VALIDADOR ==============================
+class Validador:
+    """
+    Regras de um perfil compiladas em verificações por coluna.
+    Obtenha com compilar(regras) ou validador_da_tabela(tabela): o mesmo perfil reaproveita o mesmo validador.
+    """
+
+    def __init__(self, regras: RegrasValidacao) -> None:
+        self.regras = regras
+        self._verificacoes = self._compilar(regras)
+
+    def validar(self, colunas, inicio: int = 0, fim: int | None = None, documento: str | None = None) \
+            -> RelatorioValidacao:
+        """
+        Valida as linhas do orçamento guardadas por colunas (Orcamento.colunas).
+
+        :param colunas: ColunasItens do orçamento.
+        :param inicio: Primeira linha conferida (ex.: só o lote que acabou de ser importado).
+        :param fim: Linha final (exclusiva). Caso omitida, até a última.
+        :param documento: CPF/CNPJ do cliente (opcional).
+        """
+        return self.validar_colunas(
+            larguras=colunas.larguras[inicio:fim], alturas=colunas.alturas[inicio:fim],
+            quantidades=colunas.quantidades[inicio:fim], materiais=colunas.materiais[inicio:fim],
+            acabamentos=colunas.acabamentos[inicio:fim], textos=colunas.textos, deslocamento=inicio,
+            documento=documento,
+        )
+
+    def validar_colunas(self, larguras: Sequence[float], alturas: Sequence[float], quantidades: Sequence[int],
+                        materiais: Sequence, acabamentos: Sequence, textos: Sequence[str] | None = None,
+                        deslocamento: int = 0, documento: str | None = None) -> RelatorioValidacao:
+        """
+        Valida colunas soltas (ex.: um lote lido de uma planilha, antes de entrar no orçamento).
+
+        :param materiais: Nomes dos materiais, ou códigos de 'textos'.
+        :param acabamentos: Nomes dos acabamentos, ou códigos de 'textos'.
+        :param textos: Tabela de textos dos códigos (None = as colunas já contêm os nomes).
+        :param deslocamento: Somado aos índices relatados (posição da primeira linha no orçamento).
+        :param documento: CPF/CNPJ do cliente (opcional).
+        Raises:
+            ValueError: Se as colunas tiverem tamanhos diferentes.
+        """
+
+        # 1. Confere se as colunas estão alinhadas
+        total_linhas = len(larguras)
+        if not (len(alturas) == len(quantidades) == len(materiais) == len(acabamentos) == total_linhas):
+            raise ValueError("As colunas (larguras, alturas, quantidades, materiais, acabamentos) "
+                             "devem ter o mesmo tamanho")
+        dados = {"largura_cm": larguras, "altura_cm": alturas, "quantidade": quantidades,
+                 "material": materiais, "acabamento": acabamentos, "textos": textos}
+
+        # 2. Cada verificação percorre as colunas de uma vez; só as linhas reprovadas viram erro
+        erros = []
+        for verificacao in self._verificacoes:
+            valores = [dados[nome] for nome in verificacao.colunas]
+            falhas = verificacao.falhas(*valores)
+            if falhas is None:
+                continue
+            for indice in compress(range(total_linhas), falhas):
+                erros.append(ErroValidacao(indice + deslocamento, verificacao.campo,
+                                           verificacao.mensagem(indice, *valores)))
+        erros.sort(key=lambda erro: erro.linha)  # Estável: na mesma linha, mantém a ordem das regras
+
+        # 3. Cliente
+        if documento is not None:
+            erro_documento = self.validar_cliente(documento)
+            if erro_documento:
+                erros.insert(0, erro_documento)
+
+        return RelatorioValidacao(total_linhas, erros)
+
+    def validar_cliente(self, documento: str) -> ErroValidacao | None:
+        """Confere o CPF/CNPJ do cliente. Retorna o erro, ou None se estiver correto."""
+        if not documento.strip():
+            return ErroValidacao(None, "documento", "CPF/CNPJ não informado") \
+                if self.regras.documento_obrigatorio else None
+        if validar_documento(documento):
+            return None
+        digitos = len(somente_digitos(documento))
+        tipo = "CPF" if digitos == 11 else "CNPJ" if digitos == 14 else "CPF/CNPJ"
+        return ErroValidacao(None, "documento", f"{tipo} inválido: '{documento}'")
+
+    # COMPILAÇÃO ==============================
+    @staticmethod
+    def _compilar(regras: RegrasValidacao) -> tuple[_Verificacao, ...]:
+        """Metodo Privado. Transforma as regras em verificações por coluna (limites já fixados em cada função)."""
+        minima = regras.medida_minima_cm
+        largura_maxima, comprimento_maximo = regras.largura_maxima_cm, regras.comprimento_maximo_cm
+        quantidade_minima = regras.quantidade_minima
+
+        def abaixo_minimo(coluna):
+            # not (v >= mínimo) também reprova NaN, que falha em qualquer comparação
+            return map(not_, map(ge, coluna, repeat(minima)))
+
+        def fora_da_maquina(larguras, alturas):
+            menores, maiores = map(min, larguras, alturas), map(max, larguras, alturas)
+            return map(or_, map(gt, menores, repeat(largura_maxima)), map(gt, maiores, repeat(comprimento_maximo)))
+
+        def quantidade_invalida(quantidades):
+            return map(lt, quantidades, repeat(quantidade_minima))
+
+        def texto_invalido(validos: frozenset[str]):
+            def falhas(coluna, textos):
+                # Confere cada valor distinto uma única vez; a coluna só é percorrida se houver algum inválido
+                invalidos = {valor for valor in set(coluna)
+                             if (textos[valor] if textos is not None else valor) not in validos}
+                return map(invalidos.__contains__, coluna) if invalidos else None
+            return falhas
+
+        def nome(coluna, textos, indice):
+            return textos[coluna[indice]] if textos is not None else coluna[indice]
+
+        return (
+            _Verificacao("largura_cm", ("largura_cm",), abaixo_minimo,
+                         lambda i, c: f"Largura {c[i]:g} cm inválida (mínimo {minima:g} cm)"),
+            _Verificacao("altura_cm", ("altura_cm",), abaixo_minimo,
+                         lambda i, c: f"Altura {c[i]:g} cm inválida (mínimo {minima:g} cm)"),
+            _Verificacao("medidas", ("largura_cm", "altura_cm"), fora_da_maquina,
+                         lambda i, l, a: f"{l[i]:g} × {a[i]:g} cm não cabe na máquina (largura útil "
+                                         f"{largura_maxima:g} cm, comprimento máximo {comprimento_maximo:g} cm)"),
+            _Verificacao("quantidade", ("quantidade",), quantidade_invalida,
+                         lambda i, q: f"Quantidade {q[i]} inválida (mínimo {quantidade_minima})"),
+            _Verificacao("material", ("material", "textos"), texto_invalido(regras.materiais),
+                         lambda i, c, t: f"Material '{nome(c, t, i)}' não existe no perfil"),
+            _Verificacao("acabamento", ("acabamento", "textos"), texto_invalido(regras.acabamentos),
+                         lambda i, c, t: f"Acabamento '{nome(c, t, i)}' não existe no perfil"),
+        )
+
+
+@lru_cache(maxsize=32)
+def compilar(regras: RegrasValidacao) -> Validador:
+    """Retorna o validador das regras, compilando-as só na primeira vez (cache por conjunto de regras)."""
+    return Validador(regras)
+
+
+def validador_da_tabela(tabela: TabelaPrecos, documento_obrigatorio: bool = False) -> Validador:
+    """Atalho: validador (em cache) das regras da tabela de preços de um perfil."""
+    return compilar(RegrasValidacao.da_tabela(tabela, documento_obrigatorio))
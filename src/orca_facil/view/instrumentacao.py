@@ -0,0 +1,310 @@
+"""
+Módulo de Instrumentação da Janela.
+Responsabilidade: Medir por que a janela "engasga" nas máquinas dos operadores (main.py --monitor),
+sem custo nenhum quando desligada: nada aqui é importado nem instalado sem a opção.
+
+O que é medido:
+  - Atraso do loop do Tk: uma sonda com after() a cada 100 ms compara a hora em que deveria rodar com a
+    hora em que rodou. Qualquer coisa que segure a thread do Tk (um comando lento, um redesenho pesado)
+    aparece como atraso.
+  - Tempo de cada callback do Tk (cliques nos botões, after(), eventos) e de cada aplicar_estilo().
+  - Widgets vivos (a árvore do Tk inteira e os registrados pela fábrica) e memória (tracemalloc).
+
+> Como os callbacks são medidos?
+Todo callback que o Tk chama passa por tkinter.CallWrapper. Ao instalar, o monitor troca o __call__ dele
+(e o aplicar_estilo/aplicar_estilo_lote das classes de widget) por versões cronometradas; ao desinstalar,
+os originais voltam. Um clique num botão é identificado pelo texto do botão.
+
+Saída:
+  - Painel sobreposto no canto da janela, mostrado/ocultado com F12.
+  - Um resumo por segundo (JSON, uma linha cada) em 'diagnostico/desempenho.jsonl' na pasta de dados,
+    com rotação por tamanho (o arquivo nunca passa de alguns MB).
+"""
+
+import json
+import logging
+import logging.handlers
+import time
+import tkinter
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from statistics import fmean, quantiles
+
+import customtkinter as ctk
+
+from src.configs.caminhos import pasta_dados
+from src.configs.registro import registro
+from src.orca_facil.view.widgets.base import BaseWidget
+from src.orca_facil.view.widgets.botao import Botao
+
+log = registro("VIEW")
+
+INTERVALO_SONDA_MS = 100  # Período da sonda de atraso
+SONDAS_POR_RESUMO = 10  # Um resumo (painel + arquivo) a cada 10 sondas (~1 s)
+LIMITE_LENTO = 0.016  # Segundos: callbacks acima de um quadro (60 Hz) contam como lentos
+TECLA_PAINEL = "<F12>"
+ARQUIVO = ("diagnostico", "desempenho.jsonl")
+TAMANHO_ARQUIVO = 1024 * 1024  # Bytes por arquivo antes da rotação
+ARQUIVOS_ANTIGOS = 3  # desempenho.jsonl.1 ... .3
+RESUMOS_NO_PAINEL = 60  # O painel mostra o pior atraso do último minuto
+
+
+class EstatisticaCallback:
+    """Tempos de um callback (ou de um aplicar_estilo) no intervalo do resumo atual."""
+
+    __slots__ = ("chamadas", "total", "maximo")
+
+    def __init__(self) -> None:
+        self.chamadas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+
+    def somar(self, segundos: float) -> None:
+        self.chamadas += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def como_dict(self) -> dict:
+        return {"n": self.chamadas, "total_ms": round(self.total * 1000, 2), "max_ms": round(self.maximo * 1000, 2)}
+
+
+class MonitorDesempenho:
+    """
+    Instrumentação opcional da janela principal.
+    Uso (ver Controller.iniciar): MonitorDesempenho(janela).instalar() ... desinstalar() ao fechar.
+    """
+
+    def __init__(self, janela, arquivo: str | None = None) -> None:
+        """
+        :param janela: Janela principal (JanelaPrincipal).
+        :param arquivo: Arquivo do resumo. Caso omitido, 'diagnostico/desempenho.jsonl' na pasta de dados.
+        """
+        self.janela = janela
+        self.caminho = arquivo or pasta_dados(*ARQUIVO)
+        self.instalado = False
+
+        self._atrasos: list[float] = []  # Atrasos da sonda desde o último resumo (segundos)
+        self._callbacks: dict[str, EstatisticaCallback] = {}  # Nome → tempos desde o último resumo
+        self._lentos = 0  # Callbacks acima de LIMITE_LENTO desde o último resumo
+        self._piores: deque[float] = deque(maxlen=RESUMOS_NO_PAINEL)  # Pior atraso de cada resumo
+        self._esperado = 0.0  # time.perf_counter() em que a próxima sonda deveria rodar
+        self._sondas = 0
+        self._sonda_id = None
+        self._originais: list[tuple[type, str, object]] = []  # (classe, atributo, original) para desinstalar
+        self._iniciou_tracemalloc = False
+        self._saida: logging.Logger | None = None
+        self._painel: ctk.CTkLabel | None = None
+        self._painel_visivel = False
+        self.ultimo_resumo: dict = {}
+
+    # INSTALAÇÃO ==============================
+    def instalar(self) -> "MonitorDesempenho":
+        """Liga as medições, a sonda, o arquivo e a tecla do painel."""
+        if self.instalado:
+            return self
+
+        # 1. Callbacks do Tk e estilos dos widgets
+        self._envolver(tkinter.CallWrapper, "__call__", self._medir_callback)
+        for classe in _subclasses(BaseWidget):
+            for metodo in ("aplicar_estilo", "aplicar_estilo_lote"):
+                if metodo in vars(classe):
+                    self._envolver(classe, metodo, self._medir_estilo)
+
+        # 2. Memória (só as alocações feitas daqui em diante)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+
+        # 3. Arquivo com rotação
+        self._saida = registro("DESEMPENHO")
+        self._saida.propagate = False  # Não vai para o console nem para o --log-file
+        self._saida.setLevel(logging.INFO)
+        destino = logging.handlers.RotatingFileHandler(self.caminho, maxBytes=TAMANHO_ARQUIVO,
+                                                       backupCount=ARQUIVOS_ANTIGOS, encoding="utf-8")
+        destino.setFormatter(logging.Formatter("%(message)s"))
+        self._saida.addHandler(destino)
+
+        # 4. Sonda e tecla do painel
+        self.instalado = True
+        self.janela.bind(TECLA_PAINEL, self.alternar_painel, add="+")
+        self._agendar_sonda()
+        log.info("Monitor de desempenho ligado (%s mostra o painel). Resumo em %s", TECLA_PAINEL[1:-1], self.caminho)
+        return self
+
+    def desinstalar(self) -> None:
+        """Desliga tudo e devolve os métodos originais (chamado ao fechar o programa)."""
+        if not self.instalado:
+            return
+        self.instalado = False
+        if self._sonda_id is not None:
+            try:
+                self.janela.after_cancel(self._sonda_id)
+            except tkinter.TclError:  # A janela já foi destruída
+                pass
+        for classe, atributo, original in reversed(self._originais):
+            setattr(classe, atributo, original)
+        self._originais.clear()
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+        for destino in list(self._saida.handlers):
+            self._saida.removeHandler(destino)
+            destino.close()
+
+    # PAINEL ==============================
+    def alternar_painel(self, evento=None) -> None:
+        """Mostra ou oculta o painel sobreposto (tecla F12)."""
+        if self._painel is None:
+            self._painel = ctk.CTkLabel(self.janela, text="", justify="left", anchor="nw", corner_radius=6,
+                                        font=("Consolas", 12), fg_color="#101010", text_color="#4dff88")
+        self._painel_visivel = not self._painel_visivel
+        if self._painel_visivel:
+            self._painel.configure(text=self.texto_painel())
+            self._painel.place(relx=1.0, x=-12, y=12, anchor="ne")
+            self._painel.lift()
+        else:
+            self._painel.place_forget()
+
+    def texto_painel(self) -> str:
+        """Texto do painel a partir do último resumo."""
+        resumo = self.ultimo_resumo
+        if not resumo:
+            return "MONITOR: aguardando o primeiro resumo..."
+        atraso = resumo["atraso_ms"]
+        linhas = [
+            f"ATRASO   média {atraso['media']:6.1f} ms  p95 {atraso['p95']:6.1f} ms  máx {atraso['max']:6.1f} ms",
+            f"         pior no último minuto: {max(self._piores, default=0) * 1000:.1f} ms",
+            f"LENTOS   {resumo['lentos']} callback(s) > {LIMITE_LENTO * 1000:.0f} ms no último segundo",
+            f"MEMÓRIA  {resumo['memoria_kb'] / 1024:.1f} MB (pico {resumo['pico_kb'] / 1024:.1f} MB)",
+            f"WIDGETS  {resumo['widgets']} no Tk, {resumo['registrados']} na fábrica",
+        ]
+        mais_lentos = sorted(resumo["callbacks"].items(), key=lambda item: item[1]["max_ms"], reverse=True)[:5]
+        linhas.extend(f"  {nome[:34]:34} {dados['n']:4}x  máx {dados['max_ms']:7.1f} ms"
+                      for nome, dados in mais_lentos)
+        return "\n".join(linhas)
+
+    # INTERNOS ==============================
+    def _agendar_sonda(self) -> None:
+        """Metodo Privado. Agenda a próxima sonda e anota quando ela deveria rodar."""
+        self._esperado = time.perf_counter() + INTERVALO_SONDA_MS / 1000
+        self._sonda_id = self.janela.after(INTERVALO_SONDA_MS, self._sondar)
+
+    def _sondar(self) -> None:
+        """Metodo Privado. Mede o atraso da sonda e, a cada SONDAS_POR_RESUMO, fecha um resumo."""
+        if not self.instalado:
+            return
+        self._atrasos.append(max(0.0, time.perf_counter() - self._esperado))
+        self._sondas += 1
+        if self._sondas % SONDAS_POR_RESUMO == 0:
+            self._resumir()
+        self._agendar_sonda()
+
+    def _resumir(self) -> None:
+        """Metodo Privado. Fecha o resumo do último segundo: grava no arquivo e atualiza o painel (se visível)."""
+        atrasos, self._atrasos = self._atrasos, []
+        callbacks, self._callbacks = self._callbacks, {}
+        lentos, self._lentos = self._lentos, 0
+        memoria, pico = tracemalloc.get_traced_memory()
+
+        pior = max(atrasos, default=0.0)
+        self._piores.append(pior)
+        self.ultimo_resumo = {
+            "instante": datetime.now().isoformat(timespec="seconds"),
+            "atraso_ms": {
+                "media": round(fmean(atrasos) * 1000, 2) if atrasos else 0.0,
+                "p95": round(quantiles(atrasos, n=20, method="inclusive")[-1] * 1000, 2) if len(atrasos) > 1 else round(pior * 1000, 2),
+                "max": round(pior * 1000, 2),
+            },
+            "lentos": lentos,
+            "memoria_kb": memoria // 1024,
+            "pico_kb": pico // 1024,
+            "widgets": _contar_widgets(self.janela),
+            "registrados": sum(self.janela.fabrica.widgets_vivos().values()),
+            "callbacks": {nome: estatistica.como_dict() for nome, estatistica in callbacks.items()},
+        }
+        self._saida.info(json.dumps(self.ultimo_resumo, ensure_ascii=False))
+        if self._painel_visivel:
+            self._painel.configure(text=self.texto_painel())
+
+    def _anotar(self, nome: str, segundos: float) -> None:
+        """Metodo Privado. Soma o tempo ao callback 'nome' no resumo atual."""
+        estatistica = self._callbacks.get(nome)
+        if estatistica is None:
+            estatistica = self._callbacks[nome] = EstatisticaCallback()
+        estatistica.somar(segundos)
+        if segundos > LIMITE_LENTO:
+            self._lentos += 1
+
+    def _envolver(self, classe: type, atributo: str, fabricar) -> None:
+        """Metodo Privado. Troca classe.atributo pela versão cronometrada, guardando o original."""
+        original = vars(classe)[atributo]
+        self._originais.append((classe, atributo, original))
+        setattr(classe, atributo, fabricar(original, classe))
+
+    def _medir_callback(self, original, classe: type):
+        """Metodo Privado. Versão cronometrada de CallWrapper.__call__ (todo callback chamado pelo Tk)."""
+        monitor = self
+
+        @wraps(original)
+        def chamar(wrapper, *argumentos):
+            inicio = time.perf_counter()
+            try:
+                return original(wrapper, *argumentos)
+            finally:
+                nome = _nome_callback(wrapper.func)
+                if not nome.endswith("MonitorDesempenho._sondar"):  # A própria sonda não entra na conta
+                    monitor._anotar(nome, time.perf_counter() - inicio)
+        return chamar
+
+    def _medir_estilo(self, original, classe: type):
+        """Metodo Privado. Versão cronometrada de aplicar_estilo()/aplicar_estilo_lote() de uma classe de widget."""
+        monitor = self
+        metodo = original.__name__
+
+        @wraps(original)
+        def aplicar(widget, *argumentos, **opcoes):
+            inicio = time.perf_counter()
+            try:
+                return original(widget, *argumentos, **opcoes)
+            finally:
+                monitor._anotar(f"{type(widget).__name__}.{metodo}", time.perf_counter() - inicio)
+        return aplicar
+
+
+def _subclasses(classe: type) -> list[type]:
+    """Classe e todas as suas subclasses já importadas."""
+    encontradas, pendentes = [], [classe]
+    while pendentes:
+        atual = pendentes.pop()
+        encontradas.append(atual)
+        pendentes.extend(atual.__subclasses__())
+    return encontradas
+
+
+def _nome_callback(funcao) -> str:
+    """
+    Nome legível de um callback do Tk: o texto do botão clicado, a função agendada por after()
+    (que o tkinter embrulha numa função interna, 'callit') ou o nome qualificado da função.
+    """
+    if getattr(funcao, "__qualname__", "").endswith("after.<locals>.callit"):
+        agendada = next((celula.cell_contents for celula in funcao.__closure__ or ()
+                         if callable(celula.cell_contents) and celula.cell_contents is not funcao
+                         and getattr(celula.cell_contents, "__name__", None) == funcao.__name__), None)
+        if agendada is not None:
+            return f"after: {getattr(agendada, '__qualname__', funcao.__name__)}"
+    dono = getattr(funcao, "__self__", None)
+    if isinstance(dono, Botao):
+        return f"botão: {dono.texto.replace(chr(10), ' ')}"
+    return getattr(funcao, "__qualname__", type(funcao).__name__)
+
+
+def _contar_widgets(raiz) -> int:
+    """Widgets vivos na árvore do Tk (percorre o dicionário 'children' do tkinter, sem chamar o Tk)."""
+    total, pendentes = 0, [raiz]
+    while pendentes:
+        filhos = getattr(pendentes.pop(), "children", {}).values()
+        total += len(filhos)
+        pendentes.extend(filhos)
+    return total
@@ -0,0 +1,32 @@
+"""
+Pacote de Modais.
+Responsabilidade: Janelas secundárias (Carregar Perfil, Tamanhos e Quantidades, Configurações...).
+
+> Por que os modais não são importados aqui?
+Nenhum modal aparece na abertura do programa. Cada um é registrado em MODAIS pelo caminho do seu módulo
+e só é importado e construído na primeira vez em que o usuário o abre (JanelaPrincipal.modal),
+mantendo a abertura da Janela Principal rápida.
+"""
+
+from importlib import import_module
+
+# Nome do modal → "módulo:Classe" (módulo relativo a este pacote).
+# A classe recebe (master, interface), como os widgets da fábrica, e cria os seus widgets com master.fabrica
+# (registrados no grupo com o nome do modal e descartados do registro quando o modal é fechado).
+MODAIS: dict[str, str] = {
+    "perfis": "perfis:ModalPerfis",
+}
+
+
+def criar_modal(nome: str, master, interface):
+    """
+    Importa o módulo do modal (só na primeira vez) e cria a janela.
+
+    Raises:
+        ValueError: Se o modal não estiver registrado em MODAIS.
+    """
+    try:
+        modulo, classe = MODAIS[nome].split(":")
+    except KeyError:
+        raise ValueError(f"Modal '{nome}' não registrado. Disponíveis: {', '.join(MODAIS) or 'nenhum'}") from None
+    return getattr(import_module(f"{__name__}.{modulo}"), classe)(master, interface)
@@ -0,0 +1,88 @@
+"""
+Módulo do Modal "Carregar Perfil".
+Responsabilidade: Listar os perfis cadastrados (do usado mais recentemente para o mais antigo)
+e avisar o Controller do perfil escolhido.
+
+> Por que uma quantidade fixa de botões?
+A pasta pode ter centenas de perfis. O modal cria uma vez só os botões que cabem na janela e,
+a cada abertura, troca apenas o texto deles (como a tabela de itens faz com as linhas).
+Os perfis que não aparecem na lista são encontrados pela busca do campo CLIENTE.
+"""
+
+from typing import Callable, Sequence
+
+import customtkinter as ctk
+from src.configs.interface import InterfaceVisual
+from src.configs.registro import registro
+from src.perfis.manager import ResumoPerfil
+
+log = registro("VIEW")
+
+QUANTIDADE_BOTOES = 8  # Perfis exibidos de cada vez (os mais recentes)
+
+
+class ModalPerfis(ctk.CTkToplevel):
+    """
+    Janela "Carregar Perfil".
+    Fechar a janela só a esconde: a próxima abertura reaproveita os mesmos widgets.
+    """
+
+    def __init__(self, master, interface: InterfaceVisual) -> None:
+        """
+        :param master: Janela Principal (os botões são criados com master.fabrica).
+        :param interface: Instância de InterfaceVisual usada para aplicar o estilo.
+        """
+        super().__init__(master)
+        self.interface = interface
+        self._resumos: list[ResumoPerfil] = []
+        self._ao_escolher: Callable[[ResumoPerfil], None] | None = None
+
+        # 1. Janela
+        self.title("Carregar Perfil")
+        self.geometry(f"420x{90 + QUANTIDADE_BOTOES * 50}")
+        self.resizable(False, False)
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+        # 2. Widgets (registrados pela fábrica no grupo "perfis")
+        self.label_titulo = master.fabrica.criar_label(
+            master=self,
+            texto="ESCOLHA O PERFIL",
+            interface=interface,
+            x=20, y=15, largura=380, altura=30
+        )
+        self.botoes = [master.fabrica.criar_botao(
+            master=self,
+            texto="",
+            interface=interface,
+            comando=lambda posicao=posicao: self._escolher(posicao),
+            x=20, y=55 + posicao * 50, largura=380, altura=42
+        ) for posicao in range(QUANTIDADE_BOTOES)]
+
+    def exibir(self, resumos: Sequence[ResumoPerfil], ao_escolher: Callable[[ResumoPerfil], None]) -> None:
+        """
+        Metodo público.
+        Mostra os primeiros perfis de 'resumos' e chama 'ao_escolher' com o perfil clicado.
+        """
+        self._resumos = list(resumos[:QUANTIDADE_BOTOES])
+        self._ao_escolher = ao_escolher
+
+        for posicao, botao in enumerate(self.botoes):
+            if posicao < len(self._resumos):
+                resumo = self._resumos[posicao]
+                botao.configure(text=f"{resumo.nome} — {resumo.cliente}" if resumo.cliente else resumo.nome,
+                                state="normal")
+            else:
+                botao.configure(text="", state="disabled")
+
+        self.deiconify()
+        self.lift()
+        self.focus()
+
+    def _escolher(self, posicao: int) -> None:
+        """Metodo Privado. Esconde o modal e repassa o perfil do botão clicado."""
+        if posicao >= len(self._resumos) or self._ao_escolher is None:
+            return
+        self.withdraw()
+        log.debug("Modal de perfis: escolhido %s", self._resumos[posicao].arquivo)
+        self._ao_escolher(self._resumos[posicao])
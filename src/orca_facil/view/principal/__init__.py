@@ -5,13 +5,25 @@ Responsabilidade: Criar a Janela Principal do programa e organizar os widgets ne
 
 import customtkinter as ctk
 from src.configs.interface import Janelas, InterfaceVisual
+from src.configs.precificacao import ResultadoPrecificacao, formatar_moeda
+from src.configs.registro import registro
+from src.orca_facil.view.modais import criar_modal
+from src.orca_facil.view.widgets.barra_progresso import BarraProgresso
+from src.orca_facil.view.widgets.botao import Botao
 from src.orca_facil.view.widgets.fabrica import FabricaWidgets
+from src.orca_facil.view.widgets.tabela import TabelaVirtual
+from collections import OrderedDict
+from functools import cached_property, partial
+from typing import Callable, Sequence
+import io
 import os
 import sys
+import time
 
 
-def console(mensagem) -> None:
-    print(f"\033[93m[VIEW] {mensagem}.\033[0m")  # Print em AMARELO no console
+log = registro("VIEW")
+
+QUANTIDADE_SUGESTOES = 5  # Sugestões exibidas abaixo do campo CLIENTE
 
 
 def caminho_base():
@@ -30,11 +42,14 @@ class JanelaPrincipal(ctk.CTk):
     """
 
     # INICIALIZAÇÃO
-    def __init__(self, interface: InterfaceVisual, janela: Janelas, *args, **kwargs) -> None:
+    def __init__(self, interface: InterfaceVisual, janela: Janelas, *args, construcao_tardia: bool = True,
+                 **kwargs) -> None:
         """
         Inicializa a janela principal.
 
         :param interface: Objeto com configurações de janelas, cores e fontes.
+        :param construcao_tardia: Se True, a janela aparece só com o núcleo (botões e labels) e os painéis
+                                  pesados (tabela de itens, barra de progresso) são criados logo após a primeira pintura.
         :param args: Argumentos posicionais variáveis opcionais passados à classe-pai CTk. Empacota tudo numa tupla.
         :param kwargs: Argumentos nomeados variáveis opcionais passados à classe-pai CTk. Empacota tudo num dicionário.
 
@@ -46,17 +61,18 @@ class JanelaPrincipal(ctk.CTk):
         usar *args e **kwargs permite repasse automático desses argumentos para a superclasse
         sem precisar declarar todos manualmente.
         """
-        console("Iniciando Módulo View. Método '__init__()' foi chamado")
+        log.debug("Iniciando Módulo View. Método '__init__()' foi chamado")
+        inicio = time.perf_counter()
 
         # 1. Chama o construtor da classe-pai (CTk). Sem ele só teríamos uma classe e não uma Janela Principal
         super().__init__(*args, **kwargs)  # Aplica eventuais parâmetros herdados
-        console("Inicialização: 1. Chamando o construtor da classe-pai - super().__init__")
+        log.debug("Inicialização: 1. Chamando o construtor da classe-pai - super().__init__")
 
         # 2. Instancia as classes de configuração
-        console("Inicialização: 2. Instanciando classes de configuração")
+        log.debug("Inicialização: 2. Instanciando classes de configuração")
 
         # 2.1. Armazena o objeto de configuração de interface (tema, fontes, cores).
-        console("Inicialização: 2.1. Armazenando objeto de configuração de interface (InterfaceVisual)")
+        log.debug("Inicialização: 2.1. Armazenando objeto de configuração de interface (InterfaceVisual)")
         self.interface: InterfaceVisual = interface  # Com notação de tipagem - InterfaceVisual
         """
         <variável>: TIPO = <valor>
@@ -64,38 +80,51 @@ class JanelaPrincipal(ctk.CTk):
         """
 
         # 2.2. Instancia as configurações da Janela Principal
-        console("Inicialização: 2.2. Instanciando as configurações da janela principal")
+        log.debug("Inicialização: 2.2. Instanciando as configurações da janela principal")
         self.janela: Janelas = janela  # Com notação de tipagem - Janelas
 
         # 3. Instancia o tema do programa
-        console("Inicialização: 3. Aplicando tema")
+        log.debug("Inicialização: 3. Aplicando tema")
         self.aplicar_tema()
 
         # 4. Configurações globais da Janela Principal
-        console("Inicialização: 4. Setando configurações globais da janela principal")
+        log.debug("Inicialização: 4. Setando configurações globais da janela principal")
         self.resizable(False, False)
         caminho_icone = os.path.join(caminho_base(), "assets", "icon", "icone.ico")
         self.iconbitmap(caminho_icone)
 
         # 4.1. Define o título da Janela Principal (parte superior)
-        console("Inicialização: 4.1. Definindo título da Janela Principal")
+        log.debug("Inicialização: 4.1. Definindo título da Janela Principal")
         self.title("Orça Fácil 3.0")
 
         # 4.2. Define dimensões e posicionamento da Janela Principal (largura x altura + pos_horizontal + pos_vertical)
         dimensao = f"{self.interface.janelas.dimensao_principal}"
         posicao_central = self.centralizar()
-        console("Inicialização: 4.2. Dimensionando e centralizando a Janela Principal")
+        log.debug("Inicialização: 4.2. Dimensionando e centralizando a Janela Principal")
         self.geometry(f"{dimensao}+{posicao_central}")
 
-        # 5. Criar widgets
-        console("Inicialização: 5. Instanciando widgets. Chamando Fábrica de Widgets")
+        # 5. Criar widgets do núcleo
+        log.debug("Inicialização: 5. Instanciando widgets. Chamando Fábrica de Widgets")
+        self.instante_inicio = inicio  # time.perf_counter() no início do construtor
+        self.tempos: dict[str, float] = {}  # Etapas da abertura (segundos desde instante_inicio)
+        self._paineis_prontos = False
+        self._ao_ficar_pronta: list[Callable[[], None]] = []
+        self._modais: dict[str, ctk.CTkToplevel] = {}  # Modais já criados (view/modais), por nome
         self._instanciar_widgets()
+        self.tempos["nucleo"] = time.perf_counter() - inicio
+
+        # 6. Painéis pesados: depois da primeira pintura (padrão) ou já agora
+        if construcao_tardia:
+            log.debug("Inicialização: 6. Painéis agendados para depois da primeira pintura")
+            self._agendar_paineis()
+        else:
+            self._construir_paineis()
 
     # CONFIGURAÇÕES
     def obter_dpi_sistema(self) -> float:
         """Retorna o fator de escala do monitor principal (1.0 = 100%)."""
 
-        console("Inicialização - 4.1.2.1. DPI: Obtendo DPI da tela (Configuração de escala de tela do Windows)")
+        log.debug("Inicialização - 4.1.2.1. DPI: Obtendo DPI da tela (Configuração de escala de tela do Windows)")
         dpi = self.winfo_fpixels('1i')  # converte "1i" (1 polegada) em pixels reais
 
         return dpi / 96  # 96 dpi = escala 100% - padrão do Windows
@@ -103,21 +132,21 @@ class JanelaPrincipal(ctk.CTk):
         """Centralizada a Janela Principal na tela"""
 
         # 1. Coleta as dimensões da tela
-        console("Inicialização - 4.1.1. Centralização: Coletando dimensões da tela")
+        log.debug("Inicialização - 4.1.1. Centralização: Coletando dimensões da tela")
         largura_tela = self.winfo_screenwidth()
         altura_tela = self.winfo_screenheight()
 
         # 2. Obtém o ajuste da configuração de escala de tela do Windows
-        console("Inicialização - 4.1.2. Centralização: Ajustando DPI do sistema para tela")
+        log.debug("Inicialização - 4.1.2. Centralização: Ajustando DPI do sistema para tela")
         dpi_ajustado = self.obter_dpi_sistema()
 
         # 3. Corrigindo largura e altura da tela conforme o DPI
-        console("Inicialização - 4.1.3. Centralização: Corrigindo dimensões pelo DPI do sistema")
+        log.debug("Inicialização - 4.1.3. Centralização: Corrigindo dimensões pelo DPI do sistema")
         largura_corrigida = int(self.janela.largura_principal * dpi_ajustado)
         altura_corrigida = int(self.janela.altura_principal * dpi_ajustado)
 
         # 4. Calcula a posição central
-        console("Inicialização - 4.1.4. Centralização: Calculando posição central")
+        log.debug("Inicialização - 4.1.4. Centralização: Calculando posição central")
         pos_x = (largura_tela - largura_corrigida) // 2
         pos_y = (altura_tela - altura_corrigida) // 3
 
@@ -130,11 +159,11 @@ class JanelaPrincipal(ctk.CTk):
 
         # 1. Define o modo de cor do programa (Light, Dark ou System)
         ctk.set_appearance_mode(self.janela.modo)
-        console(f"[VIEW] Inicialização: 3.1. TEMA - Modo de cor selecionado: {self.janela.modo.capitalize()}")
+        log.debug("Inicialização: 3.1. TEMA - Modo de cor selecionado: %s", self.janela.modo.capitalize())
 
         # 2. Define o tema de cores do programa
         self.interface.tema.aplicar_tema(f"{self.interface.tema.tema_atual}")
-        console(f"[VIEW] Inicialização: 3.2. TEMA - Tema de cores carregado: {self.interface.tema.tema_atual}")
+        log.debug("Inicialização: 3.2. TEMA - Tema de cores carregado: %s", self.interface.tema.tema_atual)
 
     # WIDGETS
     def _instanciar_widgets(self) -> None:
@@ -178,6 +207,14 @@ class JanelaPrincipal(ctk.CTk):
                 x=200, y=120
             )
 
+            self.botao_importar_planilha = self.fabrica.criar_botao(
+                master=self,
+                texto="Importar\nPlanilha",
+                interface=self.interface,
+                comando=lambda: "",  # 'lambda' para não executar antes de clicar no botão
+                x=1120, y=120
+            )
+
             self.botao_configuracoes = self.fabrica.criar_botao(
                 master=self,
                 texto="Configurações",
@@ -195,8 +232,10 @@ class JanelaPrincipal(ctk.CTk):
             )
 
             return (self.botao_novo_orcamento, self.botao_adicionar_arquivos, self.botao_carregar_perfil,
-                    self.botao_tamanhos_e_quantidades, self.botao_configuracoes, self.botao_gerar_pdf)
+                    self.botao_tamanhos_e_quantidades, self.botao_importar_planilha, self.botao_configuracoes,
+                    self.botao_gerar_pdf)
         def labels():
+            # Estilos próprios de cada label são passados na criação (uma única configuração no Tk)
 
             # BLOCO PRECIFICAÇÃO ============================
             def labels_texto_precificacao():
@@ -204,100 +243,122 @@ class JanelaPrincipal(ctk.CTk):
                     master=self,
                     texto="VALOR TOTAL: R$",
                     interface=self.interface,
-                    x=395, y=50
-                ).configure(font=(self.interface.fontes.tipo_geral, 20, "bold"), anchor="e")
+                    x=395, y=50,
+                    font=self.interface.fontes.objeto_fonte("destaque"), anchor="e"
+                )
 
                 self.label_texto_valor_parcelado = self.fabrica.criar_label(
                     master=self,
                     texto="VALOR PARCELADO: R$",
                     interface=self.interface,
-                    x=395, y=97.50
-                ).configure(anchor="e")
+                    x=395, y=97.50,
+                    anchor="e"
+                )
 
                 self.label_texto_em = self.fabrica.criar_label(
                     master=self,
                     texto="EM",
                     interface=self.interface,
-                    x=715, y=97.50
-                ).configure(width=40)
+                    x=715, y=97.50, largura=40
+                )
 
                 self.label_texto_parcelas_de = self.fabrica.criar_label(
                     master=self,
                     texto="PARCELAS DE R$",
                     interface=self.interface,
-                    x=795, y=97.50
-                ).configure(width=160, anchor="e")
+                    x=795, y=97.50, largura=160,
+                    anchor="e"
+                )
 
                 self.label_texto_pix_dinheiro = self.fabrica.criar_label(
                     master=self,
                     texto="PIX / DINHEIRO: R$",
                     interface=self.interface,
-                    x=395, y=145
-                ).configure(anchor="e")
+                    x=395, y=145,
+                    anchor="e"
+                )
 
                 self.label_texto_imposto_nota = self.fabrica.criar_label(
                     master=self,
                     texto="IMPOSTO NOTA: R$",
                     interface=self.interface,
-                    x=395, y=192.50
-                ).configure(anchor="e")
+                    x=395, y=192.50,
+                    anchor="e"
+                )
 
                 self.label_texto_porcentagem_imposto = self.fabrica.criar_label(
                     master=self,
                     texto="% IMPOSTO NOTA:",
                     interface=self.interface,
-                    x=795, y=192.50
-                ).configure(width=160, anchor="e")
+                    x=795, y=192.50, largura=160,
+                    anchor="e"
+                )
 
                 return (self.label_texto_valor_total, self.label_texto_valor_parcelado, self.label_texto_em,
                         self.label_texto_parcelas_de, self.label_texto_pix_dinheiro, self.label_texto_imposto_nota,
                         self.label_texto_porcentagem_imposto)
             def labels_saida_precificacao():
+                # Os valores são preenchidos depois por exibir_precificacao()
                 self.label_saida_valor_total = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=605, y=58.75
-                ).configure(font=(self.interface.fontes.tipo_geral, 20, "bold"), anchor="w",
-                            bg_color=self.interface.cores.laranja,
-                            width=180, height=30)
+                    x=605, y=58.75, largura=180, altura=30,
+                    font=self.interface.fontes.objeto_fonte("destaque"), anchor="w",
+                    bg_color=self.interface.cores.laranja
+                )
 
                 self.label_saida_valor_parcelado = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=605, y=108.75
-                ).configure(anchor="w", bg_color=self.interface.cores.cinza_claro, width=110, height=25)
+                    x=605, y=108.75, largura=110, altura=25,
+                    anchor="w", bg_color=self.interface.cores.cinza_claro
+                )
+
+                self.label_saida_numero_parcelas = self.fabrica.criar_label(
+                    master=self,
+                    texto="",
+                    interface=self.interface,
+                    x=757, y=108.75, largura=36, altura=25,
+                    anchor="center", bg_color=self.interface.cores.cinza_claro
+                )
 
                 self.label_saida_parcelas_de = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=965, y=108.75
-                ).configure(anchor="w", bg_color=self.interface.cores.cinza_claro, width=110, height=25)
+                    x=965, y=108.75, largura=110, altura=25,
+                    anchor="w", bg_color=self.interface.cores.cinza_claro
+                )
 
                 self.label_saida_pix_dinheiro = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=605, y=156.25
-                ).configure(anchor="w", bg_color=self.interface.cores.cinza_claro, width=110, height=25)
+                    x=605, y=156.25, largura=110, altura=25,
+                    anchor="w", bg_color=self.interface.cores.cinza_claro
+                )
 
                 self.label_saida_imposto_nota = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=605, y=203.75
-                ).configure(anchor="w", bg_color=self.interface.cores.cinza_claro, width=110, height=25)
+                    x=605, y=203.75, largura=110, altura=25,
+                    anchor="w", bg_color=self.interface.cores.cinza_claro
+                )
 
                 self.label_saida_porcentagem_imposto = self.fabrica.criar_label(
                     master=self,
                     texto="",
                     interface=self.interface,
-                    x=965, y=203.75
-                ).configure(anchor="w", bg_color=self.interface.cores.cinza_claro, width=110, height=25)
+                    x=965, y=203.75, largura=110, altura=25,
+                    anchor="w", bg_color=self.interface.cores.cinza_claro
+                )
 
-                return self.label_saida_valor_total, self.label_saida_valor_parcelado, self.label_saida_parcelas_de
+                return (self.label_saida_valor_total, self.label_saida_valor_parcelado,
+                        self.label_saida_numero_parcelas, self.label_saida_parcelas_de, self.label_saida_pix_dinheiro,
+                        self.label_saida_imposto_nota, self.label_saida_porcentagem_imposto)
 
             # BLOCO INFORMAÇÕES ============================
             def labels_texto_informacoes():
@@ -305,29 +366,33 @@ class JanelaPrincipal(ctk.CTk):
                     master=self,
                     texto="ORÇAMENTO Nº:",
                     interface=self.interface,
-                    x=1300, y=60
-                ).configure(width=145, height=30, anchor="w")
+                    x=1300, y=60, largura=145, altura=30,
+                    anchor="w"
+                )
 
                 self.label_perfil = self.fabrica.criar_label(
                     master=self,
                     texto="PERFIL:",
                     interface=self.interface,
-                    x=1300, y=90
-                ).configure(height=30, anchor="w")
+                    x=1300, y=90, altura=30,
+                    anchor="w"
+                )
 
                 self.label_cliente = self.fabrica.criar_label(
                     master=self,
                     texto="CLIENTE:",
                     interface=self.interface,
-                    x=1300, y=120
-                ).configure(height=30, anchor="w")
+                    x=1300, y=120, altura=30,
+                    anchor="w"
+                )
 
                 self.label_status = self.fabrica.criar_label(
                     master=self,
                     texto="PRONTO PARA COMEÇAR",
                     interface=self.interface,
-                    x=1300, y=150
-                ).configure(height=50, anchor="center", text_color=self.interface.fontes.fonte_status())
+                    x=1300, y=150, altura=50,
+                    anchor="center", text_color=self.interface.cor_status
+                )
 
                 return self.label_orcamento_numero, self.label_perfil, self.label_cliente
             def labels_saida_informacoes():
@@ -342,9 +407,251 @@ class JanelaPrincipal(ctk.CTk):
             return (self.labels_texto_precificacao, self.labels_saida_precificacao,
                     self.labels_texto_informacoes, self.labels_saida_informacoes)
 
-        # Chama a função de criação dos Widgets
+        def entradas():
+            # CLIENTE: busca de perfis enquanto o operador digita (sugestões logo abaixo)
+            self.entrada_cliente = self.fabrica.criar_entrada(
+                master=self,
+                interface=self.interface,
+                texto_exemplo="Nome, cliente ou CPF/CNPJ",
+                x=1390, y=122, largura=140, altura=26
+            )
+
+            return (self.entrada_cliente,)
+
+        # Chama a função de criação dos Widgets do núcleo (visíveis na primeira pintura da janela)
         self.botoes = botoes()
         self.labels = labels()
+        self.entradas = entradas()
+
+        # Miniaturas já convertidas para exibição (limitadas às mais recentes, como o cache do Model)
+        self._miniaturas: OrderedDict[str, ctk.CTkImage] = OrderedDict()
+
+    # PAINÉIS TARDIOS
+    @cached_property
+    def tabela_itens(self) -> TabelaVirtual:
+        """
+        Tabela de itens (o painel mais pesado da janela: ~90 widgets).
+        Criada na primeira vez em que é acessada: após a primeira pintura (construção tardia)
+        ou antes disso, se algum comando precisar dela.
+        """
+        return self.fabrica.criar_tabela(
+            master=self,
+            interface=self.interface,
+            colunas=[("ARQUIVO", 470), ("MEDIDAS (cm)", 180), ("QTD", 90), ("MATERIAL", 220),
+                     ("ACABAMENTO", 220), ("VALOR R$", 230)],
+            x=25, y=265, largura=1490, altura=490
+        )
+
+    @cached_property
+    def barra_progresso(self) -> BarraProgresso:
+        """Barra de progresso das tarefas em segundo plano (criada no primeiro acesso, como a tabela)."""
+        return self.fabrica.criar_barra_progresso(
+            master=self,
+            interface=self.interface,
+            x=1300, y=205
+        )
+
+    @cached_property
+    def sugestoes_cliente(self) -> list[Botao]:
+        """
+        Botões de sugestão da busca do campo CLIENTE (criados na primeira busca e reaproveitados).
+        Ficam escondidos até haver sugestões para exibir.
+        """
+        botoes = [self.fabrica.criar_botao(
+            master=self,
+            texto="",
+            interface=self.interface,
+            x=1300, y=150 + posicao * 30, largura=230, altura=28
+        ) for posicao in range(QUANTIDADE_SUGESTOES)]
+        for botao in botoes:
+            botao.place_forget()
+        return botoes
+
+    def quando_pronta(self, funcao: Callable[[], None]) -> None:
+        """
+        Metodo público.
+        Executa 'funcao' quando todos os painéis estiverem criados (imediatamente, se já estiverem).
+        Usado pelo Controller para conectar a tabela de itens sem antecipar a sua construção.
+        """
+        if self._paineis_prontos:
+            funcao()
+        else:
+            self._ao_ficar_pronta.append(funcao)
+
+    def _agendar_paineis(self) -> None:
+        """
+        Metodo Privado.
+        Agenda a construção dos painéis para DEPOIS da primeira pintura.
+        O Tk pinta a janela nas tarefas ociosas (idle) já pendentes; um after_idle registrado durante
+        essa rodada só executa na rodada seguinte, com a janela já visível.
+        """
+        self.after_idle(self.after_idle, self._construir_paineis)
+
+    def _construir_paineis(self) -> None:
+        """Metodo Privado. Cria os painéis tardios e avisa quem estava esperando por eles."""
+        self.tempos["primeira_pintura"] = time.perf_counter() - self.instante_inicio
+        log.info("Janela exibida em %.0f ms. Construindo painéis", self.tempos['primeira_pintura'] * 1000)
+
+        self.barras = self.barra_progresso
+        self.tabelas = self.tabela_itens
+        self.tempos["paineis"] = time.perf_counter() - self.instante_inicio
+        log.info("Painéis concluídos em %.0f ms", self.tempos['paineis'] * 1000)
+
+        self._paineis_prontos = True
+        for funcao in self._ao_ficar_pronta:
+            funcao()
+        self._ao_ficar_pronta.clear()
+
+    # MODAIS
+    def modal(self, nome: str):
+        """
+        Metodo público.
+        Retorna o modal 'nome' de view/modais, criando-o (e importando o seu módulo) só no primeiro uso.
+        Os widgets que o modal criar com self.fabrica ficam no grupo 'nome' do registro de widgets.
+        """
+        janela = self._modais.get(nome)
+        if janela is None or not janela.winfo_exists():
+            with self.fabrica.em_grupo(nome):
+                janela = self._modais[nome] = criar_modal(nome, self, self.interface)
+        return janela
+
+    # INTERAÇÕES
+    def selecionar_arquivos(self) -> tuple[str, ...]:
+        """
+        Metodo público.
+        Abre a janela de seleção de arquivos de impressão e retorna os caminhos escolhidos.
+        """
+        return ctk.filedialog.askopenfilenames(
+            parent=self,
+            title="Adicionar Arquivos",
+            filetypes=[("Arquivos de impressão", "*.jpg *.jpeg *.png *.tif *.tiff *.pdf"), ("Todos", "*.*")]
+        )
+
+    def selecionar_planilha(self) -> str:
+        """
+        Metodo público.
+        Abre a janela de seleção da planilha do pedido (CSV ou XLSX) e retorna o caminho escolhido ('' se cancelado).
+        """
+        return ctk.filedialog.askopenfilename(
+            parent=self,
+            title="Importar Planilha",
+            filetypes=[("Planilhas", "*.csv *.xlsx"), ("Todos", "*.*")]
+        )
+
+    def selecionar_destino_pdf(self, nome_sugerido: str = "orcamento.pdf") -> str:
+        """
+        Metodo público.
+        Abre a janela "Salvar como" para o PDF do orçamento e retorna o caminho escolhido ('' se cancelado).
+        """
+        return ctk.filedialog.asksaveasfilename(
+            parent=self,
+            title="Gerar PDF",
+            initialfile=nome_sugerido,
+            defaultextension=".pdf",
+            filetypes=[("PDF", "*.pdf")]
+        )
+
+    def pedir_texto(self, titulo: str, pergunta: str) -> str | None:
+        """
+        Metodo público.
+        Pede um valor ao operador numa pequena janela de entrada (ex.: edição de uma célula da tabela).
+        Retorna o texto digitado, ou None se a janela foi cancelada.
+        """
+        return ctk.CTkInputDialog(title=titulo, text=pergunta).get_input()
+
+    def guardar_miniatura(self, caminho: str, dados_png: bytes, limite: int = 300) -> None:
+        """
+        Metodo público.
+        Converte a miniatura (PNG gerado pelo Model) em CTkImage e a guarda para a tabela de itens.
+        """
+        from PIL import Image  # O Pillow só é carregado quando a primeira miniatura chega
+
+        imagem = Image.open(io.BytesIO(dados_png))
+        lado = self.tabela_itens.altura_linha - 4
+        escala = lado / max(imagem.size)
+        tamanho = (max(int(imagem.width * escala), 1), max(int(imagem.height * escala), 1))
+
+        self._miniaturas[caminho] = ctk.CTkImage(light_image=imagem, dark_image=imagem, size=tamanho)
+        self._miniaturas.move_to_end(caminho)
+        while len(self._miniaturas) > limite:
+            self._miniaturas.popitem(last=False)
+
+    def miniatura(self, caminho: str) -> ctk.CTkImage | None:
+        """
+        Metodo público.
+        Retorna a miniatura já convertida do arquivo, ou None se ainda não chegou.
+        """
+        return self._miniaturas.get(caminho)
+
+    def exibir_precificacao(self, resultado: ResultadoPrecificacao) -> None:
+        """
+        Metodo público.
+        Preenche o bloco de precificação com os valores calculados pelo Model.
+        """
+        self.label_saida_valor_total.configure(text=formatar_moeda(resultado.valor_total))
+        self.label_saida_valor_parcelado.configure(text=formatar_moeda(resultado.valor_parcelado))
+        self.label_saida_numero_parcelas.configure(text=f"{resultado.parcelas}x")
+        self.label_saida_parcelas_de.configure(text=formatar_moeda(resultado.valor_parcela))
+        self.label_saida_pix_dinheiro.configure(text=formatar_moeda(resultado.pix_dinheiro))
+        self.label_saida_imposto_nota.configure(text=formatar_moeda(resultado.imposto_nota))
+        self.label_saida_porcentagem_imposto.configure(text=f"{formatar_moeda(resultado.porcentagem_imposto)} %")
+
+    def atualizar_status(self, texto: str) -> None:
+        """
+        Metodo público.
+        Altera o texto do label de status (abaixo de CLIENTE).
+        """
+        self.label_status.configure(text=texto)
+
+    def exibir_perfil(self, nome: str, cliente: str = "") -> None:
+        """
+        Metodo público.
+        Mostra o nome do perfil aplicado ao orçamento e o seu cliente no campo CLIENTE.
+        """
+        self.label_perfil.configure(text=f"PERFIL: {nome.upper()}")
+        self.entrada_cliente.definir_texto(cliente or nome)
+
+    def exibir_sugestoes(self, textos: Sequence[str], ao_escolher: Callable[[int], None] | None = None) -> None:
+        """
+        Metodo público.
+        Mostra as sugestões da busca abaixo do campo CLIENTE (lista vazia = esconde).
+        O clique numa sugestão chama 'ao_escolher' com a posição dela na lista.
+        """
+        if not textos and "sugestoes_cliente" not in self.__dict__:
+            return  # Nenhuma busca ainda: nada a esconder
+        for posicao, botao in enumerate(self.sugestoes_cliente):
+            if posicao < len(textos):
+                botao.configure(text=textos[posicao], command=partial(ao_escolher, posicao))
+                botao.place(x=1300, y=150 + posicao * 30)
+                botao.lift()
+            else:
+                botao.place_forget()
+
+    def exibir_numero(self, numero: int | None) -> None:
+        """
+        Metodo público.
+        Mostra o número do orçamento atual (None enquanto ele ainda não foi emitido).
+        """
+        self.label_orcamento_numero.configure(text=f"ORÇAMENTO Nº: {numero}" if numero is not None else "ORÇAMENTO Nº:")
+
+    def atualizar_progresso(self, concluidos: int, total: int) -> None:
+        """
+        Metodo público.
+        Atualiza a barra de progresso e o status com o andamento de uma tarefa em segundo plano.
+        """
+        self.barra_progresso.atualizar(concluidos, total)
+        self.atualizar_status(f"PROCESSANDO {concluidos} DE {total}" if concluidos < total else "CONCLUÍDO")
+
+    def atualizar_importacao(self, linhas: int, fracao: float) -> None:
+        """
+        Metodo público.
+        Mostra o andamento da importação de uma planilha (o total de linhas só é conhecido no fim da leitura).
+
+        :param linhas: Linhas já adicionadas ao orçamento.
+        :param fracao: Fração do arquivo já lida (0 a 1).
+        """
+        self.barra_progresso.atualizar(round(fracao * 1000), 1000)
+        self.atualizar_status(f"IMPORTANDO: {linhas} LINHA(S)" if fracao < 1 else "CONCLUÍDO")
 
     # ESTILOS
     def atualizar_tema(self, novo_tema: str) -> None:
@@ -354,5 +661,5 @@ class JanelaPrincipal(ctk.CTk):
         O Controller poderá chamar este metodo após alterar o tema global.
         """
         self.interface.tema.aplicar_tema(novo_tema)
-        self.fabrica.atualizar_tema_widgets()
-        console(f"Tema atualizado para: {novo_tema.capitalize()}")
\ No newline at end of file
+        self.fabrica.atualizar_tema_widgets(self)
+        log.info("Tema atualizado para: %s", novo_tema.capitalize())
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Módulo de Barra de Progresso da interface visual.
+Responsabilidade: Define o widget temático de barra de progresso que aplica automaticamente
+o estilo visual fornecido por uma instância de InterfaceVisual.
+"""
+
+from customtkinter import CTkProgressBar
+from src.orca_facil.view.widgets.base import BaseWidget, log
+from src.configs.interface import InterfaceVisual
+
+
+class BarraProgresso(BaseWidget, CTkProgressBar):
+    """
+    Classe que representa uma barra de progresso integrada ao sistema visual da aplicação.
+    Herda de BaseWidget (módulo Widgets) e de CTkProgressBar (widget visual do CustomTkinter).
+    """
+
+    def __init__(self, local, interface: InterfaceVisual, **kwargs):
+        """
+        Inicializa a barra de progresso temática, começando vazia.
+
+        Args:
+            local: Container (janela, frame, etc.) que conterá a barra.
+            interface: Instância de InterfaceVisual usada para aplicar o estilo.
+            **kwargs: Parâmetros opcionais adicionais do CTkProgressBar.
+        """
+
+        log.debug("Barra de Progresso: Classe 'BarraProgresso' iniciada")
+
+        # 1. Inicialize as heranças
+        BaseWidget.__init__(self, interface)
+        CTkProgressBar.__init__(self, master=local, mode="determinate", **self.opcoes_iniciais(kwargs))
+
+        # 2. Guarda as referências
+        self.local = local
+        self.interface = interface
+
+        # 3. Começa vazia (o estilo do tema já foi aplicado no construtor)
+        self.set(0)
+
+    def atualizar(self, concluidos: int, total: int) -> None:
+        """
+        Atualiza o preenchimento da barra conforme o andamento de uma tarefa.
+
+        :param concluidos: Quantidade de itens já processados.
+        :param total: Quantidade total de itens. Com total 0 a barra volta a ficar vazia.
+        """
+        self.set(concluidos / total if total else 0)
+
+    def estilo(self) -> dict:
+        """Opções visuais da barra conforme o tema atual."""
+        return {
+            "progress_color": self.interface.tema.cor_principal,
+            "corner_radius": self.interface.gerais.raio_canto,
+        }
+
+    def aplicar_estilo(self) -> None:
+        """
+        Atualiza dinamicamente o estilo da barra conforme o tema atual.
+        Pode ser chamado quando o tema é alterado em tempo de execução.
+        """
+
+        log.debug("Barra de Progresso - Aplicando estilo à barra")
+
+        self.aplicar_estilo_lote(self.estilo())
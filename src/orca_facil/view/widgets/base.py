@@ -10,11 +10,11 @@ Os componentes visuais (BotaoPadrao, LabelTitulo, etc.) é que herdarão tanto d
 """
 
 from src.configs.interface import InterfaceVisual  # e aplica as cores e fontes vindas de InterfaceVisual
+from src.configs.registro import registro
 from abc import ABC, abstractmethod
 
 
-def console(mensagem) -> None:
-    print(f"\033[96m[WIDGETS] {mensagem}.\033[0m")  # Print em CIANO no console
+log = registro("WIDGETS")
 
 class BaseWidget(ABC):
     """
@@ -37,6 +37,50 @@ class BaseWidget(ABC):
         :param interface: Objeto de InterfaceVisual contendo configurações visuais (cores, fontes, etc.).
         """
         self.interface = interface
+        self._estilo_fixo: dict = {}  # Opções de estilo passadas explicitamente (não mudam com o tema)
+        self._estilo_aplicado: dict = {}  # Últimos valores de estilo enviados ao Tk (para pular os que não mudaram)
+
+    def estilo(self) -> dict:
+        """
+        Opções visuais do widget conforme o tema atual (ex.: {"fg_color": ..., "font": ...}).
+        Usadas tanto no construtor (uma única configuração no Tk) quanto em aplicar_estilo().
+        """
+        return {}
+
+    def opcoes_iniciais(self, kwargs: dict) -> dict:
+        """
+        Junta o estilo do tema às opções recebidas pelo construtor, para criar o widget já estilizado
+        (sem um configure() logo em seguida). As opções explícitas prevalecem e são mantidas nas trocas de tema.
+        """
+        padrao = self.estilo()
+        self._estilo_fixo = {chave: kwargs[chave] for chave in padrao if chave in kwargs}
+        self._estilo_aplicado = {**padrao, **self._estilo_fixo}
+        return {**padrao, **kwargs}
+
+    def aplicar_estilo_lote(self, estilo: dict) -> int:
+        """
+        Aplica um estilo já calculado (ex.: o mesmo dicionário para todos os botões) em um único configure(),
+        enviando ao Tk só as opções que mudaram desde a última aplicação.
+        Usado pela troca de tema em lote (FabricaWidgets.atualizar_tema_widgets).
+
+        :param estilo: Opções do tema atual, sem as opções explícitas do construtor (elas são mantidas).
+        :return: Quantidade de opções alteradas (0 = nenhum configure()).
+        """
+        alteradas = self._opcoes_alteradas(self._estilo_aplicado, {**estilo, **self._estilo_fixo})
+        if alteradas:
+            self.configure(**alteradas)
+        return len(alteradas)
+
+    @staticmethod
+    def _opcoes_alteradas(aplicado: dict, novo: dict) -> dict:
+        """
+        Metodo Privado.
+        Retorna as opções de 'novo' cujo valor difere de 'aplicado' e já as registra em 'aplicado'.
+        """
+        alteradas = {chave: valor for chave, valor in novo.items()
+                     if chave not in aplicado or aplicado[chave] != valor}
+        aplicado.update(alteradas)
+        return alteradas
 
     @abstractmethod
     def aplicar_estilo(self) -> None:
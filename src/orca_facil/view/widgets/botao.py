@@ -5,7 +5,7 @@ o estilo visual fornecido por uma instância de InterfaceVisual.
 """
 
 from customtkinter import CTkButton
-from src.orca_facil.view.widgets.base import BaseWidget, console
+from src.orca_facil.view.widgets.base import BaseWidget, log
 from src.configs.interface import InterfaceVisual
 
 
@@ -27,11 +27,11 @@ class Botao(BaseWidget, CTkButton):
             **kwargs: Parâmetros opcionais adicionais do CTkButton.
         """
 
-        console("Botão: Classe 'Botao' iniciada")
+        log.debug("Botão: Classe 'Botao' iniciada")
 
         # 1. Inicialize as heranças
         BaseWidget.__init__(self, interface)
-        CTkButton.__init__(self, master=local, text=texto, command=comando, **kwargs)
+        CTkButton.__init__(self, master=local, text=texto, command=comando, **self.opcoes_iniciais(kwargs))
 
         # 2. Guarda as referências
         self.local = local
@@ -39,8 +39,16 @@ class Botao(BaseWidget, CTkButton):
         self.comando = comando
         self.interface = interface
 
-        # 3. Aplica o estilo geral ao botão
-        self.aplicar_estilo()
+        # 3. O estilo do tema já foi aplicado no construtor (opcoes_iniciais): sem configure() extra
+
+    def estilo(self) -> dict:
+        """Opções visuais do botão conforme o tema atual."""
+        return {
+            "fg_color": self.interface.tema.cor_principal,
+            "hover_color": self.interface.tema.cor_principal_hover,
+            "corner_radius": self.interface.gerais.raio_canto,
+            "font": self.interface.fontes.objeto_fonte("botao"),
+        }
 
     def aplicar_estilo(self) -> None:
         """
@@ -48,11 +56,6 @@ class Botao(BaseWidget, CTkButton):
         Pode ser chamado quando o tema é alterado em tempo de execução.
         """
 
-        console("Botão - Aplicando estilo ao botão")
+        log.debug("Botão - Aplicando estilo ao botão")
 
-        self.configure(
-            fg_color=self.interface.tema.cor_principal,
-            hover_color=self.interface.tema.cor_principal_hover,
-            corner_radius=self.interface.gerais.raio_canto,
-            font=self.interface.fontes.fonte_botao
-        )
+        self.aplicar_estilo_lote(self.estilo())
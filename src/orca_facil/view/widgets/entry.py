@@ -0,0 +1,63 @@
+"""
+Módulo de Entradas de texto da interface visual.
+Responsabilidade: Define o widget temático de entrada de texto que aplica automaticamente
+o estilo visual fornecido por uma instância de InterfaceVisual.
+"""
+
+from customtkinter import CTkEntry
+from src.orca_facil.view.widgets.base import BaseWidget, log
+from src.configs.interface import InterfaceVisual
+
+
+class Entrada(BaseWidget, CTkEntry):
+    """
+    Classe que representa uma entrada de texto integrada ao sistema visual da aplicação.
+    Herda de BaseWidget (módulo Widgets) e de CTkEntry (widget visual do CustomTkinter).
+    """
+
+    def __init__(self, local, interface: InterfaceVisual, texto_exemplo: str = "", **kwargs):
+        """
+        Inicializa a entrada temática aplicando automaticamente o estilo definido pelo tema.
+
+        Args:
+            local: Container (janela, frame, etc.) que conterá a entrada.
+            interface: Instância de InterfaceVisual usada para aplicar o estilo.
+            texto_exemplo: Texto exibido em cinza enquanto a entrada está vazia.
+            **kwargs: Parâmetros opcionais adicionais do CTkEntry.
+        """
+
+        log.debug("Entrada: Classe 'Entrada' iniciada")
+
+        # 1. Inicialize as heranças
+        BaseWidget.__init__(self, interface)
+        CTkEntry.__init__(self, master=local, placeholder_text=texto_exemplo, **self.opcoes_iniciais(kwargs))
+
+        # 2. Guarda as referências
+        self.local = local
+        self.interface = interface
+
+        # 3. O estilo do tema já foi aplicado no construtor (opcoes_iniciais): sem configure() extra
+
+    def definir_texto(self, texto: str) -> None:
+        """Substitui o conteúdo da entrada (sem gerar eventos de teclado)."""
+        self.delete(0, "end")
+        if texto:
+            self.insert(0, texto)
+
+    def estilo(self) -> dict:
+        """Opções visuais da entrada conforme o tema atual."""
+        return {
+            "border_color": self.interface.tema.cor_principal,
+            "corner_radius": self.interface.gerais.raio_canto,
+            "font": self.interface.fontes.objeto_fonte("padrao"),
+        }
+
+    def aplicar_estilo(self) -> None:
+        """
+        Atualiza dinamicamente o estilo da entrada conforme o tema atual.
+        Pode ser chamado quando o tema é alterado em tempo de execução.
+        """
+
+        log.debug("Entrada - Aplicando estilo à entrada")
+
+        self.aplicar_estilo_lote(self.estilo())
@@ -6,9 +6,16 @@ Cada metodo cria um tipo de widget (Botão, Label, Entrada, etc.),
 aplicando automaticamente o tema visual e posicionando-o na tela.
 """
 
+import logging
+from contextlib import contextmanager
+
 from src.orca_facil.view.widgets.botao import Botao
 from src.orca_facil.view.widgets.label import Label
-from src.orca_facil.view.widgets.base import console
+from src.orca_facil.view.widgets.entry import Entrada
+from src.orca_facil.view.widgets.barra_progresso import BarraProgresso
+from src.orca_facil.view.widgets.tabela import TabelaVirtual
+from src.orca_facil.view.widgets.registro_widgets import GRUPO_PRINCIPAL, RegistroWidgets
+from src.orca_facil.view.widgets.base import log
 from src.configs.interface import InterfaceVisual
 
 
@@ -19,12 +26,62 @@ class FabricaWidgets:
     """
 
     def __init__(self):
-        self._widgets = []  # Lista de widgets criados
+        self._widgets = RegistroWidgets()  # Widgets criados e ainda vivos (referências fracas), por grupo
+        self.grupo_atual = GRUPO_PRINCIPAL  # Grupo em que os próximos widgets serão registrados
+
+    @contextmanager
+    def em_grupo(self, grupo: str):
+        """
+        Registra no grupo informado os widgets criados dentro do bloco (ex.: os de um modal).
 
-    def atualizar_tema_widgets(self):
-        for widget in self._widgets:
-            if hasattr(widget, "aplicar_estilo"):
-                widget.aplicar_estilo()
+        Uso:
+            with fabrica.em_grupo("perfis"):
+                fabrica.criar_botao(...)
+        """
+        anterior, self.grupo_atual = self.grupo_atual, grupo
+        try:
+            yield self
+        finally:
+            self.grupo_atual = anterior
+
+    def widgets_vivos(self, grupo: str | None = None) -> dict[str, int]:
+        """Quantidade de widgets vivos por tipo (todos ou só os do grupo), para depuração."""
+        return self._widgets.contagem(grupo)
+
+    def atualizar_tema_widgets(self, janela=None, grupo: str | None = None) -> int:
+        """
+        Reaplica o tema atual a todos os widgets da fábrica, em lote.
+
+        > Por que em lote?
+        Chamar aplicar_estilo() widget a widget recalcula o mesmo estilo para cada botão e envia ao Tk
+        todas as opções, mesmo as que não mudaram (cada configure() redesenha o widget).
+        Aqui o estilo é calculado uma única vez por classe de widget e cada widget recebe no máximo
+        um configure(), só com as opções que mudaram. Tudo acontece dentro de uma única chamada, sem
+        devolver o controle ao Tk: a tela é repintada uma vez só, no final.
+
+        :param janela: Janela cujas tarefas de desenho pendentes são executadas ao final (opcional).
+        :param grupo: Só os widgets deste grupo (ex.: um modal). Caso omitido, todos os widgets vivos.
+        :return: Quantidade de opções alteradas (0 = o tema já estava aplicado).
+        """
+        estilos = {}  # Classe do widget → estilo do tema atual (calculado pelo primeiro widget da classe)
+        alteradas = 0
+        widgets = self._widgets.widgets(grupo)
+
+        # 1. Aplica o estilo de cada classe a todos os widgets dela (todos os widgets da fábrica são BaseWidget)
+        for widget in widgets:
+            classe = type(widget)
+            if classe not in estilos:
+                estilos[classe] = widget.estilo()
+            alteradas += widget.aplicar_estilo_lote(estilos[classe])
+
+        # 2. Uma única repintura com todas as alterações
+        if janela is not None and alteradas:
+            janela.update_idletasks()
+
+        if log.isEnabledFor(logging.DEBUG):  # A contagem percorre o registro: só quando for exibida
+            log.debug("Fábrica: Tema reaplicado a %s widget(s), %s opção(ões) alterada(s). Vivos por tipo: %s",
+                      len(widgets), alteradas, self._widgets.contagem())
+        return alteradas
 
     # BOTÃO ==============================
     def criar_botao(self, master, texto: str, interface: InterfaceVisual, comando=None,
@@ -43,16 +100,16 @@ class FabricaWidgets:
         :param: **kwargs: Parâmetros adicionais repassados ao Botao (como corner_radius, etc.).
         """
 
-        console(f"Fábrica: Criando botão {texto}")
+        log.debug("Fábrica: Criando botão %s", texto)
 
         # 1. Cria o botão
         botao = Botao(master, texto, interface, width=largura, height=altura, comando=comando, **kwargs)
 
         # 2. Posiciona o botão
-        botao.place(x=x, y=y, **kwargs)
+        botao.place(x=x, y=y)
 
-        # 3. Adiciona o botão na lista de widgets
-        self._widgets.append(botao)
+        # 3. Adiciona o botão no registro de widgets
+        self._widgets.registrar(botao, self.grupo_atual)
 
         # 4. Retorna o widget criado para eventual manipulação posterior
         return botao
@@ -61,29 +118,118 @@ class FabricaWidgets:
     def criar_label(self, master, texto: str, interface: InterfaceVisual,
                     x=None, y=None, largura=200, altura=47.50, **kwargs):
         """
-        Cria um botão temático e o posiciona na janela.
+        Cria um label temático e o posiciona na janela.
 
-        :param: master: Container (janela, frame, etc.) onde o botão será inserido.
-        :param: texto: Texto exibido no botão.
+        :param: master: Container (janela, frame, etc.) onde o label será inserido.
+        :param: texto: Texto exibido no label.
         :param: interface: Instância de InterfaceVisual para aplicar estilo.
-        :param: comando: Função a ser executada no clique.
         :param: x: Posição absoluta horizontal em relação a margem esquerda da janela (master).
         :param: y: Posição absoluta vertical em relação a margem superior da janela (master).
-        :param: largura: Largura do botão (opcional).
-        :param: altura: Altura do botão (opcional).
-        :param: **kwargs: Parâmetros adicionais repassados ao Botao (como corner_radius, etc.).
+        :param: largura: Largura do label (opcional).
+        :param: altura: Altura do label (opcional).
+        :param: **kwargs: Parâmetros adicionais repassados ao Label (como font, anchor, bg_color, etc.).
+                          São aplicados já na criação, sem um configure() posterior.
         """
 
-        console(f"Fábrica: Criando label {texto}")
+        log.debug("Fábrica: Criando label %s", texto)
 
         # 1. Cria o label
         label = Label(master, texto, interface, width=largura, height=altura, **kwargs)
 
         # 2. Posiciona o label
-        label.place(x=x, y=y, **kwargs)
+        label.place(x=x, y=y)
 
-        # 3. Adiciona o label na lista de widgets
-        self._widgets.append(label)
+        # 3. Adiciona o label no registro de widgets
+        self._widgets.registrar(label, self.grupo_atual)
 
         # 4. Retorna o widget criado para eventual manipulação posterior
         return label
+
+    # ENTRADA ==============================
+    def criar_entrada(self, master, interface: InterfaceVisual, texto_exemplo: str = "",
+                      x=None, y=None, largura=200, altura=30, **kwargs):
+        """
+        Cria uma entrada de texto temática e a posiciona na janela.
+
+        :param: master: Container (janela, frame, etc.) onde a entrada será inserida.
+        :param: interface: Instância de InterfaceVisual para aplicar estilo.
+        :param: texto_exemplo: Texto exibido enquanto a entrada está vazia (opcional).
+        :param: x: Posição absoluta horizontal em relação a margem esquerda da janela (master).
+        :param: y: Posição absoluta vertical em relação a margem superior da janela (master).
+        :param: largura: Largura da entrada (opcional).
+        :param: altura: Altura da entrada (opcional).
+        :param: **kwargs: Parâmetros adicionais repassados à Entrada (como font, justify, etc.).
+        """
+
+        log.debug("Fábrica: Criando entrada %s", texto_exemplo)
+
+        # 1. Cria a entrada
+        entrada = Entrada(master, interface, texto_exemplo, width=largura, height=altura, **kwargs)
+
+        # 2. Posiciona a entrada
+        entrada.place(x=x, y=y)
+
+        # 3. Adiciona a entrada no registro de widgets
+        self._widgets.registrar(entrada, self.grupo_atual)
+
+        # 4. Retorna o widget criado para eventual manipulação posterior
+        return entrada
+
+    # BARRA DE PROGRESSO ==============================
+    def criar_barra_progresso(self, master, interface: InterfaceVisual,
+                              x=None, y=None, largura=200, altura=12, **kwargs):
+        """
+        Cria uma barra de progresso temática e a posiciona na janela.
+
+        :param: master: Container (janela, frame, etc.) onde a barra será inserida.
+        :param: interface: Instância de InterfaceVisual para aplicar estilo.
+        :param: x: Posição absoluta horizontal em relação a margem esquerda da janela (master).
+        :param: y: Posição absoluta vertical em relação a margem superior da janela (master).
+        :param: largura: Largura da barra (opcional).
+        :param: altura: Altura da barra (opcional).
+        :param: **kwargs: Parâmetros adicionais repassados à BarraProgresso.
+        """
+
+        log.debug("Fábrica: Criando barra de progresso")
+
+        # 1. Cria a barra
+        barra = BarraProgresso(master, interface, width=largura, height=altura, **kwargs)
+
+        # 2. Posiciona a barra
+        barra.place(x=x, y=y)
+
+        # 3. Adiciona a barra no registro de widgets
+        self._widgets.registrar(barra, self.grupo_atual)
+
+        # 4. Retorna o widget criado para eventual manipulação posterior
+        return barra
+
+    # TABELA ==============================
+    def criar_tabela(self, master, interface: InterfaceVisual, colunas,
+                     x=None, y=None, largura=800, altura=400, **kwargs):
+        """
+        Cria uma tabela virtual temática e a posiciona na janela.
+
+        :param: master: Container (janela, frame, etc.) onde a tabela será inserida.
+        :param: interface: Instância de InterfaceVisual para aplicar estilo.
+        :param: colunas: Pares (título, largura) de cada coluna.
+        :param: x: Posição absoluta horizontal em relação a margem esquerda da janela (master).
+        :param: y: Posição absoluta vertical em relação a margem superior da janela (master).
+        :param: largura: Largura da tabela (opcional).
+        :param: altura: Altura da tabela (opcional).
+        :param: **kwargs: Parâmetros adicionais repassados à TabelaVirtual (como altura_linha, com_imagem).
+        """
+
+        log.debug("Fábrica: Criando tabela")
+
+        # 1. Cria a tabela (as células internas não entram no registro: a própria tabela as estiliza)
+        tabela = TabelaVirtual(master, interface, colunas, largura=largura, altura=altura, **kwargs)
+
+        # 2. Posiciona a tabela
+        tabela.place(x=x, y=y)
+
+        # 3. Adiciona a tabela no registro de widgets
+        self._widgets.registrar(tabela, self.grupo_atual)
+
+        # 4. Retorna o widget criado para eventual manipulação posterior
+        return tabela
@@ -5,7 +5,7 @@ o estilo visual fornecido por uma instância de InterfaceVisual.
 """
 
 from customtkinter import CTkLabel
-from src.orca_facil.view.widgets.base import BaseWidget, console
+from src.orca_facil.view.widgets.base import BaseWidget, log
 from src.configs.interface import InterfaceVisual
 
 
@@ -26,19 +26,22 @@ class Label(BaseWidget, CTkLabel):
             **kwargs: Parâmetros opcionais adicionais do CTkLabel.
         """
 
-        console("Label: Classe 'Label' iniciada")
+        log.debug("Label: Classe 'Label' iniciada")
 
         # 1. Inicialize as heranças
         BaseWidget.__init__(self, interface)
-        CTkLabel.__init__(self, master=local, text=texto, **kwargs)
+        CTkLabel.__init__(self, master=local, text=texto, **self.opcoes_iniciais(kwargs))
 
         # 2. Guarda as referências
         self.local = local
         self.texto = texto
         self.interface = interface
 
-        # 3. Aplica o estilo geral ao label
-        self.aplicar_estilo()
+        # 3. O estilo do tema já foi aplicado no construtor (opcoes_iniciais): sem configure() extra
+
+    def estilo(self) -> dict:
+        """Opções visuais do label conforme o tema atual."""
+        return {"font": self.interface.fontes.objeto_fonte("label")}
 
     def aplicar_estilo(self) -> None:
         """
@@ -46,8 +49,6 @@ class Label(BaseWidget, CTkLabel):
         Pode ser chamado quando o tema é alterado em tempo de execução.
         """
 
-        console("Label - Aplicando estilo ao label")
+        log.debug("Label - Aplicando estilo ao label")
 
-        self.configure(
-            font=self.interface.fontes.fonte_label
-        )
+        self.aplicar_estilo_lote(self.estilo())
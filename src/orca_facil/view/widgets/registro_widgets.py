@@ -0,0 +1,85 @@
+"""
+Módulo de Registro de Widgets.
+Responsabilidade: Guardar os widgets criados pela fábrica (para a troca de tema), sem mantê-los vivos.
+
+> Por que referências fracas?
+Uma lista comum segura todos os widgets para sempre: os de um modal fechado ou de um orçamento
+limpo continuariam na memória e seriam reestilizados a cada troca de tema.
+Aqui cada widget é guardado por uma referência fraca (weakref) e sai do registro quando é destruído
+no Tk (evento <Destroy>) ou quando o Python o descarta, o que acontecer primeiro.
+
+> Grupos
+Cada widget pertence a um grupo (ex.: "principal" ou o nome de um modal), para que a troca de tema
+possa atingir só uma tela.
+"""
+
+import weakref
+from collections import Counter
+from functools import partial
+
+GRUPO_PRINCIPAL = "principal"
+
+
+class RegistroWidgets:
+    """Registro de widgets vivos, por grupo, com limpeza automática."""
+
+    def __init__(self) -> None:
+        self._grupos: dict[str, dict[int, weakref.ref]] = {}  # Grupo → {id(widget): referência fraca}
+        self._grupo_de: dict[int, str] = {}  # id(widget) → grupo
+
+    def __len__(self) -> int:
+        return len(self._grupo_de)
+
+    @property
+    def grupos(self) -> list[str]:
+        """Nomes dos grupos com pelo menos um widget vivo."""
+        return [grupo for grupo, referencias in self._grupos.items() if referencias]
+
+    def registrar(self, widget, grupo: str = GRUPO_PRINCIPAL) -> None:
+        """
+        Adiciona o widget ao registro (registrar de novo apenas troca o grupo).
+
+        :param widget: Widget da fábrica (precisa aceitar bind("<Destroy>", ..., add="+")).
+        :param grupo: Tela a que o widget pertence (ex.: "principal", "perfis").
+        """
+        chave = id(widget)
+        novo = chave not in self._grupo_de
+        self._descartar(chave)
+        self._grupos.setdefault(grupo, {})[chave] = weakref.ref(widget, partial(self._descartado, chave))
+        self._grupo_de[chave] = grupo
+        if novo:
+            widget.bind("<Destroy>", partial(self._destruido, chave), add="+")
+
+    def remover(self, widget) -> None:
+        """Tira o widget do registro (sem destruí-lo)."""
+        self._descartar(id(widget))
+
+    def widgets(self, grupo: str | None = None) -> list:
+        """
+        Widgets vivos, na ordem de criação.
+
+        :param grupo: Só os widgets deste grupo. Caso omitido, todos.
+        """
+        grupos = [self._grupos.get(grupo, {})] if grupo is not None else list(self._grupos.values())
+        return [widget for referencias in grupos for referencia in list(referencias.values())
+                if (widget := referencia()) is not None]
+
+    def contagem(self, grupo: str | None = None) -> dict[str, int]:
+        """Quantidade de widgets vivos por tipo (ex.: {"Botao": 6, "Label": 20}), para depuração."""
+        return dict(Counter(type(widget).__name__ for widget in self.widgets(grupo)))
+
+    # INTERNOS ==============================
+    def _destruido(self, chave: int, evento=None) -> None:
+        """Metodo Privado. Chamado pelo Tk (<Destroy>) quando o widget é destruído."""
+        self._descartar(chave)
+
+    def _descartado(self, chave: int, referencia: weakref.ref) -> None:
+        """Metodo Privado. Chamado pelo Python quando o widget deixa de existir na memória."""
+        if self._grupos.get(self._grupo_de.get(chave), {}).get(chave) is referencia:
+            self._descartar(chave)
+
+    def _descartar(self, chave: int) -> None:
+        """Metodo Privado. Remove a entrada do widget (se ainda estiver registrada)."""
+        grupo = self._grupo_de.pop(chave, None)
+        if grupo is not None:
+            self._grupos[grupo].pop(chave, None)
@@ -0,0 +1,258 @@
+"""
+Módulo de Tabela Virtual da interface visual.
+Responsabilidade: Exibir as linhas do orçamento (milhares de itens) com um número fixo de widgets.
+
+> Por que "virtual"?
+Criar um Label por célula deixaria o Tk lento com milhares de itens (e 10 mil linhas × 6 colunas = 60 mil widgets).
+A tabela cria apenas as linhas que cabem na tela e, ao rolar, REAPROVEITA esses mesmos widgets,
+trocando só o texto (e a miniatura) de cada célula. Os dados não ficam na tabela: ela pede cada
+linha visível a uma função fornecida pelo Controller (obter_linha).
+"""
+
+from functools import partial
+from typing import Callable, Sequence
+
+from customtkinter import CTkFrame, CTkLabel, CTkScrollbar
+from src.orca_facil.view.widgets.base import BaseWidget, log
+from src.configs.interface import InterfaceVisual
+
+
+class TabelaVirtual(BaseWidget, CTkFrame):
+    """
+    Classe que representa a tabela de itens integrada ao sistema visual da aplicação.
+    Herda de BaseWidget (módulo Widgets) e de CTkFrame (widget visual do CustomTkinter).
+    """
+
+    def __init__(self, local, interface: InterfaceVisual, colunas: Sequence[tuple[str, int]],
+                 largura: int = 800, altura: int = 400, altura_linha: int = 40, com_imagem: bool = True, **kwargs):
+        """
+        Inicializa a tabela temática com o cabeçalho e o conjunto fixo de linhas reaproveitáveis.
+
+        Args:
+            local: Container (janela, frame, etc.) que conterá a tabela.
+            interface: Instância de InterfaceVisual usada para aplicar o estilo.
+            colunas: Pares (título, largura em pixels) de cada coluna de texto.
+            largura: Largura total da tabela.
+            altura: Altura total da tabela (define quantas linhas são criadas).
+            altura_linha: Altura de cada linha, em pixels.
+            com_imagem: Se True, a primeira coluna exibe a miniatura do arquivo.
+            **kwargs: Parâmetros opcionais adicionais do CTkFrame.
+        """
+
+        log.debug("Tabela: Classe 'TabelaVirtual' iniciada")
+
+        # 1. Inicialize as heranças
+        BaseWidget.__init__(self, interface)
+        CTkFrame.__init__(self, master=local, width=largura, height=altura, **self.opcoes_iniciais(kwargs))
+
+        # 2. Guarda as referências
+        self.local = local
+        self.interface = interface
+        self.colunas = list(colunas)
+        self.altura_linha = altura_linha
+        self.com_imagem = com_imagem
+
+        # 3. Fonte de dados (definida pelo Controller) e estado da rolagem
+        self.total = 0
+        self.primeira = 0  # Índice da primeira linha visível
+        self._obter_linha: Callable[[int], Sequence[str]] = lambda indice: ()
+        self._obter_imagem: Callable[[int], object] | None = None
+        self._ao_exibir: Callable[[int, int], None] | None = None
+        self._ao_editar: Callable[[int, int], None] | None = None
+        self._redesenho_agendado = False
+
+        # 4. Cria o cabeçalho, as linhas reaproveitáveis e a barra de rolagem
+        largura_imagem = altura_linha + 4 if com_imagem else 0
+        self._cabecalho = self._criar_linha(0, largura_imagem, cabecalho=True)
+        self.quantidade_linhas = max((altura - altura_linha) // altura_linha, 1)
+        self._linhas = [self._criar_linha((indice + 1) * altura_linha, largura_imagem)
+                        for indice in range(self.quantidade_linhas)]
+        self._textos = [[None] * len(self.colunas) for _ in self._linhas]  # Último texto exibido em cada célula
+        self._imagens = [None] * len(self._linhas)  # Última imagem exibida em cada linha
+
+        self.barra_rolagem = CTkScrollbar(self, command=self._rolar, height=altura - altura_linha,
+                                          **self._estilo_barra())
+        self.barra_rolagem.place(x=largura - 18, y=altura_linha)
+        # Último estilo aplicado a cada grupo de partes internas (todas as células de um grupo têm o mesmo)
+        self._estilos_internos = {"cabecalho": self._estilo_cabecalho(), "celula": self._estilo_celula(),
+                                  "barra": self._estilo_barra()}
+
+        # 5. Rolagem pelo mouse em qualquer ponto da tabela
+        for widget in [self, *(celula for linha in self._linhas for celula in linha)]:
+            widget.bind("<MouseWheel>", self._rolar_mouse, add="+")
+
+        # 6. Duplo clique numa célula de texto pede a edição daquela linha/coluna
+        for posicao, celulas in enumerate(self._linhas):
+            for coluna, celula in enumerate(celulas[self.com_imagem:]):
+                celula.bind("<Double-Button-1>", partial(self._editar, posicao, coluna), add="+")
+
+        # 7. O estilo já foi aplicado na criação do quadro, das células e da barra (sem configure() extra)
+
+    # DADOS ==============================
+    def definir_dados(self, total: int, obter_linha: Callable[[int], Sequence[str]],
+                      obter_imagem: Callable[[int], object] | None = None,
+                      ao_exibir: Callable[[int, int], None] | None = None,
+                      ao_editar: Callable[[int, int], None] | None = None) -> None:
+        """
+        Define a fonte de dados da tabela.
+
+        :param total: Quantidade total de linhas.
+        :param obter_linha: Função que recebe o índice e retorna os textos das colunas daquela linha.
+        :param obter_imagem: Função que recebe o índice e retorna a miniatura (CTkImage) ou None.
+        :param ao_exibir: Função chamada com (início, fim) das linhas visíveis após cada rolagem (ex.: pedir miniaturas).
+        :param ao_editar: Função chamada com (índice da linha, coluna de texto) no duplo clique de uma célula.
+        """
+        self._obter_linha = obter_linha
+        self._obter_imagem = obter_imagem
+        self._ao_exibir = ao_exibir
+        self._ao_editar = ao_editar
+        self.definir_total(total)
+
+    def definir_total(self, total: int) -> None:
+        """Atualiza a quantidade de linhas (ex.: novos arquivos adicionados) e redesenha."""
+        self.total = total
+        self.primeira = min(self.primeira, max(total - self.quantidade_linhas, 0))
+        self.atualizar()
+
+    def atualizar(self) -> None:
+        """
+        Redesenha as linhas visíveis no próximo ciclo ocioso do Tk.
+        Várias chamadas seguidas (ex.: rolagem rápida) resultam em um único redesenho.
+        """
+        if not self._redesenho_agendado:
+            self._redesenho_agendado = True
+            self.after_idle(self._redesenhar)
+
+    # ROLAGEM ==============================
+    def _rolar(self, acao: str, valor, unidade: str = "units") -> None:
+        """Metodo Privado. Recebe os comandos da barra de rolagem ('moveto' fração | 'scroll' n units/pages)."""
+        if acao == "moveto":
+            self._ir_para(round(float(valor) * self.total))
+        else:
+            passo = self.quantidade_linhas if unidade == "pages" else 1
+            self._ir_para(self.primeira + int(float(valor)) * passo)
+
+    def _rolar_mouse(self, evento) -> None:
+        """Metodo Privado. Rola 3 linhas por 'clique' da roda do mouse (delta de 120 no Windows)."""
+        cliques = int(evento.delta / 120) or (1 if evento.delta > 0 else -1)
+        self._ir_para(self.primeira - 3 * cliques)
+
+    def _ir_para(self, primeira: int) -> None:
+        """Metodo Privado. Muda a primeira linha visível, respeitando os limites."""
+        primeira = max(0, min(primeira, self.total - self.quantidade_linhas))
+        if primeira != self.primeira:
+            self.primeira = primeira
+            self.atualizar()
+
+    # EDIÇÃO ==============================
+    def _editar(self, posicao: int, coluna: int, evento=None) -> None:
+        """Metodo Privado. Converte a linha reaproveitável clicada no índice real e avisa o Controller."""
+        indice = self.primeira + posicao
+        if self._ao_editar and indice < self.total:
+            self._ao_editar(indice, coluna)
+
+    # DESENHO ==============================
+    def _redesenhar(self) -> None:
+        """
+        Metodo Privado.
+        Troca o conteúdo das linhas reaproveitáveis pelo das linhas visíveis.
+        Só chama configure() nas células cujo texto/imagem realmente mudou.
+        """
+        self._redesenho_agendado = False
+        fim = min(self.primeira + self.quantidade_linhas, self.total)
+
+        for posicao, celulas in enumerate(self._linhas):
+            indice = self.primeira + posicao
+            textos = self._obter_linha(indice) if indice < fim else ()
+
+            # 1. Textos das colunas
+            anteriores = self._textos[posicao]
+            for coluna, celula in enumerate(celulas[self.com_imagem:]):
+                texto = textos[coluna] if coluna < len(textos) else ""
+                if texto != anteriores[coluna]:
+                    anteriores[coluna] = texto
+                    celula.configure(text=texto)
+
+            # 2. Miniatura (primeira coluna)
+            if self.com_imagem:
+                imagem = self._obter_imagem(indice) if self._obter_imagem and indice < fim else None
+                if imagem is not self._imagens[posicao]:
+                    self._imagens[posicao] = imagem
+                    celulas[0].configure(image=imagem)
+
+        # 3. Posição da barra de rolagem e aviso das linhas visíveis
+        if self.total:
+            self.barra_rolagem.set(self.primeira / self.total, fim / self.total)
+        else:
+            self.barra_rolagem.set(0, 1)
+        if self._ao_exibir and fim > self.primeira:
+            self._ao_exibir(self.primeira, fim)
+
+    def _criar_linha(self, y: int, largura_imagem: int, cabecalho: bool = False) -> list[CTkLabel]:
+        """Metodo Privado. Cria as células de uma linha (reaproveitadas durante toda a vida da tabela)."""
+        celulas = []
+        x = 0
+        estilo = self._estilo_cabecalho() if cabecalho else self._estilo_celula()
+        if self.com_imagem:
+            celula = CTkLabel(self, text="", width=largura_imagem, height=self.altura_linha, **estilo)
+            celula.place(x=x, y=y)
+            celulas.append(celula)
+            x += largura_imagem
+
+        for titulo, largura in self.colunas:
+            celula = CTkLabel(self, text=titulo if cabecalho else "", width=largura, height=self.altura_linha,
+                              anchor="w", **estilo)
+            celula.place(x=x, y=y)
+            celulas.append(celula)
+            x += largura
+
+        return celulas
+
+    # ESTILO ==============================
+    def estilo(self) -> dict:
+        """Opções visuais do quadro da tabela conforme o tema atual."""
+        return {"corner_radius": self.interface.gerais.raio_canto}
+
+    def _estilo_cabecalho(self) -> dict:
+        """Metodo Privado. Opções visuais das células do cabeçalho."""
+        return {"fg_color": self.interface.tema.cor_principal, "font": self.interface.fontes.objeto_fonte("label")}
+
+    def _estilo_celula(self) -> dict:
+        """Metodo Privado. Opções visuais das células de dados."""
+        return {"font": self.interface.fontes.objeto_fonte("padrao")}
+
+    def _estilo_barra(self) -> dict:
+        """Metodo Privado. Opções visuais da barra de rolagem."""
+        return {"button_color": self.interface.tema.cor_principal,
+                "button_hover_color": self.interface.tema.cor_principal_hover}
+
+    def aplicar_estilo(self) -> None:
+        """
+        Atualiza dinamicamente o estilo da tabela conforme o tema atual.
+        Pode ser chamado quando o tema é alterado em tempo de execução.
+        """
+
+        log.debug("Tabela - Aplicando estilo à tabela")
+
+        self.aplicar_estilo_lote(self.estilo())
+
+    def aplicar_estilo_lote(self, estilo: dict) -> int:
+        """
+        Aplica o estilo do quadro e das partes internas (cabeçalho, células e barra de rolagem).
+        As células de um grupo compartilham o mesmo estilo: a comparação com o último estilo aplicado
+        é feita uma vez por grupo, e cada célula recebe um único configure() só com as opções alteradas.
+
+        :return: Quantidade de opções alteradas no quadro e nos grupos (0 = nenhum configure()).
+        """
+        alteradas = super().aplicar_estilo_lote(estilo)
+        grupos = (("cabecalho", self._estilo_cabecalho(), self._cabecalho),
+                  ("celula", self._estilo_celula(), [celula for linha in self._linhas for celula in linha]),
+                  ("barra", self._estilo_barra(), [self.barra_rolagem]))
+
+        for nome, novo, partes in grupos:
+            opcoes = self._opcoes_alteradas(self._estilos_internos[nome], novo)
+            if opcoes:
+                for parte in partes:
+                    parte.configure(**opcoes)
+                alteradas += len(opcoes)
+        return alteradas
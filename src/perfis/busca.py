@@ -0,0 +1,157 @@
+"""
+Módulo de Busca de Perfis.
+Responsabilidade: Responder à digitação (type-ahead) em "Carregar Perfil" e no campo CLIENTE
+em poucos milissegundos, mesmo com milhares de perfis.
+
+> Como funciona?
+Cada perfil é indexado uma única vez (e atualizado quando é salvo ou removido), em duas estruturas:
+  - lista ORDENADA de termos (texto completo, cada palavra e o documento só com dígitos):
+    a busca por prefixo é uma busca binária (bisect) + leitura dos vizinhos, sem percorrer todos os perfis;
+  - trigramas (sequências de 3 letras) → perfis que os contêm: usado só quando o prefixo não
+    encontra o bastante, tolerando erros de digitação ("slva" encontra "Silva").
+Acentos e maiúsculas são ignorados ("joao" encontra "João").
+"""
+
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+
+LIMITE_PADRAO = 10  # Resultados exibidos na lista de sugestões
+VARREDURA_MAXIMA = 500  # Termos lidos após o prefixo (consultas de 1 letra podem casar com quase tudo)
+SIMILARIDADE_MINIMA = 0.5  # Fração mínima de trigramas em comum para uma sugestão aproximada
+FRACAO_COMUM = 0.5  # Trigramas presentes em mais que esta fração dos perfis quase não distinguem nada
+
+
+def normalizar(texto: str) -> str:
+    """Remove acentos, ignora maiúsculas e espaços repetidos (ex.: ' João  DA Silva' → 'joao da silva')."""
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+    return " ".join(sem_acentos.casefold().split())
+
+
+def trigramas(texto: str) -> set[str]:
+    """Trigramas do texto normalizado, com espaço nas bordas para valorizar o início das palavras."""
+    texto = f" {texto} "
+    return {texto[posicao:posicao + 3] for posicao in range(len(texto) - 2)}
+
+
+class IndiceBusca:
+    """
+    Índice em memória de prefixo + trigramas.
+    As chaves são identificadores opacos (no gerenciador de perfis, o nome do arquivo do perfil).
+    """
+
+    def __init__(self) -> None:
+        self._termos: list[tuple[str, int, str]] = []  # (termo, prioridade, chave), ordenada
+        self._trigramas: dict[str, set[str]] = {}  # Trigrama → chaves
+        self._entradas: dict[str, tuple[list[tuple[str, int, str]], set[str]]] = {}  # Chave → (termos, trigramas)
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, chave: str) -> bool:
+        return chave in self._entradas
+
+    # ATUALIZAÇÃO ==============================
+    def construir(self, entradas) -> None:
+        """
+        Monta o índice inteiro de uma vez (ordenação única, mais rápida que inserir um a um).
+
+        :param entradas: Pares (chave, textos), onde textos é uma sequência de textos pesquisáveis.
+        """
+        self._termos, self._trigramas, self._entradas = [], {}, {}
+        for chave, textos in entradas:
+            self._indexar(chave, textos, ordenar=False)
+        self._termos.sort()
+
+    def adicionar(self, chave: str, *textos: str) -> None:
+        """Indexa (ou reindexa) uma chave com os seus textos pesquisáveis (ex.: nome, cliente, documento)."""
+        self.remover(chave)
+        self._indexar(chave, textos, ordenar=True)
+
+    def remover(self, chave: str) -> None:
+        """Tira uma chave do índice (sem efeito se ela não existir)."""
+        entrada = self._entradas.pop(chave, None)
+        if entrada is None:
+            return
+        termos, grupos = entrada
+        for termo in termos:
+            posicao = bisect_left(self._termos, termo)
+            if posicao < len(self._termos) and self._termos[posicao] == termo:
+                del self._termos[posicao]
+        for trigrama in grupos:
+            chaves = self._trigramas.get(trigrama)
+            if chaves is not None:
+                chaves.discard(chave)
+                if not chaves:
+                    del self._trigramas[trigrama]
+
+    # CONSULTA ==============================
+    def buscar(self, consulta: str, limite: int = LIMITE_PADRAO) -> list[str]:
+        """
+        Retorna as chaves que combinam com a consulta, das mais relevantes para as menos.
+
+        Ordem: texto começando pela consulta → alguma palavra começando pela consulta → semelhança por trigramas.
+        """
+        consulta = normalizar(consulta)
+        if not consulta or limite <= 0:
+            return []
+
+        # 1. Prefixo: busca binária até o primeiro termo >= consulta e leitura dos vizinhos enquanto casarem
+        encontrados: list[tuple[int, str, str]] = []
+        inicio = bisect_left(self._termos, (consulta,))
+        for termo, prioridade, chave in islice(self._termos, inicio, inicio + VARREDURA_MAXIMA):
+            if not termo.startswith(consulta):
+                break
+            encontrados.append((prioridade, termo, chave))
+        encontrados.sort()
+
+        resultado = list(dict.fromkeys(chave for _, _, chave in encontrados))[:limite]
+        if len(resultado) >= limite or len(consulta) < 3:
+            return resultado
+
+        # 2. Aproximada: conta os trigramas da consulta presentes em cada chave.
+        #    Trigramas muito comuns (ex.: "per" em "Perfil ...") são ignorados: contá-los custaria
+        #    uma passada por quase todos os perfis sem mudar a ordem das sugestões.
+        listas = sorted((self._trigramas.get(trigrama, ()) for trigrama in trigramas(consulta)), key=len)
+        maximo = max(50, int(len(self._entradas) * FRACAO_COMUM))
+        uteis = [chaves for chaves in listas if len(chaves) <= maximo] or listas[:2]
+        contagem = Counter()
+        for chaves in uteis:
+            contagem.update(chaves)
+        # Os trigramas ignorados contam como presentes: o mínimo exigido cai na mesma proporção
+        minimo = max(1, round(len(listas) * SIMILARIDADE_MINIMA) - (len(listas) - len(uteis)))
+        ja_encontradas = set(resultado)
+        for chave, comuns in contagem.most_common():
+            if len(resultado) >= limite or comuns < minimo:
+                break
+            if chave not in ja_encontradas:
+                resultado.append(chave)
+        return resultado
+
+    # INTERNOS ==============================
+    def _indexar(self, chave: str, textos, ordenar: bool) -> None:
+        """Metodo Privado. Gera os termos e trigramas de uma chave e os insere nas estruturas."""
+        termos: list[tuple[str, int, str]] = []
+        grupos: set[str] = set()
+        for texto in textos:
+            normalizado = normalizar(texto or "")
+            if not normalizado:
+                continue
+            termos.append((normalizado, 0, chave))  # Texto completo: prioridade máxima
+            termos.extend((palavra, 1, chave) for palavra in normalizado.split()[1:])
+            digitos = "".join(filter(str.isdigit, normalizado))
+            if len(digitos) >= 3 and digitos != normalizado:
+                termos.append((digitos, 0, chave))  # Documento digitado sem pontuação
+            grupos |= trigramas(normalizado)
+
+        termos = sorted(set(termos))
+        if ordenar:
+            for termo in termos:
+                insort(self._termos, termo)
+        else:
+            self._termos.extend(termos)
+        for trigrama in grupos:
+            self._trigramas.setdefault(trigrama, set()).add(chave)
+        self._entradas[chave] = (termos, grupos)
@@ -0,0 +1,293 @@
+"""
+Módulo de Perfis.
+Responsabilidade: Gerenciar os perfis de clientes e de preços usados em "Carregar Perfil"
+(índice, busca por digitação e carregamento sob demanda).
+
+> Como abrir centenas de perfis sem ler todos?
+Cada perfil é um arquivo .json na pasta de perfis, gravado em duas linhas:
+  1ª linha: resumo (nome, cliente, documento) — pequeno, lido para montar o índice;
+  2ª linha: corpo (tabela de preços, condições de pagamento e mapeamento de planilhas) — lido só quando o perfil é escolhido.
+O índice (nome, cliente, documento, último uso) fica salvo em 'indice.json' junto com o mtime e o tamanho
+de cada arquivo. Ao iniciar, só os perfis novos ou alterados (mtime/tamanho diferentes) são reabertos,
+e mesmo assim apenas a primeira linha. Os perfis completos já lidos ficam num cache LRU em memória.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+
+from src.configs.caminhos import pasta_dados
+from src.configs.precificacao import TabelaPrecos
+from src.configs.registro import registro
+from src.perfis.busca import LIMITE_PADRAO, IndiceBusca
+
+EXTENSAO = ".json"
+ARQUIVO_INDICE = "indice.json"
+CAPACIDADE_PADRAO = 32  # Perfis completos mantidos em memória
+
+
+log = registro("PERFIS")
+
+
+@dataclass
+class ResumoPerfil:
+    """Entrada do índice de perfis: o suficiente para listar e buscar, sem a tabela de preços."""
+
+    arquivo: str  # Nome do arquivo dentro da pasta de perfis
+    nome: str
+    cliente: str = ""
+    documento: str = ""  # CPF/CNPJ do cliente
+    ultimo_uso: float = 0.0  # time.time() da última vez em que o perfil foi carregado
+    mtime_ns: int = 0  # Estado do arquivo quando foi indexado
+    tamanho: int = 0
+
+
+@dataclass
+class Perfil:
+    """Perfil completo: identificação do cliente + tabela de preços."""
+
+    nome: str
+    cliente: str = ""
+    documento: str = ""
+    tabela: TabelaPrecos = field(default_factory=TabelaPrecos)
+    planilha: dict = field(default_factory=dict)  # Mapeamento das colunas das planilhas do cliente (model/planilhas.py)
+    arquivo: str = ""  # Preenchido pelo gerenciador ao salvar/carregar
+
+
+def tabela_para_dict(tabela: TabelaPrecos) -> dict:
+    """Converte a tabela de preços em um dicionário serializável em JSON (Decimal vira texto, sem perda)."""
+    return {chave: str(valor) if isinstance(valor, Decimal) else valor for chave, valor in asdict(tabela).items()}
+
+
+def tabela_de_dict(dados: dict) -> TabelaPrecos:
+    """Reconstrói a tabela de preços; campos ausentes assumem o valor padrão."""
+    padrao = TabelaPrecos()
+    campos = {}
+    for chave, valor in dados.items():
+        if not hasattr(padrao, chave):
+            continue  # Campo de uma versão futura/antiga: ignorado
+        campos[chave] = Decimal(valor) if isinstance(getattr(padrao, chave), Decimal) else valor
+    return TabelaPrecos(**campos)
+
+
+class GerenciadorPerfis:
+    """
+    Índice de perfis + carregamento sob demanda.
+    Pode ser usado por várias threads (ex.: indexação em segundo plano enquanto a janela abre).
+    """
+
+    def __init__(self, pasta: str | None = None, capacidade: int = CAPACIDADE_PADRAO) -> None:
+        """
+        :param pasta: Pasta dos perfis. Caso omitida, usa a pasta de dados do programa.
+        :param capacidade: Quantidade máxima de perfis completos mantidos em memória.
+        """
+        self.pasta = pasta or pasta_dados("perfis")
+        self.capacidade = capacidade
+        self._indice: dict[str, ResumoPerfil] = {}  # Arquivo → resumo
+        self.busca = IndiceBusca()  # Type-ahead por nome, cliente e documento
+        self._perfis: OrderedDict[str, tuple[int, Perfil]] = OrderedDict()  # Arquivo → (mtime_ns, perfil)
+        self._trava = threading.RLock()
+        self._indice_alterado = False
+
+    # ÍNDICE ==============================
+    def indexar(self) -> list[ResumoPerfil]:
+        """
+        Atualiza o índice comparando a pasta com o índice salvo.
+        Só abre (a primeira linha de) perfis novos ou alterados; perfis apagados saem do índice.
+
+        :return: Os resumos de todos os perfis, do usado mais recentemente para o mais antigo.
+        """
+        inicio = time.perf_counter()
+        salvo = self._ler_indice()
+        indice: dict[str, ResumoPerfil] = {}
+        relidos = 0
+
+        # 1. Percorre a pasta (o scandir já traz o mtime/tamanho, sem abrir os arquivos)
+        with os.scandir(self.pasta) as itens:
+            for item in itens:
+                if not item.name.endswith(EXTENSAO) or item.name == ARQUIVO_INDICE or not item.is_file():
+                    continue
+                estado = item.stat()
+                anterior = salvo.get(item.name)
+                if anterior and (anterior.mtime_ns, anterior.tamanho) == (estado.st_mtime_ns, estado.st_size):
+                    indice[item.name] = anterior
+                    continue
+
+                # 2. Perfil novo ou alterado: lê só o resumo
+                try:
+                    resumo = self._ler_resumo(item.path)
+                except (OSError, ValueError) as erro:
+                    log.warning("Perfil ignorado (%s): %s", item.name, erro)
+                    continue
+                resumo.arquivo = item.name
+                resumo.ultimo_uso = anterior.ultimo_uso if anterior else 0.0
+                resumo.mtime_ns, resumo.tamanho = estado.st_mtime_ns, estado.st_size
+                indice[item.name] = resumo
+                relidos += 1
+
+        # 3. Substitui o índice e o grava se algo mudou
+        with self._trava:
+            alterado = relidos or indice.keys() != salvo.keys()
+            self._indice = indice
+            self._indice_alterado = self._indice_alterado or bool(alterado)
+            self.busca.construir((resumo.arquivo, (resumo.nome, resumo.cliente, resumo.documento))
+                                 for resumo in indice.values())
+        self.salvar_indice()
+
+        log.info("%s perfil(is) indexado(s), %s relido(s) em %.1f ms", len(indice), relidos,
+                 (time.perf_counter() - inicio) * 1000)
+        return self.listar()
+
+    def listar(self) -> list[ResumoPerfil]:
+        """Resumos de todos os perfis indexados, do usado mais recentemente para o mais antigo."""
+        with self._trava:
+            resumos = list(self._indice.values())
+        return sorted(resumos, key=lambda resumo: (-resumo.ultimo_uso, resumo.nome.casefold()))
+
+    def buscar(self, consulta: str, limite: int = LIMITE_PADRAO) -> list[ResumoPerfil]:
+        """
+        Sugestões para o texto digitado (nome do perfil, nome do cliente ou CPF/CNPJ).
+        Com a consulta vazia, retorna os perfis usados mais recentemente.
+        """
+        if not consulta.strip():
+            return self.listar()[:limite]
+        with self._trava:
+            return [self._indice[arquivo] for arquivo in self.busca.buscar(consulta, limite)]
+
+    def salvar_indice(self) -> None:
+        """Grava o índice em disco, se houve alterações (gravação atômica, como no cache de metadados)."""
+        with self._trava:
+            if not self._indice_alterado:
+                return
+            conteudo = json.dumps([asdict(resumo) for resumo in self._indice.values()], ensure_ascii=False,
+                                  separators=(",", ":"))
+            self._indice_alterado = False
+
+            caminho = os.path.join(self.pasta, ARQUIVO_INDICE)
+            temporario = f"{caminho}.tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                arquivo.write(conteudo)
+            os.replace(temporario, caminho)
+
+    def __len__(self) -> int:
+        with self._trava:
+            return len(self._indice)
+
+    # PERFIS ==============================
+    def carregar(self, arquivo: str) -> Perfil:
+        """
+        Retorna o perfil completo, lendo o arquivo só se ele não estiver em memória ou tiver mudado no disco.
+        Marca o perfil como usado agora (ordem de listar()).
+
+        Raises:
+            OSError: Se o arquivo do perfil não existir mais.
+            ValueError: Se o arquivo estiver corrompido.
+        """
+        caminho = os.path.join(self.pasta, arquivo)
+        mtime_ns = os.stat(caminho).st_mtime_ns
+
+        with self._trava:
+            guardado = self._perfis.get(arquivo)
+            if guardado and guardado[0] == mtime_ns:
+                self._perfis.move_to_end(arquivo)
+                perfil = guardado[1]
+            else:
+                perfil = self._ler_perfil(caminho)
+                perfil.arquivo = arquivo
+                self._lembrar(arquivo, mtime_ns, perfil)
+
+            resumo = self._indice.get(arquivo)
+            if resumo is not None:
+                resumo.ultimo_uso = time.time()
+                self._indice_alterado = True
+        return perfil
+
+    def salvar(self, perfil: Perfil) -> ResumoPerfil:
+        """
+        Grava o perfil (criando ou substituindo o arquivo) e atualiza o índice e o cache sem reler a pasta.
+
+        :return: O resumo do perfil no índice.
+        """
+        arquivo = perfil.arquivo or self._nome_arquivo(perfil.nome)
+        caminho = os.path.join(self.pasta, arquivo)
+        resumo = {"nome": perfil.nome, "cliente": perfil.cliente, "documento": perfil.documento}
+
+        # 1. Grava resumo e corpo em linhas separadas (o índice lê só a primeira)
+        temporario = f"{caminho}.tmp"
+        with open(temporario, "w", encoding="utf-8") as saida:
+            saida.write(json.dumps(resumo, ensure_ascii=False) + "\n")
+            corpo = {"tabela": tabela_para_dict(perfil.tabela), "planilha": perfil.planilha}
+            saida.write(json.dumps(corpo, ensure_ascii=False) + "\n")
+        os.replace(temporario, caminho)
+
+        # 2. Atualiza o índice e o cache com o novo estado do arquivo
+        estado = os.stat(caminho)
+        perfil.arquivo = arquivo
+        with self._trava:
+            anterior = self._indice.get(arquivo)
+            entrada = ResumoPerfil(arquivo=arquivo, ultimo_uso=anterior.ultimo_uso if anterior else time.time(),
+                                   mtime_ns=estado.st_mtime_ns, tamanho=estado.st_size, **resumo)
+            self._indice[arquivo] = entrada
+            self._indice_alterado = True
+            self.busca.adicionar(arquivo, entrada.nome, entrada.cliente, entrada.documento)
+            self._lembrar(arquivo, estado.st_mtime_ns, perfil)
+        return entrada
+
+    def remover(self, arquivo: str) -> None:
+        """Apaga o perfil do disco, do índice e do cache."""
+        try:
+            os.remove(os.path.join(self.pasta, arquivo))
+        except FileNotFoundError:
+            pass
+        with self._trava:
+            self._perfis.pop(arquivo, None)
+            self.busca.remover(arquivo)
+            if self._indice.pop(arquivo, None) is not None:
+                self._indice_alterado = True
+
+    # INTERNOS ==============================
+    def _lembrar(self, arquivo: str, mtime_ns: int, perfil: Perfil) -> None:
+        """Metodo Privado. Insere o perfil no cache LRU (chamado com a trava adquirida)."""
+        self._perfis[arquivo] = (mtime_ns, perfil)
+        self._perfis.move_to_end(arquivo)
+        while len(self._perfis) > self.capacidade:
+            self._perfis.popitem(last=False)
+
+    def _ler_indice(self) -> dict[str, ResumoPerfil]:
+        """Metodo Privado. Lê o índice salvo; índice ausente ou ilegível equivale a um índice vazio."""
+        try:
+            with open(os.path.join(self.pasta, ARQUIVO_INDICE), encoding="utf-8") as arquivo:
+                return {dados["arquivo"]: ResumoPerfil(**dados) for dados in json.load(arquivo)}
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+
+    @staticmethod
+    def _ler_resumo(caminho: str) -> ResumoPerfil:
+        """Metodo Privado. Lê apenas a primeira linha do perfil (o resumo)."""
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.loads(arquivo.readline())
+        return ResumoPerfil(arquivo="", nome=dados.get("nome", ""),
+                            cliente=dados.get("cliente", ""), documento=dados.get("documento", ""))
+
+    @staticmethod
+    def _ler_perfil(caminho: str) -> Perfil:
+        """Metodo Privado. Lê o perfil inteiro (resumo + corpo)."""
+        with open(caminho, encoding="utf-8") as arquivo:
+            resumo = json.loads(arquivo.readline())
+            corpo = json.loads(arquivo.readline() or "{}")
+        return Perfil(nome=resumo.get("nome", ""), cliente=resumo.get("cliente", ""),
+                      documento=resumo.get("documento", ""), tabela=tabela_de_dict(corpo.get("tabela", {})),
+                      planilha=corpo.get("planilha", {}))
+
+    def _nome_arquivo(self, nome: str) -> str:
+        """Metodo Privado. Gera um nome de arquivo único a partir do nome do perfil."""
+        base = "".join(caractere if caractere.isalnum() else "_" for caractere in nome.strip().lower()) or "perfil"
+        arquivo, numero = f"{base}{EXTENSAO}", 1
+        while arquivo == ARQUIVO_INDICE or os.path.exists(os.path.join(self.pasta, arquivo)):
+            numero += 1
+            arquivo = f"{base}_{numero}{EXTENSAO}"
+        return arquivo
@@ -0,0 +1,132 @@
+"""
+Módulo de PDFs em Lote.
+Responsabilidade: Gerar muitos PDFs de orçamento de uma vez (ex.: reemitir dezenas de orçamentos depois
+de uma mudança na tabela de preços), em paralelo, com a mesma saída do "Gerar PDF" (results/saida.py).
+
+> Por que preparar o fundo e o logo na inicialização?
+Preparar as imagens (ler o JPEG, desfiltrar o PNG e comprimir a transparência) é a parte cara de um PDF
+pequeno. Cada processo do pool cria um único GeradorPDF ao iniciar (initializer do pool), prepara as
+imagens uma vez e o reaproveita em todos os PDFs que receber. As fontes são as padrão do PDF (Helvetica),
+que não precisam ser lidas nem embutidas.
+
+Cada PDF é gravado de forma atômica (arquivo temporário + renomeação, ver GeradorPDF.gerar).
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+from src.configs.precificacao import ResultadoPrecificacao
+from src.configs.registro import configurar_registro, registro
+from src.results.saida import CabecalhoPDF, GeradorPDF, LinhaPDF
+
+log = registro("RESULTS")
+
+_gerador: GeradorPDF | None = None  # Gerador do processo atual (um por processo do pool)
+
+
+@dataclass
+class PedidoPDF:
+    """Um PDF a gerar (enviado a um processo do pool: as linhas vão numa sequência, não num gerador)."""
+
+    caminho: str
+    cabecalho: CabecalhoPDF
+    itens: Sequence[LinhaPDF]
+    resultado: ResultadoPrecificacao
+
+
+@dataclass
+class ResultadoPDF:
+    """O que cada PDF devolve ao processo principal."""
+
+    caminho: str
+    paginas: int = 0
+    segundos: float = 0.0
+    erro: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.erro
+
+
+def gerador_do_processo(caminho_fundo: str | None = None, caminho_logo: str | None = None) -> GeradorPDF:
+    """
+    GeradorPDF compartilhado pelo processo atual, com o fundo e o logo já preparados.
+    Criado na primeira chamada; as seguintes reaproveitam o mesmo (os caminhos só valem na primeira).
+    """
+    global _gerador
+    if _gerador is None:
+        _gerador = GeradorPDF(caminho_fundo, caminho_logo)
+        _gerador.preparar()
+    return _gerador
+
+
+def gerar_lote(pedidos: Iterable[PedidoPDF], processos: int | None = None, caminho_fundo: str | None = None,
+               caminho_logo: str | None = None, ao_concluir: Callable[[ResultadoPDF], None] | None = None) \
+        -> list[ResultadoPDF]:
+    """
+    Gera os PDFs em paralelo.
+
+    :param pedidos: PDFs a gerar.
+    :param processos: Tamanho do pool. Caso omitido, um por núcleo. Com 1 processo (ou 1 pedido),
+                      gera no próprio processo, sem criar o pool.
+    :param caminho_fundo: Fundo das páginas (padrão: 'assets/images/back_pdf.jpg').
+    :param caminho_logo: Logo do cabeçalho (padrão: 'assets/images/logo.png').
+    :param ao_concluir: Chamada no processo principal a cada PDF concluído (ex.: progresso), na ordem de conclusão.
+    :return: Um resultado por pedido, na ordem dos pedidos. Falhas voltam no campo 'erro' (o lote não para).
+    """
+    pedidos = list(pedidos)
+    processos = min(processos or os.cpu_count() or 1, len(pedidos))
+    resultados: list[ResultadoPDF | None] = [None] * len(pedidos)
+    log.info("PDF: %s orçamento(s) em %s processo(s)", len(pedidos), processos)
+
+    # 1. Poucos pedidos: no próprio processo (criar o pool custaria mais que os PDFs)
+    if processos <= 1:
+        gerador = GeradorPDF(caminho_fundo, caminho_logo)
+        for indice, pedido in enumerate(pedidos):
+            resultados[indice] = _gerar(pedido, gerador)
+            if ao_concluir is not None:
+                ao_concluir(resultados[indice])
+        return resultados
+
+    # 2. Pool: cada processo prepara o fundo e o logo uma vez, ao iniciar
+    nivel = registro("RESULTS").getEffectiveLevel()
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_processo,
+                             initargs=(caminho_fundo, caminho_logo, nivel)) as pool:
+        futuros = {pool.submit(_gerar, pedido): indice for indice, pedido in enumerate(pedidos)}
+        for futuro in as_completed(futuros):
+            indice = futuros[futuro]
+            try:
+                resultados[indice] = futuro.result()
+            except Exception as erro:  # O processo morreu ou o pedido não pôde ser enviado
+                resultados[indice] = ResultadoPDF(pedidos[indice].caminho, erro=f"{type(erro).__name__}: {erro}")
+            if ao_concluir is not None:
+                ao_concluir(resultados[indice])
+    return resultados
+
+
+# INTERNOS ==============================
+def _iniciar_processo(caminho_fundo: str | None, caminho_logo: str | None, nivel: int) -> None:
+    """Metodo Privado. Inicialização de cada processo do pool: registro e imagens preparadas uma única vez."""
+    configurar_registro(max(nivel, logging.WARNING))  # Dos processos do pool, só avisos e erros
+    gerador_do_processo(caminho_fundo, caminho_logo)
+
+
+def _gerar(pedido: PedidoPDF, gerador: GeradorPDF | None = None) -> ResultadoPDF:
+    """Metodo Privado. Gera um PDF com o gerador do processo; erros voltam no resultado."""
+    inicio = time.perf_counter()
+    resultado = ResultadoPDF(pedido.caminho)
+    try:
+        resultado.paginas = (gerador or gerador_do_processo()).gerar(pedido.caminho, pedido.cabecalho,
+                                                                     pedido.itens, pedido.resultado)
+    except (OSError, ValueError) as erro:
+        resultado.erro = f"{type(erro).__name__}: {erro}"
+        log.warning("PDF não gerado (%s): %s", pedido.caminho, resultado.erro)
+    except Exception as erro:  # Falha inesperada do gerador: vira falha do pedido, para o número voltar à numeração
+        resultado.erro = f"{type(erro).__name__}: {erro}"
+        log.exception("PDF não gerado (%s): erro inesperado", pedido.caminho)
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
@@ -0,0 +1,448 @@
+"""
+Módulo de Saída (PDF do orçamento).
+Responsabilidade: Gerar o PDF do orçamento ("Gerar PDF"), com o fundo 'back_pdf.jpg' e o 'logo.png'.
+
+> Por que um escritor de PDF próprio?
+O orçamento pode ter milhares de itens. O escritor abaixo grava cada página no disco assim que
+ela fica pronta (streaming), então a memória usada não cresce com o tamanho do orçamento.
+O fundo e o logo são gravados UMA vez, como XObjects compartilhados, e todas as páginas
+apenas os referenciam — o arquivo não repete 300 KB de imagem por página.
+As fontes são as 14 fontes padrão do PDF (Helvetica), que não precisam ser embutidas.
+
+> E entre um PDF e outro?
+O fundo e o logo são preparados (lidos, desfiltrados e comprimidos) uma vez por GeradorPDF e
+reaproveitados em todos os PDFs que ele gerar. Para muitos orçamentos de uma vez, ver results/lote_pdf.py.
+
+> Gravação atômica
+O PDF é gravado num arquivo temporário na mesma pasta e só então renomeado para o destino:
+quem abrir o arquivo nunca encontra um PDF pela metade, e uma falha não apaga o PDF anterior.
+"""
+
+import os
+import struct
+import sys
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from src.configs.precificacao import ResultadoPrecificacao, formatar_moeda
+from src.configs.registro import registro
+
+
+log = registro("RESULTS")
+
+
+def caminho_base():
+    pasta_results = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.normpath(os.path.join(pasta_results, ".."))
+
+
+# PÁGINA (A4 em pontos: 1 pt = 1/72 pol) ==============================
+LARGURA_PAGINA = 595.28
+ALTURA_PAGINA = 841.89
+MARGEM = 40
+ALTURA_LINHA = 16
+TOPO_TABELA = 650  # Primeira linha de itens na primeira página (abaixo do cabeçalho)
+TOPO_TABELA_CONTINUACAO = 740  # Primeira linha de itens nas páginas seguintes
+BASE_TABELA = 70  # Última linha de itens antes do rodapé
+ALTURA_BLOCO_TOTAIS = 110  # Espaço reservado para os totais na última página
+
+# Colunas da tabela de itens: (título, posição x, alinhamento à direita?)
+COLUNAS = (
+    ("ITEM", MARGEM, False),
+    ("ARQUIVO", MARGEM + 32, False),
+    ("MATERIAL", MARGEM + 222, False),
+    ("ACABAMENTO", MARGEM + 317, False),
+    ("MEDIDAS (cm)", MARGEM + 412, False),
+    ("QTD", LARGURA_PAGINA - MARGEM - 70, True),
+    ("VALOR R$", LARGURA_PAGINA - MARGEM, True),
+)
+
+
+@dataclass
+class CabecalhoPDF:
+    """Informações exibidas no topo da primeira página."""
+
+    numero: str = ""
+    cliente: str = ""
+    perfil: str = ""
+    data: str = ""
+
+
+class LinhaPDF(NamedTuple):
+    """Uma linha da tabela de itens do PDF."""
+
+    descricao: str
+    material: str
+    acabamento: str
+    largura_cm: float
+    altura_cm: float
+    quantidade: int
+    valor: Decimal
+
+
+# IMAGENS ==============================
+@dataclass
+class ImagemPDF:
+    """Imagem já preparada para ser gravada como XObject (dados comprimidos + dicionário)."""
+
+    largura: int
+    altura: int
+    espaco_cor: str
+    filtro: str
+    dados: bytes
+    parametros: str = ""  # Entradas extras do dicionário (ex.: /DecodeParms)
+    mascara: "ImagemPDF | None" = None  # Canal alfa (SMask), quando houver
+
+
+def preparar_jpeg(caminho: str) -> ImagemPDF:
+    """
+    Prepara um JPEG para o PDF sem decodificá-lo: o PDF aceita o arquivo JPEG original (filtro DCTDecode).
+    Só o marcador SOF é lido para obter dimensões e número de componentes de cor.
+    """
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+
+    posicao = 2
+    while posicao < len(dados):
+        marcador, tamanho = dados[posicao + 1], struct.unpack(">H", dados[posicao + 2:posicao + 4])[0]
+        if 0xC0 <= marcador <= 0xCF and marcador not in (0xC4, 0xC8, 0xCC):
+            altura, largura, componentes = struct.unpack(">HHB", dados[posicao + 5:posicao + 10])
+            espaco = {1: "/DeviceGray", 3: "/DeviceRGB", 4: "/DeviceCMYK"}[componentes]
+            return ImagemPDF(largura, altura, espaco, "/DCTDecode", dados)
+        posicao += 2 + tamanho
+
+    raise ValueError(f"JPEG inválido: {caminho}")
+
+
+def preparar_png(caminho: str) -> ImagemPDF:
+    """
+    Prepara um PNG (8 bits, sem paleta e não entrelaçado) para o PDF.
+    As linhas são desfiltradas para separar o canal alfa, que vira uma máscara suave (SMask).
+    """
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+
+    # 1. Lê o cabeçalho e junta os blocos de dados (IDAT)
+    largura, altura, bits, tipo_cor, _, _, entrelacado = struct.unpack(">IIBBBBB", dados[16:29])
+    if bits != 8 or entrelacado or tipo_cor not in (0, 2, 4, 6):
+        raise ValueError(f"PNG não suportado (use 8 bits, RGB/cinza, sem entrelaçamento): {caminho}")
+
+    comprimido, posicao = bytearray(), 8
+    while posicao < len(dados):
+        tamanho, tipo = struct.unpack(">I4s", dados[posicao:posicao + 8])
+        if tipo == b"IDAT":
+            comprimido += dados[posicao + 8:posicao + 8 + tamanho]
+        posicao += 12 + tamanho
+
+    canais = {0: 1, 2: 3, 4: 2, 6: 4}[tipo_cor]
+    cores = 1 if tipo_cor in (0, 4) else 3
+    espaco = "/DeviceGray" if cores == 1 else "/DeviceRGB"
+
+    # 2. Sem alfa: o PDF lê os dados filtrados do PNG diretamente (Predictor 15)
+    if tipo_cor in (0, 2):
+        parametros = f"/DecodeParms << /Predictor 15 /Colors {cores} /BitsPerComponent 8 /Columns {largura} >>"
+        return ImagemPDF(largura, altura, espaco, "/FlateDecode", bytes(comprimido), parametros)
+
+    # 3. Com alfa: desfiltra as linhas e separa cor e transparência
+    pixels = _desfiltrar_png(zlib.decompress(comprimido), largura, altura, canais)
+    cor = bytearray()
+    alfa = bytearray()
+    for inicio in range(0, len(pixels), canais):
+        cor += pixels[inicio:inicio + cores]
+        alfa.append(pixels[inicio + cores])
+
+    mascara = ImagemPDF(largura, altura, "/DeviceGray", "/FlateDecode", zlib.compress(bytes(alfa), 9))
+    return ImagemPDF(largura, altura, espaco, "/FlateDecode", zlib.compress(bytes(cor), 9), mascara=mascara)
+
+
+def _desfiltrar_png(dados: bytes, largura: int, altura: int, canais: int) -> bytearray:
+    """Desfaz os filtros de linha do PNG (None, Sub, Up, Average, Paeth)."""
+    largura_linha = largura * canais
+    saida = bytearray()
+    anterior = bytearray(largura_linha)
+
+    for indice in range(altura):
+        inicio = indice * (largura_linha + 1)
+        filtro = dados[inicio]
+        linha = bytearray(dados[inicio + 1:inicio + 1 + largura_linha])
+
+        for x in range(largura_linha):
+            a = linha[x - canais] if x >= canais else 0
+            b = anterior[x]
+            if filtro == 1:
+                linha[x] = (linha[x] + a) & 0xFF
+            elif filtro == 2:
+                linha[x] = (linha[x] + b) & 0xFF
+            elif filtro == 3:
+                linha[x] = (linha[x] + ((a + b) >> 1)) & 0xFF
+            elif filtro == 4:
+                c = anterior[x - canais] if x >= canais else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                linha[x] = (linha[x] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+
+        saida += linha
+        anterior = linha
+
+    return saida
+
+
+# TEXTO ==============================
+# Larguras da Helvetica (em milésimos do tamanho da fonte) para os caracteres de valores numéricos.
+_LARGURAS_HELVETICA = {**dict.fromkeys("0123456789$", 556), ",": 278, ".": 278, " ": 278, "R": 722, "%": 889}
+
+
+def _texto_pdf(texto: str) -> str:
+    """Converte o texto para a codificação WinAnsi (acentos do português) e escapa os caracteres especiais."""
+    codificado = str(texto).encode("cp1252", errors="replace").decode("latin-1")
+    return codificado.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _largura_texto(texto: str, tamanho: float) -> float:
+    """Largura aproximada de um texto em Helvetica, usada para alinhar valores à direita."""
+    return sum(_LARGURAS_HELVETICA.get(caractere, 556) for caractere in texto) * tamanho / 1000
+
+
+def _cortar(texto: str, limite: int) -> str:
+    """Corta textos longos (nomes de arquivo) para caberem na coluna."""
+    return texto if len(texto) <= limite else texto[:limite - 1] + "…"
+
+
+# ESCRITOR ==============================
+class EscritorPDF:
+    """
+    Escritor de baixo nível: grava objetos PDF diretamente no arquivo, guardando só a posição de cada um
+    (necessária para a tabela 'xref' do final).
+    """
+
+    def __init__(self, arquivo) -> None:
+        """
+        :param arquivo: Arquivo binário aberto para escrita.
+        """
+        self.arquivo = arquivo
+        self.posicoes: list[int] = []  # Posição (em bytes) de cada objeto; o índice 0 é o objeto 1
+        self.arquivo.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def reservar(self) -> int:
+        """Reserva o número de um objeto que será gravado depois (ex.: a árvore de páginas)."""
+        self.posicoes.append(0)
+        return len(self.posicoes)
+
+    def objeto(self, conteudo: str, numero: int | None = None) -> int:
+        """Grava um objeto simples (dicionário, array...) e retorna o seu número."""
+        numero = numero or self.reservar()
+        self.posicoes[numero - 1] = self.arquivo.tell()
+        self.arquivo.write(f"{numero} 0 obj\n{conteudo}\nendobj\n".encode("latin-1"))
+        return numero
+
+    def stream(self, dicionario: str, dados: bytes, numero: int | None = None) -> int:
+        """Grava um objeto stream (conteúdo de página, imagem) e retorna o seu número."""
+        numero = numero or self.reservar()
+        self.posicoes[numero - 1] = self.arquivo.tell()
+        self.arquivo.write(f"{numero} 0 obj\n<< {dicionario} /Length {len(dados)} >>\nstream\n".encode("latin-1"))
+        self.arquivo.write(dados)
+        self.arquivo.write(b"\nendstream\nendobj\n")
+        return numero
+
+    def imagem(self, imagem: ImagemPDF) -> int:
+        """Grava uma imagem (e a sua máscara de transparência, se houver) como XObject."""
+        mascara = f"/SMask {self.imagem(imagem.mascara)} 0 R " if imagem.mascara else ""
+        dicionario = (f"/Type /XObject /Subtype /Image /Width {imagem.largura} /Height {imagem.altura} "
+                      f"/ColorSpace {imagem.espaco_cor} /BitsPerComponent 8 /Filter {imagem.filtro} "
+                      f"{imagem.parametros} {mascara}")
+        return self.stream(dicionario, imagem.dados)
+
+    def finalizar(self, raiz: int) -> None:
+        """Grava a tabela de referências (xref) e o trailer, encerrando o documento."""
+        inicio_xref = self.arquivo.tell()
+        linhas = [f"xref\n0 {len(self.posicoes) + 1}\n", "0000000000 65535 f \n"]
+        linhas.extend(f"{posicao:010d} 00000 n \n" for posicao in self.posicoes)
+        linhas.append(f"trailer\n<< /Size {len(self.posicoes) + 1} /Root {raiz} 0 R >>\n"
+                      f"startxref\n{inicio_xref}\n%%EOF\n")
+        self.arquivo.write("".join(linhas).encode("latin-1"))
+
+
+class GeradorPDF:
+    """
+    Gera o PDF do orçamento página a página.
+
+    Só a página atual fica em memória: os itens são consumidos de um iterável (pode ser um gerador)
+    e cada página é comprimida e gravada assim que enche.
+    """
+
+    def __init__(self, caminho_fundo: str | None = None, caminho_logo: str | None = None) -> None:
+        """
+        :param caminho_fundo: Imagem de fundo de todas as páginas. Caso omitido, usa 'assets/images/back_pdf.jpg'.
+        :param caminho_logo: Logo do cabeçalho. Caso omitido, usa 'assets/images/logo.png'.
+        """
+        pasta_imagens = os.path.join(caminho_base(), "assets", "images")
+        self.caminho_fundo = caminho_fundo or os.path.join(pasta_imagens, "back_pdf.jpg")
+        self.caminho_logo = caminho_logo or os.path.join(pasta_imagens, "logo.png")
+        self._imagens: tuple[ImagemPDF, ImagemPDF] | None = None  # (fundo, logo), preparados no primeiro PDF
+
+    def preparar(self) -> None:
+        """
+        Prepara o fundo e o logo agora (em vez de no primeiro PDF).
+        Chamado, por exemplo, na inicialização dos processos que geram PDFs em lote.
+        """
+        if self._imagens is None:
+            self._imagens = (preparar_jpeg(self.caminho_fundo), preparar_png(self.caminho_logo))
+
+    def gerar(self, caminho: str, cabecalho: CabecalhoPDF, itens: Iterable[LinhaPDF],
+              resultado: ResultadoPrecificacao) -> int:
+        """
+        Gera o PDF do orçamento.
+
+        :param caminho: Arquivo PDF de destino.
+        :param cabecalho: Número, cliente, perfil e data do orçamento.
+        :param itens: Linhas da tabela de itens, na ordem em que serão impressas.
+        :param resultado: Valores de saída da precificação (totais exibidos na última página).
+        :return: Quantidade de páginas geradas.
+        """
+        log.info("PDF: Gerando %s", os.path.basename(caminho))
+        self.preparar()
+
+        # Gravação atômica: o destino só é substituído quando o PDF está completo
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        try:
+            paginas = self._gravar(temporario, cabecalho, itens, resultado)
+            os.replace(temporario, caminho)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+
+        log.info("PDF: %s página(s) gravadas", paginas)
+        return paginas
+
+    # INTERNOS ==============================
+    def _gravar(self, caminho: str, cabecalho: CabecalhoPDF, itens: Iterable[LinhaPDF],
+                resultado: ResultadoPrecificacao) -> int:
+        """Metodo Privado. Grava o documento inteiro em 'caminho' e retorna a quantidade de páginas."""
+        with open(caminho, "wb") as arquivo:
+            escritor = EscritorPDF(arquivo)
+
+            # 1. Catálogo e árvore de páginas (a árvore é gravada no final, quando as páginas forem conhecidas)
+            raiz = escritor.reservar()
+            arvore = escritor.reservar()
+
+            # 2. Recursos compartilhados: fontes, fundo e logo gravados uma única vez
+            recursos = self._gravar_recursos(escritor)
+
+            # 3. Páginas, gravadas uma a uma (só o número de cada página fica em memória)
+            paginas = []
+            for conteudo in self._paginas(cabecalho, itens, resultado):
+                conteudo_pagina = escritor.stream("/Filter /FlateDecode", conteudo)
+                paginas.append(escritor.objeto(
+                    f"<< /Type /Page /Parent {arvore} 0 R /Resources {recursos} 0 R "
+                    f"/MediaBox [0 0 {LARGURA_PAGINA} {ALTURA_PAGINA}] /Contents {conteudo_pagina} 0 R >>"
+                ))
+
+            # 4. Fecha a árvore de páginas, o catálogo e a tabela de referências
+            kids = " ".join(f"{pagina} 0 R" for pagina in paginas)
+            escritor.objeto(f"<< /Type /Pages /Kids [{kids}] /Count {len(paginas)} >>", arvore)
+            escritor.objeto(f"<< /Type /Catalog /Pages {arvore} 0 R >>", raiz)
+            escritor.finalizar(raiz)
+        return len(paginas)
+
+    def _gravar_recursos(self, escritor: EscritorPDF) -> int:
+        """Metodo Privado. Grava fontes e imagens e o dicionário de recursos que todas as páginas referenciam."""
+        fonte = escritor.objeto("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        negrito = escritor.objeto("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+                                  "/Encoding /WinAnsiEncoding >>")
+        imagem_fundo, imagem_logo = self._imagens
+        fundo = escritor.imagem(imagem_fundo)
+        logo = escritor.imagem(imagem_logo)
+
+        return escritor.objeto(f"<< /Font << /F1 {fonte} 0 R /F2 {negrito} 0 R >> "
+                               f"/XObject << /Fundo {fundo} 0 R /Logo {logo} 0 R >> >>")
+
+    def _paginas(self, cabecalho: CabecalhoPDF, itens: Iterable[LinhaPDF], resultado: ResultadoPrecificacao):
+        """
+        Metodo Privado (gerador).
+        Monta o conteúdo de cada página e o entrega comprimido assim que a página enche.
+        """
+        numero_pagina = 1
+        comandos = self._inicio_pagina(numero_pagina, cabecalho)
+        y = TOPO_TABELA
+
+        for indice, item in enumerate(itens, start=1):
+            # 1. Página cheia: entrega e começa outra
+            if y < BASE_TABELA:
+                yield zlib.compress("\n".join(comandos).encode("latin-1"))
+                numero_pagina += 1
+                comandos = self._inicio_pagina(numero_pagina)
+                y = TOPO_TABELA_CONTINUACAO
+
+            # 2. Linha do item
+            valores = (str(indice), _cortar(item.descricao, 34), _cortar(item.material, 16),
+                       _cortar(item.acabamento, 16), f"{item.largura_cm:.1f} x {item.altura_cm:.1f}",
+                       str(item.quantidade), formatar_moeda(item.valor))
+            comandos.extend(self._linha_tabela(valores, y, "F1"))
+            y -= ALTURA_LINHA
+
+        # 3. Totais na última página (ou numa nova, se não couberem)
+        if y - ALTURA_BLOCO_TOTAIS < BASE_TABELA - ALTURA_LINHA:
+            yield zlib.compress("\n".join(comandos).encode("latin-1"))
+            numero_pagina += 1
+            comandos = self._inicio_pagina(numero_pagina)
+            y = TOPO_TABELA_CONTINUACAO
+
+        comandos.extend(self._totais(resultado, y - ALTURA_LINHA))
+        yield zlib.compress("\n".join(comandos).encode("latin-1"))
+
+    def _inicio_pagina(self, numero: int, cabecalho: CabecalhoPDF | None = None) -> list[str]:
+        """Metodo Privado. Fundo, logo, rodapé e títulos da tabela (e o cabeçalho, na primeira página)."""
+        comandos = [
+            f"q {LARGURA_PAGINA} 0 0 {ALTURA_PAGINA} 0 0 cm /Fundo Do Q",
+            f"q 60 0 0 60 {MARGEM} {ALTURA_PAGINA - MARGEM - 60} cm /Logo Do Q",
+            self._texto(f"Página {numero}", LARGURA_PAGINA - MARGEM, 30, "F1", 8, direita=True),
+        ]
+
+        if cabecalho is not None:
+            topo = ALTURA_PAGINA - MARGEM - 20
+            comandos.append(self._texto("ORÇAMENTO", MARGEM + 80, topo, "F2", 18))
+            informacoes = (("ORÇAMENTO Nº:", cabecalho.numero), ("CLIENTE:", cabecalho.cliente),
+                           ("PERFIL:", cabecalho.perfil), ("DATA:", cabecalho.data or date.today().strftime("%d/%m/%Y")))
+            for indice, (titulo, valor) in enumerate(informacoes):
+                y = topo - 40 - indice * 16
+                comandos.append(self._texto(titulo, MARGEM + 80, y, "F2", 10))
+                comandos.append(self._texto(valor, MARGEM + 180, y, "F1", 10))
+
+        y_titulos = (TOPO_TABELA if cabecalho is not None else TOPO_TABELA_CONTINUACAO) + ALTURA_LINHA + 4
+        comandos.extend(self._linha_tabela([titulo for titulo, _, _ in COLUNAS], y_titulos, "F2"))
+        comandos.append(f"0.5 w {MARGEM} {y_titulos - 5} m {LARGURA_PAGINA - MARGEM} {y_titulos - 5} l S")
+        return comandos
+
+    def _totais(self, resultado: ResultadoPrecificacao, y: float) -> list[str]:
+        """Metodo Privado. Bloco de totais da última página (mesmos valores exibidos na Janela Principal)."""
+        linhas = (
+            ("VALOR TOTAL: R$", formatar_moeda(resultado.valor_total)),
+            ("VALOR PARCELADO: R$", f"{formatar_moeda(resultado.valor_parcelado)} em {resultado.parcelas}x de "
+                                    f"R$ {formatar_moeda(resultado.valor_parcela)}"),
+            ("PIX / DINHEIRO: R$", formatar_moeda(resultado.pix_dinheiro)),
+            ("IMPOSTO NOTA: R$", f"{formatar_moeda(resultado.imposto_nota)} "
+                                 f"({formatar_moeda(resultado.porcentagem_imposto)}%)"),
+        )
+
+        comandos = [f"0.5 w {MARGEM} {y + 10} m {LARGURA_PAGINA - MARGEM} {y + 10} l S"]
+        for indice, (titulo, valor) in enumerate(linhas):
+            tamanho = 12 if indice == 0 else 10
+            linha_y = y - 8 - indice * 20
+            comandos.append(self._texto(titulo, LARGURA_PAGINA - MARGEM - 200, linha_y, "F2", tamanho, direita=True))
+            comandos.append(self._texto(valor, LARGURA_PAGINA - MARGEM - 190, linha_y, "F1", tamanho))
+        return comandos
+
+    def _linha_tabela(self, valores, y: float, fonte: str) -> list[str]:
+        """Metodo Privado. Comandos de texto de uma linha da tabela, coluna a coluna."""
+        return [self._texto(valor, x, y, fonte, 8, direita) for valor, (_, x, direita) in zip(valores, COLUNAS)]
+
+    @staticmethod
+    def _texto(texto: str, x: float, y: float, fonte: str, tamanho: float, direita: bool = False) -> str:
+        """Metodo Privado. Comando de texto posicionado (alinhado à direita em 'x' quando solicitado)."""
+        if direita:
+            x -= _largura_texto(texto, tamanho)
+        return f"BT /{fonte} {tamanho} Tf {x:.2f} {y:.2f} Td ({_texto_pdf(texto)}) Tj ET"
@@ -0,0 +1,10 @@
+"""Dados de exemplo compartilhados pelos testes."""
+
+from src.orca_facil.model.model import LinhaOrcamento
+
+
+def linha(quantidade: int = 1, material: str = "Banner", acabamento: str = "Sem Acabamento",
+          largura_cm: float = 100.0, altura_cm: float = 100.0) -> LinhaOrcamento:
+    """Linha de orçamento de 1 m² (Banner sem acabamento = R$ 50,00 por peça na tabela padrão)."""
+    return LinhaOrcamento(descricao="peca.pdf", largura_cm=largura_cm, altura_cm=altura_cm, quantidade=quantidade,
+                          material=material, acabamento=acabamento, caminho="")
@@ -0,0 +1,15 @@
+"""
+Configurações comuns dos testes.
+Cada teste usa pastas de dados e compartilhada próprias (temporárias), para nunca tocar nos caches,
+perfis e na numeração reais do usuário.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def pastas_isoladas(tmp_path, monkeypatch):
+    """Aponta ORCA_FACIL_DADOS e ORCA_FACIL_COMPARTILHADO para pastas temporárias do teste."""
+    monkeypatch.setenv("ORCA_FACIL_DADOS", str(tmp_path / "dados"))
+    monkeypatch.setenv("ORCA_FACIL_COMPARTILHADO", str(tmp_path / "compartilhado"))
+    return tmp_path
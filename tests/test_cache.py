@@ -0,0 +1,22 @@
+"""Testes do cache de metadados (orca_facil/model/cache.py): entradas de outras versões viram falta no cache."""
+
+import json
+
+from src.orca_facil.model.arquivos import MetadadosArquivo
+from src.orca_facil.model.cache import CacheMetadados, impressao_digital
+
+
+def test_entrada_com_campo_desconhecido_e_descartada(tmp_path):
+    arquivo = tmp_path / "arte.png"
+    arquivo.write_bytes(b"conteudo")
+    chave = impressao_digital(str(arquivo))
+    caminho_cache = tmp_path / "metadados.json"
+    caminho_cache.write_text(json.dumps({chave: {"formato": "PNG", "largura_cm": 10.0, "altura_cm": 5.0,
+                                                 "campo_removido": 1}}), encoding="utf-8")
+    cache = CacheMetadados(str(caminho_cache))
+
+    assert cache.obter(str(arquivo)) == (chave, None)
+    assert len(cache) == 0
+
+    cache.guardar(chave, MetadadosArquivo(str(arquivo), formato="PNG", largura_cm=10.0, altura_cm=5.0))
+    assert cache.obter(str(arquivo))[1].largura_cm == 10.0
@@ -0,0 +1,159 @@
+"""Testes do Controller (orca_facil/controller/controller.py) sem abrir a janela."""
+
+import sqlite3
+
+import pytest
+
+from src.configs.precificacao import TabelaPrecos
+from src.orca_facil.controller.controller import Controller
+from src.orca_facil.controller.importacao import ImportacaoPlanilha
+from src.orca_facil.model.planilhas import LotePlanilha
+from tests.auxiliares import linha
+
+
+class GeradorComFalha:
+    """Gerador de PDF que sempre falha (ex.: disco cheio ou pasta sem permissão)."""
+
+    def gerar(self, *args, **kwargs):
+        raise OSError("disco cheio")
+
+
+class ViewFalsa:
+    """Só o que os comandos testados usam da Janela Principal."""
+
+    def __init__(self, destino: str = "") -> None:
+        self.destino = destino
+        self.status = ""
+
+    def selecionar_destino_pdf(self) -> str:
+        return self.destino
+
+    def atualizar_status(self, texto: str) -> None:
+        self.status = texto
+
+    def atualizar_progresso(self, concluidos: int, total: int) -> None:
+        self.progresso = (concluidos, total)
+
+    def atualizar_importacao(self, linhas: int, progresso: float) -> None:
+        self.progresso = (linhas, progresso)
+
+
+class TarefasFalsas:
+    """Agendador que só guarda a tarefa pedida, sem executá-la."""
+
+    def __init__(self) -> None:
+        self.pedidos: list[tuple] = []
+
+    def ativa(self, chave: str) -> bool:
+        return False
+
+    def executar(self, funcao, *args, **opcoes) -> None:
+        self.pedidos.append((funcao, args, opcoes))
+
+
+def emitir(controller: Controller, caminho: str, numero: int | None):
+    """Chama _emitir_pdf como o agendador chamaria, com os serviços já criados."""
+    return controller._emitir_pdf(controller.gerador_pdf, controller.numeracao, controller.repositorio, caminho,
+                                  controller.orcamento.copiar(), numero, "", "", "")
+
+
+@pytest.fixture
+def controller():
+    controller = Controller()
+    controller.gerador_pdf = GeradorComFalha()  # Substitui a propriedade criada no primeiro uso
+    controller.orcamento.adicionar([linha()])
+    yield controller
+    controller.numeracao.fechar()
+
+
+def test_pdf_com_falha_devolve_o_numero_reservado(controller, tmp_path):
+    with pytest.raises(OSError):
+        emitir(controller, str(tmp_path / "orcamento.pdf"), None)
+
+    assert controller.numeracao.proximo() == 1  # O número da tentativa voltou: a sequência não tem buraco
+
+
+def test_pdf_com_falha_mantem_o_numero_ja_emitido(controller, tmp_path):
+    numero = controller.numeracao.proximo()
+
+    with pytest.raises(OSError):
+        emitir(controller, str(tmp_path / "orcamento.pdf"), numero)
+
+    assert controller.numeracao.proximo() == numero + 1  # O número já era do orçamento: não é devolvido
+
+
+def test_gerar_pdf_cria_os_servicos_antes_de_agendar(controller, tmp_path):
+    controller.view = ViewFalsa(str(tmp_path / "orcamento.pdf"))
+    controller.tarefas = TarefasFalsas()
+
+    controller.gerar_pdf()
+
+    (funcao, args, opcoes), = controller.tarefas.pedidos
+    assert funcao == controller._emitir_pdf
+    assert args[:3] == (controller.gerador_pdf, controller.numeracao, controller.repositorio)  # Os mesmos já criados
+
+
+def test_ingestao_com_perfil_sem_materiais_e_cancelada(controller):
+    class IngestaoFalsa:
+        total, ativo, cancelada = 1, True, False
+
+        def coletar(self):
+            return []
+
+        def cancelar(self):
+            self.cancelada = True
+
+    controller.view = ViewFalsa()
+    controller.ingestao = IngestaoFalsa()
+    controller.orcamento.limpar()
+    controller.orcamento.definir_tabela(TabelaPrecos(materiais={}))
+
+    assert controller._acompanhar_ingestao() is False  # O agendador para de acompanhar
+    assert controller.ingestao.cancelada
+    assert controller.view.status == "PERFIL SEM MATERIAIS"
+
+
+def test_lote_recusado_pelo_orcamento_vai_para_as_linhas_ignoradas(controller):
+    lote = LotePlanilha(descricoes=["a", "b"], larguras=[100.0, float("inf")], alturas=[100.0, 100.0],
+                        quantidades=[1, 1], materiais=["Banner"] * 2, acabamentos=["Sem Acabamento"] * 2,
+                        numeros=[2, 3])
+    importacao = ImportacaoPlanilha()
+    importacao.ativo, importacao.linhas = False, len(lote)
+    importacao.coletar = lambda: [lote]
+    controller.importacao = importacao
+    controller.view = ViewFalsa()
+    controller._atualizar_orcamento = controller.validar_orcamento = lambda: None
+    antes = len(controller.orcamento)
+
+    assert controller._acompanhar_importacao() is False
+
+    assert len(controller.orcamento) == antes
+    assert [numero for numero, _ in importacao.erros] == [2, 3]
+    assert importacao.linhas == 0
+    assert controller.view.status == "2 LINHA(S) IGNORADA(S)"
+
+
+def test_encerrar_executa_todas_as_etapas_mesmo_com_falha(controller):
+    fechados = []
+
+    def numeracao_inacessivel():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    controller.numeracao.fechar = numeracao_inacessivel
+    controller.repositorio.fechar = lambda: fechados.append("repositorio")
+    controller.perfis.salvar_indice = lambda: fechados.append("perfis")
+
+    controller._encerrar()
+
+    assert fechados == ["repositorio", "perfis"]
+    del controller.numeracao.fechar  # O fixture fecha a numeração de verdade
+
+
+def test_edicao_invalida_nao_altera_o_orcamento(controller):
+    controller.view = ViewFalsa()
+    antes = controller.orcamento.linha(0)
+
+    controller.editar_linha(0, quantidade="3")
+
+    assert controller.orcamento.linha(0) == antes
+    assert controller.view.status == "EDIÇÃO INVÁLIDA"
@@ -0,0 +1,54 @@
+"""Testes do modo --lote (orca_facil/controller/lote.py), executados no próprio processo."""
+
+import os
+import sqlite3
+
+import pytest
+
+from src.orca_facil.controller.lote import TrabalhoLote, orcar_pasta
+from src.orca_facil.model import repositorio
+from src.configs.precificacao import TabelaPrecos
+from src.perfis.manager import Perfil
+
+
+@pytest.fixture
+def trabalho(tmp_path) -> TrabalhoLote:
+    """Pasta com uma planilha de duas linhas, orçada com o perfil padrão e o número 7."""
+    pasta = tmp_path / "cliente"
+    pasta.mkdir()
+    (pasta / "pedido.csv").write_text("descricao;largura;altura;quantidade\na;100;100;1\nb;50;50;2\n",
+                                      encoding="utf-8")
+    return TrabalhoLote(str(pasta), str(tmp_path / "orcamento_7.pdf"), Perfil(nome="Padrão"), numero=7)
+
+
+def test_orcar_pasta_grava_pdf_e_registra(trabalho):
+    resultado = orcar_pasta(trabalho)
+
+    assert resultado.ok, resultado.erro
+    assert resultado.linhas == 2
+    with open(trabalho.destino, "rb") as arquivo:
+        assert arquivo.read(5) == b"%PDF-"
+
+
+def test_banco_travado_apaga_o_pdf_e_mantem_o_numero_para_devolver(trabalho, monkeypatch):
+    def banco_travado(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(repositorio, "RepositorioOrcamentos", banco_travado)
+
+    resultado = orcar_pasta(trabalho)
+
+    assert not resultado.ok
+    assert "database is locked" in resultado.erro
+    assert resultado.numero == 7  # executar_lote devolve este número à numeração...
+    assert not os.path.exists(trabalho.destino)  # ...e nenhum PDF ficou com ele
+
+
+def test_perfil_sem_materiais_vira_erro_da_pasta(trabalho):
+    trabalho.perfil.tabela = TabelaPrecos(materiais={})
+
+    resultado = orcar_pasta(trabalho)
+
+    assert not resultado.ok
+    assert "Perfil sem materiais" in resultado.erro
+    assert not os.path.exists(trabalho.destino)
@@ -0,0 +1,37 @@
+"""Testes da geração de PDFs em lote (results/lote_pdf.py), inclusive pelo pool de processos."""
+
+import os
+
+import pytest
+
+from src.orca_facil.model.model import Orcamento
+from src.results.lote_pdf import PedidoPDF, gerar_lote
+from src.results.saida import CabecalhoPDF, LinhaPDF
+from tests.auxiliares import linha
+
+
+def _pedidos(pasta, quantidade: int) -> list[PedidoPDF]:
+    """Um pedido de PDF por orçamento, cada um com algumas linhas."""
+    pedidos = []
+    for numero in range(1, quantidade + 1):
+        orcamento = Orcamento()
+        orcamento.adicionar([linha(quantidade=numero), linha(material="Lona", acabamento="Ilhós")])
+        itens = [LinhaPDF(item.descricao, item.material, item.acabamento, item.largura_cm, item.altura_cm,
+                          item.quantidade, item.valor) for item in orcamento.linhas()]
+        pedidos.append(PedidoPDF(str(pasta / f"orcamento_{numero}.pdf"), CabecalhoPDF(numero=str(numero)), itens,
+                                 orcamento.resultado))
+    return pedidos
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_gerar_lote_grava_todos_os_pdfs(tmp_path, processos):
+    pedidos = _pedidos(tmp_path, 3)
+
+    resultados = gerar_lote(pedidos, processos=processos)
+
+    assert [resultado.erro for resultado in resultados] == ["", "", ""]
+    assert all(resultado.ok and resultado.paginas >= 1 for resultado in resultados)
+    for pedido in pedidos:
+        assert os.path.getsize(pedido.caminho) > 0
+        with open(pedido.caminho, "rb") as arquivo:
+            assert arquivo.read(5) == b"%PDF-"
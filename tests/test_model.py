@@ -0,0 +1,99 @@
+"""Testes do Model (orca_facil/model/model.py): edição de linhas e recálculo incremental."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.orca_facil.model.model import Orcamento
+from tests.auxiliares import linha
+
+
+@pytest.fixture
+def orcamento() -> Orcamento:
+    orcamento = Orcamento()
+    orcamento.adicionar([linha(quantidade=1), linha(quantidade=2, material="Lona")])
+    return orcamento
+
+
+def test_atualizar_recalcula_linha_e_total(orcamento):
+    versao = orcamento.versao
+
+    assert orcamento.atualizar(0, quantidade=3) == Decimal("150.00")
+    assert orcamento.resultado.valor_total == Decimal("240.00")  # 150 + 2 × 45
+    assert orcamento.versao == versao + 1
+
+
+@pytest.mark.parametrize("campos, erro", [
+    ({"material": "XXX"}, ValueError),  # Material fora da tabela de preços
+    ({"acabamento": "XXX"}, ValueError),
+    ({"quantidade": "3"}, TypeError),  # Texto na coluna de quantidades
+    ({"largura_cm": "abc"}, TypeError),
+    ({"quantidade": 4, "material": "XXX"}, ValueError),  # Um campo válido junto com um inválido
+    ({"largura_cm": float("inf")}, ArithmeticError),
+    ({"quantidade": 0}, ValueError),  # Medidas e quantidades precisam ser maiores que zero
+    ({"quantidade": -2}, ValueError),
+    ({"altura_cm": 0.0}, ValueError),
+    ({"largura_cm": float("nan")}, ValueError),
+    ({"valor": 10}, ValueError),  # Campo não editável
+])
+def test_atualizar_recusada_nao_altera_a_linha(orcamento, campos, erro):
+    antes = orcamento.linha(0)
+    total, versao = orcamento.resultado.valor_total, orcamento.versao
+
+    with pytest.raises(erro):
+        orcamento.atualizar(0, **campos)
+
+    assert orcamento.linha(0) == antes
+    assert orcamento.resultado.valor_total == total
+    assert orcamento.versao == versao
+
+
+def test_atualizar_depois_de_uma_recusa_continua_incremental(orcamento):
+    with pytest.raises(ValueError):
+        orcamento.atualizar(0, quantidade=5, material="XXX")
+
+    orcamento.atualizar(0, material="Adesivo Vinil")
+
+    assert orcamento.linha(0).quantidade == 1
+    assert orcamento.resultado.valor_total == Decimal("150.00")  # 60 + 2 × 45
+
+
+def test_adicionar_lote_com_material_invalido_desfaz_o_lote(orcamento):
+    with pytest.raises(ValueError):
+        orcamento.adicionar([linha(), linha(material="XXX")])
+
+    assert len(orcamento) == 2
+    assert orcamento.resultado.valor_total == Decimal("140.00")
+
+
+@pytest.mark.parametrize("quantidades, larguras, erro", [
+    ([2.5], [100.0], TypeError),  # Quantidade fracionária não cabe na coluna de inteiros
+    ([1], [float("inf")], ArithmeticError),  # Largura infinita não pode ser precificada
+    ([1], ["abc"], TypeError),
+    ([0], [100.0], ValueError),  # Quantidade zero daria uma linha de valor zerado
+    ([-1], [100.0], ValueError),
+    ([1], [-50.0], ValueError),
+])
+def test_adicionar_colunas_recusado_desfaz_todas_as_colunas(orcamento, quantidades, larguras, erro):
+    versao, total = orcamento.versao, orcamento.resultado.valor_total
+
+    with pytest.raises(erro):
+        orcamento.adicionar_colunas(descricoes=["x"], larguras=larguras, alturas=[100.0], quantidades=quantidades,
+                                    materiais=["Banner"], acabamentos=["Sem Acabamento"])
+
+    colunas = orcamento.colunas
+    assert {len(coluna) for coluna in (colunas.descricoes, colunas.caminhos, colunas.larguras, colunas.alturas,
+                                       colunas.quantidades, colunas.materiais, colunas.acabamentos,
+                                       colunas.centavos)} == {2}
+    assert orcamento.versao == versao
+    assert orcamento.resultado.valor_total == total
+
+
+def test_adicionar_colunas_incrementa_a_versao(orcamento):
+    versao = orcamento.versao
+
+    orcamento.adicionar_colunas(descricoes=["x"], larguras=[100.0], alturas=[100.0], quantidades=[1],
+                                materiais=["Banner"], acabamentos=["Sem Acabamento"])
+
+    assert orcamento.versao == versao + 1
+    assert orcamento.resultado.valor_total == Decimal("190.00")
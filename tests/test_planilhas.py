@@ -0,0 +1,68 @@
+"""Testes da leitura de planilhas (orca_facil/model/planilhas.py): valores inválidos viram erros por linha."""
+
+import pytest
+
+from src.configs.precificacao import TabelaPrecos
+from src.orca_facil.model.planilhas import MapeamentoColunas, ler_lotes, numero
+
+
+def _ler(tmp_path, linhas: list[str]):
+    """Lê um CSV com o cabeçalho padrão e retorna (linhas aceitas, erros) de todos os lotes."""
+    caminho = tmp_path / "pedido.csv"
+    caminho.write_text("\n".join(["descricao;largura;altura;quantidade", *linhas]), encoding="utf-8")
+    aceitas, erros = [], []
+    for lote, _ in ler_lotes(str(caminho)):
+        aceitas.extend(zip(lote.descricoes, lote.larguras, lote.alturas, lote.quantidades))
+        erros.extend(lote.erros)
+    return aceitas, erros
+
+
+@pytest.mark.parametrize("texto", ["inf", "-inf", "nan", "Infinity", "abc", ""])
+def test_numero_recusa_valores_nao_finitos(texto):
+    with pytest.raises(ValueError):
+        numero(texto)
+
+
+def test_numero_aceita_formato_brasileiro_e_do_xlsx():
+    assert numero("1.234,5") == 1234.5
+    assert numero("1234.5") == 1234.5
+
+
+@pytest.mark.parametrize("celulas", [
+    "a;10;10;inf",  # Quantidade infinita (antes: OverflowError na thread de leitura)
+    "a;inf;10;1",  # Medida infinita (antes: InvalidOperation ao precificar o lote)
+    "a;10;nan;1",
+    "a;10;10;2,5",  # Quantidade fracionária (antes: truncada para 2)
+    "a;10;10;1e30",
+    "a;1e308;10;1",
+    "a;10;10;0",  # Quantidade zerada (antes: o Model recusava o lote inteiro)
+    "a;0;10;1",
+    "a;-10;10;1",
+])
+def test_linha_com_valor_invalido_vai_para_os_erros(tmp_path, celulas):
+    aceitas, erros = _ler(tmp_path, [celulas, "b;10;20;3"])
+
+    assert aceitas == [("b", 10.0, 20.0, 3)]
+    assert [numero_linha for numero_linha, _ in erros] == [2]
+
+
+def test_mapeamento_do_perfil_sem_materiais():
+    with pytest.raises(ValueError, match="Perfil sem materiais"):
+        MapeamentoColunas.do_perfil({}, TabelaPrecos(acabamentos={}))
+
+    mapeamento = MapeamentoColunas.do_perfil({"material_padrao": "Lona", "acabamento_padrao": "Ilhós"},
+                                             TabelaPrecos(materiais={}, acabamentos={}))
+    assert (mapeamento.material_padrao, mapeamento.acabamento_padrao) == ("Lona", "Ilhós")
+
+
+def test_lote_guarda_o_numero_de_cada_linha_aceita(tmp_path):
+    caminho = tmp_path / "pedido.csv"
+    caminho.write_text("descricao;largura;altura;quantidade;material;acabamento\n"
+                       "a;10;10;1;Lona;Ilhós\nb;10;10;1;XXX;Ilhós\nc;10;10;1;Lona;Ilhós\n", encoding="utf-8")
+    (lote, numeros), = ler_lotes(str(caminho))
+
+    lote.filtrar({"Lona"}, {"Ilhós"}, numeros)
+
+    assert lote.descricoes == ["a", "c"]
+    assert lote.numeros == [2, 4]
+    assert lote.erros == [(3, "Material 'XXX' não existe no perfil")]
@@ -0,0 +1,62 @@
+"""Testes do motor de precificação (configs/precificacao.py): arredondamento e totais."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.configs.precificacao import MotorPrecificacao, TabelaPrecos, arredondar, formatar_moeda
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (2.675, "2.68"),  # Guardado como 2.67499999...: o meio centavo ainda sobe
+    (1.005, "1.01"),
+    (0.125, "0.13"),
+    (10.0, "10.00"),
+    (Decimal("2.345"), "2.35"),
+    (Decimal("2.344"), "2.34"),
+])
+def test_arredondar_meio_centavo_para_cima(valor, esperado):
+    assert arredondar(valor) == Decimal(esperado)
+
+
+def test_valor_linha_igual_ao_calculo_em_lote():
+    motor = MotorPrecificacao()
+    areas, quantidades = [0.0535, 1.0, 0.33], [3, 1, 7]
+    materiais, acabamentos = ["Lona", "Banner", "Adesivo Vinil"], ["Ilhós", "Sem Acabamento", "Laminação"]
+
+    resultado = motor.calcular(areas, quantidades, materiais, acabamentos)
+
+    assert resultado.valores_itens == [motor.valor_linha(*campos)
+                                       for campos in zip(areas, quantidades, materiais, acabamentos)]
+
+
+def test_area_minima_cobrada_por_peca():
+    motor = MotorPrecificacao(TabelaPrecos(area_minima=0.10))
+    # 10 x 10 cm = 0,01 m², cobrado como 0,10 m² × R$ 50,00 = R$ 5,00 por peça
+    assert motor.valor_linha(0.01, 2, "Banner", "Sem Acabamento") == Decimal("10.00")
+
+
+def test_total_e_a_soma_exata_dos_itens_arredondados():
+    motor = MotorPrecificacao()
+    resultado = motor.calcular([0.0333] * 30, [1] * 30, ["Lona"] * 30, ["Ilhós"] * 30)
+
+    assert resultado.valor_total == sum(resultado.valores_itens, Decimal("0.00"))
+
+
+def test_parcelado_fecha_com_parcelas_vezes_valor_da_parcela():
+    tabela = TabelaPrecos()
+    resultado = MotorPrecificacao(tabela).totais(Decimal("100.00"))
+
+    assert resultado.valor_parcela == Decimal("35.00")  # 100 × 1,05 / 3
+    assert resultado.valor_parcelado == resultado.valor_parcela * tabela.parcelas
+    assert resultado.pix_dinheiro == Decimal("95.00")
+    assert resultado.imposto_nota == Decimal("6.00")
+
+
+def test_material_desconhecido_levanta_value_error():
+    with pytest.raises(ValueError, match="Material 'XXX'"):
+        MotorPrecificacao().valor_linha(1.0, 1, "XXX", "Sem Acabamento")
+
+
+def test_formatar_moeda_no_padrao_brasileiro():
+    assert formatar_moeda(Decimal("1234.5")) == "1.234,50"
@@ -0,0 +1,33 @@
+"""Testes da configuração do registro (configs/registro.py)."""
+
+import logging
+
+import pytest
+
+from src.configs.registro import RAIZ, configurar_registro, encerrar_registro
+
+
+@pytest.fixture(autouse=True)
+def registro_encerrado():
+    yield
+    encerrar_registro()
+
+
+@pytest.mark.parametrize("nivel, esperado", [
+    (logging.WARNING, logging.WARNING),  # Processos do pool passam o nível como número
+    ("debug", logging.DEBUG),
+    ("ERROR", logging.ERROR),
+    ("verbose", logging.INFO),  # Desconhecido: volta para INFO
+])
+def test_nivel_do_registro(nivel, esperado):
+    configurar_registro(nivel, console=False)
+
+    assert logging.getLogger(RAIZ).level == esperado
+
+
+def test_nivel_invalido_na_variavel_de_ambiente(monkeypatch):
+    monkeypatch.setenv("ORCA_FACIL_LOG", "verbose")
+
+    configurar_registro(console=False)
+
+    assert logging.getLogger(RAIZ).level == logging.INFO
@@ -0,0 +1,65 @@
+"""Testes do repositório de orçamentos (orca_facil/model/repositorio.py): reemissão e migração do esquema."""
+
+import sqlite3
+
+import pytest
+
+from src.orca_facil.model import repositorio
+from src.orca_facil.model.model import Orcamento
+from src.orca_facil.model.repositorio import RepositorioOrcamentos
+from tests.auxiliares import linha
+
+# Tabela de orçamentos da versão 1 do esquema (sem 'atualizado_em')
+ESQUEMA_V1 = """
+CREATE TABLE orcamentos (
+    id INTEGER PRIMARY KEY,
+    numero INTEGER NOT NULL,
+    cliente TEXT NOT NULL DEFAULT '',
+    cliente_busca TEXT NOT NULL DEFAULT '',
+    documento TEXT NOT NULL DEFAULT '',
+    perfil TEXT NOT NULL DEFAULT '',
+    criado_em REAL NOT NULL,
+    total_centavos INTEGER NOT NULL,
+    linhas INTEGER NOT NULL
+);
+INSERT INTO orcamentos (numero, cliente, criado_em, total_centavos, linhas) VALUES (5, 'Ana', 1000.0, 5000, 1);
+PRAGMA user_version = 1;
+"""
+
+
+@pytest.fixture
+def orcamento() -> Orcamento:
+    orcamento = Orcamento()
+    orcamento.adicionar([linha()])
+    return orcamento
+
+
+def test_reemitir_mantem_a_data_de_criacao(tmp_path, orcamento, monkeypatch):
+    banco = RepositorioOrcamentos(str(tmp_path / "orcamentos.sqlite3"))
+    monkeypatch.setattr(repositorio.time, "time", lambda: 1000.0)
+    banco.salvar(orcamento, 1, "Ana")
+
+    monkeypatch.setattr(repositorio.time, "time", lambda: 2000.0)
+    orcamento.atualizar(0, quantidade=2)
+    gravado = banco.salvar(orcamento, 1, "Ana")
+
+    resumo = banco.obter(1)
+    banco.fechar()
+    assert (gravado.criado_em, gravado.atualizado_em) == (1000.0, 2000.0)
+    assert (resumo.criado_em, resumo.atualizado_em) == (1000.0, 2000.0)
+    assert resumo.linhas == 1 and resumo.total == orcamento.resultado.valor_total
+
+
+def test_banco_da_versao_anterior_e_migrado(tmp_path):
+    caminho = str(tmp_path / "orcamentos.sqlite3")
+    conexao = sqlite3.connect(caminho)
+    conexao.executescript(ESQUEMA_V1)
+    conexao.close()
+
+    banco = RepositorioOrcamentos(caminho)
+    resumo = banco.obter(5)
+    versao = banco._conexao.execute("PRAGMA user_version").fetchone()[0]
+    banco.fechar()
+
+    assert versao == repositorio.VERSAO_ESQUEMA
+    assert (resumo.cliente, resumo.criado_em, resumo.atualizado_em) == ("Ana", 1000.0, 1000.0)